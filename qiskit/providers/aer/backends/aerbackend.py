@@ -367,8 +367,18 @@ class AerBackend(BaseBackend, ABC):
         for key, val in run_options.items():
             setattr(config, key, val)
 
+        # Add autotuned options for options that are not set
+        for key, val in self._autotune_options(config).items():
+            if not hasattr(config, key):
+                setattr(config, key, val)
+
         return qobj
 
+    def _autotune_options(self, config):
+        """Return the autotuned default options for a qobj config."""
+        # pylint: disable=unused-argument
+        return {}
+
     def _run_config(
             self,
             backend_options=None,  # DEPRECATED
@@ -14,8 +14,14 @@
 """
 Qiskit Aer simulator backend utils
 """
+import json
+import logging
 import os
+import platform
+import shutil
+import tempfile
 from math import log2
+import numpy as np
 from qiskit.util import local_hardware_info
 from qiskit.circuit import QuantumCircuit
 from qiskit.compiler import assemble
@@ -31,6 +37,21 @@ MAX_QUBITS_STATEVECTOR = int(log2(SYSTEM_MEMORY_GB * (1024**3) / 16))
 # loaded at runtime by the simulator extension
 LIBRARY_DIR = os.path.dirname(__file__)
 
+# Environment variable for the location of the autotune profile
+AUTOTUNE_PROFILE_ENV = 'QISKIT_AER_AUTOTUNE_PROFILE'
+
+# Default location of the autotune profile
+AUTOTUNE_PROFILE_FILE = os.path.join(
+    os.path.expanduser('~'), '.qiskit', 'aer_autotune.json')
+
+# Cached autotune profile as (path, modification time, options)
+_AUTOTUNE_CACHE = (None, None, {})
+
+# Config options for initial states passed as buffers, and their dimensions
+BUFFER_OPTIONS = {'initial_statevector': 1, 'initial_unitary': 2}
+
+logger = logging.getLogger(__name__)
+
 
 def cpp_execute(controller, qobj):
     """Execute qobj_dict on C++ controller wrapper"""
@@ -48,7 +69,44 @@ def cpp_execute(controller, qobj):
     # loaded at runtime by the simulator extension
     qobj_dict['config']['library_dir'] = LIBRARY_DIR
 
-    return controller(qobj_dict)
+    # Pass initial states as buffers instead of converting them to JSON
+    buffers = []
+    config = qobj_dict['config']
+    for key, ndim in BUFFER_OPTIONS.items():
+        if config.get(key) is not None:
+            reference = _buffer_reference(config[key], ndim, buffers)
+            if reference is not None:
+                config[key] = reference
+    for experiment in qobj_dict['experiments']:
+        for inst in experiment['instructions']:
+            if inst['name'] == 'initialize':
+                reference = _buffer_reference(inst['params'], 1, buffers)
+                if reference is not None:
+                    inst['params'] = reference
+
+    return controller(qobj_dict, buffers)
+
+
+def _buffer_reference(value, ndim, buffers):
+    """Add a complex array to the buffers and return its reference in the qobj.
+
+    The value may be an array, a list of complex numbers or the path of a
+    ``.npy`` file, which is memory mapped. Returns None if the value is not
+    a complex array with ``ndim`` dimensions, for example a list of
+    ``[re, im]`` pairs, which is then converted to JSON.
+    """
+    if isinstance(value, (str, os.PathLike)):
+        value = np.load(value, mmap_mode='r')
+    if not (isinstance(value, np.ndarray) and
+            value.dtype in (np.complex64, np.complex128)):
+        try:
+            value = np.asarray(value, dtype=np.complex128)
+        except (TypeError, ValueError):
+            return None
+    if value.ndim != ndim:
+        return None
+    buffers.append(np.ascontiguousarray(value))
+    return {'aer_buffer': len(buffers) - 1}
 
 
 def available_methods(controller, methods):
@@ -67,3 +125,85 @@ def available_methods(controller, methods):
         if result.get('success', False):
             valid_methods.append(method)
     return valid_methods
+
+
+def max_qubits_statevector_chunked(chunk_directory=None):
+    """Return the max number of qubits for a complex double chunked statevector.
+
+    Args:
+        chunk_directory (str or None): the directory for the chunk files.
+            If None the default temporary directory is used.
+
+    Returns:
+        int: the number of qubits that fit in the free disk space of the
+        chunk directory, and at least the in-memory statevector limit.
+    """
+    if not chunk_directory:
+        chunk_directory = tempfile.gettempdir()
+    try:
+        free = shutil.disk_usage(chunk_directory).free
+    except OSError:
+        return MAX_QUBITS_STATEVECTOR
+    return max(MAX_QUBITS_STATEVECTOR, int(log2(max(free, 16) / 16)))
+
+
+def cpu_model():
+    """Return the CPU model name of the current machine."""
+    try:
+        with open('/proc/cpuinfo') as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def autotune_profile_path():
+    """Return the path of the autotune profile file."""
+    return os.environ.get(AUTOTUNE_PROFILE_ENV, AUTOTUNE_PROFILE_FILE)
+
+
+def autotune_profile_key():
+    """Return the key of the current machine in the autotune profile."""
+    return '{} ({} cores)'.format(cpu_model(), local_hardware_info()['cpus'])
+
+
+def load_autotune_options():
+    """Return the autotuned options for the current machine.
+
+    Returns:
+        dict: the options stored by :func:`~qiskit.providers.aer.utils.autotune`
+              for the CPU model and core count of the current machine, or
+              an empty dict if the machine has not been autotuned.
+    """
+    global _AUTOTUNE_CACHE  # pylint: disable=global-statement
+    path = autotune_profile_path()
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return {}
+    if _AUTOTUNE_CACHE[:2] == (path, mtime):
+        return _AUTOTUNE_CACHE[2].copy()
+    try:
+        with open(path) as file:
+            profile = json.load(file)
+        options = profile.get(autotune_profile_key(), {}).get('options', {})
+    except (OSError, ValueError, AttributeError) as err:
+        logger.warning('Ignoring invalid autotune profile "%s": %s', path, err)
+        options = {}
+    _AUTOTUNE_CACHE = (path, mtime, options)
+    return options.copy()
+
+
+def autotune_options(method, fusion_methods):
+    """Return the autotuned default options for a simulation method.
+
+    Fusion options are tuned for the CPU statevector method, so they are
+    only returned for the methods in ``fusion_methods``.
+    """
+    options = load_autotune_options()
+    if method not in fusion_methods:
+        options = {key: val for key, val in options.items()
+                   if not key.startswith('fusion_')}
+    return options
@@ -15,11 +15,15 @@ Qiskit Aer qasm simulator backend.
 
 import copy
 import logging
+import os
 from qiskit.providers.models import QasmBackendConfiguration
 
+from ..aererror import AerError
 from ..version import __version__
 from .aerbackend import AerBackend
 from .backend_utils import (cpp_execute, available_methods,
+                            autotune_options,
+                            max_qubits_statevector_chunked,
                             MAX_QUBITS_STATEVECTOR)
 # pylint: disable=import-error, no-name-in-module
 from .controller_wrappers import qasm_controller_execute
@@ -78,6 +82,15 @@ class QasmSimulator(AerBackend):
       to calculate probability amplitudes as CPU does. If no GPU is available,
       a runtime error is raised.
 
+    * ``"statevector_chunked"``: A dense statevector simulation that provides
+      the same functionalities with ``"statevector"``, but stores the
+      statevector in memory-mapped chunk files on disk. Blocks of gates on
+      the qubits within a chunk are applied chunk by chunk in one streaming
+      pass over the files, and the other qubits are moved into the chunks by
+      swap gates. The number of qubits is limited by the free disk space in the chunk
+      directory instead of the system memory. This method is not available
+      on Windows.
+
     * ``"density_matrix"``: A dense density matrix simulation that may
       sample measurement outcomes from *noisy* circuits with all
       measurements at end of the circuit. It can only simulate half the
@@ -104,6 +117,14 @@ class QasmSimulator(AerBackend):
       automatically for each circuit based on the circuit instructions,
       number of qubits, and noise model.
 
+    **Autotuned Options**
+
+    The default values of the parallelization and fusion thresholds below
+    can be calibrated for the current machine using
+    :func:`~qiskit.providers.aer.utils.autotune`. The calibrated values
+    are used as defaults for any of these options that are not set. Fusion
+    options are only used for the ``"statevector"`` method.
+
     **Additional Backend Options**
 
     The following simulator specific backend options are supported
@@ -112,7 +133,10 @@ class QasmSimulator(AerBackend):
 
     * ``precision`` (str): Set the floating point precision for
       certain simulation methods to either ``"single"`` or ``"double"``
-      precision (default: ``"double"``).
+      precision (default: ``"double"``). For the ``"matrix_product_state"``
+      method the tensors are stored in single precision and the
+      contractions and the LAPACK SVD of two-qubit gates are computed in
+      single precision.
 
     * ``zero_threshold`` (double): Sets the threshold for truncating
       small values to zero in the result data (Default: 1e-10).
@@ -154,6 +178,33 @@ class QasmSimulator(AerBackend):
       Passes include gate fusion and truncation of unused qubits
       (Default: 12).
 
+    * ``checkpoint_directory`` (str): Sets the directory of the checkpoint
+      files of the circuits. A checkpoint stores the quantum state, the
+      classical registers of the completed shots and the random number
+      generator, and is named after the experiment index, the simulator
+      seed and a fingerprint of the circuit. Checkpoints are written
+      between the blocks of operations applied together by the simulator,
+      for measurement sampling, shots with sampled noise or simulated one
+      at a time, and shot branching. This applies to the
+      ``"statevector"``, ``"density_matrix"``, ``"stabilizer"`` and
+      ``"matrix_product_state"`` methods, and checkpoints are disabled if
+      empty (Default: ``""``).
+
+    * ``checkpoint_ops`` (int): Sets the number of operations between
+      checkpoints. If 0 checkpoints are only written after
+      ``checkpoint_seconds`` (Default: 0).
+
+    * ``checkpoint_seconds`` (double): Sets the time in seconds after which
+      a checkpoint is written. If ``checkpoint_ops`` is also set, a
+      checkpoint is written after a block of ``checkpoint_ops`` operations
+      only once this time has passed (Default: 0).
+
+    * ``checkpoint_resume`` (bool): If True, the simulation of a circuit
+      resumes from its checkpoint file if it exists, for example after
+      the process was interrupted. Resuming requires a fixed
+      ``seed_simulator``, see :meth:`resume`. The file is removed when the
+      circuit is completed (Default: False).
+
     These backend options only apply when using the ``"statevector"``
     simulation method:
 
@@ -170,6 +221,54 @@ class QasmSimulator(AerBackend):
       qubit optimized implementation of measurement sampling. Note
       that setting this two low can reduce performance (Default: 10)
 
+    * ``shot_branching_enable`` (bool): If True, the shots of an ideal
+      circuit with mid-circuit measurements or resets that cannot use
+      measurement sampling are simulated together. At each measurement
+      or reset the shots are split into branches for the sampled
+      outcomes, and the state is only copied when the shots take
+      different outcomes. Branches whose states coincide are merged
+      into one, and the memory of each shot is returned in shot order.
+      If False every shot is simulated separately.
+      This also applies to the ``"statevector_gpu"`` and
+      ``"statevector_thrust"`` methods (Default: True).
+
+    * ``statevector_allocator`` (str): Sets the allocation policy for the
+      state buffers. ``"hugepage"`` advises the kernel to back the buffers
+      with transparent huge pages, ``"interleaved"`` interleaves the pages
+      across all NUMA nodes, and ``"first_touch"`` writes the pages from the
+      OpenMP threads with the same static schedule as the gate kernels so
+      that each page is placed on the NUMA node of the thread that uses it.
+      The hugepage and interleaved policies are only applied on Linux. The
+      policy that was applied is reported in the ``statevector_allocator``
+      result metadata, which is ``"default"`` if the kernel rejected the
+      requested policy (Default: ``"default"``).
+
+    * ``statevector_shards`` (int): Sets the number of shards of the
+      statevector, for example the number of NUMA sockets. This must be a
+      power of two. If greater than 1, the pages of each shard of the state
+      buffers are placed on one NUMA node, round robin over the allowed
+      nodes (Linux only), and the circuit qubits are remapped so that
+      non-diagonal gates only act on qubits whose amplitude pairs lie in the
+      same shard. Swap gates exchange amplitudes between pairs of shards
+      when a gate needs a global qubit. The remapping only applies to the
+      ``"statevector"`` method above the parallel threshold. If the shards
+      were placed, their number is reported in the ``statevector_shards``
+      result metadata (Default: 1).
+
+    These backend options only apply when using the ``"statevector_chunked"``
+    simulation method:
+
+    * ``statevector_chunk_directory`` (str): Sets the directory for the
+      chunk files of the statevector. This should be on a fast local disk
+      (Default: ``$TMPDIR`` or ``/tmp``).
+
+    * ``statevector_chunk_qubits`` (int): Sets the number of qubits of the
+      amplitudes in each chunk. Only one chunk is resident in memory while a
+      block of gates is applied. Chunks are merged into files so that at most
+      64 chunk files are used for a statevector. The number of chunks and
+      streamed gate blocks are reported in the ``statevector_chunks`` result
+      metadata (Default: 20).
+
     These backend options only apply when using the ``"stabilizer"``
     simulation method:
 
@@ -256,10 +355,57 @@ class QasmSimulator(AerBackend):
       It is more efficient for a large number of shots, small number of qubits and low
       entanglement. ``"mps_apply_measure"`` creates a copy of the mps structure and
       makes a measurement on it. It is more effients for a small number of shots, high
-      number of qubits, and low entanglement. If the user does not specify the algorithm,
-      a heuristic algorithm is used to select between the two algorithms.
+      number of qubits, and low entanglement. ``"mps_conditional_probabilities"``
+      samples the qubits one by one from their conditional probabilities given the
+      outcomes of the previous qubits, computing each distinct prefix of outcomes once
+      for all of its shots without copying the mps structure. It is more efficient for
+      a high number of qubits and shots. If the user does not specify the algorithm,
+      a heuristic algorithm is used to select between the three algorithms.
       (Default: "mps_heuristic").
 
+    * ``mps_svd_algorithm`` (str): Choose the algorithm for the singular
+      value decompositions of two-qubit gates. ``"csvd"`` is the built-in
+      Golub-Kahan algorithm, ``"lapack"`` uses the LAPACK ``zgesdd`` routine,
+      and ``"randomized"`` computes only the singular values kept by
+      ``matrix_product_state_max_bond_dimension`` with a randomized SVD. If
+      the user does not specify the algorithm, ``"heuristic"`` chooses one
+      of them from the matrix size and the maximum bond dimension
+      (Default: "heuristic").
+
+    * ``mps_memory_budget_mb`` (int): Memory in MB for the tensors of the
+      matrix product state. When the memory approaches the budget, the
+      truncation threshold is raised, and then the maximum bond dimension is
+      lowered. The total weight of the discarded Schmidt coefficients is
+      reported in the ``matrix_product_state_discarded_weight`` result
+      metadata. Circuits whose estimated memory exceeds ``max_memory_mb``
+      are only rejected if the budget is 0 and
+      ``matrix_product_state_max_bond_dimension`` is set. If set to 0 the
+      truncation is not adapted (Default: 0).
+
+    * ``mps_initial_layout`` (bool): Choose the initial order of the qubits
+      in the chain of the matrix product state to minimize the distance of
+      the two-qubit gates of the circuit (Default: True).
+
+    * ``mps_routing_lookahead`` (int): Number of next two-qubit gates whose
+      distance is minimized when two non-adjacent qubits are moved together
+      by swaps. If set to 0 the second qubit of a gate is moved next to the
+      first one. The qubits are not moved back to their sorted order until
+      sampling the measurement outcomes, and the number of swaps is reported
+      in the ``matrix_product_state_swaps`` result metadata (Default: 16).
+
+    * ``mps_purification`` (bool): Apply the Kraus channels of the noise
+      model and the resets exactly, by adding purification qubits to the
+      matrix product state, instead of sampling one Kraus operator per shot.
+      The noisy expectation values and probabilities are then computed in a
+      single simulation, and the measurement outcomes of all shots are
+      sampled from it. The purification qubits of each channel are
+      compressed with the other purification qubits next to them, truncated
+      by the ``matrix_product_state_truncation_threshold`` and
+      ``matrix_product_state_max_bond_dimension`` options, and their number
+      is reported in the ``matrix_product_state_purification_qubits`` result
+      metadata. Statevector and amplitudes snapshots are not supported after
+      a purified channel (Default: False).
+
     These backend options apply in circuit optimization passes:
 
     * ``fusion_enable`` (bool): Enable fusion optimization in circuit
@@ -270,6 +416,32 @@ class QasmSimulator(AerBackend):
       in a fusion optimization [Default: 5]
     * ``fusion_threshold`` (int): Threshold that number of qubits must be greater
       than or equal to enable fusion optimization [Default: 14]
+    * ``fusion_cost_table`` (list[float]): Relative cost of applying a
+      k-qubit matrix to the state for k = 1, 2, ..., used by fusion to
+      choose the fused gates. If not set the costs are estimated from the
+      number of qubits [Default: None]
+    * ``fusion_reorder`` (bool): Reorder gates on disjoint qubits to group
+      gates acting on the same qubits before fusion [Default: True]
+    * ``commutation_enable`` (bool): Reorder commuting gates to group gates
+      acting on the same qubits and merge runs of diagonal gates into a
+      single diagonal gate before fusion [Default: True]
+    * ``commutation_threshold`` (int): Threshold that number of qubits must
+      be greater than or equal to enable commutation reordering
+      [Default: 14]
+    * ``commutation_verbose`` (bool): Output the reordered circuit into
+      metadata [Default: False]
+
+    These backend options apply to the ``"statevector"`` and
+    ``"statevector_gpu"`` methods without an initial statevector:
+
+    * ``clifford_prefix_enable`` (bool): Simulate the leading Clifford
+      gates of the circuit on a stabilizer tableau and initialize the
+      statevector from the resulting stabilizer state. This is skipped for
+      circuits with statevector snapshots since the tableau does not keep
+      the global phase of the state [Default: True]
+    * ``clifford_prefix_threshold`` (int): Threshold that number of qubits
+      must be greater than or equal to enable the Clifford prefix
+      [Default: 14]
     """
 
     _DEFAULT_CONFIGURATION = {
@@ -312,8 +484,9 @@ class QasmSimulator(AerBackend):
             QasmSimulator._AVAILABLE_METHODS = available_methods(
                 self._controller, [
                     'automatic', 'statevector', 'statevector_gpu',
-                    'statevector_thrust', 'density_matrix',
-                    'density_matrix_gpu', 'density_matrix_thrust',
+                    'statevector_thrust', 'statevector_chunked',
+                    'density_matrix', 'density_matrix_gpu',
+                    'density_matrix_thrust',
                     'stabilizer', 'matrix_product_state', 'extended_stabilizer'
                 ])
 
@@ -352,6 +525,40 @@ class QasmSimulator(AerBackend):
                   **options)
         return sim
 
+    def resume(self, qobj, checkpoint_directory, validate=False, **run_options):
+        """Resume a qobj from the checkpoints of an interrupted run.
+
+        The circuits of the qobj continue from their checkpoint files in
+        ``checkpoint_directory``, and the circuits without a checkpoint are
+        run from the start. The qobj, seed and options must be the same as
+        in the interrupted run.
+
+        Args:
+            qobj (QasmQobj): The Qobj of the interrupted run.
+            checkpoint_directory (str): The checkpoint directory of the
+                interrupted run.
+            validate (bool): validate the Qobj before running (default: False).
+            run_options (kwargs): additional run time backend options.
+
+        Returns:
+            AerJob: The simulation job.
+
+        Raises:
+            AerError: if the checkpoint directory does not exist or if
+                there is no simulator seed.
+        """
+        if not os.path.isdir(checkpoint_directory):
+            raise AerError('Checkpoint directory "{}" does not exist.'.format(
+                checkpoint_directory))
+        if ('seed_simulator' not in run_options
+                and 'seed_simulator' not in self.options
+                and getattr(qobj.config, 'seed_simulator', None) is None):
+            raise AerError('Resuming from checkpoints requires the'
+                           ' seed_simulator of the interrupted run.')
+        return self.run(qobj, validate=validate,
+                        checkpoint_directory=checkpoint_directory,
+                        checkpoint_resume=True, **run_options)
+
     def _execute(self, qobj):
         """Execute a qobj on the backend.
 
@@ -380,7 +587,8 @@ class QasmSimulator(AerBackend):
 
         # If key is method we update our configurations
         if key == 'method':
-            method_config = self._method_configuration(value)
+            method_config = self._method_configuration(
+                value, self.options.get('statevector_chunk_directory'))
             self._set_configuration_option('description', method_config.description)
             self._set_configuration_option('backend_name', method_config.backend_name)
             self._set_configuration_option('n_qubits', method_config.n_qubits)
@@ -394,9 +602,21 @@ class QasmSimulator(AerBackend):
                     set(basis_gates).intersection(noise_basis_gates))
             self._set_configuration_option('basis_gates', basis_gates)
 
+        # The chunked statevector qubit limit depends on the free disk
+        # space in the chunk directory
+        if (key == 'statevector_chunk_directory'
+                and self.options.get('method') == 'statevector_chunked'):
+            self._set_configuration_option(
+                'n_qubits', max_qubits_statevector_chunked(value))
+
         # Set all other options from AerBackend
         super()._set_option(key, value)
 
+    def _autotune_options(self, config):
+        """Return the autotuned default options for a qobj config."""
+        return autotune_options(getattr(config, 'method', 'automatic'),
+                                ['statevector', 'statevector_cpu'])
+
     def _validate(self, qobj):
         """Semantic validations of the qobj which cannot be done via schemas.
 
@@ -421,7 +641,7 @@ class QasmSimulator(AerBackend):
                         experiment.header.name)
 
     @staticmethod
-    def _method_configuration(method=None):
+    def _method_configuration(method=None, chunk_directory=None):
         """Return QasmBackendConfiguration."""
         # Default configuration
         config = QasmBackendConfiguration.from_dict(
@@ -431,6 +651,12 @@ class QasmSimulator(AerBackend):
         if method in ['statevector', 'statevector_gpu', 'statevector_thrust']:
             config.description = 'A C++ QasmQobj statevector simulator with noise'
 
+        # Chunked statevector method
+        elif method == 'statevector_chunked':
+            config.n_qubits = max_qubits_statevector_chunked(chunk_directory)
+            config.description = ('A C++ QasmQobj statevector simulator with noise '
+                                  'streaming memory-mapped chunk files')
+
         # Density Matrix methods
         elif method in [
                 'density_matrix', 'density_matrix_gpu', 'density_matrix_thrust'
@@ -21,6 +21,7 @@ from ..aererror import AerError
 from ..version import __version__
 from .aerbackend import AerBackend
 from .backend_utils import (cpp_execute, available_methods,
+                            autotune_options,
                             MAX_QUBITS_STATEVECTOR)
 # pylint: disable=import-error, no-name-in-module
 from .controller_wrappers import statevector_controller_execute
@@ -49,6 +50,13 @@ class StatevectorSimulator(AerBackend):
 
         backend = StatevectorSimulator(precision='single')
 
+    **Autotuned Options**
+
+    The default values of the parallelization and fusion thresholds below
+    can be calibrated for the current machine using
+    :func:`~qiskit.providers.aer.utils.autotune`. The calibrated values
+    are used as defaults for any of these options that are not set.
+
     **Backend Options**
 
     The following configurable backend options are supported
@@ -61,6 +69,12 @@ class StatevectorSimulator(AerBackend):
       certain simulation methods to either ``"single"`` or ``"double"``
       precision (default: ``"double"``).
 
+    * ``initial_statevector`` (vector_like or str): Sets a custom initial
+      statevector for the simulation instead of the all-zero state. This
+      may be a complex64 or complex128 NumPy array, which is read directly
+      from its memory by the simulator, or the path of a ``.npy`` file,
+      which is memory mapped (Default: None).
+
     * ``zero_threshold`` (double): Sets the threshold for truncating
       small values to zero in the result data (Default: 1e-10).
 
@@ -91,6 +105,17 @@ class StatevectorSimulator(AerBackend):
       max_parallel_threads. Note that setting this too low can reduce
       performance (Default: 14).
 
+    * ``statevector_allocator`` (str): Sets the allocation policy for the
+      state buffers. ``"hugepage"`` advises the kernel to back the buffers
+      with transparent huge pages, ``"interleaved"`` interleaves the pages
+      across all NUMA nodes, and ``"first_touch"`` writes the pages from the
+      OpenMP threads with the same static schedule as the gate kernels so
+      that each page is placed on the NUMA node of the thread that uses it.
+      The hugepage and interleaved policies are only applied on Linux. The
+      policy that was applied is reported in the ``statevector_allocator``
+      result metadata, which is ``"default"`` if the kernel rejected the
+      requested policy (Default: ``"default"``).
+
     These backend options apply in circuit optimization passes:
 
     * ``fusion_enable`` (bool): Enable fusion optimization in circuit
@@ -101,6 +126,20 @@ class StatevectorSimulator(AerBackend):
       in a fusion optimization [Default: 5]
     * ``fusion_threshold`` (int): Threshold that number of qubits must be greater
       than or equal to enable fusion optimization [Default: 14]
+    * ``fusion_cost_table`` (list[float]): Relative cost of applying a
+      k-qubit matrix to the state for k = 1, 2, ..., used by fusion to
+      choose the fused gates. If not set the costs are estimated from the
+      number of qubits [Default: None]
+    * ``fusion_reorder`` (bool): Reorder gates on disjoint qubits to group
+      gates acting on the same qubits before fusion [Default: True]
+    * ``commutation_enable`` (bool): Reorder commuting gates to group gates
+      acting on the same qubits and merge runs of diagonal gates into a
+      single diagonal gate before fusion [Default: True]
+    * ``commutation_threshold`` (int): Threshold that number of qubits must
+      be greater than or equal to enable commutation reordering
+      [Default: 14]
+    * ``commutation_verbose`` (bool): Output the reordered circuit into
+      metadata [Default: False]
     """
 
     _DEFAULT_CONFIGURATION = {
@@ -170,6 +209,11 @@ class StatevectorSimulator(AerBackend):
         """
         return cpp_execute(self._controller, qobj)
 
+    def _autotune_options(self, config):
+        """Return the autotuned default options for a qobj config."""
+        return autotune_options(getattr(config, 'method', 'automatic'),
+                                ['automatic', 'statevector', 'statevector_cpu'])
+
     def _validate(self, qobj):
         """Semantic validations of the qobj which cannot be done via schemas.
         Some of these may later move to backend schemas.
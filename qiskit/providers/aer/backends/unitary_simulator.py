@@ -63,8 +63,11 @@ class UnitarySimulator(AerBackend):
       certain simulation methods to either ``"single"`` or ``"double"``
       precision (default: ``"double"``).
 
-    * ``"initial_unitary"`` (matrix_like): Sets a custom initial unitary
-      matrix for the simulation instead of identity (Default: None).
+    * ``"initial_unitary"`` (matrix_like or str): Sets a custom initial
+      unitary matrix for the simulation instead of identity. This may be a
+      complex64 or complex128 NumPy array, which is read directly from its
+      memory by the simulator, or the path of a ``.npy`` file, which is
+      memory mapped (Default: None).
 
     * ``"validation_threshold"`` (double): Sets the threshold for checking
       if initial unitary and target unitary are unitary matrices.
@@ -97,6 +100,17 @@ class UnitarySimulator(AerBackend):
       max_parallel_threads. Note that setting this too low can reduce
       performance (Default: 14).
 
+    * ``statevector_allocator`` (str): Sets the allocation policy for the
+      state buffers. ``"hugepage"`` advises the kernel to back the buffers
+      with transparent huge pages, ``"interleaved"`` interleaves the pages
+      across all NUMA nodes, and ``"first_touch"`` writes the pages from the
+      OpenMP threads with the same static schedule as the gate kernels so
+      that each page is placed on the NUMA node of the thread that uses it.
+      The hugepage and interleaved policies are only applied on Linux. The
+      policy that was applied is reported in the ``statevector_allocator``
+      result metadata, which is ``"default"`` if the kernel rejected the
+      requested policy (Default: ``"default"``).
+
     These backend options apply in circuit optimization passes:
 
     * ``fusion_enable`` (bool): Enable fusion optimization in circuit
@@ -107,6 +121,20 @@ class UnitarySimulator(AerBackend):
       in a fusion optimization [Default: 5]
     * ``fusion_threshold`` (int): Threshold that number of qubits must be greater
       than or equal to enable fusion optimization [Default: 7]
+    * ``fusion_cost_table`` (list[float]): Relative cost of applying a
+      k-qubit matrix to the state for k = 1, 2, ..., used by fusion to
+      choose the fused gates. If not set the costs are estimated from the
+      number of qubits [Default: None]
+    * ``fusion_reorder`` (bool): Reorder gates on disjoint qubits to group
+      gates acting on the same qubits before fusion [Default: True]
+    * ``commutation_enable`` (bool): Reorder commuting gates to group gates
+      acting on the same qubits and merge runs of diagonal gates into a
+      single diagonal gate before fusion [Default: True]
+    * ``commutation_threshold`` (int): Threshold that number of qubits must
+      be greater than or equal to enable commutation reordering
+      [Default: 7]
+    * ``commutation_verbose`` (bool): Output the reordered circuit into
+      metadata [Default: False]
     """
 
     _DEFAULT_CONFIGURATION = {
@@ -21,28 +21,39 @@ template<typename T>
 class ControllerExecutor {
 public:
     ControllerExecutor() = default;
-    py::object operator()(const py::object &qobj) { return AerToPy::to_python(AER::controller_execute<T>(qobj)); }
+    py::object operator()(const py::object &qobj, const py::list &buffers) {
+        // Complex arrays referenced by {"aer_buffer": i} in the qobj are read
+        // directly from the memory of the numpy arrays
+        std::vector<JSON::Buffer> views;
+        for (const auto &buffer : buffers)
+            views.push_back(JSON::numpy_to_buffer(buffer));
+        JSON::BufferScope scope(std::move(views));
+        return AerToPy::to_python(AER::controller_execute<T>(qobj));
+    }
 };
 
 PYBIND11_MODULE(controller_wrappers, m) {
 
     py::class_<ControllerExecutor<AER::Simulator::QasmController> > qasm_ctrl (m, "qasm_controller_execute");
     qasm_ctrl.def(py::init<>());
-    qasm_ctrl.def("__call__", &ControllerExecutor<AER::Simulator::QasmController>::operator());
+    qasm_ctrl.def("__call__", &ControllerExecutor<AER::Simulator::QasmController>::operator(),
+        py::arg("qobj"), py::arg("buffers") = py::list());
     qasm_ctrl.def("__reduce__", [qasm_ctrl](const ControllerExecutor<AER::Simulator::QasmController> &self) {
         return py::make_tuple(qasm_ctrl, py::tuple());
     });
 
     py::class_<ControllerExecutor<AER::Simulator::StatevectorController> > statevec_ctrl (m, "statevector_controller_execute");
     statevec_ctrl.def(py::init<>());
-    statevec_ctrl.def("__call__", &ControllerExecutor<AER::Simulator::StatevectorController>::operator());
+    statevec_ctrl.def("__call__", &ControllerExecutor<AER::Simulator::StatevectorController>::operator(),
+        py::arg("qobj"), py::arg("buffers") = py::list());
     statevec_ctrl.def("__reduce__", [statevec_ctrl](const ControllerExecutor<AER::Simulator::StatevectorController> &self) {
         return py::make_tuple(statevec_ctrl, py::tuple());
     });
 
     py::class_<ControllerExecutor<AER::Simulator::UnitaryController> > unitary_ctrl (m, "unitary_controller_execute");
     unitary_ctrl.def(py::init<>());
-    unitary_ctrl.def("__call__", &ControllerExecutor<AER::Simulator::UnitaryController>::operator());
+    unitary_ctrl.def("__call__", &ControllerExecutor<AER::Simulator::UnitaryController>::operator(),
+        py::arg("qobj"), py::arg("buffers") = py::list());
     unitary_ctrl.def("__reduce__", [unitary_ctrl](const ControllerExecutor<AER::Simulator::UnitaryController> &self) {
         return py::make_tuple(unitary_ctrl, py::tuple());
     });
@@ -19,8 +19,6 @@
 from collections import OrderedDict
 import numpy as np
 from ...aererror import AerError
-# pylint: disable=no-name-in-module
-from .pulse_utils import oplist_to_array
 
 
 class DigestedPulseQobj:
@@ -187,6 +185,9 @@ def build_pulse_arrays(experiments, pulse_library):
     used in simulations and mapping of experimental pulse
     sequencies to pulse_idx sequencies and timings.
 
+    Waveforms with identical samples are stored only once, and all pulse
+    names sharing those samples are mapped to the same index.
+
     Parameters:
         experiments (list): list of experiments
         pulse_library (list): list of pulses
@@ -197,13 +198,18 @@ def build_pulse_arrays(experiments, pulse_library):
         maps pulses to the index at which the pulses start.
     """
     pulse_dict = {}
-    total_pulse_length = 0
+    waveforms = []
+    # maps the raw bytes of a waveform to its index in waveforms
+    waveform_index = {}
 
-    num_pulse = 0
     for pulse in pulse_library:
-        pulse_dict[pulse['name']] = num_pulse
-        total_pulse_length += len(pulse['samples'])
-        num_pulse += 1
+        samples = _pulse_samples_to_array(pulse['samples'])
+        pulse_int = waveform_index.setdefault(samples.tobytes(), len(waveforms))
+        if pulse_int == len(waveforms):
+            waveforms.append(samples)
+        pulse_dict[pulse['name']] = pulse_int
+
+    num_pulse = len(waveforms)
 
     idx = num_pulse + 1
     # now go through experiments looking for PV gates
@@ -214,50 +220,39 @@ def build_pulse_arrays(experiments, pulse_library):
                 if pulse['val'] not in [pval[1] for pval in pv_pulses] and pulse['val'] != 0:
                     pv_pulses.append((pulse['val'], idx))
                     idx += 1
-                    total_pulse_length += 1
 
     pulse_dict['pv'] = pv_pulses
 
-    pulses = np.empty(total_pulse_length, dtype=complex)
-    pulses_idx = np.zeros(idx + 1, dtype=np.uint32)
-
-    stop = 0
-    ind = 1
-    for _, pulse in enumerate(pulse_library):
-        stop = pulses_idx[ind - 1] + len(pulse['samples'])
-        pulses_idx[ind] = stop
-        oplist_to_array(format_pulse_samples(pulse['samples']), pulses, pulses_idx[ind - 1])
-        ind += 1
+    waveforms += [_pulse_samples_to_array([pv[0]]) for pv in pv_pulses]
 
-    for pv in pv_pulses:
-        stop = pulses_idx[ind - 1] + 1
-        pulses_idx[ind] = stop
-        oplist_to_array(format_pulse_samples([pv[0]]), pulses, pulses_idx[ind - 1])
-        ind += 1
+    pulses_idx = np.zeros(idx + 1, dtype=np.uint32)
+    if waveforms:
+        pulses = np.concatenate(waveforms)
+        pulses_idx[1:len(waveforms) + 1] = np.cumsum([len(samples) for samples in waveforms])
+    else:
+        pulses = np.empty(0, dtype=complex)
 
     return pulses, pulses_idx, pulse_dict
 
 
-def format_pulse_samples(pulse_samples):
-    """Converts input into a list of complex numbers, where each complex numbers is
-    given as a list of length 2. If it is already of this format, it simply returns it.
+def _pulse_samples_to_array(pulse_samples):
+    """Converts pulse samples into a flat complex array.
 
-    This function assumes the input is either an ndarray, a list of numpy complex number types,
-    or a list already in the desired format.
+    The samples may be an ndarray or list of complex numbers, or a list of
+    complex numbers each given as a list of length 2.
 
     Args:
         pulse_samples (list): An ndarray of complex numbers or a list
 
     Returns:
-        list: list of the required format
+        ndarray: complex array of samples
     """
+    samples = np.asarray(pulse_samples)
 
-    new_samples = list(pulse_samples)
-
-    if not np.iscomplexobj(new_samples[0]):
-        return new_samples
+    if not np.iscomplexobj(samples) and samples.ndim == 2:
+        samples = samples[:, 0] + 1j * samples[:, 1]
 
-    return [[samp.real, samp.imag] for samp in new_samples]
+    return np.ascontiguousarray(samples, dtype=complex).ravel()
 
 
 def experiment_to_structs(experiment, ham_chans, pulse_inds, pulse_to_int, dt, qubit_list=None):
@@ -284,36 +279,46 @@ def experiment_to_structs(experiment, ham_chans, pulse_inds, pulse_to_int, dt, q
     structs['header'] = experiment['header']
     structs['channels'] = OrderedDict()
     for chan_name in ham_chans:
-        structs['channels'][chan_name] = [[], []]
+        structs['channels'][chan_name] = [None, []]
     structs['acquire'] = []
     structs['cond'] = []
     structs['snapshot'] = []
     structs['tlist'] = []
     structs['can_sample'] = True
-    # This is a list that tells us whether
-    # the last PV pulse on a channel needs to
-    # be assigned a final time based on the next pulse on that channel
-    pv_needs_tf = [0] * len(ham_chans)
+
+    # position of each channel in structs['channels']
+    chan_pos = {chan_name: pos for pos, chan_name in enumerate(ham_chans)}
+    tlist_set = set()
+
+    # Pulse table rows for all channels, split per channel once all
+    # instructions have been read
+    row_chans = []
+    row_t0s = []
+    row_ints = []
+    row_conds = []
+    # Final times of PV pulses, keyed by row
+    pv_stops = {}
+    # Row of the last PV pulse on a channel which needs to be assigned
+    # a final time based on the next pulse on that channel
+    pv_needs_tf = {}
 
     # The instructions are time-ordered so just loop through them.
     for inst in experiment['instructions']:
         # Do D and U channels
-        if 'ch' in inst.keys() and inst['ch'][0] in ['d', 'u']:
+        if 'ch' in inst and inst['ch'][0] in ['d', 'u']:
             chan_name = inst['ch'].upper()
-            if chan_name not in ham_chans.keys():
+            pos = chan_pos.get(chan_name)
+            if pos is None:
                 raise ValueError('Channel {} is not in Hamiltonian model'.format(inst['ch']))
 
             # If last pulse on channel was a PV then need to set
             # its final time to be start time of current pulse
-            if pv_needs_tf[ham_chans[chan_name]]:
-                structs['channels'][chan_name][0][-3] = inst['t0'] * dt
-                pv_needs_tf[ham_chans[chan_name]] = 0
+            if pos in pv_needs_tf:
+                pv_stops[pv_needs_tf.pop(pos)] = inst['t0'] * dt
 
             # Get condtional info
-            if 'conditional' in inst.keys():
-                cond = inst['conditional']
-            else:
-                cond = -1
+            cond = inst.get('conditional', -1)
+
             # PV's
             if inst['name'] == 'pv':
                 # Get PV index
@@ -321,19 +326,21 @@ def experiment_to_structs(experiment, ham_chans, pulse_inds, pulse_to_int, dt, q
                     if pv[0] == inst['val']:
                         index = pv[1]
                         break
-                structs['channels'][chan_name][0].extend([inst['t0'] * dt, None, index, cond])
-                pv_needs_tf[ham_chans[chan_name]] = 1
+                pv_needs_tf[pos] = len(row_t0s)
+                row_chans.append(pos)
+                row_t0s.append(inst['t0'])
+                row_ints.append(index)
+                row_conds.append(cond)
 
             # ShiftPhase instructions
             elif inst['name'] == 'fc':
+                phases = structs['channels'][chan_name][1]
                 # get current phase value
                 current_phase = 0
-                if len(structs['channels'][chan_name][1]) > 0:
-                    current_phase = structs['channels'][chan_name][1][-2]
+                if len(phases) > 0:
+                    current_phase = phases[-2]
 
-                structs['channels'][chan_name][1].extend([inst['t0'] * dt,
-                                                          current_phase + inst['phase'],
-                                                          cond])
+                phases.extend([inst['t0'] * dt, current_phase + inst['phase'], cond])
 
             # SetPhase instruction
             elif inst['name'] == 'setp':
@@ -345,13 +352,10 @@ def experiment_to_structs(experiment, ham_chans, pulse_inds, pulse_to_int, dt, q
                 pass  # nothing to be done in this case
             # A standard pulse
             else:
-                start = inst['t0'] * dt
-                pulse_int = pulse_to_int[inst['name']]
-                pulse_width = (pulse_inds[pulse_int + 1] - pulse_inds[pulse_int]) * dt
-                stop = start + pulse_width
-                structs['channels'][chan_name][0].extend([start, stop, pulse_int, cond])
-
-                max_time = max(max_time, stop)
+                row_chans.append(pos)
+                row_t0s.append(inst['t0'])
+                row_ints.append(pulse_to_int[inst['name']])
+                row_conds.append(cond)
 
         # Take care of acquires and snapshots (bfuncs added )
         else:
@@ -374,7 +378,7 @@ def experiment_to_structs(experiment, ham_chans, pulse_inds, pulse_to_int, dt, q
                             np.asarray(qlist2, dtype=np.uint32),
                             np.asarray(mlist2, dtype=np.uint32)
                             ]
-                if 'register_slot' in inst.keys():
+                if 'register_slot' in inst:
                     acq_vals.append(np.asarray(inst['register_slot'],
                                                dtype=np.uint32))
                 else:
@@ -385,14 +389,13 @@ def experiment_to_structs(experiment, ham_chans, pulse_inds, pulse_to_int, dt, q
                 max_time = max(max_time, (inst['t0'] + inst['duration']) * dt)
 
                 # Add time to tlist
-                if inst['t0'] * dt not in structs['tlist']:
-                    structs['tlist'].append(inst['t0'] * dt)
+                _add_to_tlist(structs['tlist'], tlist_set, inst['t0'] * dt)
 
             # conditionals
             elif inst['name'] == 'bfunc':
                 bfun_vals = [inst['t0'] * dt, inst['mask'], inst['relation'],
                              inst['val'], inst['register']]
-                if 'memory' in inst.keys():
+                if 'memory' in inst:
                     bfun_vals.append(inst['memory'])
                 else:
                     bfun_vals.append(None)
@@ -403,8 +406,7 @@ def experiment_to_structs(experiment, ham_chans, pulse_inds, pulse_to_int, dt, q
                 max_time = max(max_time, inst['t0'] * dt)
 
                 # Add time to tlist
-                if inst['t0'] * dt not in structs['tlist']:
-                    structs['tlist'].append(inst['t0'] * dt)
+                _add_to_tlist(structs['tlist'], tlist_set, inst['t0'] * dt)
 
             # snapshots
             elif inst['name'] == 'snapshot':
@@ -413,24 +415,38 @@ def experiment_to_structs(experiment, ham_chans, pulse_inds, pulse_to_int, dt, q
                 structs['snapshot'].append([inst['t0'] * dt, inst['label']])
 
                 # Add time to tlist
-                if inst['t0'] * dt not in structs['tlist']:
-                    structs['tlist'].append(inst['t0'] * dt)
+                _add_to_tlist(structs['tlist'], tlist_set, inst['t0'] * dt)
 
                 # update max_time
                 max_time = max(max_time, inst['t0'] * dt)
 
-    # If any PVs still need time then they are at the end
-    # and should just go til final time
-    ham_keys = list(ham_chans.keys())
-    for idx, pp in enumerate(pv_needs_tf):
-        if pp:
-            structs['channels'][ham_keys[idx]][0][-3] = max_time
-            pv_needs_tf[idx] = 0
+    # Build the (start, stop, index, cond) rows of all pulses at once
+    row_chans = np.asarray(row_chans, dtype=np.intp)
+    row_ints = np.asarray(row_ints, dtype=np.intp)
+    starts = np.asarray(row_t0s, dtype=float) * dt
+    pulse_widths = np.diff(np.asarray(pulse_inds, dtype=np.int64))
+    stops = starts + pulse_widths[row_ints] * dt
+
+    is_pv = np.zeros(len(row_ints), dtype=bool)
+    is_pv[list(pv_stops) + list(pv_needs_tf.values())] = True
+    if np.any(~is_pv):
+        max_time = max(max_time, stops[~is_pv].max())
+
+    # PVs set by a later pulse end at that pulse, any still needing a time
+    # are at the end and should just go til final time
+    for row, stop in pv_stops.items():
+        stops[row] = stop
+    for row in pv_needs_tf.values():
+        stops[row] = max_time
+
+    table = np.column_stack((starts, stops, row_ints, np.asarray(row_conds, dtype=float)))
+    order = np.argsort(row_chans, kind='stable')
+    chan_counts = np.bincount(row_chans, minlength=len(chan_pos))
+    chan_tables = np.split(table[order], np.cumsum(chan_counts)[:-1])
 
     # Convert lists to numpy arrays
-    for key in structs['channels'].keys():
-        structs['channels'][key][0] = np.asarray(structs['channels'][key][0],
-                                                 dtype=float)
+    for pos, key in enumerate(structs['channels'].keys()):
+        structs['channels'][key][0] = chan_tables[pos].ravel()
         structs['channels'][key][1] = np.asarray(structs['channels'][key][1],
                                                  dtype=float)
 
@@ -440,3 +456,10 @@ def experiment_to_structs(experiment, ham_chans, pulse_inds, pulse_to_int, dt, q
         structs['can_sample'] = False
 
     return structs
+
+
+def _add_to_tlist(tlist, tlist_set, time):
+    """Append time to tlist, keeping the entries unique."""
+    if time not in tlist_set:
+        tlist_set.add(time)
+        tlist.append(time)
@@ -71,6 +71,7 @@ def pulse_controller(qobj):
     pulse_de_model.h_diag = ham_model._h_diag
     pulse_de_model.evals = ham_model._evals
     pulse_de_model.estates = ham_model._estates
+    pulse_de_model.h_ops_base = ham_model._h_ops_data
     dim_qub = ham_model._subsystem_dims
     dim_osc = {}
     # convert estates into a Qutip qobj
@@ -153,7 +154,7 @@ def pulse_controller(qobj):
     # solver options
     allowed_solver_options = ['atol', 'rtol', 'nsteps', 'max_step',
                               'num_cpus', 'norm_tol', 'norm_steps',
-                              'method']
+                              'method', 'analytic_idle']
     solver_options = getattr(config, 'solver_options', {})
     for key in solver_options:
         if key not in allowed_solver_options:
@@ -356,6 +357,9 @@ class PulseInternalDEModel:
         self.h_diag_elems = None
 
         self.h_ops_data = None
+        # RHS operator data of the noiseless Hamiltonian, shared with the
+        # (cached) HamiltonianModel
+        self.h_ops_base = None
 
         self._rhs_dict = None
 
@@ -368,9 +372,12 @@ class PulseInternalDEModel:
         self.vars_names = list(self.variables.keys())
 
         num_h_terms = len(self.system)
-        H = [hpart[0] for hpart in self.system]
         self.num_h_terms = num_h_terms
 
+        if self.h_ops_base is None:
+            self.h_ops_base = [-1.0j * hpart[0].data for hpart in self.system]
+        self.h_ops_data = list(self.h_ops_base)
+
         self.c_ops_data = []
         self.n_ops_data = []
 
@@ -394,10 +401,7 @@ class PulseInternalDEModel:
                 # Hamiltonian to decrease norm
                 H_noise = Operator(H_noise.data - 0.5j * n_op.data)
 
-            H = H + [H_noise]
-
-        # construct data sets
-        self.h_ops_data = [-1.0j * hpart.data for hpart in H]
+            self.h_ops_data.append(-1.0j * H_noise.data)
 
         self._rhs_dict = {'freqs': list(self.freqs.values()),
                           'pulse_array': self.pulse_array,
@@ -409,8 +413,9 @@ class PulseInternalDEModel:
                           'h_diag_elems': self.h_diag_elems}
 
     def init_rhs(self, exp):
-        """Set up and return rhs function corresponding to this model for a given
-        experiment exp
+        """Set up and return rhs functions corresponding to this model for a given
+        experiment exp, as a dict with the Python callable under 'rhs' and the
+        underlying C++ functor (used by native DE methods) under 'native_rhs'.
         """
 
         # if _rhs_dict has not been set up, config the internal data
@@ -427,7 +432,7 @@ class PulseInternalDEModel:
         def rhs(t, y):
             return ode_rhs_obj(t, y)
 
-        return rhs
+        return {'rhs': rhs, 'native_rhs': ode_rhs_obj}
 
 
 class PulseSimDescription:
@@ -52,6 +52,11 @@ class PulseSimOptions():
         reuse_seeds (bool, False): Reuse seeds, if already generated.
         store_final_state (bool, False): Whether or not to store the final state
                                         of the evolution.
+        analytic_idle (bool, False): Propagate intervals in which no pulse is played on any
+                                     channel analytically with the drift Hamiltonian, and only
+                                     run the DE solver over intervals with an active channel.
+                                     Only used for noiseless simulations whose
+                                     measurements are all at the end.
     """
 
     def __init__(self,
@@ -71,7 +76,8 @@ class PulseSimOptions():
                  shots=1024,
                  store_final_state=False,
                  seeds=None,
-                 reuse_seeds=False):
+                 reuse_seeds=False,
+                 analytic_idle=False):
 
         # set DE specific options
         self.de_options = DE_Options(method=method,
@@ -92,6 +98,7 @@ class PulseSimOptions():
         self.norm_tol = norm_tol
         self.norm_steps = norm_steps
         self.store_final_state = store_final_state
+        self.analytic_idle = analytic_idle
 
     def copy(self):
         """Create a copy."""
@@ -111,7 +118,8 @@ class PulseSimOptions():
                                shots=self.shots,
                                store_final_state=self.store_final_state,
                                seeds=self.seeds,
-                               reuse_seeds=self.reuse_seeds)
+                               reuse_seeds=self.reuse_seeds,
+                               analytic_idle=self.analytic_idle)
 
     def __str__(self):
         return str(vars(self))
@@ -137,16 +137,111 @@ def unitary_evolution(exp, y0, pulse_de_model, solver_options=None):
 
     tlist = exp['tlist']
 
-    for t in tlist[1:]:
-        ODE.integrate(t)
-        if ODE.successful():
-            psi = ODE.y / dznrm2(ODE.y)
-        else:
-            err_msg = 'ODE method exited with status: %s' % ODE.return_code()
-            raise Exception(err_msg)
+    if solver_options.analytic_idle:
+        psi, t_final = _evolution_with_idle_propagation(ODE, exp, y0, pulse_de_model)
+    else:
+        for t in tlist[1:]:
+            ODE.integrate(t)
+            if ODE.successful():
+                psi = ODE.y / dznrm2(ODE.y)
+            else:
+                err_msg = 'ODE method exited with status: %s' % ODE.return_code()
+                raise Exception(err_msg)
+        t_final = ODE.t
 
     # apply final rotation to come out of rotating frame
-    psi_rot = np.exp(-1j * pulse_de_model.h_diag_elems * ODE.t)
+    psi_rot = np.exp(-1j * pulse_de_model.h_diag_elems * t_final)
     psi *= psi_rot
 
-    return psi, ODE.t
+    return psi, t_final
+
+
+def _evolution_with_idle_propagation(ODE, exp, y0, pulse_de_model):
+    """
+    Evolve the state through the times in exp['tlist'], running the DE solver only
+    over intervals in which a pulse is played on some channel. In the remaining intervals
+    the RHS reduces to the drift Hamiltonian, and the state is propagated exactly using the
+    eigen-decomposition of the drift.
+
+    Parameters:
+        ODE (ODE_Method): DE solver set up for the experiment
+        exp (dict): dictionary containing experiment description
+        y0 (array): initial state
+        pulse_de_model (PulseInternalDEModel): container for de model
+
+    Returns:
+        tuple: the normalized state in the rotating frame and the final time
+
+    Raises:
+        Exception: if ODE solving has errors
+    """
+    active = _active_intervals(exp)
+    idx = 0
+
+    t = 0.
+    y = y0
+    for t_stop in exp['tlist'][1:]:
+        while t < t_stop:
+            # skip active intervals that are already finished
+            while idx < len(active) and active[idx][1] <= t:
+                idx += 1
+            start, stop = active[idx] if idx < len(active) else (np.inf, np.inf)
+
+            if start > t:
+                t_next = min(start, t_stop)
+                y = _drift_propagation(y, t, t_next, pulse_de_model)
+            else:
+                t_next = min(stop, t_stop)
+                ODE.t = t
+                ODE.y = y
+                ODE.integrate(t_next)
+                if not ODE.successful():
+                    err_msg = 'ODE method exited with status: %s' % ODE.return_code()
+                    raise Exception(err_msg)
+                y = ODE.y
+            t = t_next
+
+    return y / dznrm2(y), t
+
+
+def _active_intervals(exp):
+    """Return the sorted, disjoint time intervals in which a pulse is played on any channel.
+
+    Parameters:
+        exp (dict): dictionary containing experiment description
+
+    Returns:
+        list: list of [start, stop] intervals
+    """
+    intervals = []
+    for pulses, _ in exp['channels'].values():
+        intervals.extend(np.reshape(pulses, (-1, 4))[:, :2].tolist())
+    intervals.sort()
+
+    merged = []
+    for start, stop in intervals:
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], stop)
+        else:
+            merged.append([start, stop])
+    return merged
+
+
+def _drift_propagation(y, t0, tf, pulse_de_model):
+    """Propagate a rotating frame state from t0 to tf under the drift Hamiltonian.
+
+    Parameters:
+        y (array): state at time t0 in the frame rotating with the diagonal of the drift
+        t0 (float): initial time
+        tf (float): final time
+        pulse_de_model (PulseInternalDEModel): container for de model
+
+    Returns:
+        array: state at time tf in the rotating frame
+    """
+    h_diag = pulse_de_model.h_diag
+    estates = pulse_de_model.estates
+    # leave rotating frame, evolve in the drift eigenbasis, and re-enter the frame
+    y_lab = np.exp(-1j * h_diag * t0) * y
+    y_eig = np.exp(-1j * pulse_de_model.evals * (tf - t0)) * (estates.conj().T @ y_lab)
+    return np.exp(1j * h_diag * tf) * (estates @ y_eig)
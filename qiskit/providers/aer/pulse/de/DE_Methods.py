@@ -428,6 +428,120 @@ class RK4(ODE_Method):
         self._max_dt = options.max_dt
 
 
+class NativeODE(ODE_Method):
+    """Method wrapper for the time-stepping loops implemented in the ``pulse_utils`` extension.
+
+    To use:
+        - Specify 'native-RK4' (fixed step RK4 with step size bounded by ``max_dt``) or
+          'native-dopri5' (adaptive Dormand-Prince 5(4) using ``atol``, ``rtol``,
+          ``first_step``, ``min_step``, ``max_step`` and ``nsteps``) in DE_Options attribute
+          'method'.
+        - The rhs dict must contain, in addition to 'rhs', a 'native_rhs' entry with the
+          ``OdeRhsFunctor`` object returned by ``pulse_utils.get_ode_rhs_functor``.
+
+    Additional notes:
+        - The whole integration loop, including the evaluation of the rhs, runs in C++, so
+          there is no Python call overhead per stage. Only the state at the requested time is
+          returned to Python.
+        - With the 'step' kwarg, 'native-dopri5' takes a single adaptive step and
+          'native-RK4' advances by at most ``max_dt``.
+    """
+
+    method_spec = {'inner_state_spec': {'type': 'array', 'ndim': 1}}
+
+    def __init__(self, t0=None, y0=None, rhs=None, options=None):
+
+        # proposed size of the next adaptive step, kept between calls to integrate
+        self._h = None
+        self._native_rhs = None
+
+        super().__init__(t0, y0, rhs, options)
+
+    def set_rhs(self, rhs=None, reset=True):
+        """Set rhs functions, keeping the native rhs functor.
+
+        Raises:
+            Exception: if rhs dict has no native rhs functor
+        """
+
+        if isinstance(rhs, dict):
+            self._native_rhs = rhs.get('native_rhs', self._native_rhs)
+
+        if self._native_rhs is None:
+            raise Exception("NativeODE requires a 'native_rhs' entry in the rhs dict.")
+
+        super().set_rhs(rhs, reset)
+
+    def integrate(self, tf, **kwargs):
+        """Integrate up to a time tf.
+
+        Args:
+            tf (float): time to integrate up to
+            kwargs (dict): Supported kwargs:
+                            - 'step': if False, integrates up to tf, if True, only implements a
+                                      single step of the solver ('native-RK4' integrates up
+                                      to at most ``max_dt`` past the current time)
+        """
+
+        step = kwargs.get('step', False)
+        if step and self.options.method == 'RK4':
+            tf = min(tf, self._t + self.options.max_dt)
+        tlist = np.array([tf], dtype=float)
+        y0 = np.ascontiguousarray(self._y, dtype=complex)
+
+        try:
+            if self.options.method == 'RK4':
+                states = self._native_rhs.rk4(self._t, y0, tlist, self.options.max_dt)
+                self._t = tf
+            else:
+                states, self._t, self._h = self._native_rhs.dopri5(self._t, y0, tlist,
+                                                                   self._h or 0.,
+                                                                   self.options.atol,
+                                                                   self.options.rtol,
+                                                                   self.options.min_step,
+                                                                   self.options.max_step,
+                                                                   self.options.nsteps,
+                                                                   bool(step))
+        except RuntimeError as error:
+            self._successful = False
+            self._return_code = str(error)
+            return
+
+        self._y = states[-1]
+        self._successful = True
+        self._return_code = None
+
+    def _reset_method(self, reset=True):
+        """Discard the proposed step size."""
+        if reset:
+            self._h = self.options.first_step
+
+    def set_options(self, options):
+        # establish method
+        if options is None:
+            options = DE_Options(method='dopri5')
+        else:
+            options = options.copy()
+            if 'native-' in options.method:
+                options.method = options.method[7:]
+
+        if options.method not in ['RK4', 'dopri5']:
+            raise Exception('Unsupported native method {}.'.format(options.method))
+
+        # handle None-type defaults
+        if options.first_step is None:
+            options.first_step = 0
+
+        if options.max_step is None:
+            options.max_step = 0
+
+        if options.min_step is None:
+            options.min_step = 0
+
+        self.options = options
+        self._h = options.first_step
+
+
 def method_from_string(method_str):
     """Returns an ODE_Method specified by a string.
 
@@ -444,8 +558,12 @@ def method_from_string(method_str):
     if 'zvode-' in method_str:
         return QiskitZVODE
 
+    if 'native-' in method_str:
+        return NativeODE
+
     method_dict = {'RK4': RK4,
                    'scipy': ScipyODE,
-                   'zvode': QiskitZVODE}
+                   'zvode': QiskitZVODE,
+                   'native': NativeODE}
 
     return method_dict.get(method_str)
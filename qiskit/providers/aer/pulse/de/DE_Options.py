@@ -33,7 +33,9 @@ class DE_Options:
           relevant options.
 
     Attributes:
-        method (str, 'zvode-adams'): Integration method.
+        method (str, 'zvode-adams'): Integration method. Methods prefixed with 'scipy-',
+                                     'zvode-' and 'native-' (e.g. 'native-dopri5' or
+                                     'native-RK4') are supported.
         atol (float, 1e-8): Absolute tolerance for variable step solvers.
         rtol (float, 1e-6): Relative tolerance for variable step solvers.
         order (int, 12): Order of integrator.
@@ -11,16 +11,20 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
-# pylint: disable=eval-used, exec-used, invalid-name, missing-return-type-doc
+# pylint: disable=eval-used, invalid-name, missing-return-type-doc
 
 "HamiltonianModel class for system specification for the PulseSimulator"
 
+import copy
 from collections import OrderedDict
 import numpy as np
 import numpy.linalg as la
 from ...aererror import AerError
 from .string_model_parser.string_model_parser import HamiltonianParser
 
+# Maximum number of parsed Hamiltonian models kept in the model cache
+MODEL_CACHE_SIZE = 32
+
 
 class HamiltonianModel():
     """Hamiltonian model for pulse simulator."""
@@ -60,6 +64,8 @@ class HamiltonianModel():
         self._evals = None
         # Eigenstates of the time-indepedent hamiltonian
         self._estates = None
+        # Operator data in the form used by the RHS function
+        self._h_ops_data = None
 
         # populate self._channels
         self._calculate_hamiltonian_channels()
@@ -70,10 +76,19 @@ class HamiltonianModel():
         # populate self._h_diag, self._evals, self._estates
         self._compute_drift_data()
 
+        # populate self._h_ops_data
+        self._h_ops_data = [-1.0j * hpart[0].data for hpart in self._system]
+
     @classmethod
     def from_dict(cls, hamiltonian, subsystem_list=None):
         """Initialize from a Hamiltonian string specification.
 
+        Parsed models are stored in a module level cache keyed by the
+        content of the Hamiltonian dict and the subsystem list, so that
+        repeated constructions of the same model (e.g. across
+        :class:`~qiskit.providers.aer.PulseSimulator` instances) skip parsing
+        and the diagonalization of the drift Hamiltonian.
+
         Args:
             hamiltonian (dict): dictionary representing Hamiltonian in string specification.
             subsystem_list (list or None): List of subsystems to extract from the hamiltonian.
@@ -123,6 +138,13 @@ class HamiltonianModel():
         else:
             oscillator_dims = {}
 
+        cache_key = _model_cache_key(hamiltonian['h_str'], variables, subsystem_dims,
+                                     oscillator_dims, subsystem_list)
+        cached_model = _MODEL_CACHE.get(cache_key)
+        if cached_model is not None:
+            # Cached data is shared between copies and must not be modified in place
+            return copy.copy(cached_model)
+
         # Parse the Hamiltonian
         system = HamiltonianParser(h_str=hamiltonian['h_str'],
                                    dim_osc=oscillator_dims,
@@ -130,7 +152,15 @@ class HamiltonianModel():
         system.parse(subsystem_list)
         system = system.compiled
 
-        return cls(system, variables, subsystem_dims)
+        model = cls(system, variables, subsystem_dims)
+        _MODEL_CACHE.set(cache_key, model)
+
+        return copy.copy(model)
+
+    @staticmethod
+    def clear_cache():
+        """Clear the cache of models constructed with :meth:`from_dict`."""
+        _MODEL_CACHE.clear()
 
     def get_qubit_lo_from_drift(self):
         """ Computes a list of qubit frequencies corresponding to the exact energy
@@ -204,20 +234,16 @@ class HamiltonianModel():
             Exception: Missing index on channel.
         """
         # Get the diagonal elements of the hamiltonian with all the
-        # drive terms set to zero
-        for chan in self._channels:
-            exec('%s=0' % chan)
-
-        # might be a better solution to replace the 'var' in the hamiltonian
-        # string with 'op_system.vars[var]'
-        for var in self._variables:
-            exec('%s=%f' % (var, self._variables[var]))
+        # drive terms set to zero, evaluating the coefficients with the
+        # full precision values of the variables
+        namespace = {chan: 0 for chan in self._channels}
+        namespace.update(self._variables)
 
         full_dim = np.prod(list(self._subsystem_dims.values()))
 
         ham_full = np.zeros((full_dim, full_dim), dtype=complex)
         for ham_part in self._system:
-            ham_full += ham_part[0].data * eval(ham_part[1])
+            ham_full += ham_part[0].data * eval(ham_part[1], {'np': np}, namespace)
         # Remap eigenvalues and eigenstates
         evals, estates = la.eigh(ham_full)
 
@@ -244,6 +270,63 @@ class HamiltonianModel():
         self._h_diag = np.ascontiguousarray(np.diag(ham_full).real)
 
 
+class _ModelCache:
+    """Least recently used cache of parsed Hamiltonian models."""
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        self._models = OrderedDict()
+
+    def get(self, key):
+        """Return the model stored for key, or None if there is none."""
+        if key is None or key not in self._models:
+            return None
+        self._models.move_to_end(key)
+        return self._models[key]
+
+    def set(self, key, model):
+        """Store a model, discarding the least recently used one if full."""
+        if key is None:
+            return
+        self._models[key] = model
+        self._models.move_to_end(key)
+        while len(self._models) > self._max_size:
+            self._models.popitem(last=False)
+
+    def clear(self):
+        """Remove all models from the cache."""
+        self._models.clear()
+
+
+_MODEL_CACHE = _ModelCache(MODEL_CACHE_SIZE)
+
+
+def _model_cache_key(h_str, variables, subsystem_dims, oscillator_dims, subsystem_list):
+    """Return a hashable key for the content of a Hamiltonian specification.
+
+    Parameters:
+        h_str (list): list of Hamiltonian strings
+        variables (OrderedDict): Hamiltonian variables
+        subsystem_dims (dict): qubit subspace dimensions
+        oscillator_dims (dict): oscillator subspace dimensions
+        subsystem_list (list): subsystems extracted from the Hamiltonian
+    Returns:
+        tuple or None: the cache key, or None if the specification is not hashable
+    """
+    if isinstance(h_str, str):
+        h_str = [h_str]
+    key = (tuple(h_str),
+           tuple(variables.items()),
+           tuple(sorted(subsystem_dims.items())),
+           tuple(sorted(oscillator_dims.items())),
+           tuple(subsystem_list or []))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 def _hamiltonian_pre_parse_exceptions(hamiltonian):
     """Raises exceptions for hamiltonian specification.
 
@@ -19,7 +19,7 @@ Utilities (:mod:`qiskit.providers.aer.utils`)
 
 This module contains utility functions for modifying
 :class:`~qiskit.providers.aer.noise.NoiseModel` objects and ``QuantumCircuits``
-using noise models.
+using noise models, and for calibrating the simulators on the current machine.
 
 
 Classes
@@ -41,6 +41,7 @@ Functions
     insert_noise
     approximate_quantum_error
     approximate_noise_model
+    autotune
 """
 
 from .noise_remapper import remap_noise_model
@@ -48,3 +49,4 @@ from .noise_transformation import NoiseTransformer
 from .noise_transformation import approximate_quantum_error
 from .noise_transformation import approximate_noise_model
 from .noise_model_inserter import insert_noise
+from .autotune import autotune
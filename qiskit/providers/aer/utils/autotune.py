@@ -0,0 +1,305 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Calibrate simulator parallelization thresholds for the current machine.
+"""
+
+import datetime
+import json
+import logging
+import os
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.quantum_info import random_unitary
+from qiskit.util import local_hardware_info
+
+from ..aererror import AerError
+from ..backends.qasm_simulator import QasmSimulator
+from ..backends.backend_utils import (autotune_profile_path,
+                                      autotune_profile_key, cpu_model)
+from ..version import __version__
+
+logger = logging.getLogger(__name__)
+
+# Ranks of the extended stabilizer decomposition used for calibration
+EXTENDED_STABILIZER_RANKS = [16, 32, 64, 128, 256, 512, 1024]
+
+# Candidate values of the matrix product state parallel threshold
+MPS_THRESHOLDS = [1, 2, 4, 8, 14, 32, 64, 128]
+
+# Candidate values of the maximum number of fused qubits
+FUSION_MAX_QUBITS = [2, 3, 4, 5]
+
+
+def autotune(filename=None, min_qubits=8, max_qubits=22, depth=10,
+             shots=10000, repeats=3):
+    """Calibrate the simulator parallelization thresholds for this machine.
+
+    This runs micro-benchmarks of the statevector gate kernels, gate
+    fusion, measurement sampling, extended stabilizer and matrix product
+    state simulation to find the following options for the current
+    machine:
+
+    * ``statevector_parallel_threshold``: the number of qubits above which
+      OpenMP parallelization of the gate kernels is faster.
+    * ``fusion_cost_table``: the time of applying a k-qubit matrix to a
+      ``max_qubits`` qubit state relative to a single-qubit matrix.
+    * ``fusion_threshold``: the number of qubits from which gate fusion
+      is faster.
+    * ``fusion_max_qubit``: the fused gate size with the fastest simulation
+      of ``max_qubits`` qubits.
+    * ``statevector_sample_measure_opt``: the number of qubits above which
+      the large qubit measurement sampling algorithm is faster.
+    * ``extended_stabilizer_parallel_threshold``: the decomposition rank
+      above which OpenMP parallelization is faster.
+    * ``mps_parallel_threshold``: the fastest matrix product state OpenMP
+      threshold for a ``max_qubits`` qubit circuit.
+
+    The options are stored in a JSON profile under a key for the CPU model
+    and core count of the machine, so that a profile shared between
+    machines keeps the options of each of them. The
+    :class:`~qiskit.providers.aer.QasmSimulator` and
+    :class:`~qiskit.providers.aer.StatevectorSimulator` use the options of
+    the current machine as defaults for any of these options that are not
+    set.
+
+    Args:
+        filename (str): the profile file. If None the
+            ``QISKIT_AER_AUTOTUNE_PROFILE`` environment variable is used,
+            or ``~/.qiskit/aer_autotune.json`` if it is not set
+            (Default: None).
+        min_qubits (int): the smallest number of qubits benchmarked
+            (Default: 8).
+        max_qubits (int): the largest number of qubits benchmarked
+            (Default: 22).
+        depth (int): the number of gate layers of the benchmark circuits
+            (Default: 10).
+        shots (int): the number of shots of the measurement sampling
+            benchmark (Default: 10000).
+        repeats (int): the number of times each benchmark is run, the
+            fastest time is used (Default: 3).
+
+    Returns:
+        dict: the autotuned options.
+
+    Raises:
+        AerError: if the qubit range is invalid or a benchmark fails.
+    """
+    if min_qubits < 2 or max_qubits < min_qubits:
+        raise AerError('Invalid autotune qubit range ({}, {}).'.format(
+            min_qubits, max_qubits))
+    tuner = _Autotuner(min_qubits, max_qubits, depth, shots, repeats)
+
+    options = {}
+    options['statevector_parallel_threshold'] = tuner.parallel_threshold()
+    options['fusion_cost_table'] = tuner.fusion_cost_table(options)
+    options['fusion_threshold'] = tuner.fusion_threshold(options)
+    options['fusion_max_qubit'] = tuner.fusion_max_qubit(options)
+    options['statevector_sample_measure_opt'] = tuner.sample_measure_opt(options)
+    options['extended_stabilizer_parallel_threshold'] = \
+        tuner.extended_stabilizer_threshold()
+    options['mps_parallel_threshold'] = tuner.mps_threshold()
+
+    # Update the entry of this machine in the profile
+    if filename is None:
+        filename = autotune_profile_path()
+    profile = {}
+    if os.path.exists(filename):
+        try:
+            with open(filename) as file:
+                profile = json.load(file)
+        except ValueError:
+            logger.warning('Overwriting invalid autotune profile "%s".', filename)
+    profile[autotune_profile_key()] = {
+        'cpu_model': cpu_model(),
+        'cpus': local_hardware_info()['cpus'],
+        'date': datetime.datetime.now().isoformat(),
+        'qiskit_aer_version': __version__,
+        'options': options
+    }
+    directory = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(directory, exist_ok=True)
+    tmp_filename = filename + '.tmp'
+    with open(tmp_filename, 'w') as file:
+        json.dump(profile, file, indent=2, sort_keys=True)
+    os.replace(tmp_filename, filename)
+    return options
+
+
+class _Autotuner:
+    """Benchmarks for the autotuned options."""
+
+    def __init__(self, min_qubits, max_qubits, depth, shots, repeats):
+        self.qubits = list(range(min_qubits, max_qubits + 1))
+        self.depth = depth
+        self.shots = shots
+        self.repeats = repeats
+        self.simulator = QasmSimulator()
+
+    def layered_circuit(self, num_qubits, measure=False):
+        """Return a circuit of single-qubit gate and CX layers."""
+        circuit = QuantumCircuit(num_qubits)
+        for layer in range(self.depth):
+            for qubit in range(num_qubits):
+                circuit.u3(0.1 * (layer + 1), 0.2 * (qubit + 1), 0.3, qubit)
+            for qubit in range(layer % 2, num_qubits - 1, 2):
+                circuit.cx(qubit, qubit + 1)
+        if measure:
+            circuit.measure_all()
+        return circuit
+
+    def time(self, circuit, shots=1, **options):
+        """Return the fastest simulation time of a circuit."""
+        qobj = assemble(circuit, shots=shots)
+        times = []
+        for _ in range(self.repeats):
+            result = self.simulator.run(qobj, max_parallel_threads=0,
+                                        **options).result()
+            if not result.success:
+                raise AerError('Autotune benchmark failed ({}).'.format(
+                    result.status))
+            times.append(result.to_dict()['results'][0]['time_taken'])
+        return min(times)
+
+    @staticmethod
+    def crossover(timings):
+        """Return the index of the first (enabled, disabled) timing from
+        which the enabled timing is faster for every larger size, or None."""
+        index = None
+        for i, (enabled, disabled) in enumerate(timings):
+            if enabled < disabled:
+                if index is None:
+                    index = i
+            else:
+                index = None
+        return index
+
+    def qubit_threshold(self, timings, default):
+        """Return the qubit threshold that must be exceeded to enable an
+        optimization from (enabled, disabled) timings for each size."""
+        index = self.crossover(timings)
+        return default if index is None else self.qubits[index] - 1
+
+    def parallel_threshold(self):
+        """Benchmark OpenMP parallelization of the gate kernels."""
+        timings = []
+        for num_qubits in self.qubits:
+            circuit = self.layered_circuit(num_qubits)
+            options = {'method': 'statevector', 'fusion_enable': False}
+            timings.append((
+                self.time(circuit, statevector_parallel_threshold=num_qubits - 1,
+                          **options),
+                self.time(circuit, statevector_parallel_threshold=num_qubits,
+                          **options)))
+        return self.qubit_threshold(timings, self.qubits[-1])
+
+    def fusion_cost_table(self, tuned):
+        """Benchmark the matrix kernels used by gate fusion."""
+        num_qubits = self.qubits[-1]
+        options = {'method': 'statevector', 'fusion_enable': False,
+                   'statevector_parallel_threshold':
+                       tuned['statevector_parallel_threshold']}
+        gate_times = []
+        for size in range(1, min(max(FUSION_MAX_QUBITS), num_qubits) + 1):
+            circuit = QuantumCircuit(num_qubits)
+            num_gates = 0
+            for layer in range(self.depth):
+                matrix = random_unitary(2 ** size, seed=layer)
+                for qubit in range(0, num_qubits - size + 1, size):
+                    circuit.unitary(matrix, range(qubit, qubit + size))
+                    num_gates += 1
+            gate_times.append(self.time(circuit, **options) / num_gates)
+        return [round(gate_time / gate_times[0], 3) for gate_time in gate_times]
+
+    def fusion_threshold(self, tuned):
+        """Benchmark gate fusion."""
+        timings = []
+        options = {'method': 'statevector',
+                   'fusion_cost_table': tuned['fusion_cost_table'],
+                   'statevector_parallel_threshold':
+                       tuned['statevector_parallel_threshold']}
+        for num_qubits in self.qubits:
+            circuit = self.layered_circuit(num_qubits)
+            timings.append((
+                self.time(circuit, fusion_threshold=num_qubits, **options),
+                self.time(circuit, fusion_enable=False, **options)))
+        # Fusion is enabled for circuits with at least fusion_threshold qubits
+        return self.qubit_threshold(timings, self.qubits[-1]) + 1
+
+    def fusion_max_qubit(self, tuned):
+        """Benchmark the size of fused gates."""
+        circuit = self.layered_circuit(self.qubits[-1])
+        options = {'method': 'statevector', 'fusion_threshold': 1,
+                   'fusion_cost_table': tuned['fusion_cost_table'],
+                   'statevector_parallel_threshold':
+                       tuned['statevector_parallel_threshold']}
+        timings = [self.time(circuit, fusion_max_qubit=max_qubit, **options)
+                   for max_qubit in FUSION_MAX_QUBITS]
+        return FUSION_MAX_QUBITS[timings.index(min(timings))]
+
+    def sample_measure_opt(self, tuned):
+        """Benchmark the measurement sampling algorithms."""
+        timings = []
+        options = {'method': 'statevector',
+                   'statevector_parallel_threshold':
+                       tuned['statevector_parallel_threshold'],
+                   'fusion_cost_table': tuned['fusion_cost_table'],
+                   'fusion_threshold': tuned['fusion_threshold'],
+                   'fusion_max_qubit': tuned['fusion_max_qubit']}
+        for num_qubits in self.qubits:
+            circuit = self.layered_circuit(num_qubits, measure=True)
+            timings.append((
+                self.time(circuit, shots=self.shots,
+                          statevector_sample_measure_opt=num_qubits - 1,
+                          **options),
+                self.time(circuit, shots=self.shots,
+                          statevector_sample_measure_opt=num_qubits,
+                          **options)))
+        return self.qubit_threshold(timings, self.qubits[-1])
+
+    def extended_stabilizer_threshold(self):
+        """Benchmark OpenMP parallelization of the extended stabilizer."""
+        # A single non-Clifford gate with a small extent gives a
+        # decomposition rank of about 1 / approximation_error ** 2
+        circuit = QuantumCircuit(self.qubits[0])
+        for qubit in range(self.qubits[0]):
+            circuit.h(qubit)
+        for qubit in range(self.qubits[0] - 1):
+            circuit.cx(qubit, qubit + 1)
+        circuit.u1(1e-3, 0)
+        for layer in range(self.depth):
+            for qubit in range(layer % 2, self.qubits[0] - 1, 2):
+                circuit.cx(qubit, qubit + 1)
+                circuit.s(qubit)
+        timings = []
+        for rank in EXTENDED_STABILIZER_RANKS:
+            options = {'method': 'extended_stabilizer',
+                       'extended_stabilizer_approximation_error': rank ** -0.5}
+            timings.append((
+                self.time(circuit, extended_stabilizer_parallel_threshold=1,
+                          **options),
+                self.time(circuit, extended_stabilizer_parallel_threshold=2 ** 62,
+                          **options)))
+        index = self.crossover(timings)
+        if index is None:
+            return EXTENDED_STABILIZER_RANKS[-1]
+        return EXTENDED_STABILIZER_RANKS[index] - 1
+
+    def mps_threshold(self):
+        """Benchmark OpenMP parallelization of matrix product states."""
+        circuit = self.layered_circuit(self.qubits[-1])
+        timings = [self.time(circuit, method='matrix_product_state',
+                             mps_parallel_threshold=threshold)
+                   for threshold in MPS_THRESHOLDS]
+        return MPS_THRESHOLDS[timings.index(min(timings))]
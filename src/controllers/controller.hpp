@@ -538,6 +538,8 @@ Result Controller::execute(std::vector<Circuit> &circuits,
   // Initialize Result object for the given number of experiments
   const auto num_circuits = circuits.size();
   Result result(num_circuits);
+  for (size_t j = 0; j < num_circuits; ++j)
+    circuits[j].index = j;
 
   // Execute each circuit in a try block
   try {
@@ -15,16 +15,30 @@
 #ifndef _aer_qasm_controller_hpp_
 #define _aer_qasm_controller_hpp_
 
+#include <chrono>
+#include <cstdio>
+#include <fstream>
+#include <iomanip>
+#include <limits>
+#include <map>
+#include <numeric>
+#include <sstream>
+
 #include "controller.hpp"
+#include "framework/checkpoint.hpp"
 #include "simulators/density_matrix/densitymatrix_state.hpp"
 #include "simulators/extended_stabilizer/extended_stabilizer_state.hpp"
 #include "simulators/matrix_product_state/matrix_product_state.hpp"
 #include "simulators/stabilizer/stabilizer_state.hpp"
 #include "simulators/statevector/qubitvector.hpp"
+#include "simulators/statevector/qubitvector_chunked.hpp"
 #include "simulators/statevector/statevector_state.hpp"
 #include "simulators/superoperator/superoperator_state.hpp"
+#include "transpile/clifford_prefix.hpp"
+#include "transpile/commutation.hpp"
 #include "transpile/delay_measure.hpp"
 #include "transpile/fusion.hpp"
+#include "transpile/local_qubits.hpp"
 
 namespace AER {
 namespace Simulator {
@@ -39,11 +53,34 @@ namespace Simulator {
  *   optimizations passes for an ideal circuit [Default: 0].
  * - "optimize_noise_threshold" (int): Qubit threshold for running circuit
  *   optimizations passes for a noisy circuit [Default: 12].
+ * - "shot_branching_enable" (bool): Simulate the shots of an ideal
+ *   statevector circuit with mid-circuit measurements or resets together,
+ *   branching the shots at each sampled outcome and merging the branches
+ *   whose states coincide [Default: True].
+ * - "checkpoint_directory" (str): Directory of the checkpoint files of the
+ *   circuits, for measure sampling, shots simulated one at a time with or
+ *   without sampled noise, and shot branching. Checkpoints are written
+ *   between the blocks of ops applied together by the State, and are
+ *   supported by the statevector, density_matrix, stabilizer and
+ *   matrix_product_state methods. Checkpoints are disabled if empty
+ *   [Default: ""].
+ * - "checkpoint_ops" (int): Number of operations between checkpoints. If 0
+ *   checkpoints are only written after checkpoint_seconds [Default: 0].
+ * - "checkpoint_seconds" (double): Time in seconds after which a checkpoint
+ *   is written. If checkpoint_ops is also set, a checkpoint is written
+ *   after checkpoint_ops operations once this time has passed [Default: 0].
+ * - "checkpoint_resume" (bool): Resume the simulation of a circuit from its
+ *   checkpoint file if it exists. The file is named by the experiment
+ *   index, the simulator seed and a fingerprint of the circuit, so resuming
+ *   requires a fixed "seed_simulator". The file is removed when the
+ *   circuit is completed [Default: False].
  *
  * From Statevector::State class
  *
  * - "initial_statevector" (json complex vector): Use a custom initial
  *      statevector for the simulation [Default: null].
+ *      It can also be a reference {"aer_buffer": i} to a buffer of the
+ *      JSON::BufferScope, e.g. a numpy array passed by the Python bindings.
  * - "zero_threshold" (double): Threshold for truncating small values to
  *      zero in result data [Default: 1e-10]
  * - "statevector_parallel_threshold" (int): Threshold that number of qubits
@@ -89,6 +126,22 @@ namespace Simulator {
  *if the approximation reduces the number of coefficients to 0, we will not
  *perform any approximation.
  *
+ * - "mps_memory_budget_mb" (int): Memory in MB for the tensors of the matrix
+ *product state. When the memory approaches the budget, the truncation
+ *threshold is raised, and then the maximum bond dimension is lowered. If a
+ *budget is set, circuits whose estimated memory exceeds max_memory_mb are not
+ *rejected. Set to 0 to disable the adaptive truncation. [Default: 0]
+ *
+ * - "mps_initial_layout" (bool): Choose the initial order of the qubits in
+ *the chain to minimize the distance of the two-qubit gates. [Default: true]
+ *
+ * - "mps_routing_lookahead" (int): Number of next two-qubit gates whose
+ *distance is minimized when moving two qubits together. [Default: 16]
+ *
+ * - "mps_purification" (bool): Apply the Kraus channels of the noise model
+ *and resets to new purification qubits of the matrix product state instead
+ *of sampling them for every shot. [Default: false]
+ *
  * From BaseController Class
  *
  * - "noise_model" (json): A noise model to use for simulation [Default: null]
@@ -118,6 +171,24 @@ namespace Simulator {
  *       in a fusion optimization [Default: 5]
  * - fusion_threshold (int): Threshold that number of qubits must be greater
  *       than or equal to enable fusion optimization [Default: 14]
+ * - fusion_cost_table (list[double]): Relative cost of applying a k-qubit
+ *       matrix to the state for k = 1, 2, ... [Default: []]
+ * - fusion_reorder (bool): Reorder gates on disjoint qubits to group gates
+ *       on the same qubits before fusion [Default: True]
+ *
+ * From Transpile:CommutationReorder Class
+ * - commutation_enable (bool): Reorder commuting gates to group gates on the
+ *       same qubits and merge diagonal gates before fusion [Default: True]
+ * - commutation_threshold (int): Threshold that number of qubits must be
+ *       greater than or equal to enable commutation reordering [Default: 14]
+ * - commutation_verbose (bool): Output the reordered circuit into metadata
+ *       [Default: False]
+ *
+ * From Transpile:CliffordPrefix Class
+ * - clifford_prefix_enable (bool): Simulate the leading Clifford gates of
+ *       a statevector simulation on the stabilizer tableau [Default: True]
+ * - clifford_prefix_threshold (int): Threshold that number of qubits must be
+ *       greater than or equal to enable the Clifford prefix [Default: 14]
  *
  **************************************************************************/
 
@@ -153,6 +224,7 @@ class QasmController : public Base::Controller {
     statevector,
     statevector_thrust_gpu,
     statevector_thrust_cpu,
+    statevector_chunked,
     density_matrix,
     density_matrix_thrust_gpu,
     density_matrix_thrust_cpu,
@@ -190,6 +262,18 @@ class QasmController : public Base::Controller {
                            const Noise::NoiseModel& noise,
                            bool validate = false) const;
 
+  // Check the memory requirements of a circuit for a State subclass
+  using Base::Controller::validate_memory_requirements;
+
+  // A matrix product state is only checked against max_memory_mb if its
+  // bond dimensions are bounded by max_bond_dimension. Without a bound the
+  // estimate is the worst case of the circuit, which low entanglement
+  // circuits never reach, and with a memory budget the adaptive truncation
+  // keeps the tensors within the budget
+  bool validate_memory_requirements(const MatrixProductState::State& state,
+                                    const Circuit& circ,
+                                    bool throw_except) const;
+
   // Initialize a State subclass to a given initial state
   template <class State_t, class Initstate_t>
   void initialize_state(const Circuit& circ,
@@ -207,10 +291,50 @@ class QasmController : public Base::Controller {
                                      const Operations::OpSet &opset,
                                      const json_t& config) const;
 
+  // Return a local qubit transpilation pass for sharded statevectors
+  // configured for the current method and config
+  Transpile::LocalQubits transpile_local_qubits(Method method,
+                                                const json_t& config) const;
+
+  // Return a commutation reordering transpilation pass configured for the
+  // current method and config
+  Transpile::CommutationReorder transpile_commutation(Method method,
+                                                      const json_t& config) const;
+
+  // Return a Clifford prefix transpilation pass configured for the
+  // current method and config
+  Transpile::CliffordPrefix transpile_clifford_prefix(Method method,
+                                                      const json_t& config) const;
+
   //----------------------------------------------------------------
   // Run circuit helpers
   //----------------------------------------------------------------
 
+  // Checkpoint file of the simulation of a circuit
+  struct CheckpointFile {
+    // Path of the file, empty if checkpoints are disabled
+    std::string path;
+    // Name of the State class and fingerprint of the simulation
+    std::string method;
+    uint_t fingerprint = 0;
+    // Schedule of the next checkpoint
+    Checkpoint::Schedule schedule;
+    // Number of checkpoints written
+    uint_t num_checkpoints = 0;
+    // Header of the checkpoint the simulation was resumed from
+    Checkpoint::Header header;
+  };
+
+  // Progress of the shots of a circuit simulated one shot at a time
+  struct ShotsProgress {
+    // Index of the current shot
+    uint_t shot = 0;
+    // State of the RNG engine at the start of the current shot
+    std::string shot_rng;
+    // Memory and register of each completed shot
+    std::vector<std::string> cregs;
+  };
+
   // Execute n-shots of a circuit on the input state
   template <class State_t, class Initstate_t>
   void run_circuit_helper(const Circuit& circ,
@@ -244,6 +368,20 @@ class QasmController : public Base::Controller {
                       ExperimentResult& result,
                       RngEngine& rng) const;
 
+  // Execute n-shots of a circuit one shot at a time. The circuit of each
+  // shot is returned by shot_circuit, which can sample it with the RNG
+  // engine. If checkpoints are enabled, the checkpoints store the state of
+  // the current shot and the classical registers of the completed shots.
+  template <class State_t, class Initstate_t>
+  void run_shots(const Circuit& circ,
+                 uint_t shots,
+                 State_t& state,
+                 const Initstate_t& initial_state,
+                 const std::string& mode,
+                 const std::function<const Circuit&(RngEngine&)>& shot_circuit,
+                 ExperimentResult& result,
+                 RngEngine& rng) const;
+
   template <class State_t, class Initstate_t>
   void run_circuit_with_sampled_noise(const Circuit& circ,
                                       const Noise::NoiseModel& noise,
@@ -260,9 +398,11 @@ class QasmController : public Base::Controller {
   //----------------------------------------------------------------
 
   // Sample measurement outcomes for the input measure ops from the
-  // current state of the input State_t
+  // current state of the input State_t. The outcome transitions of the
+  // input Kraus ops are applied to the sampled outcomes of each shot
   template <class State_t>
   void measure_sampler(const std::vector<Operations::Op>& meas_ops,
+                       const std::vector<Operations::Op>& kraus_ops,
                        uint_t shots,
                        State_t& state,
                        ExperimentResult& result,
@@ -274,6 +414,209 @@ class QasmController : public Base::Controller {
   bool check_measure_sampling_opt(const Circuit& circ,
                                   const Method method) const;
 
+  // Check if measure sampling optimization is valid for the input circuit,
+  // set rule to the name of the analysis rule that enabled or blocked
+  // measure sampling for the circuit, and set sampled_kraus to the
+  // positions of the Kraus ops that must be applied to the sampled outcomes
+  // instead of the state
+  bool check_measure_sampling_opt(const Circuit& circ,
+                                  const Method method,
+                                  std::string& rule,
+                                  std::vector<size_t>& sampled_kraus) const;
+
+  // Return true if the Kraus op at position pos in the circuit maps
+  // computational basis states to computational basis states, and only
+  // ops with the same property act on its qubits up to the first
+  // measurement. Its effect on the measurement outcomes is then a
+  // stochastic transition of the sampled outcomes
+  bool is_averaged_kraus(const Circuit& circ, size_t pos) const;
+
+  // Return true if every Kraus matrix of the op has at most one nonzero
+  // entry in each row. This includes diagonal Kraus channels, mixtures of
+  // Pauli or permutation unitaries, and amplitude damping
+  bool is_classical_kraus(const Operations::Op& op) const;
+
+  //----------------------------------------------------------------
+  // Shot branching optimization
+  //----------------------------------------------------------------
+
+  // Execute n-shots of a circuit with mid-circuit measurements or resets
+  // by simulating the shots together until a measure or reset, and splitting
+  // them into a branch for each sampled outcome. Returns false if shot
+  // branching is not supported for the State_t class.
+  template <class State_t, class Initstate_t>
+  bool run_shot_branching(const Circuit& circ,
+                          uint_t shots,
+                          State_t& state,
+                          const Initstate_t& initial_state,
+                          ExperimentResult& result,
+                          RngEngine& rng) const;
+
+  template <class statevec_t, class Initstate_t>
+  bool run_shot_branching(const Circuit& circ,
+                          uint_t shots,
+                          Statevector::State<statevec_t>& state,
+                          const Initstate_t& initial_state,
+                          ExperimentResult& result,
+                          RngEngine& rng) const;
+
+  // A branch of shots that share the state of the qubits. The shots are
+  // grouped by their classical register, since branches with different
+  // classical registers are merged if their states coincide after the last
+  // op that reads the classical registers.
+  template <class vector_t>
+  struct ShotBranch {
+    // Saved state of the branch, empty for the branch held by the State
+    vector_t qreg;
+    // Outcomes of the measures and resets applied to the branch
+    std::vector<uint_t> outcomes;
+    // Classical registers and the indices of their shots
+    std::vector<std::pair<ClassicalRegister, reg_t>> cregs;
+  };
+
+  // Execute the branches of shots from the op at position pos in the
+  // circuit to the end of the circuit. The branches are simulated op by op
+  // together, and merged when their states coincide. On input the state of
+  // the branch without a saved state, if any, is held by the State.
+  // At most max_saved_states copies of the state are saved, otherwise the
+  // branches are simulated one at a time. The classical register of each
+  // shot is stored in shot_cregs. If checkpoint is not null, checkpoints of
+  // the branches are written between the ops applied to all the branches.
+  template <class statevec_t, class Initstate_t, class vector_t>
+  void run_shot_branches(const Circuit& circ,
+                         size_t pos,
+                         size_t last_creg_read,
+                         std::vector<ShotBranch<vector_t>>& branches,
+                         Statevector::State<statevec_t>& state,
+                         const Initstate_t& initial_state,
+                         uint_t max_saved_states,
+                         std::vector<ClassicalRegister>& shot_cregs,
+                         ExperimentResult& result,
+                         RngEngine& rng,
+                         uint_t& num_branches,
+                         uint_t& num_merges,
+                         CheckpointFile* checkpoint) const;
+
+  // Return a fingerprint of the probabilities of a saved state. States
+  // that are equal up to a global phase have the same fingerprint.
+  template <class vector_t>
+  double branch_signature(const vector_t& qreg) const;
+
+  // Return true if two saved states are equal up to a global phase
+  template <class vector_t>
+  bool same_branch_state(const vector_t& qreg0, const vector_t& qreg1) const;
+
+  // Simulate the state of a branch again from the start of the circuit to
+  // the op at position pos, applying the recorded outcomes of its measures
+  // and resets
+  template <class statevec_t, class Initstate_t>
+  void replay_shot_branch(const Circuit& circ,
+                          size_t pos,
+                          Statevector::State<statevec_t>& state,
+                          const Initstate_t& initial_state,
+                          const std::vector<uint_t>& outcomes,
+                          ExperimentResult& result,
+                          RngEngine& rng) const;
+
+  // Check if shot branching optimization is valid for the input circuit
+  // for the given method. This checks if the circuit only contains
+  // operations that are applied in the same way to every shot of a branch
+  bool check_shot_branching_opt(const Circuit& circ,
+                                const Method method) const;
+
+  //----------------------------------------------------------------
+  // Checkpoints
+  //----------------------------------------------------------------
+
+  // Return true if checkpoints are enabled by the config
+  bool checkpoint_enabled() const;
+
+  // Return the checkpoint file of a circuit simulated with the named
+  // execution mode. The path is empty if checkpoints are disabled or not
+  // supported by the State_t class.
+  template <class State_t>
+  CheckpointFile checkpoint_file(const Circuit& circ,
+                                 const State_t& state,
+                                 const std::string& mode,
+                                 uint_t shots) const;
+
+  // Open the checkpoint file of a circuit and read its header if the
+  // simulation is resumed. Returns false if there is no checkpoint to resume.
+  bool open_checkpoint(CheckpointFile& file,
+                       std::ifstream& in,
+                       ExperimentResult& result) const;
+
+  // Write a checkpoint file with the header of the op position and shot,
+  // followed by the data written by write_data
+  void write_checkpoint(CheckpointFile& file,
+                        uint_t position,
+                        uint_t shot,
+                        const std::function<void(std::ostream&)>& write_data) const;
+
+  // Remove the checkpoint file of a completed circuit and add the
+  // checkpoint metadata
+  void close_checkpoint(const CheckpointFile& file,
+                        ExperimentResult& result) const;
+
+  // Apply the ops of a state evolution from position pos. If checkpoints are
+  // enabled, a checkpoint of the state and of the progress of the shots is
+  // written when it is due, between the blocks of ops applied together by
+  // the State_t class.
+  template <class State_t>
+  void apply_ops_with_checkpoints(const std::vector<Operations::Op>& ops,
+                                  uint_t pos,
+                                  State_t& state,
+                                  CheckpointFile& file,
+                                  const ShotsProgress& progress,
+                                  ExperimentResult& result,
+                                  RngEngine& rng,
+                                  bool final_ops) const;
+
+  // Write a checkpoint of the progress of the shots. If position is not 0
+  // the classical register and the state of the current shot are written.
+  template <class State_t>
+  void save_shots_checkpoint(CheckpointFile& file,
+                             uint_t position,
+                             uint_t shot,
+                             const ShotsProgress& progress,
+                             const State_t& state,
+                             const RngEngine& rng) const;
+
+  // Read the progress of the shots and the state of the RNG engine from a
+  // checkpoint written by save_shots_checkpoint
+  void load_shots_progress(std::istream& in,
+                           ShotsProgress& progress,
+                           std::string& rng_state) const;
+
+  // Read the classical register and the state of the current shot from a
+  // checkpoint written by save_shots_checkpoint. The state must be
+  // initialized with the number of qubits of the saved state.
+  template <class State_t>
+  void load_shot_state(std::istream& in, State_t& state) const;
+
+  // Write a checkpoint of the branches of shot branching at the op at
+  // position pos. The state of the branch with index held is written from
+  // the State.
+  template <class statevec_t, class vector_t>
+  void save_branches_checkpoint(CheckpointFile& file,
+                                uint_t pos,
+                                const std::vector<ShotBranch<vector_t>>& branches,
+                                size_t held,
+                                const Statevector::State<statevec_t>& state,
+                                const RngEngine& rng,
+                                uint_t num_branches,
+                                uint_t num_merges) const;
+
+  // Read the branches written by save_branches_checkpoint. The state of the
+  // branch that was held is loaded into the State.
+  template <class statevec_t, class vector_t>
+  void load_branches_checkpoint(std::istream& in,
+                                std::vector<ShotBranch<vector_t>>& branches,
+                                Statevector::State<statevec_t>& state,
+                                RngEngine& rng,
+                                uint_t& num_branches,
+                                uint_t& num_merges) const;
+
   //-----------------------------------------------------------------------
   // Config
   //-----------------------------------------------------------------------
@@ -289,6 +632,15 @@ class QasmController : public Base::Controller {
   // Initial statevector for Statevector simulation method
   cvector_t initial_statevector_;
 
+  // Enable the shot branching optimization
+  bool shot_branching_enable_ = true;
+
+  // Checkpoints of the state
+  std::string checkpoint_directory_;
+  uint_t checkpoint_ops_ = 0;
+  double checkpoint_seconds_ = 0.;
+  bool checkpoint_resume_ = false;
+
   // TODO: initial stabilizer state
 
 };
@@ -314,6 +666,8 @@ void QasmController::set_config(const json_t& config) {
       simulation_method_ = Method::statevector_thrust_gpu;
     } else if (method == "statevector_thrust") {
       simulation_method_ = Method::statevector_thrust_cpu;
+    } else if (method == "statevector_chunked") {
+      simulation_method_ = Method::statevector_chunked;
     } else if (method == "density_matrix" || method == "density_matrix_cpu") {
       simulation_method_ = Method::density_matrix;
     } else if (method == "density_matrix_gpu") {
@@ -333,6 +687,24 @@ void QasmController::set_config(const json_t& config) {
     }
   }
 
+  JSON::get_value(shot_branching_enable_, "shot_branching_enable", config);
+
+  // Checkpoints of the state
+  JSON::get_value(checkpoint_directory_, "checkpoint_directory", config);
+  JSON::get_value(checkpoint_ops_, "checkpoint_ops", config);
+  JSON::get_value(checkpoint_seconds_, "checkpoint_seconds", config);
+  JSON::get_value(checkpoint_resume_, "checkpoint_resume", config);
+
+  // Memory budget for the adaptive truncation of the matrix product state
+  uint_t mps_memory_budget_mb = 0;
+  JSON::get_value(mps_memory_budget_mb, "mps_memory_budget_mb", config);
+  MatrixProductState::MPS::set_memory_budget_mb(mps_memory_budget_mb);
+
+  // Purification of the noise of the matrix product state
+  bool mps_purification = false;
+  JSON::get_value(mps_purification, "mps_purification", config);
+  MatrixProductState::MPS::set_purification(mps_purification);
+
   std::string precision;
   if (JSON::get_value(precision, "precision", config)) {
     if (precision == "double") {
@@ -369,6 +741,11 @@ void QasmController::clear_config() {
   Base::Controller::clear_config();
   simulation_method_ = Method::automatic;
   initial_statevector_ = cvector_t();
+  shot_branching_enable_ = true;
+  checkpoint_directory_.clear();
+  checkpoint_ops_ = 0;
+  checkpoint_seconds_ = 0.;
+  checkpoint_resume_ = false;
 }
 
 //-------------------------------------------------------------------------
@@ -438,6 +815,21 @@ void QasmController::run_circuit(const Circuit& circ,
       }
 #endif
     }
+    case Method::statevector_chunked: {
+      if (simulation_precision_ == Precision::double_precision) {
+        // Double-precision chunked Statevector simulation
+        return run_circuit_helper<
+            Statevector::State<QV::QubitVectorChunked<double>>>(
+            circ, noise, config, shots, rng_seed, initial_statevector_,
+            Method::statevector_chunked, result);
+      } else {
+        // Single-precision chunked Statevector simulation
+        return run_circuit_helper<
+            Statevector::State<QV::QubitVectorChunked<float>>>(
+            circ, noise, config, shots, rng_seed, initial_statevector_,
+            Method::statevector_chunked, result);
+      }
+    }
     case Method::density_matrix: {
       if (simulation_precision_ == Precision::double_precision) {
         // Double-precision density matrix simulation
@@ -581,6 +973,23 @@ QasmController::Method QasmController::simulation_method(
       return Method::statevector_thrust_cpu;
 #endif
     }
+    case Method::statevector_chunked: {
+      // Memory requirements are for one streamed chunk, or the full vector
+      // for statevector snapshots. The disk space for the chunk files is
+      // checked when the chunk files are created.
+      if (validate) {
+        if (simulation_precision_ == Precision::single_precision) {
+          Statevector::State<QV::QubitVectorChunked<float>> state;
+          validate_state(state, circ, noise_model, true);
+          validate_memory_requirements(state, circ, true);
+        } else {
+          Statevector::State<QV::QubitVectorChunked<double>> state;
+          validate_state(state, circ, noise_model, true);
+          validate_memory_requirements(state, circ, true);
+        }
+      }
+      return Method::statevector_chunked;
+    }
     case Method::density_matrix: {
       if (validate) {
         if (simulation_precision_ == Precision::single_precision) {
@@ -742,6 +1151,15 @@ size_t QasmController::required_memory_mb(
         return state.required_memory_mb(circ.num_qubits, circ.ops);
       }
     }
+    case Method::statevector_chunked: {
+      if (simulation_precision_ == Precision::single_precision) {
+        Statevector::State<QV::QubitVectorChunked<float>> state;
+        return state.required_memory_mb(circ.num_qubits, circ.ops);
+      } else {
+        Statevector::State<QV::QubitVectorChunked<double>> state;
+        return state.required_memory_mb(circ.num_qubits, circ.ops);
+      }
+    }
     case Method::density_matrix:
     case Method::density_matrix_thrust_cpu:
     case Method::density_matrix_thrust_gpu: {
@@ -796,7 +1214,8 @@ Transpile::Fusion QasmController::transpile_fusion(Method method,
     }
     case Method::statevector:
     case Method::statevector_thrust_gpu:
-    case Method::statevector_thrust_cpu: {
+    case Method::statevector_thrust_cpu:
+    case Method::statevector_chunked: {
       if (fusion_pass.allow_kraus) {
         // Halve default max fused qubits for Kraus noise fusion
         fusion_pass.max_qubit /= 2;
@@ -813,9 +1232,78 @@ Transpile::Fusion QasmController::transpile_fusion(Method method,
   return fusion_pass;
 }
 
+Transpile::LocalQubits QasmController::transpile_local_qubits(Method method,
+                                                             const json_t& config) const {
+  Transpile::LocalQubits local_pass;
+  local_pass.set_config(config);
+  // Only the OpenMP statevector is sharded across NUMA sockets, and the
+  // chunked statevector keeps the operations on the qubits within a chunk
+  if (method == Method::statevector_chunked) {
+    int chunk_qubits = QV::QubitVectorChunked<>::DEFAULT_CHUNK_QUBITS;
+    JSON::get_value(chunk_qubits, "statevector_chunk_qubits", config);
+    local_pass.local_qubits = std::max(chunk_qubits, 1);
+    local_pass.threshold = local_pass.local_qubits;
+  } else if (method != Method::statevector) {
+    local_pass.active = false;
+  }
+  return local_pass;
+}
+
+Transpile::CommutationReorder QasmController::transpile_commutation(Method method,
+                                                                   const json_t& config) const {
+  Transpile::CommutationReorder commutation_pass;
+  switch (method) {
+    case Method::statevector:
+    case Method::statevector_thrust_gpu:
+    case Method::statevector_thrust_cpu:
+    case Method::statevector_chunked:
+      break;
+    case Method::density_matrix:
+    case Method::density_matrix_thrust_gpu:
+    case Method::density_matrix_thrust_cpu: {
+      // Halve the default threshold and group size as for fusion
+      commutation_pass.threshold /= 2;
+      commutation_pass.max_qubit /= 2;
+      break;
+    }
+    default: {
+      commutation_pass.active = false;
+      return commutation_pass;
+    }
+  }
+  commutation_pass.set_config(config);
+  return commutation_pass;
+}
+
+Transpile::CliffordPrefix QasmController::transpile_clifford_prefix(Method method,
+                                                                   const json_t& config) const {
+  Transpile::CliffordPrefix prefix_pass;
+  switch (method) {
+    case Method::statevector:
+    case Method::statevector_thrust_gpu:
+    case Method::statevector_thrust_cpu:
+      break;
+    default: {
+      prefix_pass.active = false;
+      return prefix_pass;
+    }
+  }
+  prefix_pass.set_config(config);
+  prefix_pass.threads = std::max<int>(1, parallel_state_update_);
+  return prefix_pass;
+}
+
 void QasmController::set_parallelization_circuit(
     const Circuit& circ,
     const Noise::NoiseModel& noise_model) {
+  // The shots of a circuit with checkpoints are run in turn so that
+  // a single file records their progress
+  if (checkpoint_enabled()) {
+    parallel_shots_ = 1;
+    parallel_state_update_ =
+        std::max<int>({1, max_parallel_threads_ / parallel_experiments_});
+    return;
+  }
   const auto method = simulation_method(circ, noise_model, false);
   switch (method) {
     case Method::statevector:
@@ -825,7 +1313,12 @@ void QasmController::set_parallelization_circuit(
     case Method::matrix_product_state: {
       if (circ.shots == 1 ||
           (!noise_model.has_quantum_errors() &&
-           check_measure_sampling_opt(circ, Method::statevector))) {
+           check_measure_sampling_opt(circ, Method::statevector)) ||
+          (noise_model.is_ideal() &&
+           check_shot_branching_opt(circ, method)) ||
+          (method == Method::matrix_product_state &&
+           MatrixProductState::MPS::get_purification() &&
+           check_measure_sampling_opt(circ, method))) {
         parallel_shots_ = 1;
         parallel_state_update_ =
             std::max<int>({1, max_parallel_threads_ / parallel_experiments_});
@@ -834,6 +1327,14 @@ void QasmController::set_parallelization_circuit(
       Base::Controller::set_parallelization_circuit(circ, noise_model);
       break;
     }
+    case Method::statevector_chunked: {
+      // Parallel shots would each need their own set of chunk files, so all
+      // threads are used for state update
+      parallel_shots_ = 1;
+      parallel_state_update_ =
+          std::max<int>({1, max_parallel_threads_ / parallel_experiments_});
+      return;
+    }
     case Method::density_matrix:
     case Method::density_matrix_thrust_gpu:
     case Method::density_matrix_thrust_cpu: {
@@ -853,6 +1354,17 @@ void QasmController::set_parallelization_circuit(
   }
 }
 
+bool QasmController::validate_memory_requirements(
+    const MatrixProductState::State& state,
+    const Circuit& circ,
+    bool throw_except) const {
+  if (MatrixProductState::MPS::get_memory_budget_mb() > 0 ||
+      MatrixProductState::MPS_Tensor::get_max_bond_dimension() == UINT64_MAX)
+    return true;
+  return Base::Controller::validate_memory_requirements(state, circ,
+                                                        throw_except);
+}
+
 //-------------------------------------------------------------------------
 // Run circuit helpers
 //-------------------------------------------------------------------------
@@ -869,11 +1381,12 @@ void QasmController::run_circuit_helper(const Circuit& circ,
   // Initialize new state object
   State_t state;
 
+  // Set state config
+  state.set_config(config);
+
   // Check memory requirements, raise exception if they're exceeded
   validate_memory_requirements(state, circ, true);
 
-  // Set state config
-  state.set_config(config);
   state.set_parallalization(parallel_state_update_);
   state.set_global_phase(circ.global_phase_angle);
 
@@ -884,7 +1397,6 @@ void QasmController::run_circuit_helper(const Circuit& circ,
   // Output data container
   result.set_config(config);
   result.metadata.add(state.name(), "method");
-  state.add_metadata(result);
 
   // Add measure sampling to metadata
   // Note: this will set to `true` if sampling is enabled for the circuit
@@ -900,6 +1412,13 @@ void QasmController::run_circuit_helper(const Circuit& circ,
   else if (noise.has_quantum_errors() == false) {
     opt_circ = noise.sample_noise(circ, rng);
   }
+  // Purified noise is applied once as Kraus channels
+  else if (method == Method::matrix_product_state &&
+           MatrixProductState::MPS::get_purification()) {
+    auto noise_kraus = noise;
+    noise_kraus.activate_kraus_method();
+    opt_circ = noise_kraus.sample_noise(circ, rng);
+  }
   // Superop noise sampling
   else if (method == Method::density_matrix ||
            method == Method::density_matrix_thrust_gpu ||
@@ -920,19 +1439,39 @@ void QasmController::run_circuit_helper(const Circuit& circ,
   else {
     run_circuit_with_sampled_noise(circ, noise, config, shots, state,
                                    initial_state, method, result, rng);
+    state.add_metadata(result);
     return;
   }
 
   // Optimize circuit
   Noise::NoiseModel dummy_noise;
+  auto prefix_pass = transpile_clifford_prefix(method, config);
+  // The prefix is replaced by an initialize instruction holding a copy of
+  // the state, which is copied again by measure sampling
+  if (!initial_state.empty() ||
+      3 * state.required_memory_mb(opt_circ.num_qubits, opt_circ.ops) >
+          max_memory_mb_ / std::max<int>(1, parallel_experiments_)) {
+    prefix_pass.active = false;
+  }
+  prefix_pass.optimize_circuit(opt_circ, dummy_noise, state.opset(), result);
   Transpile::DelayMeasure measure_pass;
   measure_pass.set_config(config);
   measure_pass.optimize_circuit(opt_circ, dummy_noise, state.opset(), result);
+  auto commutation_pass = transpile_commutation(method, config);
+  commutation_pass.optimize_circuit(opt_circ, dummy_noise, state.opset(), result);
   auto fusion_pass = transpile_fusion(method, opt_circ.opset(), config);
   fusion_pass.optimize_circuit(opt_circ, dummy_noise, state.opset(), result);
+  // Fused operations are remapped to local qubits after fusion, so that the
+  // inserted swaps are not fused with gates on global qubits
+  auto local_pass = transpile_local_qubits(method, config);
+  local_pass.optimize_circuit(opt_circ, dummy_noise, state.opset(), result);
 
   // Run simulation
   run_multi_shot(opt_circ, shots, state, initial_state, method, result, rng);
+
+  // State metadata is added after the run so that it reports the memory
+  // allocation that was actually applied
+  state.add_metadata(result);
 }
 
 template <class State_t, class Initstate_t>
@@ -955,31 +1494,127 @@ void QasmController::run_multi_shot(const Circuit& circ,
                                     ExperimentResult& result,
                                     RngEngine& rng) const {
   // Check if measure sampler and optimization are valid
-  if (check_measure_sampling_opt(circ, method)) {
+  std::string sampling_rule;
+  std::vector<size_t> sampled_kraus;
+  const bool can_sample =
+      check_measure_sampling_opt(circ, method, sampling_rule, sampled_kraus);
+  result.metadata.add(sampling_rule, "measure_sampling_rule");
+  if (can_sample) {
     // Implement measure sampler
     auto pos = circ.first_measure_pos;  // Position of first measurement op
 
-    // Run circuit instructions before first measure
-    std::vector<Operations::Op> ops(circ.ops.begin(),
-                                    circ.ops.begin() + pos);
+    // Run circuit instructions before first measure. The Kraus ops that
+    // map basis states to basis states are applied to the sampled outcomes
+    std::vector<bool> skip(pos, false);
+    std::vector<Operations::Op> kraus_ops;
+    for (const auto i : sampled_kraus) {
+      skip[i] = true;
+      if (!std::all_of(circ.ops[i].mats.begin(), circ.ops[i].mats.end(),
+                       [this](const cmatrix_t& mat) {
+                         return Utils::is_diagonal(mat, validation_threshold_);
+                       }))
+        kraus_ops.push_back(circ.ops[i]);
+    }
+    std::vector<Operations::Op> ops;
+    ops.reserve(pos);
+    for (size_t i = 0; i < pos; ++i) {
+      if (!skip[i])
+        ops.push_back(circ.ops[i]);
+    }
     bool final_ops = (pos == circ.ops.size());
     initialize_state(circ, state, initial_state);
-    state.apply_ops(ops, result, rng, final_ops);
+    auto checkpoint = checkpoint_file(circ, state, "measure_sampling", shots);
+    ShotsProgress progress;
+    uint_t start = 0;
+    std::ifstream in;
+    if (open_checkpoint(checkpoint, in, result)) {
+      std::string rng_state;
+      load_shots_progress(in, progress, rng_state);
+      rng.set_state(rng_state);
+      load_shot_state(in, state);
+      start = checkpoint.header.position;
+    }
+    apply_ops_with_checkpoints(ops, start, state, checkpoint, progress, result,
+                               rng, final_ops);
+    close_checkpoint(checkpoint, result);
 
     // Get measurement operations and set of measured qubits
     ops = std::vector<Operations::Op>(circ.ops.begin() + pos,
                                       circ.ops.end());
-    measure_sampler(ops, shots, state, result, rng);
+    measure_sampler(ops, kraus_ops, shots, state, result, rng);
 
     // Add measure sampling metadata
     result.metadata.add(true, "measure_sampling");
+  } else if (check_shot_branching_opt(circ, method) &&
+             run_shot_branching(circ, shots, state, initial_state, result, rng)) {
+    // Add shot branching metadata
+    result.metadata.add(true, "shot_branching");
   } else {
     // Perform standard execution if we cannot apply the
     // measurement sampling optimization
+    run_shots(circ, shots, state, initial_state, "shots",
+              [&circ](RngEngine&) -> const Circuit& { return circ; },
+              result, rng);
+  }
+}
+
+template <class State_t, class Initstate_t>
+void QasmController::run_shots(
+    const Circuit& circ,
+    uint_t shots,
+    State_t& state,
+    const Initstate_t& initial_state,
+    const std::string& mode,
+    const std::function<const Circuit&(RngEngine&)>& shot_circuit,
+    ExperimentResult& result,
+    RngEngine& rng) const {
+  auto checkpoint = checkpoint_file(circ, state, mode, shots);
+  if (checkpoint.path.empty()) {
     while (shots-- > 0) {
-      run_single_shot(circ, state, initial_state, result, rng);
+      run_single_shot(shot_circuit(rng), state, initial_state, result, rng);
     }
+    return;
   }
+
+  // The results of the completed shots are saved again on resume. The
+  // circuit of the interrupted shot is sampled again from the state of
+  // the RNG engine at the start of the shot.
+  ShotsProgress progress;
+  std::string rng_state;
+  uint_t pos = 0;
+  std::ifstream in;
+  if (open_checkpoint(checkpoint, in, result)) {
+    load_shots_progress(in, progress, rng_state);
+    progress.shot = checkpoint.header.shot;
+    pos = checkpoint.header.position;
+    rng.set_state(pos > 0 ? progress.shot_rng : rng_state);
+    ClassicalRegister creg;
+    for (size_t i = 0; i + 1 < progress.cregs.size(); i += 2) {
+      creg.creg_memory() = progress.cregs[i];
+      creg.creg_register() = progress.cregs[i + 1];
+      Base::Controller::save_count_data(result, creg);
+    }
+  }
+
+  for (; progress.shot < shots; ++progress.shot) {
+    progress.shot_rng = rng.state();
+    const Circuit& shot_circ = shot_circuit(rng);
+    initialize_state(shot_circ, state, initial_state);
+    if (pos > 0) {
+      rng.set_state(rng_state);
+      load_shot_state(in, state);
+    }
+    apply_ops_with_checkpoints(shot_circ.ops, pos, state, checkpoint,
+                               progress, result, rng, true);
+    pos = 0;
+    Base::Controller::save_count_data(result, state.creg());
+    progress.cregs.push_back(state.creg().creg_memory());
+    progress.cregs.push_back(state.creg().creg_register());
+    if (progress.shot + 1 < shots && checkpoint.schedule.due())
+      save_shots_checkpoint(checkpoint, 0, progress.shot + 1, progress, state,
+                            rng);
+  }
+  close_checkpoint(checkpoint, result);
 }
 
 
@@ -996,18 +1631,25 @@ void QasmController::run_circuit_with_sampled_noise(const Circuit& circ,
 
   // Transpilation for circuit noise method
   auto fusion_pass = transpile_fusion(method, circ.opset(), config);
+  auto commutation_pass = transpile_commutation(method, config);
+  auto local_pass = transpile_local_qubits(method, config);
   Transpile::DelayMeasure measure_pass;
   measure_pass.set_config(config);
   Noise::NoiseModel dummy_noise;
 
   // Sample noise using circuit method
-  while (shots-- > 0) {
-    Circuit noise_circ = noise.sample_noise(circ, rng);
+  Circuit noise_circ;
+  auto sample_circuit = [&](RngEngine& rng) -> const Circuit& {
+    noise_circ = noise.sample_noise(circ, rng);
     noise_circ.shots = 1;
     measure_pass.optimize_circuit(noise_circ, dummy_noise, state.opset(), result);
+    commutation_pass.optimize_circuit(noise_circ, dummy_noise, state.opset(), result);
     fusion_pass.optimize_circuit(noise_circ, dummy_noise, state.opset(), result);
-    run_single_shot(noise_circ, state, initial_state, result, rng);
-  }
+    local_pass.optimize_circuit(noise_circ, dummy_noise, state.opset(), result);
+    return noise_circ;
+  };
+  run_shots(circ, shots, state, initial_state, "noise_sampling",
+            sample_circuit, result, rng);
 }
 
 //-------------------------------------------------------------------------
@@ -1016,34 +1658,725 @@ void QasmController::run_circuit_with_sampled_noise(const Circuit& circ,
 
 bool QasmController::check_measure_sampling_opt(const Circuit& circ,
                                                 const Method method) const {
+  std::string rule;
+  std::vector<size_t> sampled_kraus;
+  return check_measure_sampling_opt(circ, method, rule, sampled_kraus);
+}
+
+bool QasmController::check_measure_sampling_opt(
+    const Circuit& circ,
+    const Method method,
+    std::string& rule,
+    std::vector<size_t>& sampled_kraus) const {
+  sampled_kraus.clear();
   // Check if circuit has sampling flag disabled
   if (circ.can_sample == false) {
+    rule = "ops_after_measure";
     return false;
   }
 
-  // Check if non-density matrix simulation and circuit contains
-  // a stochastic instruction before measurement
-  // ie. initialize, reset, kraus, superop, conditional
-  // TODO:
-  // * If initialize should be allowed if applied to product states (ie start of
-  // circuit)
-  // * Resets should be allowed if applied to |0> state (no gates before).
+  // Density matrix simulation applies stochastic instructions exactly
   bool density_mat = (method == Method::density_matrix ||
                       method == Method::density_matrix_thrust_gpu ||
                       method == Method::density_matrix_thrust_cpu);
-  if (!density_mat && (circ.opset().contains(Operations::OpType::reset) ||
-                       circ.opset().contains(Operations::OpType::initialize) ||
-                       circ.opset().contains(Operations::OpType::kraus) ||
-                       circ.opset().contains(Operations::OpType::superop))) {
+  if (density_mat) {
+    rule = "density_matrix";
+    return true;
+  }
+
+  // The purified matrix product state applies Kraus channels and resets
+  // without sampling
+  if (method == Method::matrix_product_state &&
+      MatrixProductState::MPS::get_purification()) {
+    rule = "mps_purification";
+    return true;
+  }
+
+  // Check if non-density matrix simulation and circuit contains
+  // a stochastic instruction before measurement
+  // ie. initialize, reset, kraus, superop
+  const auto& opset = circ.opset();
+  if (!opset.contains(Operations::OpType::reset) &&
+      !opset.contains(Operations::OpType::initialize) &&
+      !opset.contains(Operations::OpType::kraus) &&
+      !opset.contains(Operations::OpType::superop)) {
+    rule = "no_stochastic_ops";
+    return true;
+  }
+
+  // Otherwise check that every stochastic instruction is deterministic:
+  // * resets of qubits in the initial |0> state (no ops before)
+  // * initialize of qubits in the initial |0> state
+  // * Kraus ops that map basis states to basis states, followed by ops
+  //   that commute with the measurement. Diagonal Kraus ops are averaged
+  //   out of the sampled outcome probabilities, and the others are
+  //   applied as stochastic transitions of the sampled outcomes
+  const bool initial_zero = initial_statevector_.empty();
+  std::vector<bool> applied(circ.num_qubits, false);
+  auto initial_qubits = [&](const reg_t& qubits) {
+    return initial_zero &&
+           std::none_of(qubits.begin(), qubits.end(),
+                        [&](uint_t qubit) { return applied[qubit]; });
+  };
+  std::set<std::string> rules;
+  for (size_t pos = 0; pos < circ.first_measure_pos; ++pos) {
+    const auto& op = circ.ops[pos];
+    switch (op.type) {
+      case Operations::OpType::barrier:
+        break;
+      case Operations::OpType::reset: {
+        if (!initial_qubits(op.qubits)) {
+          rule = "reset";
+          return false;
+        }
+        rules.insert("reset_initial_qubits");
+        break;
+      }
+      case Operations::OpType::initialize: {
+        if (!initial_qubits(op.qubits)) {
+          rule = "initialize";
+          return false;
+        }
+        rules.insert("initialize_initial_qubits");
+        for (const auto qubit : op.qubits)
+          applied[qubit] = true;
+        break;
+      }
+      case Operations::OpType::kraus: {
+        if (!is_averaged_kraus(circ, pos)) {
+          rule = "kraus";
+          return false;
+        }
+        const bool diagonal = std::all_of(
+            op.mats.begin(), op.mats.end(), [this](const cmatrix_t& mat) {
+              return Utils::is_diagonal(mat, validation_threshold_);
+            });
+        rules.insert(diagonal ? "diagonal_kraus" : "sampled_kraus");
+        sampled_kraus.push_back(pos);
+        for (const auto qubit : op.qubits)
+          applied[qubit] = true;
+        break;
+      }
+      case Operations::OpType::superop: {
+        rule = "superop";
+        return false;
+      }
+      default: {
+        for (const auto qubit : op.qubits)
+          applied[qubit] = true;
+      }
+    }
+  }
+  rule.clear();
+  for (const auto& name : rules)
+    rule += (rule.empty() ? "" : ",") + name;
+  return true;
+}
+
+bool QasmController::is_classical_kraus(const Operations::Op& op) const {
+  for (const auto& mat : op.mats) {
+    for (size_t row = 0; row < mat.GetRows(); ++row) {
+      size_t nonzero = 0;
+      for (size_t col = 0; col < mat.GetColumns(); ++col) {
+        if (std::abs(mat(row, col)) > validation_threshold_)
+          ++nonzero;
+      }
+      if (nonzero > 1)
+        return false;
+    }
+  }
+  return true;
+}
+
+bool QasmController::is_averaged_kraus(const Circuit& circ, size_t pos) const {
+  // If every Kraus matrix has at most one nonzero entry in each row, the
+  // probabilities of the basis outcomes after the channel only depend on
+  // the probabilities before it, through the transition probabilities
+  // sum_k |K_k(y, x)|^2. A diagonal channel does not change them, and any
+  // other channel can be applied to the sampled outcomes if the ops
+  // between it and the measurements do not mix the basis states of its
+  // qubits
+  const auto& kraus = circ.ops[pos];
+  if (!is_classical_kraus(kraus))
+    return false;
+  const bool diagonal = std::all_of(
+      kraus.mats.begin(), kraus.mats.end(), [this](const cmatrix_t& mat) {
+        return Utils::is_diagonal(mat, validation_threshold_);
+      });
+  if (!diagonal) {
+    // The transition of a measured qubit cannot depend on the outcome of
+    // a qubit that is not measured
+    std::set<uint_t> measured;
+    for (size_t i = circ.first_measure_pos; i < circ.ops.size(); ++i) {
+      if (circ.ops[i].type == Operations::OpType::measure)
+        measured.insert(circ.ops[i].qubits.begin(), circ.ops[i].qubits.end());
+    }
+    const auto num_measured = std::count_if(
+        kraus.qubits.begin(), kraus.qubits.end(),
+        [&](uint_t qubit) { return measured.count(qubit) > 0; });
+    if (num_measured > 0 &&
+        num_measured < static_cast<long>(kraus.qubits.size()))
+      return false;
+  }
+  for (size_t i = pos + 1; i < circ.first_measure_pos; ++i) {
+    const auto& op = circ.ops[i];
+    // Snapshots would observe the state without the channel
+    if (op.type == Operations::OpType::snapshot)
+      return false;
+    const bool overlap = std::any_of(
+        op.qubits.begin(), op.qubits.end(), [&](uint_t qubit) {
+          return std::find(kraus.qubits.begin(), kraus.qubits.end(), qubit) !=
+                 kraus.qubits.end();
+        });
+    if (!overlap)
+      continue;
+    switch (op.type) {
+      case Operations::OpType::barrier:
+      case Operations::OpType::diagonal_matrix:
+        break;
+      case Operations::OpType::gate: {
+        if (!Operations::is_diagonal_gate(op.name))
+          return false;
+        break;
+      }
+      case Operations::OpType::kraus: {
+        // Later Kraus ops are applied to the outcomes after this one
+        if (!is_classical_kraus(op))
+          return false;
+        break;
+      }
+      default:
+        return false;
+    }
+  }
+  return true;
+}
+
+//-------------------------------------------------------------------------
+// Shot branching optimization
+//-------------------------------------------------------------------------
+
+bool QasmController::check_shot_branching_opt(const Circuit& circ,
+                                              const Method method) const {
+  if (!shot_branching_enable_ || circ.shots < 2)
+    return false;
+
+  // The state is copied to memory for each branch, so chunk files
+  // are not supported
+  if (method != Method::statevector &&
+      method != Method::statevector_thrust_gpu &&
+      method != Method::statevector_thrust_cpu) {
     return false;
   }
-  // Otherwise true
+
+  // Branching is only useful if the outcome of a measure or reset
+  // changes the state for the rest of the circuit
+  const auto& opset = circ.opset();
+  if (!opset.contains(Operations::OpType::measure) &&
+      !opset.contains(Operations::OpType::reset)) {
+    return false;
+  }
+
+  // Snapshots, readout errors and noise are applied differently to every
+  // shot, so the shots of a branch cannot be simulated together
+  const Operations::OpSet::optypeset_t allowed_ops({
+    Operations::OpType::gate, Operations::OpType::measure,
+    Operations::OpType::reset, Operations::OpType::bfunc,
+    Operations::OpType::barrier, Operations::OpType::matrix,
+    Operations::OpType::diagonal_matrix, Operations::OpType::multiplexer
+  });
+  for (const auto& optype : opset.optypes) {
+    if (allowed_ops.find(optype) == allowed_ops.end())
+      return false;
+  }
   return true;
 }
 
+template <class State_t, class Initstate_t>
+bool QasmController::run_shot_branching(const Circuit& circ,
+                                        uint_t shots,
+                                        State_t& state,
+                                        const Initstate_t& initial_state,
+                                        ExperimentResult& result,
+                                        RngEngine& rng) const {
+  return false;
+}
+
+template <class statevec_t, class Initstate_t>
+bool QasmController::run_shot_branching(const Circuit& circ,
+                                        uint_t shots,
+                                        Statevector::State<statevec_t>& state,
+                                        const Initstate_t& initial_state,
+                                        ExperimentResult& result,
+                                        RngEngine& rng) const {
+  using vector_t = decltype(state.qreg().copy_to_vector());
+
+  // Number of copies of the state that fit in the memory available
+  // to this experiment
+  const size_t state_mb = std::max<size_t>(
+      1, state.required_memory_mb(circ.num_qubits, circ.ops));
+  const size_t max_mb = max_memory_mb_ / std::max<int>(1, parallel_experiments_);
+  const uint_t max_saved_states = (max_mb > state_mb) ? max_mb / state_mb - 1 : 0;
+
+  // Branches with different classical registers can only be merged when
+  // the rest of the circuit does not read the classical registers
+  size_t last_creg_read = 0;
+  for (size_t i = 0; i < circ.ops.size(); ++i) {
+    const auto& op = circ.ops[i];
+    if (op.conditional || op.old_conditional ||
+        op.type == Operations::OpType::bfunc)
+      last_creg_read = i + 1;
+  }
+
+  initialize_state(circ, state, initial_state);
+  std::vector<ShotBranch<vector_t>> branches(1);
+  reg_t all_shots(shots);
+  std::iota(all_shots.begin(), all_shots.end(), 0);
+  branches[0].cregs.emplace_back(state.creg(), std::move(all_shots));
+
+  // The classical registers are saved in shot order once all the
+  // branches are simulated
+  std::vector<ClassicalRegister> shot_cregs(shots);
+  uint_t num_branches = 0;
+  uint_t num_merges = 0;
+  size_t pos = 0;
+  auto checkpoint = checkpoint_file(circ, state, "shot_branching", shots);
+  std::ifstream in;
+  if (open_checkpoint(checkpoint, in, result)) {
+    load_branches_checkpoint(in, branches, state, rng, num_branches,
+                             num_merges);
+    pos = checkpoint.header.position;
+  }
+  run_shot_branches(circ, pos, last_creg_read, branches, state, initial_state,
+                    max_saved_states, shot_cregs, result, rng, num_branches,
+                    num_merges, &checkpoint);
+  close_checkpoint(checkpoint, result);
+  for (const auto& creg : shot_cregs)
+    Base::Controller::save_count_data(result, creg);
+  result.metadata.add(num_branches, "shot_branches");
+  result.metadata.add(num_merges, "shot_branch_merges");
+  return true;
+}
+
+template <class statevec_t, class Initstate_t, class vector_t>
+void QasmController::run_shot_branches(const Circuit& circ,
+                                       size_t pos,
+                                       size_t last_creg_read,
+                                       std::vector<ShotBranch<vector_t>>& branches,
+                                       Statevector::State<statevec_t>& state,
+                                       const Initstate_t& initial_state,
+                                       uint_t max_saved_states,
+                                       std::vector<ClassicalRegister>& shot_cregs,
+                                       ExperimentResult& result,
+                                       RngEngine& rng,
+                                       uint_t& num_branches,
+                                       uint_t& num_merges,
+                                       CheckpointFile* checkpoint) const {
+  using creg_shots_t = std::pair<ClassicalRegister, reg_t>;
+  const auto& ops = circ.ops;
+  auto is_branch_op = [](const Operations::Op& op) {
+    return op.type == Operations::OpType::measure ||
+           op.type == Operations::OpType::reset;
+  };
+
+  // The state of the branch with index held is in the State, and the
+  // states of the other branches are saved. If no branch is held the
+  // State is only used to apply ops to the saved states.
+  const size_t none = std::numeric_limits<size_t>::max();
+  size_t held = std::distance(
+      branches.begin(),
+      std::find_if(branches.begin(), branches.end(),
+                   [](const ShotBranch<vector_t>& branch) {
+                     return branch.qreg.size() == 0;
+                   }));
+  if (held == branches.size())
+    held = none;
+  auto hold = [&](size_t i) {
+    if (i == held)
+      return;
+    if (held < branches.size())
+      branches[held].qreg = state.qreg().copy_to_vector();
+    state.qreg().initialize_from_data(branches[i].qreg.data(),
+                                      branches[i].qreg.size());
+    branches[i].qreg = vector_t();
+    held = i;
+  };
+  auto num_saved = [&]() {
+    return static_cast<uint_t>(std::count_if(
+        branches.begin(), branches.end(),
+        [](const ShotBranch<vector_t>& branch) { return branch.qreg.size() > 0; }));
+  };
+  // Add the shots of a classical register to a list of classical
+  // registers, merging them with the shots of an equal register
+  auto add_creg = [](std::vector<creg_shots_t>& cregs, creg_shots_t&& creg) {
+    for (auto& other : cregs) {
+      if (other.first.memory_hex() == creg.first.memory_hex() &&
+          other.first.register_hex() == creg.first.register_hex()) {
+        other.second.insert(other.second.end(), creg.second.begin(),
+                            creg.second.end());
+        return;
+      }
+    }
+    cregs.push_back(std::move(creg));
+  };
+
+  // Checkpoints of the branches are written between the ops applied to
+  // every branch, or between the blocks of ops of a single branch
+  const bool checkpoints = checkpoint && !checkpoint->path.empty();
+  auto save_checkpoint = [&](size_t next_pos) {
+    save_branches_checkpoint(*checkpoint, next_pos, branches, held, state, rng,
+                             num_branches, num_merges);
+  };
+
+  while (pos < ops.size()) {
+    if (checkpoints && checkpoint->schedule.due())
+      save_checkpoint(pos);
+
+    // Apply the ops before the next measure or reset to every branch,
+    // starting with the held branch. Only branches with a single classical
+    // register apply ops that read or write it.
+    if (!is_branch_op(ops[pos])) {
+      auto next = pos;
+      while (next < ops.size() && !is_branch_op(ops[next]))
+        ++next;
+      const std::vector<Operations::Op> block(ops.begin() + pos, ops.begin() + next);
+      const size_t first = (held < branches.size()) ? held : 0;
+      uint_t applied = 0;
+      if (checkpoints && branches.size() == 1) {
+        state.set_checkpoint_hook([&](uint_t num_ops) {
+          checkpoint->schedule.add(num_ops - applied);
+          applied = num_ops;
+          if (applied < block.size() && checkpoint->schedule.due()) {
+            branches[held].cregs.front().first = state.creg();
+            save_checkpoint(pos + applied);
+          }
+        });
+      }
+      for (size_t k = 0; k < branches.size(); ++k) {
+        const size_t i = (first + k) % branches.size();
+        hold(i);
+        auto& creg = branches[i].cregs.front().first;
+        state.creg() = creg;
+        state.apply_ops(block, result, rng);
+        creg = state.creg();
+      }
+      if (checkpoints) {
+        state.set_checkpoint_hook(nullptr);
+        checkpoint->schedule.add(block.size() - applied);
+      }
+      pos = next;
+      continue;
+    }
+
+    // Split every branch between the sampled outcomes of the op. The new
+    // branches are appended and the split branches are removed afterwards.
+    const auto& op = ops[pos];
+    if (checkpoints)
+      checkpoint->schedule.add(1);
+    const size_t num_parents = branches.size();
+    std::vector<bool> split(num_parents, false);
+    std::vector<bool> processed(num_parents, false);
+    const size_t first = (held < num_parents) ? held : 0;
+    for (size_t k = 0; k < num_parents; ++k) {
+      const size_t i = (first + k) % num_parents;
+      hold(i);
+      processed[i] = true;
+      if (!branches[i].cregs.front().first.check_conditional(op))
+        continue;
+      const auto probs = state.branch_probabilities(op);
+
+      // If the state after a reset is the same for every outcome there is
+      // no need to sample the outcomes
+      if (op.type == Operations::OpType::reset &&
+          state.is_deterministic_reset(op.qubits)) {
+        const uint_t outcome = std::distance(
+            probs.begin(), std::max_element(probs.begin(), probs.end()));
+        state.apply_branch(op, outcome, probs[outcome]);
+        branches[i].outcomes.push_back(outcome);
+        continue;
+      }
+
+      std::map<uint_t, std::vector<creg_shots_t>> outcome_cregs;
+      for (const auto& creg : branches[i].cregs) {
+        std::map<uint_t, reg_t> outcome_shots;
+        for (const auto shot : creg.second)
+          outcome_shots[rng.rand_int(probs)].push_back(shot);
+        for (auto& shots : outcome_shots) {
+          creg_shots_t outcome_creg(creg.first, std::move(shots.second));
+          if (op.type == Operations::OpType::measure)
+            outcome_creg.first.store_measure(
+                Utils::int2reg(shots.first, 2, op.qubits.size()),
+                op.memory, op.registers);
+          add_creg(outcome_cregs[shots.first], std::move(outcome_creg));
+        }
+      }
+      if (outcome_cregs.size() == 1) {
+        const uint_t outcome = outcome_cregs.begin()->first;
+        state.apply_branch(op, outcome, probs[outcome]);
+        branches[i].outcomes.push_back(outcome);
+        branches[i].cregs = std::move(outcome_cregs.begin()->second);
+        continue;
+      }
+
+      // If the states of all the outcomes cannot be saved, the branches
+      // are simulated one at a time
+      if (num_saved() + outcome_cregs.size() > max_saved_states) {
+        if (num_parents == 1) {
+          // With one copy the outcomes are simulated in turn from the
+          // saved state. Without a copy each shot is simulated separately
+          // to the end of the circuit, and the state of the branch is
+          // simulated again for the other shots.
+          const auto saved_qreg = (max_saved_states > 0)
+                                      ? state.qreg().copy_to_vector()
+                                      : vector_t();
+          const auto outcomes = branches[i].outcomes;
+          bool restore = false;
+          for (auto& outcome_creg : outcome_cregs) {
+            const uint_t outcome = outcome_creg.first;
+            if (max_saved_states > 0) {
+              if (restore)
+                state.qreg().initialize_from_data(saved_qreg.data(),
+                                                  saved_qreg.size());
+              restore = true;
+              std::vector<ShotBranch<vector_t>> child(1);
+              child[0].outcomes = outcomes;
+              child[0].outcomes.push_back(outcome);
+              child[0].cregs = std::move(outcome_creg.second);
+              state.apply_branch(op, outcome, probs[outcome]);
+              run_shot_branches(circ, pos + 1, last_creg_read, child, state,
+                                initial_state, max_saved_states - 1,
+                                shot_cregs, result, rng, num_branches,
+                                num_merges, nullptr);
+              continue;
+            }
+            for (const auto& creg : outcome_creg.second) {
+              for (const auto shot : creg.second) {
+                if (restore)
+                  replay_shot_branch(circ, pos, state, initial_state,
+                                     outcomes, result, rng);
+                restore = true;
+                state.creg() = creg.first;
+                state.apply_branch(op, outcome, probs[outcome]);
+                state.apply_ops(std::vector<Operations::Op>(ops.begin() + pos + 1, ops.end()),
+                                result, rng, true);
+                shot_cregs[shot] = state.creg();
+                num_branches++;
+              }
+            }
+          }
+          branches.clear();
+          return;
+        }
+
+        // Each branch is simulated with the memory left by the saved
+        // states of the other branches, starting with the held branch.
+        // The branches that are processed already start after the op.
+        std::vector<ShotBranch<vector_t>> remaining;
+        std::vector<size_t> remaining_pos;
+        remaining.push_back(std::move(branches[i]));
+        remaining_pos.push_back(pos);
+        for (size_t j = 0; j < branches.size(); ++j) {
+          if (j == i || (j < num_parents && split[j]))
+            continue;
+          remaining_pos.push_back((j >= num_parents || processed[j]) ? pos + 1 : pos);
+          remaining.push_back(std::move(branches[j]));
+        }
+        branches.clear();
+        for (size_t j = 0; j < remaining.size(); ++j) {
+          std::vector<ShotBranch<vector_t>> branch;
+          branch.push_back(std::move(remaining[j]));
+          if (branch[0].qreg.size() > 0) {
+            state.qreg().initialize_from_data(branch[0].qreg.data(),
+                                              branch[0].qreg.size());
+            branch[0].qreg = vector_t();
+          }
+          const uint_t saved = remaining.size() - 1 - j;
+          run_shot_branches(circ, remaining_pos[j], last_creg_read, branch,
+                            state, initial_state,
+                            max_saved_states - std::min(max_saved_states, saved),
+                            shot_cregs, result, rng, num_branches, num_merges,
+                            nullptr);
+        }
+        return;
+      }
+
+      // The state of every outcome is saved. The state of the branch is
+      // restored for the next outcomes, and released before the last one.
+      auto saved_qreg = state.qreg().copy_to_vector();
+      const auto saved_outcomes = branches[i].outcomes;
+      size_t count = 0;
+      for (auto& outcome_creg : outcome_cregs) {
+        const uint_t outcome = outcome_creg.first;
+        if (count > 0)
+          state.qreg().initialize_from_data(saved_qreg.data(), saved_qreg.size());
+        if (++count == outcome_cregs.size())
+          saved_qreg = vector_t();
+        state.apply_branch(op, outcome, probs[outcome]);
+        ShotBranch<vector_t> child;
+        child.qreg = state.qreg().copy_to_vector();
+        child.outcomes = saved_outcomes;
+        child.outcomes.push_back(outcome);
+        child.cregs = std::move(outcome_creg.second);
+        branches.push_back(std::move(child));
+      }
+      split[i] = true;
+      held = none;
+    }
+    pos++;
+
+    // Remove the split branches
+    {
+      std::vector<ShotBranch<vector_t>> next_branches;
+      size_t next_held = none;
+      for (size_t j = 0; j < branches.size(); ++j) {
+        if (j < num_parents && split[j])
+          continue;
+        if (j == held)
+          next_held = next_branches.size();
+        next_branches.push_back(std::move(branches[j]));
+      }
+      branches = std::move(next_branches);
+      held = next_held;
+    }
+
+    // Merge the branches whose states coincide. The held state is only
+    // compared if a copy of it can be saved.
+    if (branches.size() < 2)
+      continue;
+    const bool merge_cregs = pos >= last_creg_read;
+    const bool compare_held = held < branches.size() &&
+                              num_saved() < max_saved_states;
+    if (compare_held)
+      branches[held].qreg = state.qreg().copy_to_vector();
+    std::vector<double> signatures(branches.size());
+    for (size_t i = 0; i < branches.size(); ++i) {
+      if (branches[i].qreg.size() > 0)
+        signatures[i] = branch_signature(branches[i].qreg);
+    }
+    std::vector<bool> merged(branches.size(), false);
+    for (size_t i = 0; i < branches.size(); ++i) {
+      if (merged[i] || branches[i].qreg.size() == 0)
+        continue;
+      for (size_t j = i + 1; j < branches.size(); ++j) {
+        if (merged[j] || branches[j].qreg.size() == 0)
+          continue;
+        if (!merge_cregs &&
+            (branches[i].cregs.size() != 1 || branches[j].cregs.size() != 1 ||
+             branches[i].cregs[0].first.memory_hex() !=
+                 branches[j].cregs[0].first.memory_hex() ||
+             branches[i].cregs[0].first.register_hex() !=
+                 branches[j].cregs[0].first.register_hex()))
+          continue;
+        if (std::abs(signatures[i] - signatures[j]) > 1e-6 ||
+            !same_branch_state(branches[i].qreg, branches[j].qreg))
+          continue;
+        for (auto& creg : branches[j].cregs)
+          add_creg(branches[i].cregs, std::move(creg));
+        merged[j] = true;
+        num_merges++;
+      }
+    }
+    std::vector<ShotBranch<vector_t>> next_branches;
+    size_t next_held = none;
+    for (size_t i = 0; i < branches.size(); ++i) {
+      if (merged[i])
+        continue;
+      if (i == held) {
+        next_held = next_branches.size();
+        if (compare_held)
+          branches[i].qreg = vector_t();
+      }
+      next_branches.push_back(std::move(branches[i]));
+    }
+    branches = std::move(next_branches);
+    held = next_held;
+  }
+
+  // Store the classical registers of the shots of each branch
+  for (const auto& branch : branches) {
+    for (const auto& creg : branch.cregs) {
+      for (const auto shot : creg.second)
+        shot_cregs[shot] = creg.first;
+    }
+  }
+  num_branches += branches.size();
+}
+
+template <class vector_t>
+double QasmController::branch_signature(const vector_t& qreg) const {
+  // Sum of the probabilities with pseudo-random weights in [0, 1)
+  const int_t size = qreg.size();
+  double signature = 0.;
+#pragma omp parallel for if (parallel_state_update_ > 1 && size > (1LL << 14)) num_threads(parallel_state_update_) reduction(+:signature)
+  for (int_t i = 0; i < size; ++i) {
+    const double weight = static_cast<double>(
+        (static_cast<uint_t>(i) * 0x9E3779B97F4A7C15ULL) >> 11) / 9007199254740992.;
+    signature += std::norm(qreg[i]) * weight;
+  }
+  return signature;
+}
+
+template <class vector_t>
+bool QasmController::same_branch_state(const vector_t& qreg0,
+                                       const vector_t& qreg1) const {
+  using data_t = typename std::decay<decltype(qreg0[0])>::type::value_type;
+  if (qreg0.size() != qreg1.size())
+    return false;
+  const int_t size = qreg0.size();
+  double norm0 = 0., norm1 = 0., re = 0., im = 0.;
+#pragma omp parallel for if (parallel_state_update_ > 1 && size > (1LL << 14)) num_threads(parallel_state_update_) reduction(+:norm0,norm1,re,im)
+  for (int_t i = 0; i < size; ++i) {
+    const std::complex<double> amp0 = qreg0[i], amp1 = qreg1[i];
+    const auto product = std::conj(amp0) * amp1;
+    norm0 += std::norm(amp0);
+    norm1 += std::norm(amp1);
+    re += product.real();
+    im += product.imag();
+  }
+  // The fidelity of equal states differs from 1 by the rounding errors
+  const double tolerance = std::max(
+      1e-10, 100. * std::numeric_limits<data_t>::epsilon());
+  return (re * re + im * im) >= (1. - tolerance) * norm0 * norm1;
+}
+
+template <class statevec_t, class Initstate_t>
+void QasmController::replay_shot_branch(const Circuit& circ,
+                                        size_t pos,
+                                        Statevector::State<statevec_t>& state,
+                                        const Initstate_t& initial_state,
+                                        const std::vector<uint_t>& outcomes,
+                                        ExperimentResult& result,
+                                        RngEngine& rng) const {
+  // The ops of a branch are the same for every shot, so only the outcomes
+  // of its measures and resets need to be recorded
+  const auto& ops = circ.ops;
+  initialize_state(circ, state, initial_state);
+  size_t start = 0;
+  auto next_outcome = outcomes.begin();
+  for (size_t i = 0; i < pos; ++i) {
+    const auto& op = ops[i];
+    if (op.type != Operations::OpType::measure &&
+        op.type != Operations::OpType::reset)
+      continue;
+    state.apply_ops(std::vector<Operations::Op>(ops.begin() + start, ops.begin() + i),
+                    result, rng);
+    start = i + 1;
+    if (!state.creg().check_conditional(op))
+      continue;
+    if (next_outcome == outcomes.end())
+      throw std::runtime_error("QasmController: invalid shot branch outcomes.");
+    const auto probs = state.branch_probabilities(op);
+    const uint_t outcome = *next_outcome++;
+    state.apply_branch(op, outcome, probs[outcome]);
+  }
+  state.apply_ops(std::vector<Operations::Op>(ops.begin() + start, ops.begin() + pos),
+                  result, rng);
+}
+
 template <class State_t>
 void QasmController::measure_sampler(
     const std::vector<Operations::Op>& meas_roerror_ops,
+    const std::vector<Operations::Op>& kraus_ops,
     uint_t shots,
     State_t& state,
     ExperimentResult& result,
@@ -1082,6 +2415,25 @@ void QasmController::measure_sampler(
     qubit_map[meas_qubits[j]] = j;
   }
 
+  // Transition probabilities of the sampled outcomes of the measured qubits
+  // of each Kraus op: transitions[x][y] = sum_k |K_k(y, x)|^2
+  std::vector<std::pair<reg_t, std::vector<rvector_t>>> kraus_transitions;
+  for (const auto& op : kraus_ops) {
+    if (qubit_map.find(op.qubits[0]) == qubit_map.end())
+      continue;
+    reg_t positions;
+    for (const auto qubit : op.qubits)
+      positions.push_back(qubit_map[qubit]);
+    const size_t dim = 1ULL << op.qubits.size();
+    std::vector<rvector_t> transitions(dim, rvector_t(dim, 0.));
+    for (const auto& mat : op.mats) {
+      for (size_t x = 0; x < dim; ++x)
+        for (size_t y = 0; y < dim; ++y)
+          transitions[x][y] += std::norm(mat(y, x));
+    }
+    kraus_transitions.emplace_back(positions, transitions);
+  }
+
   // Maps of memory and register to qubit position
   std::unordered_map<uint_t, uint_t> memory_map;
   std::unordered_map<uint_t, uint_t> register_map;
@@ -1104,6 +2456,17 @@ void QasmController::measure_sampler(
     auto sample = all_samples.back();
     creg.initialize(meas_circ.num_memory, meas_circ.num_registers);
 
+    // apply the Kraus transitions in circuit order
+    for (const auto& kraus : kraus_transitions) {
+      const auto& positions = kraus.first;
+      uint_t outcome = 0;
+      for (size_t j = 0; j < positions.size(); ++j)
+        outcome |= sample[positions[j]] << j;
+      outcome = rng.rand_int(kraus.second[outcome]);
+      for (size_t j = 0; j < positions.size(); ++j)
+        sample[positions[j]] = (outcome >> j) & 1ULL;
+    }
+
     // process memory bit measurements
     for (const auto &pair : memory_map) {
       creg.store_measure(reg_t({sample[pair.second]}), reg_t({pair.first}),
@@ -1128,6 +2491,260 @@ void QasmController::measure_sampler(
   }
 }
 
+//-------------------------------------------------------------------------
+// Checkpoints
+//-------------------------------------------------------------------------
+
+bool QasmController::checkpoint_enabled() const {
+  return !checkpoint_directory_.empty() &&
+         (checkpoint_ops_ > 0 || checkpoint_seconds_ > 0);
+}
+
+template <class State_t>
+QasmController::CheckpointFile QasmController::checkpoint_file(
+    const Circuit& circ,
+    const State_t& state,
+    const std::string& mode,
+    uint_t shots) const {
+  CheckpointFile file;
+  if (!checkpoint_enabled() || !state.checkpoint_supported())
+    return file;
+
+  // The checkpoint file is named by the experiment index, the seed and the
+  // fingerprint of the simulation, so that the circuits of a qobj have their
+  // own files even if they are identical
+  Checkpoint::Fingerprint fingerprint;
+  fingerprint.add(state.name());
+  fingerprint.add(mode);
+  fingerprint.add<uint_t>(shots);
+  fingerprint.add<uint_t>(circ.num_memory);
+  fingerprint.add<uint_t>(circ.num_registers);
+  for (const auto& op : circ.ops)
+    fingerprint.add(op);
+  std::stringstream filename;
+  filename << "aer_checkpoint_" << circ.index << "_" << circ.seed << "_"
+           << std::hex << std::setw(16) << std::setfill('0')
+           << fingerprint.value() << ".bin";
+  file.path = checkpoint_directory_ + "/" + filename.str();
+  file.method = state.name();
+  file.fingerprint = fingerprint.value();
+  file.schedule = Checkpoint::Schedule(checkpoint_ops_, checkpoint_seconds_);
+  return file;
+}
+
+bool QasmController::open_checkpoint(CheckpointFile& file,
+                                     std::ifstream& in,
+                                     ExperimentResult& result) const {
+  if (file.path.empty() || !checkpoint_resume_)
+    return false;
+  in.open(file.path, std::ios::binary);
+  if (!in)
+    return false;
+  file.header = Checkpoint::read_header(in);
+  if (file.header.method != file.method ||
+      file.header.fingerprint != file.fingerprint) {
+    throw std::runtime_error("QasmController: checkpoint file \"" + file.path +
+                             "\" was not written by this circuit.");
+  }
+  result.metadata.add(file.header.position, "checkpoint", "resumed_op");
+  result.metadata.add(file.header.shot, "checkpoint", "resumed_shot");
+  return true;
+}
+
+void QasmController::write_checkpoint(
+    CheckpointFile& file,
+    uint_t position,
+    uint_t shot,
+    const std::function<void(std::ostream&)>& write_data) const {
+  // The previous checkpoint is only replaced by a complete file
+  const std::string tmp_path = file.path + ".tmp";
+  std::ofstream out(tmp_path, std::ios::binary | std::ios::trunc);
+  if (!out) {
+    throw std::runtime_error("QasmController: cannot open checkpoint file \"" +
+                             tmp_path + "\".");
+  }
+  Checkpoint::write(out, Checkpoint::Header({file.method, file.fingerprint,
+                                             position, shot}));
+  write_data(out);
+  out.close();
+  if (!out) {
+    throw std::runtime_error("QasmController: cannot write checkpoint file \"" +
+                             tmp_path + "\".");
+  }
+#ifdef _WIN32
+  std::remove(file.path.c_str());
+#endif
+  if (std::rename(tmp_path.c_str(), file.path.c_str()) != 0) {
+    throw std::runtime_error("QasmController: cannot rename checkpoint file \"" +
+                             tmp_path + "\".");
+  }
+  ++file.num_checkpoints;
+  file.schedule.reset();
+}
+
+void QasmController::close_checkpoint(const CheckpointFile& file,
+                                      ExperimentResult& result) const {
+  if (file.path.empty())
+    return;
+  // The simulation is completed, so the checkpoint is not needed
+  std::remove(file.path.c_str());
+  result.metadata.add(file.num_checkpoints, "checkpoint", "num_checkpoints");
+}
+
+template <class State_t>
+void QasmController::apply_ops_with_checkpoints(
+    const std::vector<Operations::Op>& ops,
+    uint_t pos,
+    State_t& state,
+    CheckpointFile& file,
+    const ShotsProgress& progress,
+    ExperimentResult& result,
+    RngEngine& rng,
+    bool final_ops) const {
+  if (file.path.empty()) {
+    state.apply_ops(ops, result, rng, final_ops);
+    return;
+  }
+
+  // The State calls the hook between the blocks of ops it applies together,
+  // with the number of ops applied so far
+  uint_t applied = 0;
+  state.set_checkpoint_hook([&](uint_t num_ops) {
+    file.schedule.add(num_ops - applied);
+    applied = num_ops;
+    if (pos + applied < ops.size() && file.schedule.due())
+      save_shots_checkpoint(file, pos + applied, progress.shot, progress,
+                            state, rng);
+  });
+  if (pos == 0) {
+    state.apply_ops(ops, result, rng, final_ops);
+  } else {
+    state.apply_ops(std::vector<Operations::Op>(ops.begin() + pos, ops.end()),
+                    result, rng, final_ops);
+  }
+  state.set_checkpoint_hook(nullptr);
+  file.schedule.add(ops.size() - pos - applied);
+}
+
+template <class State_t>
+void QasmController::save_shots_checkpoint(CheckpointFile& file,
+                                           uint_t position,
+                                           uint_t shot,
+                                           const ShotsProgress& progress,
+                                           const State_t& state,
+                                           const RngEngine& rng) const {
+  write_checkpoint(file, position, shot, [&](std::ostream& out) {
+    Checkpoint::write(out, rng.state());
+    Checkpoint::write(out, progress.shot_rng);
+    Checkpoint::write(out, progress.cregs);
+    if (position > 0) {
+      Checkpoint::write(out, state.creg().memory_bin().substr(2));
+      Checkpoint::write(out, state.creg().register_bin().substr(2));
+      state.save_checkpoint(out);
+    }
+  });
+}
+
+void QasmController::load_shots_progress(std::istream& in,
+                                         ShotsProgress& progress,
+                                         std::string& rng_state) const {
+  Checkpoint::read(in, rng_state);
+  Checkpoint::read(in, progress.shot_rng);
+  Checkpoint::read(in, progress.cregs);
+}
+
+template <class State_t>
+void QasmController::load_shot_state(std::istream& in, State_t& state) const {
+  Checkpoint::read(in, state.creg().creg_memory());
+  Checkpoint::read(in, state.creg().creg_register());
+  state.load_checkpoint(in);
+}
+
+template <class statevec_t, class vector_t>
+void QasmController::save_branches_checkpoint(
+    CheckpointFile& file,
+    uint_t pos,
+    const std::vector<ShotBranch<vector_t>>& branches,
+    size_t held,
+    const Statevector::State<statevec_t>& state,
+    const RngEngine& rng,
+    uint_t num_branches,
+    uint_t num_merges) const {
+  write_checkpoint(file, pos, 0, [&](std::ostream& out) {
+    Checkpoint::write(out, rng.state());
+    Checkpoint::write(out, num_branches);
+    Checkpoint::write(out, num_merges);
+    Checkpoint::write<uint_t>(out, branches.size());
+    Checkpoint::write<uint_t>(out, held);
+    for (size_t i = 0; i < branches.size(); ++i) {
+      const auto& branch = branches[i];
+      if (i == held) {
+        state.save_checkpoint(out);
+      } else {
+        Checkpoint::write<uint_t>(out, state.qreg().num_qubits());
+        Checkpoint::write_amplitudes(out, branch.qreg.data(),
+                                     branch.qreg.size());
+      }
+      Checkpoint::write(out, branch.outcomes);
+      Checkpoint::write<uint_t>(out, branch.cregs.size());
+      for (const auto& creg : branch.cregs) {
+        Checkpoint::write(out, creg.first.memory_bin().substr(2));
+        Checkpoint::write(out, creg.first.register_bin().substr(2));
+        Checkpoint::write(out, creg.second);
+      }
+    }
+  });
+}
+
+template <class statevec_t, class vector_t>
+void QasmController::load_branches_checkpoint(
+    std::istream& in,
+    std::vector<ShotBranch<vector_t>>& branches,
+    Statevector::State<statevec_t>& state,
+    RngEngine& rng,
+    uint_t& num_branches,
+    uint_t& num_merges) const {
+  using amplitude_t = typename std::decay<decltype(branches[0].qreg[0])>::type;
+  std::string rng_state;
+  Checkpoint::read(in, rng_state);
+  rng.set_state(rng_state);
+  Checkpoint::read(in, num_branches);
+  Checkpoint::read(in, num_merges);
+  uint_t size, held;
+  Checkpoint::read(in, size);
+  Checkpoint::read(in, held);
+  branches.clear();
+  branches.resize(size);
+  for (size_t i = 0; i < branches.size(); ++i) {
+    auto& branch = branches[i];
+    if (i == held) {
+      state.load_checkpoint(in);
+    } else {
+      uint_t num_qubits;
+      Checkpoint::read(in, num_qubits);
+      const uint_t size = Checkpoint::read_amplitudes_size<
+          typename amplitude_t::value_type>(in);
+      if (num_qubits != state.qreg().num_qubits() ||
+          size != state.qreg().size()) {
+        throw std::runtime_error(
+            "QasmController: the checkpoint does not match the number of "
+            "qubits of the state.");
+      }
+      branch.qreg = vector_t(size, false);
+      Checkpoint::read_buffer(in, branch.qreg.data(), size);
+    }
+    Checkpoint::read(in, branch.outcomes);
+    uint_t num_cregs;
+    Checkpoint::read(in, num_cregs);
+    branch.cregs.resize(num_cregs);
+    for (auto& creg : branch.cregs) {
+      Checkpoint::read(in, creg.first.creg_memory());
+      Checkpoint::read(in, creg.first.creg_register());
+      Checkpoint::read(in, creg.second);
+    }
+  }
+}
+
 //-------------------------------------------------------------------------
 }  // end namespace Simulator
 //-------------------------------------------------------------------------
@@ -17,6 +17,7 @@
 
 #include "controller.hpp"
 #include "simulators/statevector/statevector_state.hpp"
+#include "transpile/commutation.hpp"
 #include "transpile/fusion.hpp"
 
 namespace AER {
@@ -33,6 +34,8 @@ namespace Simulator {
  *
  * - "initial_statevector" (json complex vector): Use a custom initial
  *      statevector for the simulation [Default: null].
+ *      It can also be a reference {"aer_buffer": i} to a buffer of the
+ *      JSON::BufferScope, e.g. a numpy array passed by the Python bindings.
  * - "zero_threshold" (double): Threshold for truncating small values to
  *      zero in result data [Default: 1e-10]
  * - "statevector_parallel_threshold" (int): Threshold that number of qubits
@@ -300,10 +303,13 @@ void StatevectorController::run_circuit_helper(
   const std::vector<Operations::Op>* op_ptr = &circ.ops;
   Transpile::Fusion fusion_pass;
   fusion_pass.set_config(config);
+  Transpile::CommutationReorder commutation_pass;
+  commutation_pass.set_config(config);
   Circuit opt_circ;
   if (fusion_pass.active && circ.num_qubits >= fusion_pass.threshold) {
     opt_circ = circ; // copy circuit
     Noise::NoiseModel dummy_noise; // dummy object for transpile pass
+    commutation_pass.optimize_circuit(opt_circ, dummy_noise, state.opset(), result);
     fusion_pass.optimize_circuit(opt_circ, dummy_noise, state.opset(), result);
     op_ptr = &opt_circ.ops;
   }
@@ -317,6 +323,7 @@ void StatevectorController::run_circuit_helper(
   state.initialize_creg(circ.num_memory, circ.num_registers);
   state.apply_ops(*op_ptr, result, rng);
   Base::Controller::save_count_data(result, state.creg());
+  state.add_metadata(result);
 
   // Add final state to the data
   state.save_data_single(result, "statevector", state.qreg().move_to_vector());
@@ -119,6 +119,45 @@ void zheevx_(char *jobz, char *range, char *uplo, int *n,
              std::complex<double> *work, int *lwork, double *rwork,
              int *iwork, int *ifail, int *info);
 
+// Computes the singular value decomposition of a Double-Precison Complex
+// matrix A using a divide and conquer algorithm
+void zgesdd_(char *jobz, int *m, int *n, std::complex<double> *a, int *lda,
+             double *s, std::complex<double> *u, int *ldu,
+             std::complex<double> *vt, int *ldvt, std::complex<double> *work,
+             int *lwork, double *rwork, int *iwork, int *info);
+
+// Computes the singular value decomposition of a Double-Precison Complex
+// matrix A using the QR algorithm
+void zgesvd_(char *jobu, char *jobvt, int *m, int *n, std::complex<double> *a,
+             int *lda, double *s, std::complex<double> *u, int *ldu,
+             std::complex<double> *vt, int *ldvt, std::complex<double> *work,
+             int *lwork, double *rwork, int *info);
+
+// Computes the singular value decomposition of a Single-Precison Complex
+// matrix A using a divide and conquer algorithm
+void cgesdd_(char *jobz, int *m, int *n, std::complex<float> *a, int *lda,
+             float *s, std::complex<float> *u, int *ldu,
+             std::complex<float> *vt, int *ldvt, std::complex<float> *work,
+             int *lwork, float *rwork, int *iwork, int *info);
+
+// Computes the singular value decomposition of a Single-Precison Complex
+// matrix A using the QR algorithm
+void cgesvd_(char *jobu, char *jobvt, int *m, int *n, std::complex<float> *a,
+             int *lda, float *s, std::complex<float> *u, int *ldu,
+             std::complex<float> *vt, int *ldvt, std::complex<float> *work,
+             int *lwork, float *rwork, int *info);
+
+// Computes a QR factorization of a Double-Precison Complex matrix A
+void zgeqrf_(int *m, int *n, std::complex<double> *a, int *lda,
+             std::complex<double> *tau, std::complex<double> *work,
+             int *lwork, int *info);
+
+// Generates the Double-Precison Complex matrix Q with orthonormal columns
+// of a QR factorization computed by zgeqrf
+void zungqr_(int *m, int *n, int *k, std::complex<double> *a, int *lda,
+             std::complex<double> *tau, std::complex<double> *work,
+             int *lwork, int *info);
+
 // Determines Single-Precision machine parameters.
 float slamch_(char *cmach);
 
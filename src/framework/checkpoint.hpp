@@ -0,0 +1,305 @@
+/**
+ * This code is part of Qiskit.
+ *
+ * (C) Copyright IBM 2018, 2019, 2020.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+#ifndef _aer_framework_checkpoint_hpp_
+#define _aer_framework_checkpoint_hpp_
+
+#include <chrono>
+#include <complex>
+#include <cstdio>
+#include <istream>
+#include <ostream>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <vector>
+
+#include "framework/matrix.hpp"
+#include "framework/operations.hpp"
+#include "framework/types.hpp"
+
+namespace AER {
+namespace Checkpoint {
+
+//============================================================================
+// Checkpoint files
+//
+// A checkpoint file stores the state of a simulation after an operation of
+// a circuit, so that the simulation can be resumed from this operation. It
+// contains a header identifying the circuit, the current shot and the
+// position of the next operation, followed by the state of the RNG engine,
+// the classical registers of the completed shots and the quantum state.
+// Values are written in the native byte order, so a checkpoint can only be
+// read on the same architecture.
+//============================================================================
+
+struct Header {
+  std::string method;    // name of the State class
+  uint_t fingerprint;    // fingerprint of the operations of the circuit
+  uint_t position;       // position of the next operation
+  uint_t shot;           // index of the current shot
+};
+
+const std::string MAGIC = "QISKIT_AER_CHECKPOINT";
+const uint_t VERSION = 2;
+
+//----------------------------------------------------------------------------
+// Binary serialization
+//----------------------------------------------------------------------------
+
+template <typename T>
+void write(std::ostream &out, const T &value) {
+  static_assert(std::is_trivially_copyable<T>::value,
+                "Checkpoint::write requires a trivially copyable type");
+  out.write(reinterpret_cast<const char *>(&value), sizeof(T));
+}
+
+template <typename T>
+void write_buffer(std::ostream &out, const T *data, uint_t size) {
+  out.write(reinterpret_cast<const char *>(data), size * sizeof(T));
+}
+
+inline void write(std::ostream &out, const std::string &value) {
+  write<uint_t>(out, value.size());
+  write_buffer(out, value.data(), value.size());
+}
+
+template <typename T>
+void write(std::ostream &out, const std::vector<T> &value) {
+  static_assert(std::is_trivially_copyable<T>::value,
+                "Checkpoint::write requires a vector of a trivially copyable type");
+  write<uint_t>(out, value.size());
+  write_buffer(out, value.data(), value.size());
+}
+
+inline void write(std::ostream &out, const std::vector<std::string> &value) {
+  write<uint_t>(out, value.size());
+  for (const auto &item : value)
+    write(out, item);
+}
+
+template <typename T>
+void write(std::ostream &out, const matrix<T> &value) {
+  write<uint_t>(out, value.GetRows());
+  write<uint_t>(out, value.GetColumns());
+  write_buffer(out, value.data(), value.size());
+}
+
+inline void write(std::ostream &out, const Header &header) {
+  write(out, MAGIC);
+  write(out, VERSION);
+  write(out, header.method);
+  write(out, header.fingerprint);
+  write(out, header.position);
+  write(out, header.shot);
+}
+
+// Write the amplitudes of a state, with their number and size so that a
+// state is only read with the same precision
+template <typename T>
+void write_amplitudes(std::ostream &out, const std::complex<T> *data,
+                      uint_t size) {
+  write<uint_t>(out, size);
+  write<uint_t>(out, sizeof(std::complex<T>));
+  write_buffer(out, data, size);
+}
+
+inline void check_stream(const std::istream &in) {
+  if (!in)
+    throw std::runtime_error("Checkpoint: unexpected end of checkpoint file.");
+}
+
+template <typename T>
+void read(std::istream &in, T &value) {
+  static_assert(std::is_trivially_copyable<T>::value,
+                "Checkpoint::read requires a trivially copyable type");
+  in.read(reinterpret_cast<char *>(&value), sizeof(T));
+  check_stream(in);
+}
+
+template <typename T>
+void read_buffer(std::istream &in, T *data, uint_t size) {
+  in.read(reinterpret_cast<char *>(data), size * sizeof(T));
+  check_stream(in);
+}
+
+inline void read(std::istream &in, std::string &value) {
+  uint_t size;
+  read(in, size);
+  value.resize(size);
+  read_buffer(in, &value[0], size);
+}
+
+template <typename T>
+void read(std::istream &in, std::vector<T> &value) {
+  static_assert(std::is_trivially_copyable<T>::value,
+                "Checkpoint::read requires a vector of a trivially copyable type");
+  uint_t size;
+  read(in, size);
+  value.resize(size);
+  read_buffer(in, value.data(), size);
+}
+
+inline void read(std::istream &in, std::vector<std::string> &value) {
+  uint_t size;
+  read(in, size);
+  value.resize(size);
+  for (auto &item : value)
+    read(in, item);
+}
+
+template <typename T>
+void read(std::istream &in, matrix<T> &value) {
+  uint_t rows, cols;
+  read(in, rows);
+  read(in, cols);
+  value.resize(rows, cols);
+  read_buffer(in, value.data(), value.size());
+}
+
+inline Header read_header(std::istream &in) {
+  std::string magic;
+  uint_t version;
+  read(in, magic);
+  read(in, version);
+  if (magic != MAGIC || version != VERSION)
+    throw std::runtime_error("Checkpoint: invalid checkpoint file.");
+  Header header;
+  read(in, header.method);
+  read(in, header.fingerprint);
+  read(in, header.position);
+  read(in, header.shot);
+  return header;
+}
+
+// Return the number of amplitudes of a state written by write_amplitudes,
+// and check that they have the size of std::complex<T>
+template <typename T>
+uint_t read_amplitudes_size(std::istream &in) {
+  uint_t size, amplitude_size;
+  read(in, size);
+  read(in, amplitude_size);
+  if (amplitude_size != sizeof(std::complex<T>))
+    throw std::runtime_error(
+        "Checkpoint: the precision of the state does not match the checkpoint.");
+  return size;
+}
+
+//----------------------------------------------------------------------------
+// Checkpoint schedule
+//----------------------------------------------------------------------------
+
+// Decide when a checkpoint is due: after a number of operations, after a
+// time, or after both if both are set
+class Schedule {
+public:
+  Schedule(uint_t ops = 0, double seconds = 0.)
+    : ops_(ops), seconds_(seconds), last_(clock_t::now()) {}
+
+  // Record that num_ops operations were applied since the last call
+  void add(uint_t num_ops) { num_ops_ += num_ops; }
+
+  // Return true if a checkpoint is due
+  bool due() const {
+    if (ops_ == 0 && seconds_ <= 0.)
+      return false;
+    if (ops_ > 0 && num_ops_ < ops_)
+      return false;
+    return seconds_ <= 0. ||
+           std::chrono::duration<double>(clock_t::now() - last_).count() >=
+               seconds_;
+  }
+
+  // Start the schedule of the next checkpoint
+  void reset() {
+    num_ops_ = 0;
+    last_ = clock_t::now();
+  }
+
+private:
+  using clock_t = std::chrono::steady_clock;
+  uint_t ops_;
+  double seconds_;
+  uint_t num_ops_ = 0;
+  clock_t::time_point last_;
+};
+
+//----------------------------------------------------------------------------
+// Circuit fingerprint
+//----------------------------------------------------------------------------
+
+// FNV-1a hash of the operations that change the state of the simulation, so
+// that a checkpoint is only resumed by the circuit that wrote it
+class Fingerprint {
+public:
+  uint_t value() const { return hash_; }
+
+  void add(const void *data, uint_t size) {
+    const unsigned char *bytes = static_cast<const unsigned char *>(data);
+    for (uint_t i = 0; i < size; ++i) {
+      hash_ ^= bytes[i];
+      hash_ *= 1099511628211ULL;
+    }
+  }
+
+  template <typename T>
+  void add(const T &value) {
+    static_assert(std::is_trivially_copyable<T>::value,
+                  "Fingerprint::add requires a trivially copyable type");
+    add(&value, sizeof(T));
+  }
+
+  void add(const std::string &value) {
+    add<uint_t>(value.size());
+    add(value.data(), value.size());
+  }
+
+  template <typename T>
+  void add(const std::vector<T> &value) {
+    add<uint_t>(value.size());
+    for (const auto &item : value)
+      add(item);
+  }
+
+  template <typename T>
+  void add(const matrix<T> &value) {
+    add<uint_t>(value.GetRows());
+    add<uint_t>(value.GetColumns());
+    add(value.data(), value.size() * sizeof(T));
+  }
+
+  void add(const Operations::Op &op) {
+    add(static_cast<int>(op.type));
+    add(op.name);
+    add(op.qubits);
+    add(op.regs);
+    add(op.params);
+    add(op.string_params);
+    add(op.conditional);
+    add(op.conditional ? op.conditional_reg : 0);
+    add(op.memory);
+    add(op.registers);
+    add(op.mats);
+    add(op.probs);
+  }
+
+private:
+  uint_t hash_ = 14695981039346656037ULL;
+};
+
+//----------------------------------------------------------------------------
+} // end namespace Checkpoint
+} // end namespace AER
+//----------------------------------------------------------------------------
+#endif
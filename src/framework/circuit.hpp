@@ -50,6 +50,7 @@ public:
   // Circuit metadata constructed from json QobjExperiment
   uint_t shots = 1;
   uint_t seed;
+  uint_t index = 0;             // Position of the experiment in the qobj
   json_t header;
   double global_phase_angle = 0;
 
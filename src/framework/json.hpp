@@ -20,6 +20,9 @@
 #include <fstream>
 #include <iostream>
 #include <map>
+#include <stdexcept>
+#include <string>
+#include <utility>
 #include <vector>
 
 #include <iostream>
@@ -74,6 +77,62 @@ inline bool check_keys(std::vector<std::string> keys, const json_t &js);
  */
 template <typename T> bool get_value(T &var, std::string key, const json_t &js);
 
+/**
+ * A C-contiguous array of complex numbers owned by the caller of the
+ * simulator, for example a NumPy array passed through the Python bindings.
+ * Complex vectors and matrices are read directly from the buffer instead of
+ * being converted to JSON lists of [re, im] pairs.
+ */
+struct Buffer {
+  const void *data = nullptr;
+  bool single_precision = false; // complex<float> if true, else complex<double>
+  std::vector<size_t> shape;
+
+  size_t size() const;
+
+  // Copy a 1-dimensional buffer to a complex vector
+  template <typename T>
+  void copy_to(std::vector<std::complex<T>> &vec) const;
+
+  // Copy a 2-dimensional row-major buffer to a (column-major) complex matrix
+  template <typename T>
+  void copy_to(matrix<std::complex<T>> &mat) const;
+
+  // Buffers are complex, so they cannot be copied to real matrices
+  template <typename T>
+  void copy_to(matrix<T> &mat) const;
+
+  // Return the i-th element of the buffer
+  template <typename T>
+  std::complex<T> get(size_t i) const;
+};
+
+/**
+ * Makes a list of buffers available to the JSON conversion of complex
+ * vectors and matrices while it is in scope. A JSON object
+ * {"aer_buffer": i} is then converted from the i-th buffer of the list.
+ * The memory of the buffers must remain valid while the scope exists.
+ */
+class BufferScope {
+public:
+  explicit BufferScope(std::vector<Buffer> buffers);
+  ~BufferScope();
+  BufferScope(const BufferScope &) = delete;
+  BufferScope &operator=(const BufferScope &) = delete;
+
+  // Return true if a JSON value is a reference to a buffer
+  static bool is_buffer(const json_t &js);
+
+  // Return the buffer referenced by a JSON value
+  static const Buffer &get(const json_t &js);
+
+private:
+  static const std::vector<Buffer> *&current();
+
+  std::vector<Buffer> buffers_;
+  const std::vector<Buffer> *previous_;
+};
+
 } // end namespace JSON
 
 //============================================================================
@@ -113,6 +172,7 @@ void to_json(json_t &js, const std::vector<std::complex<RealType>> &vec);
  * - an object with real pair values: {'00': n, ... }
  * - an list with complex values: [ [a0re, a0im], ...]
  * - an list with real values: [a0, a1, ....]
+ * - a reference to a buffer: {'aer_buffer': i} (see JSON::BufferScope)
  * @param js a json_t object to convert.
  * @param vec a complex vector to contain result.
  */
@@ -199,6 +259,86 @@ bool JSON::get_value(T &var, std::string key, const json_t &js) {
   }
 }
 
+//------------------------------------------------------------------------------
+// Buffers
+//------------------------------------------------------------------------------
+
+inline size_t JSON::Buffer::size() const {
+  size_t size = 1;
+  for (const auto dim : shape)
+    size *= dim;
+  return size;
+}
+
+template <typename T>
+std::complex<T> JSON::Buffer::get(size_t i) const {
+  if (single_precision) {
+    const auto &z = static_cast<const std::complex<float> *>(data)[i];
+    return std::complex<T>(z.real(), z.imag());
+  }
+  const auto &z = static_cast<const std::complex<double> *>(data)[i];
+  return std::complex<T>(z.real(), z.imag());
+}
+
+template <typename T>
+void JSON::Buffer::copy_to(std::vector<std::complex<T>> &vec) const {
+  if (shape.size() != 1) {
+    throw std::invalid_argument(
+        std::string("JSON: invalid complex vector (buffer is not 1-dimensional)."));
+  }
+  vec.resize(shape[0]);
+  for (size_t i = 0; i < shape[0]; i++)
+    vec[i] = get<T>(i);
+}
+
+template <typename T>
+void JSON::Buffer::copy_to(matrix<std::complex<T>> &mat) const {
+  if (shape.size() != 2 || shape[0] == 0) {
+    throw std::invalid_argument(
+        std::string("JSON: invalid matrix (buffer is not a 2-dimensional array)."));
+  }
+  const size_t nrows = shape[0];
+  const size_t ncols = shape[1];
+  mat = matrix<std::complex<T>>(nrows, ncols);
+  for (size_t c = 0; c < ncols; c++)
+    for (size_t r = 0; r < nrows; r++)
+      mat(r, c) = get<T>(r * ncols + c);
+}
+
+template <typename T>
+void JSON::Buffer::copy_to(matrix<T> &) const {
+  throw std::invalid_argument(
+      std::string("JSON: invalid matrix (buffer is complex)."));
+}
+
+inline JSON::BufferScope::BufferScope(std::vector<Buffer> buffers)
+    : buffers_(std::move(buffers)), previous_(current()) {
+  current() = &buffers_;
+}
+
+inline JSON::BufferScope::~BufferScope() {
+  current() = previous_;
+}
+
+inline const std::vector<JSON::Buffer> *&JSON::BufferScope::current() {
+  static const std::vector<Buffer> *buffers = nullptr;
+  return buffers;
+}
+
+inline bool JSON::BufferScope::is_buffer(const json_t &js) {
+  return js.is_object() && js.find("aer_buffer") != js.end();
+}
+
+inline const JSON::Buffer &JSON::BufferScope::get(const json_t &js) {
+  const size_t index = js["aer_buffer"].get<size_t>();
+  if (current() == nullptr || index >= current()->size()) {
+    throw std::invalid_argument(
+        std::string("JSON: invalid reference to buffer ") +
+        std::to_string(index) + std::string("."));
+  }
+  return (*current())[index];
+}
+
 //------------------------------------------------------------------------------
 // JSON Conversion
 //------------------------------------------------------------------------------
@@ -231,6 +371,10 @@ void std::to_json(json_t &js, const std::vector<std::complex<RealType>> &vec) {
 
 template <typename RealType>
 void std::from_json(const json_t &js, std::vector<std::complex<RealType>> &vec) {
+  if (JSON::BufferScope::is_buffer(js)) {
+    JSON::BufferScope::get(js).copy_to(vec);
+    return;
+  }
   std::vector<std::complex<RealType>> ret;
   if (js.is_array()) {
     for (auto &elt : js)
@@ -282,6 +426,11 @@ template <typename T> void to_json(json_t &js, const matrix<T> &mat) {
 
 
 template <typename T> void from_json(const json_t &js, matrix<T> &mat) {
+  // Read complex matrices from a buffer
+  if (JSON::BufferScope::is_buffer(js)) {
+    JSON::BufferScope::get(js).copy_to(mat);
+    return;
+  }
   // Check JSON is an array
   if(!js.is_array()) {
     throw std::invalid_argument(
@@ -205,6 +205,19 @@ inline void check_duplicate_qubits(const Op &op) {
                                 R"(" instruction ("qubits" are not unique).)");
 }
 
+//------------------------------------------------------------------------------
+// Gate properties
+//------------------------------------------------------------------------------
+
+// Return true if the named gate is diagonal in the computational basis
+inline bool is_diagonal_gate(const std::string &name) {
+  static const stringset_t diagonal_gates({
+    "id", "delay", "u1", "p", "z", "s", "sdg", "t", "tdg", "rz",
+    "cz", "cp", "cu1", "rzz", "mcz", "mcu1", "mcphase"
+  });
+  return diagonal_gates.find(name) != diagonal_gates.end();
+}
+
 //------------------------------------------------------------------------------
 // Generator functions
 //------------------------------------------------------------------------------
@@ -109,6 +109,15 @@ json_t numpy_to_json_2d(py::array_t<T, py::array::c_style> arr);
 template <typename T>
 json_t numpy_to_json_3d(py::array_t<T, py::array::c_style> arr);
 
+/**
+ * Return a view of a C-contiguous complex64 or complex128 numpy array, so
+ * that its data can be read without converting it to a json list. The array
+ * must remain alive while the buffer is used.
+ * @param obj is a numpy array
+ * @returns a buffer referencing the data of the array
+ */
+Buffer numpy_to_buffer(const py::handle &obj);
+
 } //end namespace JSON
 
 /*******************************************************************************
@@ -208,6 +217,24 @@ json_t JSON::numpy_to_json(py::array_t<T, py::array::c_style> arr) {
     return tbr;
 }
 
+JSON::Buffer JSON::numpy_to_buffer(const py::handle &obj) {
+    Buffer buffer;
+    if (py::isinstance<py::array_t<std::complex<double> > >(obj)) {
+        buffer.single_precision = false;
+    } else if (py::isinstance<py::array_t<std::complex<float> > >(obj)) {
+        buffer.single_precision = true;
+    } else {
+        throw std::invalid_argument("Buffer must be a complex64 or complex128 numpy array.");
+    }
+    auto arr = py::reinterpret_borrow<py::array>(obj);
+    if (!(arr.flags() & py::array::c_style)) {
+        throw std::invalid_argument("Buffer must be a C-contiguous numpy array.");
+    }
+    buffer.data = arr.data();
+    buffer.shape.assign(arr.shape(), arr.shape() + arr.ndim());
+    return buffer;
+}
+
 void std::to_json(json_t &js, const py::handle &obj) {
     if (py::isinstance<py::float_>(obj)) {
         js = obj.cast<nl::json::number_float_t>();
@@ -17,6 +17,8 @@
 
 #include <cstdint>
 #include <random>
+#include <sstream>
+#include <string>
 
 namespace AER {
 
@@ -54,6 +56,19 @@ public:
 
   // Set a fixed seed for the RNG engine
   void set_seed(size_t seed) { rng.seed(seed); }
+
+  // Return the state of the RNG engine as a string
+  std::string state() const {
+    std::ostringstream ss;
+    ss << rng;
+    return ss.str();
+  }
+
+  // Restore a state returned by state()
+  void set_state(const std::string &state) {
+    std::istringstream ss(state);
+    ss >> rng;
+  }
   
   //-----------------------------------------------------------------------
   // Sampling methods
@@ -93,6 +108,14 @@ public:
     return std::discrete_distribution<size_t>(probs.begin(), probs.end())(rng);
   }
 
+  // Generate a pseudo random integer from the binomial distribution of the
+  // number of successes in n trials with success probability p
+  template <typename Integer,
+            typename = std::enable_if_t<std::is_integral<Integer>::value>>
+  Integer rand_binomial(Integer n, double p) {
+    return std::binomial_distribution<Integer>(n, p)(rng);
+  }
+
 private:
   std::mt19937_64 rng; // Mersenne twister rng engine
 };
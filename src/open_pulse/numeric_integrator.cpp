@@ -174,17 +174,11 @@ struct RhsData {
   std::vector<complex_t> osc_terms_no_t;
 };
 
-py::array_t <complex_t> inner_ode_rhs(double t,
-                                      py::array_t <complex_t> the_vec,
-                                      const RhsData &rhs_data) {
-    if (the_vec.ptr() == nullptr) {
-        throw std::invalid_argument("py_vec cannot be null");
-    }
-
-    auto vec = static_cast<complex_t *>(the_vec.request().ptr);
-    auto num_rows = the_vec.size();
-    py::array_t <complex_t> out_arr(num_rows);
-    auto out = static_cast<complex_t *>(out_arr.request().ptr);
+void inner_ode_rhs(double t,
+                   const complex_t * vec,
+                   complex_t * out,
+                   size_t num_rows,
+                   const RhsData &rhs_data) {
     memset(&out[0], 0, num_rows * sizeof(complex_t));
 
     std::unordered_map<std::string, complex_t> chan_values;
@@ -236,10 +230,247 @@ py::array_t <complex_t> inner_ode_rhs(double t,
     for (auto i = 0; i < num_rows; ++i) {
         out[i] += complex_t(0., 1.) * rhs_data.energy[i] * vec[i];
     }
+}
+
+py::array_t <complex_t> inner_ode_rhs(double t,
+                                      py::array_t <complex_t> the_vec,
+                                      const RhsData &rhs_data) {
+    if (the_vec.ptr() == nullptr) {
+        throw std::invalid_argument("py_vec cannot be null");
+    }
+
+    auto vec = static_cast<complex_t *>(the_vec.request().ptr);
+    auto num_rows = the_vec.size();
+    py::array_t <complex_t> out_arr(num_rows);
+    auto out = static_cast<complex_t *>(out_arr.request().ptr);
+    inner_ode_rhs(t, vec, out, num_rows, rhs_data);
 
     return out_arr;
 }
 
+//============================================================================
+// Native time-stepping loops
+//============================================================================
+
+namespace {
+
+using state_t = std::vector<complex_t>;
+
+// out = y + sum_j (h * coeffs[j]) * ks[j]
+void axpy_stages(const state_t &y, double h,
+                 const std::vector<double> &coeffs,
+                 const std::vector<const state_t *> &ks,
+                 state_t &out) {
+    const auto dim = y.size();
+    for (size_t i = 0; i < dim; ++i) {
+        complex_t val = y[i];
+        for (size_t j = 0; j < coeffs.size(); ++j) {
+            if (coeffs[j] != 0.)
+                val += (h * coeffs[j]) * (*ks[j])[i];
+        }
+        out[i] = val;
+    }
+}
+
+state_t state_from_array(const py::array_t <complex_t> &arr) {
+    auto raw = static_cast<const complex_t *>(arr.request().ptr);
+    return state_t(raw, raw + arr.size());
+}
+
+std::vector<double> times_from_array(const py::array_t <double> &arr) {
+    auto raw = static_cast<const double *>(arr.request().ptr);
+    return std::vector<double>(raw, raw + arr.size());
+}
+
+void copy_to_row(const state_t &state, complex_t * states, size_t row) {
+    std::copy(state.begin(), state.end(), states + row * state.size());
+}
+
+// Dormand-Prince 5(4) tableau
+const double c2 = 1. / 5, c3 = 3. / 10, c4 = 4. / 5, c5 = 8. / 9;
+const std::vector<double> a2 = {1. / 5};
+const std::vector<double> a3 = {3. / 40, 9. / 40};
+const std::vector<double> a4 = {44. / 45, -56. / 15, 32. / 9};
+const std::vector<double> a5 = {19372. / 6561, -25360. / 2187, 64448. / 6561, -212. / 729};
+const std::vector<double> a6 = {9017. / 3168, -355. / 33, 46732. / 5247, 49. / 176,
+                                -5103. / 18656};
+const std::vector<double> a7 = {35. / 384, 0., 500. / 1113, 125. / 192, -2187. / 6784,
+                                11. / 84};
+// Difference between the 5th and 4th order solutions
+const std::vector<double> e = {71. / 57600, 0., -71. / 16695, 71. / 1920, -17253. / 339200,
+                               22. / 525, -1. / 40};
+// Dense output coefficients (Hairer, Norsett & Wanner)
+const std::vector<double> d = {-12715105075. / 11282082432, 0., 87487479700. / 32700410799,
+                               -10690763975. / 1880347072, 701980252875. / 199316789632,
+                               -1453857185. / 822651844, 69997945. / 29380423};
+
+} // namespace
+
+py::array_t <complex_t> RhsFunctor::rk4(double t0,
+                                        py::array_t <complex_t> y0,
+                                        py::array_t <double> tlist,
+                                        double max_dt) {
+    if (max_dt <= 0.)
+        throw std::invalid_argument("RK4 requires a positive max_dt.");
+
+    auto y = state_from_array(y0);
+    const auto times = times_from_array(tlist);
+    const auto dim = y.size();
+
+    state_t k1(dim), k2(dim), k3(dim), k4(dim), tmp(dim);
+    py::array_t <complex_t> out(std::vector<py::ssize_t>{static_cast<py::ssize_t>(times.size()),
+                                                          static_cast<py::ssize_t>(dim)});
+    auto states = static_cast<complex_t *>(out.request().ptr);
+
+    double t = t0;
+    for (size_t n = 0; n < times.size(); ++n) {
+        const double delta_t = times[n] - t;
+        const auto steps = static_cast<long>(std::floor(delta_t / max_dt)) + 1;
+        const double h = delta_t / steps;
+        for (long step = 0; step < steps; ++step) {
+            inner_ode_rhs(t, y.data(), k1.data(), dim, *rhs_data_);
+            axpy_stages(y, h, {0.5}, {&k1}, tmp);
+            inner_ode_rhs(t + h / 2, tmp.data(), k2.data(), dim, *rhs_data_);
+            axpy_stages(y, h, {0.5}, {&k2}, tmp);
+            inner_ode_rhs(t + h / 2, tmp.data(), k3.data(), dim, *rhs_data_);
+            axpy_stages(y, h, {1.}, {&k3}, tmp);
+            inner_ode_rhs(t + h, tmp.data(), k4.data(), dim, *rhs_data_);
+            axpy_stages(y, h, {1. / 6, 1. / 3, 1. / 3, 1. / 6}, {&k1, &k2, &k3, &k4}, y);
+            t += h;
+        }
+        t = times[n];
+        copy_to_row(y, states, n);
+    }
+    return out;
+}
+
+py::tuple RhsFunctor::dopri5(double t0,
+                             py::array_t <complex_t> y0,
+                             py::array_t <double> tlist,
+                             double first_step,
+                             double atol,
+                             double rtol,
+                             double min_step,
+                             double max_step,
+                             long nsteps,
+                             bool single_step) {
+    auto y = state_from_array(y0);
+    const auto times = times_from_array(tlist);
+    const auto dim = y.size();
+    if (times.empty())
+        throw std::invalid_argument("dopri5 requires at least one output time.");
+    const double t_end = times.back();
+    if (max_step <= 0.)
+        max_step = std::abs(t_end - t0);
+
+    state_t k1(dim), k2(dim), k3(dim), k4(dim), k5(dim), k6(dim), k7(dim);
+    state_t y_new(dim), tmp(dim);
+    const auto num_out = single_step ? size_t(1) : times.size();
+    py::array_t <complex_t> out(std::vector<py::ssize_t>{static_cast<py::ssize_t>(num_out),
+                                                          static_cast<py::ssize_t>(dim)});
+    auto states = static_cast<complex_t *>(out.request().ptr);
+
+    double t = t0;
+    inner_ode_rhs(t, y.data(), k1.data(), dim, *rhs_data_);
+
+    // Initial step size estimate from the scaled norms of y0 and f(t0, y0)
+    double h = first_step;
+    if (h <= 0.) {
+        double d0 = 0., d1 = 0.;
+        for (size_t i = 0; i < dim; ++i) {
+            const double sc = atol + rtol * std::abs(y[i]);
+            d0 += std::norm(y[i]) / (sc * sc);
+            d1 += std::norm(k1[i]) / (sc * sc);
+        }
+        d0 = std::sqrt(d0 / dim);
+        d1 = std::sqrt(d1 / dim);
+        h = (d0 < 1e-5 || d1 < 1e-5) ? 1e-6 : 0.01 * d0 / d1;
+    }
+    h = std::min(h, max_step);
+
+    size_t next_out = 0;
+    if (single_step) {
+        copy_to_row(y, states, 0);
+    } else {
+        while (next_out < times.size() && times[next_out] <= t) {
+            copy_to_row(y, states, next_out);
+            next_out++;
+        }
+    }
+
+    long step_count = 0;
+    while (t < t_end) {
+        if (step_count++ >= nsteps)
+            throw std::runtime_error("dopri5: maximum number of steps (nsteps) exceeded.");
+        if (h < min_step)
+            throw std::runtime_error("dopri5: required step size is below min_step.");
+        h = std::min(h, t_end - t);
+
+        axpy_stages(y, h, a2, {&k1}, tmp);
+        inner_ode_rhs(t + c2 * h, tmp.data(), k2.data(), dim, *rhs_data_);
+        axpy_stages(y, h, a3, {&k1, &k2}, tmp);
+        inner_ode_rhs(t + c3 * h, tmp.data(), k3.data(), dim, *rhs_data_);
+        axpy_stages(y, h, a4, {&k1, &k2, &k3}, tmp);
+        inner_ode_rhs(t + c4 * h, tmp.data(), k4.data(), dim, *rhs_data_);
+        axpy_stages(y, h, a5, {&k1, &k2, &k3, &k4}, tmp);
+        inner_ode_rhs(t + c5 * h, tmp.data(), k5.data(), dim, *rhs_data_);
+        axpy_stages(y, h, a6, {&k1, &k2, &k3, &k4, &k5}, tmp);
+        inner_ode_rhs(t + h, tmp.data(), k6.data(), dim, *rhs_data_);
+        axpy_stages(y, h, a7, {&k1, &k2, &k3, &k4, &k5, &k6}, y_new);
+        inner_ode_rhs(t + h, y_new.data(), k7.data(), dim, *rhs_data_);
+
+        // Scaled RMS norm of the local error estimate
+        double err = 0.;
+        for (size_t i = 0; i < dim; ++i) {
+            const complex_t err_i = h * (e[0] * k1[i] + e[2] * k3[i] + e[3] * k4[i] +
+                                         e[4] * k5[i] + e[5] * k6[i] + e[6] * k7[i]);
+            const double sc = atol + rtol * std::max(std::abs(y[i]), std::abs(y_new[i]));
+            err += std::norm(err_i) / (sc * sc);
+        }
+        err = std::sqrt(err / dim);
+
+        const double factor = (err == 0.) ? 10. : 0.9 * std::pow(err, -0.2);
+        if (err > 1.) {
+            // Rejected step
+            h *= std::max(0.2, factor);
+            continue;
+        }
+
+        // Accepted step: dense output for the times in (t, t + h]
+        const double t_new = t + h;
+        while (!single_step && next_out < times.size() && times[next_out] <= t_new) {
+            if (times[next_out] == t_new) {
+                copy_to_row(y_new, states, next_out);
+            } else {
+                const double theta = (times[next_out] - t) / h;
+                const double theta1 = 1. - theta;
+                for (size_t i = 0; i < dim; ++i) {
+                    const complex_t ydiff = y_new[i] - y[i];
+                    const complex_t bspl = h * k1[i] - ydiff;
+                    const complex_t rc4 = ydiff - h * k7[i] - bspl;
+                    const complex_t rc5 = h * (d[0] * k1[i] + d[2] * k3[i] + d[3] * k4[i] +
+                                               d[4] * k5[i] + d[5] * k6[i] + d[6] * k7[i]);
+                    tmp[i] = y[i] + theta * (ydiff + theta1 * (bspl + theta * (rc4 + theta1 * rc5)));
+                }
+                copy_to_row(tmp, states, next_out);
+            }
+            next_out++;
+        }
+
+        t = t_new;
+        y.swap(y_new);
+        k1.swap(k7);
+        h = std::min(h * std::min(10., factor), max_step);
+
+        if (single_step) {
+            copy_to_row(y, states, 0);
+            break;
+        }
+    }
+
+    return py::make_tuple(out, t, h);
+}
+
 RhsFunctor::RhsFunctor(py::object the_global_data, py::object the_exp, py::object the_system,
                        py::object the_channels, py::object the_reg)
     : rhs_data_(
@@ -49,6 +49,31 @@ public:
 
     py::array_t <complex_t> operator()(double t, py::array_t <complex_t> the_vec);
 
+    // Fixed step RK4 integration from (t0, y0) through all the times in tlist.
+    // Each interval is split in the smallest number of equal steps not larger than max_dt.
+    // Returns a 2D array with the state at each time in tlist.
+    py::array_t <complex_t> rk4(double t0,
+                                py::array_t <complex_t> y0,
+                                py::array_t <double> tlist,
+                                double max_dt);
+
+    // Adaptive Dormand-Prince 5(4) integration from (t0, y0) through all the times in tlist,
+    // with the states at tlist computed by dense output.
+    // If single_step is true only one accepted step is done, and the state at the end of
+    // the step is returned.
+    // Returns a tuple (states, t, h_next) where states is a 2D array with a state for each
+    // time in tlist, t is the final time and h_next the proposed size for the next step.
+    py::tuple dopri5(double t0,
+                     py::array_t <complex_t> y0,
+                     py::array_t <double> tlist,
+                     double first_step,
+                     double atol,
+                     double rtol,
+                     double min_step,
+                     double max_step,
+                     long nsteps,
+                     bool single_step);
+
 private:
     std::shared_ptr<RhsData> rhs_data_;
 };
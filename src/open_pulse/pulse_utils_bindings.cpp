@@ -48,6 +48,8 @@ PYBIND11_MODULE(pulse_utils, m) {
 
     py::class_<RhsFunctor> ode_rhs_func(m, "OdeRhsFunctor");
     ode_rhs_func.def("__call__", &RhsFunctor::operator());
+    ode_rhs_func.def("rk4", &RhsFunctor::rk4, "Fixed step RK4 integration through the times in tlist");
+    ode_rhs_func.def("dopri5", &RhsFunctor::dopri5, "Adaptive Dormand-Prince integration through the times in tlist");
     ode_rhs_func.def("__reduce__", [ode_rhs_func](const RhsFunctor& self) { return py::make_tuple(ode_rhs_func, py::tuple());});
 
     m.def("get_ode_rhs_functor", &get_ode_rhs_functor, "Get ode_rhs functor to allow caching of parameters");
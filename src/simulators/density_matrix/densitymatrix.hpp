@@ -125,6 +125,17 @@ public:
   // outcome in [0, 2^num_qubits - 1]
   virtual double probability(const uint_t outcome) const override;
 
+  //-----------------------------------------------------------------------
+  // Expectation Value
+  //-----------------------------------------------------------------------
+
+  // Return the expectation value sum_j coeff_j * Tr[P_j rho] of a sum of
+  // N-qubit Pauli matrices. The Paulis are input as (coeff, string) pairs.
+  // Terms with the same X/Y support are evaluated in a single pass over the
+  // matrix elements rho[i ^ x_mask, i].
+  std::complex<double> expval_pauli_sum(const reg_t &qubits,
+                                        const pauli_sum_t &paulis) const;
+
 protected:
 
   // Construct a vectorized superoperator from a vectorized matrix
@@ -354,6 +365,47 @@ double DensityMatrix<data_t>::probability(const uint_t outcome) const {
   return std::real(BaseVector::data_[outcome * shift]);
 }
 
+//-----------------------------------------------------------------------
+// Expectation Value
+//-----------------------------------------------------------------------
+
+template <typename data_t>
+std::complex<double>
+DensityMatrix<data_t>::expval_pauli_sum(const reg_t &qubits,
+                                        const pauli_sum_t &paulis) const {
+  // Tr[P rho] = sum_i phase * sign_z(i) * rho[i ^ x_mask, i]
+  const int_t nrows = BaseMatrix::num_rows();
+  std::complex<double> expval(0., 0.);
+  for (const auto &group : pauli_groups(qubits, paulis)) {
+    const int_t NTERMS = group.z_masks.size();
+    const auto &z_masks = group.z_masks;
+    const uint_t x_mask = group.x_mask;
+    std::vector<std::complex<double>> vals(NTERMS, 0.);
+    #pragma omp parallel if (BaseVector::num_qubits_ > BaseVector::omp_threshold_ && BaseVector::omp_threads_ > 1) num_threads(BaseVector::omp_threads_)
+    {
+      std::vector<std::complex<double>> vals_private(NTERMS, 0.);
+      #pragma omp for
+      for (int_t i = 0; i < nrows; ++i) {
+        const std::complex<double> val = BaseVector::data_[(i ^ x_mask) + i * nrows];
+        for (int_t j = 0; j < NTERMS; ++j) {
+          if (AER::Utils::popcount(i & z_masks[j]) & 1)
+            vals_private[j] -= val;
+          else
+            vals_private[j] += val;
+        }
+      }
+      #pragma omp critical
+      for (int_t j = 0; j < NTERMS; ++j) {
+        vals[j] += vals_private[j];
+      }
+    }
+    for (int_t j = 0; j < NTERMS; ++j) {
+      expval += group.coeffs[j] * std::real(group.phases[j] * vals[j]);
+    }
+  }
+  return expval;
+}
+
 //------------------------------------------------------------------------------
 } // end namespace QV
 } // end namespace AER
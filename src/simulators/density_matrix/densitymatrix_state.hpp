@@ -20,6 +20,7 @@
 #include <math.h>
 
 #include "densitymatrix.hpp"
+#include "framework/checkpoint.hpp"
 #include "framework/json.hpp"
 #include "framework/opset.hpp"
 #include "framework/utils.hpp"
@@ -111,11 +112,21 @@ public:
   // if the controller/engine allows threads for it
   virtual void set_config(const json_t &config) override;
 
+  // Add the allocation policy of the state buffers to the metadata
+  virtual void add_metadata(ExperimentResult &result) const override;
+
   // Sample n-measurement outcomes without applying the measure operation
   // to the system state
   virtual std::vector<reg_t> sample_measure(const reg_t &qubits, uint_t shots,
                                             RngEngine &rng) override;
 
+  // Checkpoints are supported by every density matrix class
+  virtual bool checkpoint_supported() const override {return true;}
+
+  // Write and read the entries of the density matrix
+  virtual void save_checkpoint(std::ostream &out) const override;
+  virtual void load_checkpoint(std::istream &in) override;
+
   //-----------------------------------------------------------------------
   // Additional methods
   //-----------------------------------------------------------------------
@@ -390,6 +401,56 @@ void State<densmat_t>::set_config(const json_t &config) {
   // Set OMP threshold for state update functions
   JSON::get_value(omp_qubit_threshold_, "statevector_parallel_threshold",
                   config);
+
+  // Set the allocation policy for the state buffers
+  std::string allocator;
+  if (JSON::get_value(allocator, "statevector_allocator", config)) {
+    BaseState::qreg_.set_allocator(allocator);
+  }
+}
+
+template <class densmat_t>
+void State<densmat_t>::add_metadata(ExperimentResult &result) const {
+  result.metadata.add(BaseState::qreg_.get_allocator(), "statevector_allocator");
+}
+
+template <class densmat_t>
+void State<densmat_t>::save_checkpoint(std::ostream &out) const {
+  // A matrix in host memory is written from its buffer, and a device
+  // matrix from a copy
+  const auto &qreg = BaseState::qreg_;
+  Checkpoint::write<uint_t>(out, qreg.num_qubits());
+  if (std::is_base_of<QV::QubitVector<double>, densmat_t>::value ||
+      std::is_base_of<QV::QubitVector<float>, densmat_t>::value) {
+    Checkpoint::write_amplitudes(out, qreg.data(), qreg.size());
+  } else {
+    const auto vec = qreg.copy_to_vector();
+    Checkpoint::write_amplitudes(out, vec.data(), vec.size());
+  }
+}
+
+template <class densmat_t>
+void State<densmat_t>::load_checkpoint(std::istream &in) {
+  auto &qreg = BaseState::qreg_;
+  using amplitude_t = typename std::remove_pointer<
+      typename std::decay<decltype(qreg.data())>::type>::type;
+  uint_t num_qubits;
+  Checkpoint::read(in, num_qubits);
+  const uint_t size =
+      Checkpoint::read_amplitudes_size<typename amplitude_t::value_type>(in);
+  if (num_qubits != qreg.num_qubits() || size != qreg.size()) {
+    throw std::runtime_error(
+        "DensityMatrix::State: the checkpoint does not match the number of "
+        "qubits of the state.");
+  }
+  if (std::is_base_of<QV::QubitVector<double>, densmat_t>::value ||
+      std::is_base_of<QV::QubitVector<float>, densmat_t>::value) {
+    Checkpoint::read_buffer(in, qreg.data(), size);
+  } else {
+    AER::Vector<amplitude_t> vec(size, false);
+    Checkpoint::read_buffer(in, vec.data(), size);
+    qreg.initialize_from_data(vec.data(), size);
+  }
 }
 
 //=========================================================================
@@ -444,6 +505,7 @@ void State<densmat_t>::apply_ops(const std::vector<Operations::Op> &ops,
                                       op.name + "\'.");
       }
     }
+    BaseState::checkpoint_hook(i + 1);
   }
 }
 
@@ -526,13 +588,9 @@ void State<densmat_t>::snapshot_pauli_expval(const Operations::Op &op,
         "Invalid expval snapshot (Pauli components are empty).");
   }
 
-  // Accumulate expval components
-  complex_t expval(0., 0.);
-  for (const auto &param : op.params_expval_pauli) {
-    const auto &coeff = param.first;
-    const auto &pauli = param.second;
-    expval += coeff * BaseState::qreg_.expval_pauli(op.qubits, pauli);
-  }
+  // Compute the expectation value of the Pauli sum
+  complex_t expval = BaseState::qreg_.expval_pauli_sum(op.qubits,
+                                                       op.params_expval_pauli);
 
   // Add to snapshot
   Utils::chop_inplace(expval, json_chop_threshold_);
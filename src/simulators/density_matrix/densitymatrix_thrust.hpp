@@ -134,6 +134,17 @@ public:
   // generating samples.
   virtual reg_t sample_measure(const std::vector<double> &rnds) const override;
 
+  //-----------------------------------------------------------------------
+  // Expectation Value
+  //-----------------------------------------------------------------------
+
+  // Return the expectation value sum_j coeff_j * Tr[P_j rho] of a sum of
+  // N-qubit Pauli matrices. The Paulis are input as (coeff, string) pairs.
+  // Terms with the same X/Y support are evaluated in a single pass over the
+  // matrix elements rho[i ^ x_mask, i].
+  std::complex<double> expval_pauli_sum(const reg_t &qubits,
+                                        const pauli_sum_t &paulis) const;
+
 protected:
 
   // Construct a vectorized superoperator from a vectorized matrix
@@ -484,6 +495,124 @@ void DensityMatrixThrust<data_t>::apply_toffoli(const uint_t qctrl0,
 
 }
 
+//-----------------------------------------------------------------------
+// Expectation Value
+//-----------------------------------------------------------------------
+
+//Tr[P rho] for a sum of Pauli terms sharing the same X mask
+//params_ holds the Z mask of each term,
+//matrix_ holds the weighted phase of each term
+template <typename data_t>
+class DensityExpvalPauliSum : public GateFuncBase
+{
+protected:
+  uint_t x_mask_;
+  uint_t nterms_;
+  uint_t num_qubits_;
+  uint_t row_mask_;
+public:
+  DensityExpvalPauliSum(uint_t x,uint_t nt,uint_t nq)
+  {
+    x_mask_ = x;
+    nterms_ = nt;
+    num_qubits_ = nq;
+    row_mask_ = (1ull << nq) - 1;
+  }
+
+  bool IsDiagonal(void)
+  {
+    return true;
+  }
+  bool Reduction(void)
+  {
+    return true;
+  }
+
+  __host__ __device__ double operator()(const thrust::tuple<uint_t,struct GateParams<data_t>> &iter) const
+  {
+    uint_t i,k,gid,row,col,count;
+    thrust::complex<data_t>* pV;
+    uint_t* z_masks;
+    thrust::complex<double>* phases;
+    thrust::complex<double> q0;
+    double d0,ret = 0.0;
+    struct GateParams<data_t> params;
+
+    i = ExtractIndexFromTuple(iter);
+    params = ExtractParamsFromTuple(iter);
+    pV = params.buf_;
+    z_masks = params.params_;
+    phases = params.matrix_;
+    gid = params.gid_;
+
+    //only elements rho[col ^ x_mask, col] contribute to the trace
+    row = (i + gid) & row_mask_;
+    col = (i + gid) >> num_qubits_;
+    if((row ^ col) != x_mask_){
+      return 0.0;
+    }
+
+    q0 = pV[i];
+    for(k=0;k<nterms_;k++){
+      d0 = (phases[k] * q0).real();
+
+      //count bits (__builtin_popcountll can not be used on GPU)
+      count = col & z_masks[k];
+      count = (count & 0x5555555555555555) + ((count >> 1) & 0x5555555555555555);
+      count = (count & 0x3333333333333333) + ((count >> 2) & 0x3333333333333333);
+      count = (count & 0x0f0f0f0f0f0f0f0f) + ((count >> 4) & 0x0f0f0f0f0f0f0f0f);
+      count = (count & 0x00ff00ff00ff00ff) + ((count >> 8) & 0x00ff00ff00ff00ff);
+      count = (count & 0x0000ffff0000ffff) + ((count >> 16) & 0x0000ffff0000ffff);
+      count = (count & 0x00000000ffffffff) + ((count >> 32) & 0x00000000ffffffff);
+
+      if(count & 1){
+        ret -= d0;
+      }
+      else{
+        ret += d0;
+      }
+    }
+    return ret;
+  }
+  const char* Name(void)
+  {
+    return "density_expval_pauli_sum";
+  }
+};
+
+template <typename data_t>
+std::complex<double> DensityMatrixThrust<data_t>::expval_pauli_sum(const reg_t &qubits,
+                                                                   const pauli_sum_t &paulis) const
+{
+  std::complex<double> expval(0., 0.);
+
+  for (const auto &group : pauli_groups(qubits, paulis)) {
+    const uint_t nterms = group.z_masks.size();
+
+    //the reduction kernel returns a real number, so the real and imaginary
+    //parts of the coefficients are reduced in separate passes
+    bool has_imag = false;
+    for (const auto &coeff : group.coeffs) {
+      has_imag |= (coeff.imag() != 0.);
+    }
+
+    for (int part = 0; part < (has_imag ? 2 : 1); part++) {
+      cvector_t<double> weighted(nterms);
+      for (uint_t k = 0; k < nterms; k++) {
+        const double w = (part == 0) ? group.coeffs[k].real() : group.coeffs[k].imag();
+        weighted[k] = w * group.phases[k];
+      }
+      BaseVector::set_matrix(weighted);
+      BaseVector::set_params(group.z_masks);
+
+      const double val = BaseVector::apply_function(
+          DensityExpvalPauliSum<data_t>(group.x_mask, nterms, num_qubits()), qubits);
+      expval += (part == 0) ? std::complex<double>(val, 0.) : std::complex<double>(0., val);
+    }
+  }
+  return expval;
+}
+
 //-----------------------------------------------------------------------
 // Z-measurement outcome probabilities
 //-----------------------------------------------------------------------
@@ -119,8 +119,9 @@ public:
   void initialize_qreg(uint_t num_qubits, const cvector_t &statevector);
 
   // Returns the required memory for storing an n-qubit state in megabytes.
-  // For this state the memory is indepdentent of the number of ops
-  // and is approximately 16 * 1 << num_qubits bytes
+  // The memory is estimated from bounds on the bond dimensions after each
+  // operation. With a memory budget the truncation keeps the memory below
+  // the budget, so the estimate is at most the budget.
     virtual size_t required_memory_mb(uint_t num_qubits,
                                     const std::vector<Operations::Op> &ops)
                                     const override;
@@ -138,6 +139,15 @@ public:
                                             uint_t shots,
                                             RngEngine &rng) override;
 
+  // Write and read the matrix product state
+  virtual bool checkpoint_supported() const override {return true;}
+  virtual void save_checkpoint(std::ostream &out) const override {
+    qreg_.save_checkpoint(out);
+  }
+  virtual void load_checkpoint(std::istream &in) override {
+    qreg_.load_checkpoint(in);
+  }
+
   // Computes sample_measure by first computing the probabilities and then
   // randomly chooses measurement outcomes based on the probability weights
   std::vector<reg_t> 
@@ -153,6 +163,15 @@ public:
 				     uint_t shots,
 				     RngEngine &rng) const;
 
+  // Computes sample_measure by sampling the qubits one by one from their
+  // conditional probabilities, sharing the computation between the shots
+  // with the same outcomes on the previous qubits. The MPS is not copied,
+  // so this is efficient for a large number of qubits and shots
+  std::vector<reg_t> 
+  sample_measure_using_conditional_probabilities(const reg_t &qubits,
+						 uint_t shots,
+						 RngEngine &rng) const;
+
   //-----------------------------------------------------------------------
   // Additional methods
   //-----------------------------------------------------------------------
@@ -169,6 +188,13 @@ protected:
   // If the input is not in allowed_gates an exeption will be raised.
   void apply_gate(const Operations::Op &op);
 
+  // Return true if the operation is applied to two qubits of the MPS
+  static bool is_two_qubit_op(const Operations::Op &op);
+
+  // Return true if the operation is a two-qubit unitary that can be
+  // collected in a layer of gates applied in parallel
+  static bool is_layer_gate(const Operations::Op &op);
+
   // Initialize the specified qubits to a given state |psi>
   // by creating the MPS state with the new state |psi>.
   // |psi> is given in params
@@ -393,14 +419,7 @@ void State::initialize_omp() {
 
 size_t State::required_memory_mb(uint_t num_qubits,
 			      const std::vector<Operations::Op> &ops) const {
-    // for each qubit we have a tensor structure.
-    // Initially, each tensor contains 2 matrices with a single complex double
-    // Depending on the number of 2-qubit gates,
-    // these matrices may double their size
-    // for now - compute only initial size
-    // later - FIXME
-    size_t mem_mb = 16 * 2 * num_qubits;
-    return mem_mb;
+  return MPS::required_memory_mb(num_qubits, ops);
 }
 
 void State::set_config(const json_t &config) {
@@ -445,10 +464,41 @@ void State::set_config(const json_t &config) {
       MPS::set_sample_measure_alg(Sample_measure_alg::PROB);
     } else if (alg.compare("mps_apply_measure") == 0) {
       MPS::set_sample_measure_alg(Sample_measure_alg::APPLY_MEASURE);
+    } else if (alg.compare("mps_conditional_probabilities") == 0) {
+      MPS::set_sample_measure_alg(Sample_measure_alg::CONDITIONAL);
     }
   } else {
     MPS::set_sample_measure_alg(Sample_measure_alg::HEURISTIC);
   }
+
+  // Set the layout and routing of the qubits for two-qubit gates
+  bool initial_layout = true;
+  JSON::get_value(initial_layout, "mps_initial_layout", config);
+  MPS::set_initial_layout(initial_layout);
+  uint_t routing_lookahead = 16;
+  JSON::get_value(routing_lookahead, "mps_routing_lookahead", config);
+  MPS::set_routing_lookahead(routing_lookahead);
+
+  // Set the algorithm for the SVD of two-qubit gates
+  MPS_Tensor::set_svd_alg(SVD_alg::HEURISTIC);
+  if (JSON::get_value(alg, "mps_svd_algorithm", config)) {
+    if (alg.compare("csvd") == 0) {
+      MPS_Tensor::set_svd_alg(SVD_alg::CSVD);
+    } else if (alg.compare("lapack") == 0) {
+      MPS_Tensor::set_svd_alg(SVD_alg::LAPACK);
+    } else if (alg.compare("randomized") == 0) {
+      MPS_Tensor::set_svd_alg(SVD_alg::RANDOMIZED);
+    } else if (alg.compare("heuristic") != 0) {
+      throw std::invalid_argument(
+        "MatrixProductState::State::set_config: invalid mps_svd_algorithm \"" +
+        alg + "\".");
+    }
+  }
+
+  // Set the precision of the contractions and SVDs of two-qubit gates
+  std::string precision = "double";
+  JSON::get_value(precision, "precision", config);
+  MPS_Tensor::set_single_precision(precision == "single");
 }
 
 void State::add_metadata(ExperimentResult &result) const {
@@ -461,6 +511,20 @@ void State::add_metadata(ExperimentResult &result) const {
   result.metadata.add(
     MPS::get_sample_measure_alg(),
     "matrix_product_state_sample_measure_algorithm");
+  const std::vector<std::string> svd_algs = {"csvd", "lapack", "randomized",
+                                             "heuristic"};
+  result.metadata.add(
+    svd_algs[static_cast<int>(MPS_Tensor::get_svd_alg())],
+    "matrix_product_state_svd_algorithm");
+  result.metadata.add(
+    std::string(MPS_Tensor::get_single_precision() ? "single" : "double"),
+    "matrix_product_state_precision");
+  result.metadata.add(
+    MPS::get_memory_budget_mb(),
+    "matrix_product_state_memory_budget_mb");
+  result.metadata.add(
+    MPS::get_routing_lookahead(),
+    "matrix_product_state_routing_lookahead");
 } 
 
 //=========================================================================
@@ -471,8 +535,38 @@ void State::apply_ops(const std::vector<Operations::Op> &ops,
                       ExperimentResult &result,
                       RngEngine &rng, bool final_ops) {
 
+  // The qubits of the two-qubit operations, for the layout and routing
+  std::vector<std::pair<uint_t, uint_t>> gates;
+  if (MPS::get_initial_layout() || MPS::get_routing_lookahead() > 0) {
+    for (const auto &op : ops) {
+      if (is_two_qubit_op(op))
+        gates.push_back(std::make_pair(op.qubits[0], op.qubits[1]));
+    }
+  }
+  // A product state is reordered without swaps
+  if (MPS::get_initial_layout() && qreg_.get_max_bond_dimensions() <= 1)
+    qreg_.apply_layout(MPS::linear_layout(qreg_.num_qubits(), gates));
+
   // Simple loop over vector of input operations
-  for (const auto &op: ops) {
+  uint_t next_gate = 0;
+  uint_t layer_end = 0;
+  for (uint_t i = 0; i < ops.size(); i++) {
+    const auto &op = ops[i];
+    // The gates of a run of two-qubit gates on disjoint bonds are applied
+    // in parallel
+    if (i >= layer_end && BaseState::threads_ > 1 && is_layer_gate(op)) {
+      layer_end = i + 1;
+      while (layer_end < ops.size() && is_layer_gate(ops[layer_end]))
+        layer_end++;
+      if (layer_end > i + 1)
+        qreg_.begin_layer(BaseState::threads_);
+    }
+    if (MPS::get_routing_lookahead() > 0 && is_two_qubit_op(op)) {
+      next_gate++;
+      qreg_.set_lookahead(gates.begin() + next_gate,
+        gates.begin() + std::min<uint_t>(gates.size(),
+                                         next_gate + MPS::get_routing_lookahead()));
+    }
     if(BaseState::creg_.check_conditional(op)) {
       switch (op.type) {
         case Operations::OpType::barrier:
@@ -512,6 +606,56 @@ void State::apply_ops(const std::vector<Operations::Op> &ops,
                                       op.name + "\'.");
       }
     }
+    if (i + 1 == layer_end)
+      qreg_.end_layer();
+    // The state is written to a checkpoint outside of the parallel layers
+    if (i + 1 >= layer_end)
+      BaseState::checkpoint_hook(i + 1);
+  }
+  qreg_.set_lookahead(gates.end(), gates.end());
+
+  // The truncation and routing since the state was initialized, which is
+  // the current shot when shots are simulated one at a time
+  result.metadata.add(qreg_.get_discarded_weight(),
+                      "matrix_product_state_discarded_weight");
+  result.metadata.add(qreg_.get_num_swaps(),
+                      "matrix_product_state_swaps");
+  if (MPS::get_purification()) {
+    result.metadata.add(qreg_.get_num_purification_qubits(),
+                        "matrix_product_state_purification_qubits");
+  }
+  if (MPS::get_memory_budget_mb() > 0) {
+    result.metadata.add(qreg_.get_truncation_threshold(),
+                        "matrix_product_state_adaptive_truncation_threshold");
+    result.metadata.add(qreg_.get_max_bond_dimension(),
+                        "matrix_product_state_adaptive_max_bond_dimension");
+  }
+}
+
+bool State::is_two_qubit_op(const Operations::Op &op) {
+  if (op.qubits.size() != 2)
+    return false;
+  switch (op.type) {
+    case Operations::OpType::gate:
+    case Operations::OpType::matrix:
+    case Operations::OpType::diagonal_matrix:
+    case Operations::OpType::kraus:
+      return true;
+    default:
+      return false;
+  }
+}
+
+bool State::is_layer_gate(const Operations::Op &op) {
+  if (op.qubits.size() != 2 || op.conditional)
+    return false;
+  switch (op.type) {
+    case Operations::OpType::gate:
+    case Operations::OpType::matrix:
+    case Operations::OpType::diagonal_matrix:
+      return true;
+    default:
+      return false;
   }
 }
 
@@ -527,13 +671,15 @@ void State::snapshot_pauli_expval(const Operations::Op &op,
   }
 
   //Compute expval components
-  complex_t expval(0., 0.);
+  std::vector<std::string> pauli_matrices;
+  pauli_matrices.reserve(op.params_expval_pauli.size());
+  for (const auto &param : op.params_expval_pauli)
+    pauli_matrices.push_back(param.second);
+  const auto pauli_expvals = qreg_.expectation_values_pauli(op.qubits, pauli_matrices);
 
-  for (const auto &param : op.params_expval_pauli) {
-    complex_t coeff = param.first;
-    std::string pauli_matrices = param.second;
-    complex_t pauli_expval = qreg_.expectation_value_pauli(op.qubits, pauli_matrices);
-    expval += coeff * pauli_expval;
+  complex_t expval(0., 0.);
+  for (uint_t i = 0; i < pauli_expvals.size(); i++) {
+    expval += op.params_expval_pauli[i].first * pauli_expvals[i];
   }
 
   // add to snapshot
@@ -594,6 +740,9 @@ void State::snapshot_matrix_expval(const Operations::Op &op,
 void State::snapshot_state(const Operations::Op &op,
 			   ExperimentResult &result,
 			   std::string name) {
+  if (qreg_.get_num_purification_qubits() > 0)
+    throw std::invalid_argument(
+      "MatrixProductState::State::statevector snapshot is not supported after purified noise.");
   cvector_t statevector;
   qreg_.full_state_vector(statevector);
   result.legacy_data.add_pershot_snapshot("statevector", op.string_params[0], statevector);
@@ -605,6 +754,9 @@ void State::snapshot_amplitudes(const Operations::Op &op,
   if (op.params_amplitudes.empty()) {
     throw std::invalid_argument("Invalid amplitudes snapshot (No base value given).");
   }
+  if (qreg_.get_num_purification_qubits() > 0)
+    throw std::invalid_argument(
+      "MatrixProductState::State::amplitudes snapshot is not supported after purified noise.");
   reg_t base_values;
   for (const auto &param : op.params_amplitudes) {
     base_values.push_back(param);
@@ -779,7 +931,10 @@ void State::apply_matrix(const reg_t &qubits, const cvector_t &vmat) {
 void State::apply_kraus(const reg_t &qubits,
                    const std::vector<cmatrix_t> &kmats,
                    RngEngine &rng) {
-  qreg_.apply_kraus(qubits, kmats, rng);
+  if (MPS::get_purification())
+    qreg_.apply_kraus_purified(qubits, kmats);
+  else
+    qreg_.apply_kraus(qubits, kmats, rng);
 }
 
 
@@ -822,7 +977,7 @@ std::vector<reg_t> State::sample_measure(const reg_t &qubits,
                                          uint_t shots,
                                          RngEngine &rng) {
 
-  // There are two alternative algorithms for sample measure
+  // There are three alternative algorithms for sample measure
   // We choose the one that is optimal relative to the total number 
   // of qubits,and the number of shots.
   // The parameters used below are based on experimentation.
@@ -831,40 +986,22 @@ std::vector<reg_t> State::sample_measure(const reg_t &qubits,
   if (MPS::get_sample_measure_alg() == Sample_measure_alg::PROB){
     return sample_measure_using_probabilities(qubits, shots, rng);
   }
-  if (MPS::get_sample_measure_alg() == Sample_measure_alg::APPLY_MEASURE ||
-      num_qubits >26 )
+  if (MPS::get_sample_measure_alg() == Sample_measure_alg::APPLY_MEASURE)
      return sample_measure_using_apply_measure(qubits, shots, rng);
-
-  double num_qubits_dbl = static_cast<double>(num_qubits);
-  double shots_dbl = static_cast<double>(shots);
+  if (MPS::get_sample_measure_alg() == Sample_measure_alg::CONDITIONAL)
+    return sample_measure_using_conditional_probabilities(qubits, shots, rng);
 
   // Sample_measure_alg::HEURISTIC
-  uint_t max_bond_dim = qreg_.get_max_bond_dimensions();
-
-  if (num_qubits <10)
+  // The conditional probabilities take O(shots * num_qubits * bond^2) and
+  // are faster than applying the measure for any bond dimension. Computing
+  // all the probabilities is only faster for small circuits or when there
+  // are many more shots than outcomes, and when there are no purification
+  // qubits that the qubits would be moved across.
+  if (qreg_.get_num_purification_qubits() == 0 &&
+      (num_qubits < 10 ||
+       (num_qubits <= 26 && static_cast<double>(shots) > 16. * pow(2., num_qubits))))
     return sample_measure_using_probabilities(qubits, shots, rng);
-  if (max_bond_dim <= 2) {
-    if (shots_dbl < 12.0 * pow(1.85, (num_qubits_dbl-10.0)))
-       return sample_measure_using_apply_measure(qubits, shots, rng);
-    else
-      return sample_measure_using_probabilities(qubits, shots, rng);
-  } else if (max_bond_dim <= 4) {
-    if (shots_dbl < 3.0 * pow(1.75, (num_qubits_dbl-10.0)))
-       return sample_measure_using_apply_measure(qubits, shots, rng);
-    else
-      return sample_measure_using_probabilities(qubits, shots, rng);
-  } else if (max_bond_dim <= 8) {
-    if (shots_dbl < 2.5 * pow(1.65, (num_qubits_dbl-10.0)))
-       return sample_measure_using_apply_measure(qubits, shots, rng);
-    else
-      return sample_measure_using_probabilities(qubits, shots, rng);
-  } else if (max_bond_dim <= 16) {
-    if (shots_dbl < 0.5 * pow(1.75, (num_qubits_dbl-10.0)))
-       return sample_measure_using_apply_measure(qubits, shots, rng);
-    else
-      return sample_measure_using_probabilities(qubits, shots, rng);
-  } 
-  return sample_measure_using_probabilities(qubits, shots, rng);
+  return sample_measure_using_conditional_probabilities(qubits, shots, rng);
 }
 	     
 std::vector<reg_t> State::
@@ -895,6 +1032,13 @@ sample_measure_using_probabilities(const reg_t &qubits,
   return all_samples;
 }
 
+std::vector<reg_t> State::
+  sample_measure_using_conditional_probabilities(const reg_t &qubits,
+						 uint_t shots,
+						 RngEngine &rng) const {
+  return qreg_.sample_measure_using_conditional_probabilities(qubits, shots, rng);
+}
+
 std::vector<reg_t> State::
   sample_measure_using_apply_measure(const reg_t &qubits, 
 				     uint_t shots, 
@@ -975,6 +1119,15 @@ void State::apply_snapshot(const Operations::Op &op, ExperimentResult &result) {
 
 void State::apply_reset(const reg_t &qubits,
                         RngEngine &rng) {
+  if (MPS::get_purification()) {
+    // The reset channel |0><0| rho |0><0| + |0><1| rho |1><0|
+    std::vector<cmatrix_t> kmats(2, cmatrix_t(2, 2));
+    kmats[0](0, 0) = 1.;
+    kmats[1](0, 1) = 1.;
+    for (const auto &qubit : qubits)
+      qreg_.apply_kraus_purified(reg_t({qubit}), kmats);
+    return;
+  }
   // Simulate unobserved measurement
   reg_t outcome = qreg_.apply_measure(qubits, rng);
   // Apply update to reset state
@@ -42,6 +42,26 @@ static const cmatrix_t one_measure =
   uint_t MPS::omp_threshold_ = 14;  
   enum Sample_measure_alg MPS::sample_measure_alg_ = Sample_measure_alg::HEURISTIC; 
   double MPS::json_chop_threshold_ = 1E-8;  
+  uint_t MPS::memory_budget_mb_ = 0;
+  bool MPS::initial_layout_ = true;
+  uint_t MPS::routing_lookahead_ = 16;
+  bool MPS::purification_ = false;
+
+// The truncation is tightened when the memory exceeds this fraction of the
+// memory budget
+constexpr double MEMORY_BUDGET_FRACTION = 0.8;
+// The truncation threshold is raised by this factor, starting from the
+// minimum, until it reaches the maximum. Then the maximum bond dimension
+// is halved instead.
+constexpr double ADAPTIVE_TRUNCATION_FACTOR = 10.;
+constexpr double MIN_ADAPTIVE_TRUNCATION_THRESHOLD = 1e-10;
+constexpr double MAX_ADAPTIVE_TRUNCATION_THRESHOLD = 1e-2;
+// Number of copies of the contracted tensor made by the SVD of a
+// multi-qubit operation
+constexpr double SVD_MEMORY_FACTOR = 4.;
+// Weight of the distance of the k-th next gate when routing is
+// ROUTING_DECAY^k
+constexpr double ROUTING_DECAY = 0.8;
 //------------------------------------------------------------------------
 // local function declarations
 //------------------------------------------------------------------------
@@ -298,6 +318,16 @@ void MPS::initialize(uint_t num_qubits)
   qubit_ordering_.location_.clear();
   qubit_ordering_.location_.resize(num_qubits);
   std::iota(qubit_ordering_.location_.begin(), qubit_ordering_.location_.end(), 0);
+
+  truncation_threshold_ = MPS_Tensor::get_truncation_threshold();
+  max_bond_dimension_ = MPS_Tensor::get_max_bond_dimension();
+  discarded_weight_ = 0.;
+  budget_memory_mb_ = 0.;
+  lookahead_.clear();
+  num_swaps_ = 0;
+  num_purification_qubits_ = 0;
+  layer_ = false;
+  layer_gates_.clear();
 }
 
 void MPS::initialize(const MPS &other){
@@ -307,6 +337,12 @@ void MPS::initialize(const MPS &other){
       lambda_reg_ = other.lambda_reg_;
       qubit_ordering_.order_ = other.qubit_ordering_.order_;
       qubit_ordering_.location_ = other.qubit_ordering_.location_;
+      truncation_threshold_ = other.truncation_threshold_;
+      max_bond_dimension_ = other.max_bond_dimension_;
+      discarded_weight_ = other.discarded_weight_;
+      budget_memory_mb_ = other.budget_memory_mb_;
+      num_swaps_ = other.num_swaps_;
+      num_purification_qubits_ = other.num_purification_qubits_;
     }     
 }
 
@@ -438,6 +474,7 @@ void MPS::apply_swap_internal(uint_t index_A, uint_t index_B, bool swap_gate) {
 			    cmatrix_t(1, 1) /*dummy matrix*/, false /*swapped*/);
  
   if (!swap_gate) {
+    num_swaps_++;
     // we move the qubit at index_A one position to the right
     // and the qubit at index_B (or index_A+1) is moved one position 
     //to the left
@@ -467,10 +504,25 @@ void MPS::apply_2_qubit_gate(uint_t index_A, uint_t index_B, Gates gate_type, co
   // If index_B > index_A, we move the qubit at index_B to index_A+1
   // If index_B < index_A, we move the qubit at index_B to index_A-1, and then
   // swap between the qubits
+  // With a lookahead, both qubits may be moved, to the positions
+  // minimizing the distance of the next gates
   uint_t A = index_A;
 
   bool swapped = false;
 
+  if (!lookahead_.empty()) {
+    const uint_t first = std::min(index_A, index_B);
+    const uint_t second = std::max(index_A, index_B);
+    // By default the qubit at index_B is moved next to the one at index_A
+    A = routing_position(first, second,
+			 (index_A < index_B) ? index_A : index_A - 1);
+    change_position(first, A);
+    change_position(second, A+1);
+    swapped = (index_B < index_A);
+    common_apply_2_qubit_gate(A, gate_type, mat, swapped, is_diagonal);
+    return;
+  }
+
   if (index_B > index_A+1) {
     change_position(index_B, index_A+1);  // Move B to be right after A
   } else if (index_A > 0 && index_B < index_A-1) {
@@ -483,12 +535,100 @@ void MPS::apply_2_qubit_gate(uint_t index_A, uint_t index_B, Gates gate_type, co
   common_apply_2_qubit_gate(A, gate_type, mat, swapped, is_diagonal);
 }
 
+uint_t MPS::routing_position(uint_t first, uint_t second,
+			      uint_t default_pos) const {
+  // Moving the qubit at first to position pos and the qubit at second to
+  // pos+1 shifts the qubits in (first, pos] to the left, and the qubits in
+  // [pos+1, second) to the right
+  auto new_position = [&](uint_t position, uint_t pos) {
+    if (position == first)
+      return pos;
+    if (position == second)
+      return pos + 1;
+    if (position > first && position <= pos)
+      return position - 1;
+    if (position > pos && position < second)
+      return position + 1;
+    return position;
+  };
+  auto cost = [&](uint_t pos) {
+    double total = 0., weight = 1.;
+    for (const auto &gate : lookahead_) {
+      const uint_t a = new_position(get_qubit_index(gate.first), pos);
+      const uint_t b = new_position(get_qubit_index(gate.second), pos);
+      total += weight * ((a > b) ? a - b - 1 : b - a - 1);
+      weight *= ROUTING_DECAY;
+    }
+    return total;
+  };
+  // Every choice takes second-first-1 swaps, so the default position is
+  // kept unless another one is strictly better
+  uint_t best_pos = default_pos;
+  double best_cost = cost(best_pos);
+  for (uint_t pos = first; pos < second; pos++) {
+    const double pos_cost = cost(pos);
+    if (pos_cost < best_cost) {
+      best_pos = pos;
+      best_cost = pos_cost;
+    }
+  }
+  return best_pos;
+}
+
 void MPS::common_apply_2_qubit_gate(uint_t A,  // the gate is applied to A and A+1
 				    Gates gate_type, const cmatrix_t &mat,
 				    bool swapped,
 				    bool is_diagonal) {
   // After we moved the qubits as necessary, 
   // the operation is always between qubits A and A+1
+  if (layer_) {
+    // A gate on the positions A and A+1 reads the lambdas of the bonds
+    // A-1 and A+1, so it is independent of the gates at distance 2 or more
+    for (const auto &gate : layer_gates_) {
+      if (gate.A + 1 >= A && A + 1 >= gate.A) {
+	apply_layer_gates();
+	break;
+      }
+    }
+    layer_gates_.push_back({A, gate_type, mat, swapped, is_diagonal});
+    return;
+  }
+  discarded_weight_ += update_2_qubit_tensors(A, gate_type, mat, swapped, is_diagonal);
+  apply_memory_budget();
+}
+
+void MPS::end_layer() {
+  apply_layer_gates();
+  layer_ = false;
+}
+
+void MPS::apply_layer_gates() {
+  const int_t size = layer_gates_.size();
+  std::vector<double> discarded_weights(size, 0.);
+  std::exception_ptr error = nullptr;
+  #pragma omp parallel for if (size > 1 && num_qubits_ > omp_threshold_ && layer_threads_ > 1) num_threads(layer_threads_)
+  for (int_t i = 0; i < size; i++) {
+    const layer_gate &gate = layer_gates_[i];
+    try {
+      discarded_weights[i] = update_2_qubit_tensors(gate.A, gate.gate_type, gate.mat,
+						    gate.swapped, gate.is_diagonal);
+    } catch (...) {
+      #pragma omp critical
+      error = std::current_exception();
+    }
+  }
+  layer_gates_.clear();
+  if (error)
+    std::rethrow_exception(error);
+  for (const double weight : discarded_weights)
+    discarded_weight_ += weight;
+  apply_memory_budget();
+}
+
+double MPS::update_2_qubit_tensors(uint_t A,
+				   Gates gate_type, const cmatrix_t &mat,
+				   bool swapped,
+				   bool is_diagonal) {
 
   //There is no lambda on the edges of the MPS
   if (A != 0)
@@ -531,7 +671,9 @@ void MPS::common_apply_2_qubit_gate(uint_t A,  // the gate is applied to A and A
 
   MPS_Tensor left_gamma, right_gamma;
   rvector_t lambda;
-  MPS_Tensor::Decompose(temp, left_gamma, lambda, right_gamma);
+  const double discarded_weight =
+    MPS_Tensor::Decompose(temp, left_gamma, lambda, right_gamma,
+			  max_bond_dimension_, truncation_threshold_);
 
   if (A != 0)
     left_gamma.div_Gamma_by_left_Lambda(lambda_reg_[A-1]);
@@ -541,6 +683,7 @@ void MPS::common_apply_2_qubit_gate(uint_t A,  // the gate is applied to A and A
   q_reg_[A] = left_gamma;
   lambda_reg_[A] = lambda;
   q_reg_[A+1] = right_gamma;
+  return discarded_weight;
 }
 
 void MPS::apply_3_qubit_gate(const reg_t &qubits,
@@ -590,7 +733,9 @@ void MPS::apply_3_qubit_gate(const reg_t &qubits,
 
   // We convert the matrix back into a 3-qubit MPS structure
   MPS sub_MPS;
+  truncate_like(sub_MPS);
   sub_MPS.initialize_from_matrix(qubits.size(), state_mat);
+  add_discarded_weight(sub_MPS);
 
   // copy the 3-qubit MPS back to the corresponding positions in the original MPS
   for (uint_t i=0; i<sub_MPS.num_qubits(); i++) {
@@ -602,6 +747,7 @@ void MPS::apply_3_qubit_gate(const reg_t &qubits,
     q_reg_[first].div_Gamma_by_left_Lambda(lambda_reg_[first-1]);
   if (first+2 < num_qubits_-1)
     q_reg_[first+2].div_Gamma_by_right_Lambda(lambda_reg_[first+2]);
+  apply_memory_budget();
 }
 
 void MPS::apply_matrix(const reg_t & qubits, const cmatrix_t &mat, 
@@ -676,7 +822,9 @@ void MPS::apply_matrix_to_target_qubits(const reg_t &target_qubits,
 
   // We convert the matrix back into an MPS structure
   MPS sub_MPS;
+  truncate_like(sub_MPS);
   sub_MPS.initialize_from_matrix(num_qubits, state_mat);
+  add_discarded_weight(sub_MPS);
 
   if (num_qubits == num_qubits_) {
     q_reg_.clear();
@@ -695,6 +843,7 @@ void MPS::apply_matrix_to_target_qubits(const reg_t &target_qubits,
     if (first+num_qubits-1 < num_qubits_-1)
 	q_reg_[first+num_qubits-1].div_Gamma_by_right_Lambda(lambda_reg_[first+num_qubits-1]);
   }
+  apply_memory_budget();
 }
 
 void MPS::apply_diagonal_matrix(const AER::reg_t &qubits, const cvector_t &vmat) {
@@ -711,7 +860,7 @@ void MPS::apply_kraus(const reg_t &qubits,
                    const std::vector<cmatrix_t> &kmats,
                    RngEngine &rng) {
   reg_t internal_qubits = get_internal_qubits(qubits);
-  apply_kraus_internal(qubits, kmats, rng);
+  apply_kraus_internal(internal_qubits, kmats, rng);
 
 }
 void MPS::apply_kraus_internal(const reg_t &qubits,
@@ -732,7 +881,7 @@ void MPS::apply_kraus_internal(const reg_t &qubits,
   
   cmatrix_t rho = density_matrix_internal(qubits);
   
-  cmatrix_t sq_kmat;
+  cmatrix_t sq_kmat, temp_mat;
   double p = 0;
 
   // Loop through N-1 kraus operators
@@ -745,8 +894,7 @@ void MPS::apply_kraus_internal(const reg_t &qubits,
     // check if we need to apply this operator
     if (accum > r) {
       // rescale mat so projection is normalized
-      cmatrix_t temp_mat =  kmats[j] * (1 / std::sqrt(p));
-      apply_matrix_internal(qubits, temp_mat);
+      temp_mat =  kmats[j] * (1 / std::sqrt(p));
       complete = true;
       break;
     }
@@ -755,11 +903,176 @@ void MPS::apply_kraus_internal(const reg_t &qubits,
   if (!complete) {
     // Compute probability from accumulated
     double renorm = 1 / std::sqrt(1. - accum);
-    cmatrix_t temp_mat = kmats.back()* renorm;
-    apply_matrix_internal(qubits, temp_mat);
+    temp_mat = kmats.back()* renorm;
+  }
+
+  // The qubits may be moved when the operator is applied
+  reg_t logical_qubits(qubits.size());
+  for (uint_t i=0; i<qubits.size(); i++)
+    logical_qubits[i] = qubit_ordering_.order_[qubits[i]];
+  apply_matrix_internal(qubits, temp_mat);
+
+  // A non-unitary operator changes the Schmidt coefficients of the bonds
+  // outside of the qubits, as a measurement does
+  if (!AER::Utils::is_unitary(temp_mat, 1e-7)) {
+    const reg_t positions = get_internal_qubits(logical_qubits);
+    propagate_to_neighbors_internal(
+      *std::min_element(positions.begin(), positions.end()),
+      *std::max_element(positions.begin(), positions.end()));
   }
 }
 
+void MPS::apply_kraus_purified(const reg_t &qubits,
+			       const std::vector<cmatrix_t> &kmats) {
+  if (kmats.empty())
+    return;
+  if (kmats.size() == 1) {
+    apply_matrix(qubits, kmats[0]);
+    return;
+  }
+  // The purification qubits are added right after the last of the qubits,
+  // where they only extend the bonds that the isometry entangles
+  uint_t num_new_qubits = 0;
+  while ((1ULL << num_new_qubits) < kmats.size())
+    num_new_qubits++;
+  const reg_t internal_qubits = get_internal_qubits(qubits);
+  uint_t position = *std::max_element(internal_qubits.begin(), internal_qubits.end()) + 1;
+  reg_t all_qubits = qubits;
+  for (uint_t i = 0; i < num_new_qubits; i++)
+    all_qubits.push_back(add_qubit(position++));
+  num_purification_qubits_ += num_new_qubits;
+
+  // The columns of the purification qubits in the |0> state are the
+  // stacked Kraus operators, the other columns are never used
+  const uint_t dim = 1ULL << qubits.size();
+  cmatrix_t mat(dim << num_new_qubits, dim << num_new_qubits);
+  for (uint_t k = 0; k < kmats.size(); k++)
+    for (uint_t col = 0; col < dim; col++)
+      for (uint_t row = 0; row < dim; row++)
+	mat(row + k * dim, col) = kmats[k](row, col);
+  apply_matrix(all_qubits, mat);
+  compress_purification_qubits(get_qubit_index(all_qubits.back()));
+}
+
+void MPS::compress_purification_qubits(uint_t position) {
+  // Find the run of purification qubits around the position
+  const uint_t num_system_qubits = num_qubits_ - num_purification_qubits_;
+  auto is_purification = [&](uint_t pos) {
+    return qubit_ordering_.order_[pos] >= num_system_qubits;
+  };
+  uint_t first = position, last = position;
+  while (first > 0 && is_purification(first - 1))
+    first--;
+  while (last < num_qubits_ - 1 && is_purification(last + 1))
+    last++;
+  const uint_t num_qubits = last - first + 1;
+  if (num_qubits == 1)
+    return;
+
+  // The rows of block_mat are the indices of the run and its columns the
+  // pairs of outer bond indices. Only the reduced state of the system
+  // qubits is observable, so the run can be rotated by the left singular
+  // vectors of block_mat, after which only its first rank indices are used.
+  const MPS_Tensor block = state_vec_as_MPS(first, last);
+  const std::vector<cmatrix_t> block_data = block.get_data();
+  const uint_t left_dim = block_data[0].GetRows();
+  const uint_t right_dim = block_data[0].GetColumns();
+  cmatrix_t block_mat(1ULL << num_qubits, left_dim * right_dim);
+  for (uint_t b = 0; b < block_mat.GetRows(); b++)
+    for (uint_t l = 0; l < left_dim; l++)
+      for (uint_t r = 0; r < right_dim; r++)
+	block_mat(b, l * right_dim + r) = block_data[b](l, r);
+  cmatrix_t U, V;
+  rvector_t S(std::min(block_mat.GetRows(), block_mat.GetColumns()));
+  svd(block_mat, U, S, V, MPS_Tensor::get_svd_alg(), max_bond_dimension_,
+      MPS_Tensor::get_single_precision());
+  const double weight = reduce_zeros(U, S, V, max_bond_dimension_,
+				     truncation_threshold_);
+  uint_t num_new_qubits = 1;
+  while ((1ULL << num_new_qubits) < S.size())
+    num_new_qubits++;
+  if (num_new_qubits >= num_qubits)
+    return;
+  discarded_weight_ += weight;
+
+  // The rotated run is U^dagger block_mat = S V^dagger, renormalized after
+  // the truncation
+  double norm = 0.;
+  for (uint_t k = 0; k < S.size(); k++)
+    norm += S[k] * S[k];
+  std::vector<cmatrix_t> data(1ULL << num_new_qubits,
+			      cmatrix_t(left_dim, right_dim));
+  for (uint_t k = 0; k < S.size(); k++) {
+    const double factor = S[k] / std::sqrt(norm);
+    for (uint_t l = 0; l < left_dim; l++)
+      for (uint_t r = 0; r < right_dim; r++)
+	data[k](l, r) = factor * std::conj(V(l * right_dim + r, k));
+  }
+
+  // Convert the rotated run back into an MPS structure of fewer qubits
+  std::vector<MPS_Tensor> tensors;
+  std::vector<rvector_t> lambdas;
+  if (num_new_qubits == 1) {
+    tensors.push_back(MPS_Tensor(data));
+  } else {
+    cmatrix_t state_mat = data[0];
+    for (uint_t i = 1; i < data.size(); i++)
+      state_mat = AER::Utils::concatenate(state_mat, data[i], 1);
+    MPS sub_MPS;
+    truncate_like(sub_MPS);
+    sub_MPS.initialize_from_matrix(num_new_qubits, state_mat);
+    add_discarded_weight(sub_MPS);
+    tensors = sub_MPS.q_reg_;
+    lambdas = sub_MPS.lambda_reg_;
+  }
+  if (first > 0)
+    tensors.front().div_Gamma_by_left_Lambda(lambda_reg_[first - 1]);
+  if (last < num_qubits_ - 1)
+    tensors.back().div_Gamma_by_right_Lambda(lambda_reg_[last]);
+
+  // Replace the run, and renumber the purification qubits that remain
+  reg_t removed(qubit_ordering_.order_.begin() + first + num_new_qubits,
+		qubit_ordering_.order_.begin() + last + 1);
+  std::sort(removed.begin(), removed.end());
+  q_reg_.erase(q_reg_.begin() + first, q_reg_.begin() + last + 1);
+  q_reg_.insert(q_reg_.begin() + first, tensors.begin(), tensors.end());
+  lambda_reg_.erase(lambda_reg_.begin() + first, lambda_reg_.begin() + last);
+  lambda_reg_.insert(lambda_reg_.begin() + first, lambdas.begin(), lambdas.end());
+  auto &order = qubit_ordering_.order_;
+  order.erase(order.begin() + first + num_new_qubits, order.begin() + last + 1);
+  for (auto &qubit : order)
+    qubit -= std::lower_bound(removed.begin(), removed.end(), qubit) - removed.begin();
+  num_qubits_ -= removed.size();
+  num_purification_qubits_ -= removed.size();
+  qubit_ordering_.location_.resize(num_qubits_);
+  for (uint_t i = 0; i < num_qubits_; i++)
+    qubit_ordering_.location_[order[i]] = i;
+  apply_memory_budget();
+}
+
+uint_t MPS::add_qubit(uint_t position) {
+  // A qubit in the |0> state inserted in a bond has the Schmidt
+  // coefficients of the bond on both of its sides, and
+  // Gamma^0 = diag(1 / lambda) keeps the canonical form
+  const bool edge = (position == 0 || position == num_qubits_);
+  const rvector_t lambda = edge ? rvector_t(1, 1.) : lambda_reg_[position - 1];
+  const uint_t size = lambda.size();
+  cmatrix_t gamma0(size, size), gamma1(size, size);
+  for (uint_t i = 0; i < size; i++)
+    gamma0(i, i) = 1.;
+  MPS_Tensor tensor(gamma0, gamma1);
+  tensor.div_Gamma_by_left_Lambda(lambda);
+
+  q_reg_.insert(q_reg_.begin() + position, tensor);
+  lambda_reg_.insert(lambda_reg_.begin() + (position == 0 ? 0 : position - 1), lambda);
+  const uint_t qubit = num_qubits_++;
+  qubit_ordering_.order_.insert(qubit_ordering_.order_.begin() + position, qubit);
+  qubit_ordering_.location_.resize(num_qubits_);
+  for (uint_t i = 0; i < num_qubits_; i++)
+    qubit_ordering_.location_[qubit_ordering_.order_[i]] = i;
+  return qubit;
+}
+
 void MPS::centralize_qubits(const reg_t &qubits, 
 				     reg_t &centralized_qubits) {
   reg_t sorted_indices;
@@ -1079,6 +1392,117 @@ complex_t MPS::expectation_value_pauli_internal(const reg_t &qubits,
   return result;
 }
 
+std::vector<complex_t> MPS::expectation_values_pauli(const reg_t &qubits,
+						     const std::vector<std::string> &matrices) const {
+  const reg_t internal_qubits = get_internal_qubits(qubits);
+  const uint_t num_terms = matrices.size();
+
+  // The support of every string, and its matrices on all the positions of
+  // the support
+  reg_t first(num_terms), last(num_terms);
+  std::vector<std::string> paulis(num_terms);
+  for (uint_t t = 0; t < num_terms; t++) {
+    const std::string &term = matrices[t];
+    if (term.size() != qubits.size()) {
+      throw std::invalid_argument(
+        "MPS::expectation_values_pauli: Pauli string size does not match the number of qubits.");
+    }
+    first[t] = num_qubits_;
+    last[t] = 0;
+    for (uint_t k = 0; k < qubits.size(); k++) {
+      if (term[term.size()-1-k] != 'I') {
+	first[t] = std::min(first[t], internal_qubits[k]);
+	last[t] = std::max(last[t], internal_qubits[k]);
+      }
+    }
+    if (first[t] > last[t]) {
+      // The identity is contracted on a single qubit
+      first[t] = last[t] = internal_qubits[0];
+    }
+    paulis[t].assign(last[t] - first[t] + 1, 'I');
+    for (uint_t k = 0; k < qubits.size(); k++) {
+      const char gate = term[term.size()-1-k];
+      if (gate != 'I')
+	paulis[t][internal_qubits[k] - first[t]] = gate;
+    }
+  }
+  std::vector<uint_t> order(num_terms);
+  std::iota(order.begin(), order.end(), 0);
+  std::sort(order.begin(), order.end(), [&](uint_t a, uint_t b) {
+    return (first[a] != first[b]) ? first[a] < first[b] : paulis[a] < paulis[b];
+  });
+
+  // The Gamma tensors multiplied by their left Lambda, and their daggers,
+  // computed once for every qubit
+  std::vector<std::vector<cmatrix_t>> gammas(num_qubits_), gammas_dagger(num_qubits_);
+  auto gamma = [&](uint_t position) -> const std::vector<cmatrix_t>& {
+    if (gammas[position].empty()) {
+      MPS_Tensor tensor = q_reg_[position];
+      if (position > 0)
+	tensor.mul_Gamma_by_left_Lambda(lambda_reg_[position-1]);
+      gammas[position] = tensor.get_data();
+      for (const auto &mat : gammas[position])
+	gammas_dagger[position].push_back(AER::Utils::dagger(mat));
+    }
+    return gammas[position];
+  };
+
+  // Contract the left environment with the Pauli matrix on the next qubit:
+  // sum_ij G_i^dagger * env * P_ij G_j
+  auto contract = [&](const cmatrix_t *env, uint_t position, char pauli) {
+    const auto &data = gamma(position);
+    const auto &data_dagger = gammas_dagger[position];
+    const cmatrix_t m0 = env ? (*env) * data[0] : data[0];
+    const cmatrix_t m1 = env ? (*env) * data[1] : data[1];
+    switch (pauli) {
+      case 'I':
+	return data_dagger[0] * m0 + data_dagger[1] * m1;
+      case 'X':
+	return data_dagger[0] * m1 + data_dagger[1] * m0;
+      case 'Y':
+	return complex_t(0., -1.) * (data_dagger[0] * m1) +
+	       complex_t(0., 1.) * (data_dagger[1] * m0);
+      case 'Z':
+	return data_dagger[0] * m0 - data_dagger[1] * m1;
+      default:
+	throw std::invalid_argument(
+	  std::string("MPS::expectation_values_pauli: invalid Pauli matrix ") + pauli);
+    }
+  };
+
+  // envs[k] is the left environment after the k-th qubit of the support of
+  // the previous string
+  std::vector<cmatrix_t> envs;
+  std::vector<complex_t> expvals(num_terms);
+  uint_t prev = num_terms;
+  for (const uint_t t : order) {
+    // Length of the prefix shared with the previous string
+    uint_t shared = 0;
+    if (prev < num_terms && first[prev] == first[t]) {
+      const uint_t max_shared = std::min(paulis[prev].size(), paulis[t].size());
+      while (shared < max_shared && paulis[prev][shared] == paulis[t][shared])
+	shared++;
+    }
+    envs.resize(shared);
+    for (uint_t k = shared; k < paulis[t].size(); k++) {
+      envs.push_back(contract(k > 0 ? &envs[k-1] : nullptr, first[t] + k, paulis[t][k]));
+    }
+    // Close the right edge with the squares of the right Lambda
+    const cmatrix_t &env = envs.back();
+    complex_t expval = 0.;
+    if (last[t] < num_qubits_-1) {
+      const rvector_t &lambda = lambda_reg_[last[t]];
+      for (uint_t i = 0; i < lambda.size(); i++)
+	expval += lambda[i] * lambda[i] * env(i, i);
+    } else {
+      expval = AER::Utils::trace(env);
+    }
+    expvals[t] = expval;
+    prev = t;
+  }
+  return expvals;
+}
+
 std::ostream& MPS::print(std::ostream& out) const {
   for(uint_t i=0; i<num_qubits_; i++)
     {
@@ -1338,13 +1762,129 @@ reg_t MPS::sample_measure_using_probabilities_internal(const rvector_t &rnds,
   return samples;
 }
 
+//------------------------------------------------------------------------------
+// Sample measure outcomes from conditional probabilities. In canonical form
+// Gamma_i^s Lambda_i is right normalized, so the right environment of every
+// position is the identity. After choosing the outcomes s_first ... s_i, the
+// left part of the chain is the row vector
+// v = e_a Gamma_first^s_first Lambda_first ... Gamma_i^s_i Lambda_i
+// where the index a of the left bond of the first position is drawn with
+// probability Lambda_{first-1}[a]^2, and the probability of the outcome s at
+// position i+1 is |v Gamma_{i+1}^s Lambda_{i+1}|^2 / |v|^2. The positions
+// between the sampled qubits are sampled too, and their outcomes discarded.
+//------------------------------------------------------------------------------
+std::vector<reg_t> MPS::sample_measure_using_conditional_probabilities(const reg_t &qubits,
+								       uint_t shots,
+								       RngEngine &rng) const {
+  std::vector<reg_t> samples;
+  if (qubits.empty())
+    return std::vector<reg_t>(shots);
+  samples.reserve(shots);
+
+  const reg_t internal_qubits = get_internal_qubits(qubits);
+  const uint_t first = *std::min_element(internal_qubits.begin(), internal_qubits.end());
+  const uint_t last = *std::max_element(internal_qubits.begin(), internal_qubits.end());
+
+  // The site tensors Gamma_i^s Lambda_i of the sampled positions
+  std::vector<std::vector<cmatrix_t>> sites(last - first + 1);
+  for (uint_t i = first; i <= last; i++) {
+    MPS_Tensor tensor = q_reg_[i];
+    if (i < num_qubits_ - 1)
+      tensor.mul_Gamma_by_right_Lambda(lambda_reg_[i]);
+    sites[i - first] = tensor.get_data();
+  }
+
+  // A prefix of outcomes of the positions first ... position-1, and the
+  // number of shots sharing it
+  struct Prefix {
+    uint_t position;
+    cvector_t state;
+    uint_t shots;
+    reg_t outcomes;
+  };
+  std::vector<Prefix> stack;
+
+  // Split the shots between the indices of the left bond
+  rvector_t left_probs(1, 1.);
+  if (first > 0) {
+    left_probs = lambda_reg_[first - 1];
+    for (auto &prob : left_probs)
+      prob *= prob;
+  }
+  double remaining_prob = std::accumulate(left_probs.begin(), left_probs.end(), 0.);
+  uint_t remaining_shots = shots;
+  for (uint_t a = 0; a < left_probs.size() && remaining_shots > 0; a++) {
+    uint_t count = remaining_shots;
+    if (a < left_probs.size() - 1 && left_probs[a] < remaining_prob)
+      count = rng.rand_binomial(remaining_shots, left_probs[a] / remaining_prob);
+    remaining_prob -= left_probs[a];
+    remaining_shots -= count;
+    if (count > 0) {
+      cvector_t state(left_probs.size(), 0.);
+      state[a] = 1.;
+      stack.push_back({first, std::move(state), count, reg_t()});
+    }
+  }
+
+  while (!stack.empty()) {
+    Prefix prefix = std::move(stack.back());
+    stack.pop_back();
+    if (prefix.position > last) {
+      reg_t sample(qubits.size());
+      for (uint_t k = 0; k < qubits.size(); k++)
+	sample[k] = prefix.outcomes[internal_qubits[k] - first];
+      samples.insert(samples.end(), prefix.shots, sample);
+      continue;
+    }
+
+    // The left vectors and probabilities of both outcomes
+    const std::vector<cmatrix_t> &site = sites[prefix.position - first];
+    std::vector<cvector_t> states(2);
+    double probs[2];
+    for (uint_t s = 0; s < 2; s++) {
+      const cmatrix_t &mat = site[s];
+      states[s].resize(mat.GetColumns());
+      probs[s] = 0.;
+      for (uint_t col = 0; col < mat.GetColumns(); col++) {
+	complex_t value = 0.;
+	for (uint_t row = 0; row < mat.GetRows(); row++)
+	  value += prefix.state[row] * mat(row, col);
+	states[s][col] = value;
+	probs[s] += std::norm(value);
+      }
+    }
+    const double total = probs[0] + probs[1];
+    const uint_t shots0 = (total > 0.) ?
+      rng.rand_binomial(prefix.shots, std::min(1., probs[0] / total)) :
+      rng.rand_binomial(prefix.shots, 0.5);
+
+    for (uint_t s = 0; s < 2; s++) {
+      const uint_t count = (s == 0) ? shots0 : prefix.shots - shots0;
+      if (count == 0)
+	continue;
+      const double norm = std::sqrt(probs[s]);
+      if (norm > 0.) {
+	for (auto &value : states[s])
+	  value /= norm;
+      }
+      reg_t outcomes = prefix.outcomes;
+      outcomes.push_back(s);
+      stack.push_back({prefix.position + 1, std::move(states[s]), count,
+	               std::move(outcomes)});
+    }
+  }
+
+  // The samples are grouped by prefix, so shuffle them into shot order
+  for (uint_t i = samples.size(); i > 1; i--)
+    std::swap(samples[i - 1], samples[rng.rand_int<uint_t>(0, i - 1)]);
+  return samples;
+}
+
 
 reg_t MPS::apply_measure(const reg_t &qubits, 
 			 RngEngine &rng) {
-  // since input is always sorted in qasm_controller, therefore, we must return the qubits 
-  // to their original location (sorted)
-  move_all_qubits_to_sorted_ordering();
-
+  // The qubits are measured in their current positions, so the routing
+  // of the previous gates is not undone
   reg_t outcome_vector_internal(qubits.size()), outcome_vector(qubits.size());
   apply_measure_internal(qubits, rng, outcome_vector_internal);
   for (uint_t i=0; i<qubits.size(); i++) {
@@ -1389,20 +1929,27 @@ uint_t MPS::apply_measure(uint_t qubit,
   }
   apply_matrix(qubits_to_update, measurement_matrix);
 
-  // step 4 - propagate the changes to all qubits to the right
-  for (uint_t i=qubit; i<num_qubits_-1; i++) {
+  // step 4 - propagate the changes to all qubits
+  const uint_t position = get_qubit_index(qubit);
+  propagate_to_neighbors_internal(position, position);
+  return measurement;
+}
+
+void MPS::propagate_to_neighbors_internal(uint_t min_position,
+					  uint_t max_position) {
+  // propagate the changes to all qubits to the right
+  for (uint_t i=max_position; i<num_qubits_-1; i++) {
     if (lambda_reg_[i].size() == 1) 
       break;   // no need to propagate if no entanglement
     apply_2_qubit_gate(i, i+1, id, cmatrix_t(1, 1));
   }
 
   // and propagate the changes to all qubits to the left
-  for (int_t i=qubit; i>0; i--) {
+  for (int_t i=min_position; i>0; i--) {
     if (lambda_reg_[i-1].size() == 1) 
       break;   // no need to propagate if no entanglement
     apply_2_qubit_gate(i-1, i, id, cmatrix_t(1, 1));
   }
-  return measurement;
 }
 
 void MPS::initialize_from_statevector(uint_t num_qubits, cvector_t state_vector) {
@@ -1452,10 +1999,11 @@ void MPS::initialize_from_matrix(uint_t num_qubits, const cmatrix_t mat) {
     // step 2 - SVD
     S.clear();
     S.resize(std::min(reshaped_matrix.GetRows(), reshaped_matrix.GetColumns()));
-    csvd_wrapper(reshaped_matrix, U, S, V);
-    reduce_zeros(U, S, V, 
-		 MPS_Tensor::get_max_bond_dimension(), 
-		 MPS_Tensor::get_truncation_threshold() );
+    svd(reshaped_matrix, U, S, V, MPS_Tensor::get_svd_alg(),
+        max_bond_dimension_, MPS_Tensor::get_single_precision());
+    discarded_weight_ += reduce_zeros(U, S, V,
+				      max_bond_dimension_,
+				      truncation_threshold_);
 
     // step 3 - update q_reg_ with new gamma and new lambda
     //          increment number of qubits in the MPS structure
@@ -1477,6 +2025,325 @@ void MPS::initialize_from_matrix(uint_t num_qubits, const cmatrix_t mat) {
   q_reg_.push_back(right_gamma);
   num_qubits_++;
 }
+
+//-------------------------------------------------------------------------
+// Memory estimate and memory budget
+//-------------------------------------------------------------------------
+
+size_t MPS::required_memory_mb(uint_t num_qubits,
+			       const std::vector<Operations::Op> &ops) {
+  if (num_qubits == 0)
+    return 0;
+  const double complex_size = MPS_Tensor::get_single_precision()
+                               ? sizeof(complexf_t) : sizeof(complex_t);
+  const double max_bond_dimension = MPS_Tensor::get_max_bond_dimension();
+
+  // bonds[i] is the bond dimension between the qubits at positions i-1 and i.
+  // The bonds at the edges of the chain are always 1.
+  std::vector<double> bonds(num_qubits + 1, 1.);
+  reg_t order(num_qubits), location(num_qubits);
+  std::iota(order.begin(), order.end(), 0);
+  std::iota(location.begin(), location.end(), 0);
+
+  // Each Gamma tensor holds two matrices of the dimensions of its bonds
+  auto tensor_size = [&](uint_t pos) {
+    return 2 * complex_size * bonds[pos] * bonds[pos+1];
+  };
+  double state_size = 0;
+  for (uint_t pos = 0; pos < num_qubits; pos++)
+    state_size += tensor_size(pos);
+  double peak_size = state_size;
+
+  // Multiply the bond dimension by the operator Schmidt rank of the
+  // operation on the cut
+  auto grow_bond = [&](uint_t cut, double rank) {
+    if (cut == 0 || cut >= num_qubits)
+      return;
+    double bond = std::min({bonds[cut] * rank,
+			    2 * bonds[cut-1], 2 * bonds[cut+1],
+			    max_bond_dimension});
+    if (bond <= bonds[cut])
+      return;
+    state_size -= tensor_size(cut-1) + tensor_size(cut);
+    bonds[cut] = bond;
+    state_size += tensor_size(cut-1) + tensor_size(cut);
+  };
+
+  // Apply an operation of operator Schmidt rank base^min(l, r) on the cuts
+  // between l and r of the contiguous positions [first, last]
+  auto apply_block = [&](uint_t first, uint_t last, double base) {
+    // Contracted tensor and its SVD
+    const double block_size = SVD_MEMORY_FACTOR * complex_size *
+      std::pow(2., last - first + 1) * bonds[first] * bonds[last+1];
+    peak_size = std::max(peak_size, state_size + block_size);
+    for (uint_t cut = first + 1; cut <= last; cut++) {
+      grow_bond(cut, std::pow(base, std::min(cut - first, last + 1 - cut)));
+    }
+    peak_size = std::max(peak_size, state_size);
+  };
+
+  // Swap the qubits at positions pos and pos+1
+  auto swap_positions = [&](uint_t pos) {
+    apply_block(pos, pos+1, 4.);
+    std::swap(order[pos], order[pos+1]);
+    location[order[pos]] = pos;
+    location[order[pos+1]] = pos+1;
+  };
+  auto change_position = [&](uint_t src, uint_t dst) {
+    for (; src < dst; src++)
+      swap_positions(src);
+    for (; src > dst; src--)
+      swap_positions(src-1);
+  };
+
+  for (const auto &op : ops) {
+    double base = 4.;
+    switch (op.type) {
+      case Operations::OpType::gate:
+	// Controlled and Ising gates have operator Schmidt rank 2
+	if (op.name != "swap")
+	  base = 2.;
+	break;
+      case Operations::OpType::diagonal_matrix:
+	base = 2.;
+	break;
+      case Operations::OpType::initialize:
+	// Initializing all the qubits restores the initial ordering
+	if (op.qubits.size() == num_qubits) {
+	  std::iota(order.begin(), order.end(), 0);
+	  std::iota(location.begin(), location.end(), 0);
+	}
+	break;
+      case Operations::OpType::matrix:
+      case Operations::OpType::kraus:
+	break;
+      default:
+	continue;
+    }
+    if (op.qubits.size() < 2)
+      continue;
+
+    if (op.qubits.size() == 2) {
+      // The second qubit is moved next to the first, as in apply_2_qubit_gate
+      const uint_t index_A = location[op.qubits[0]];
+      const uint_t index_B = location[op.qubits[1]];
+      if (index_B > index_A+1)
+	change_position(index_B, index_A+1);
+      else if (index_A > 0 && index_B < index_A-1)
+	change_position(index_B, index_A-1);
+      const uint_t first = std::min(location[op.qubits[0]], location[op.qubits[1]]);
+      apply_block(first, first+1, base);
+    } else {
+      // The qubits are moved around their median, as in centralize_qubits
+      reg_t sorted_indices(op.qubits.size());
+      for (uint_t i = 0; i < op.qubits.size(); i++)
+	sorted_indices[i] = location[op.qubits[i]];
+      std::sort(sorted_indices.begin(), sorted_indices.end());
+      const reg_t centralized_qubits = calc_new_indices(sorted_indices);
+      const reg_t qubits_to_move = [&]() {
+	reg_t qubits(sorted_indices.size());
+	for (uint_t i = 0; i < sorted_indices.size(); i++)
+	  qubits[i] = order[sorted_indices[i]];
+	return qubits;
+      }();
+      const uint_t mid_index = (centralized_qubits.size()-1)/2;
+      for (uint_t i = mid_index; i < qubits_to_move.size(); i++)
+	change_position(location[qubits_to_move[i]], centralized_qubits[i]);
+      for (int_t i = mid_index-1; i >= 0; i--)
+	change_position(location[qubits_to_move[i]], centralized_qubits[i]);
+      apply_block(centralized_qubits.front(), centralized_qubits.back(), base);
+    }
+  }
+  return static_cast<size_t>(std::min(std::ceil(peak_size / (1ULL << 20)), 1e18));
+}
+
+void MPS::save_checkpoint(std::ostream &out) const {
+  Checkpoint::write(out, num_qubits_);
+  Checkpoint::write(out, num_purification_qubits_);
+  Checkpoint::write(out, qubit_ordering_.order_);
+  Checkpoint::write(out, truncation_threshold_);
+  Checkpoint::write(out, max_bond_dimension_);
+  Checkpoint::write(out, discarded_weight_);
+  Checkpoint::write(out, budget_memory_mb_);
+  Checkpoint::write(out, num_swaps_);
+  for (uint_t i = 0; i < num_qubits_; i++) {
+    const std::vector<cmatrix_t> data = q_reg_[i].get_data();
+    Checkpoint::write<uint_t>(out, data.size());
+    for (const auto &mat : data)
+      Checkpoint::write(out, mat);
+  }
+  for (const auto &lambda : lambda_reg_)
+    Checkpoint::write(out, lambda);
+}
+
+void MPS::load_checkpoint(std::istream &in) {
+  uint_t num_qubits, num_purification_qubits;
+  Checkpoint::read(in, num_qubits);
+  Checkpoint::read(in, num_purification_qubits);
+  if (num_qubits - num_purification_qubits !=
+      num_qubits_ - num_purification_qubits_) {
+    throw std::runtime_error(
+        "MPS::load_checkpoint: the checkpoint does not match the number of "
+        "qubits of the state.");
+  }
+  num_qubits_ = num_qubits;
+  num_purification_qubits_ = num_purification_qubits;
+  Checkpoint::read(in, qubit_ordering_.order_);
+  qubit_ordering_.location_.resize(num_qubits_);
+  for (uint_t i = 0; i < num_qubits_; i++)
+    qubit_ordering_.location_[qubit_ordering_.order_[i]] = i;
+  Checkpoint::read(in, truncation_threshold_);
+  Checkpoint::read(in, max_bond_dimension_);
+  Checkpoint::read(in, discarded_weight_);
+  Checkpoint::read(in, budget_memory_mb_);
+  Checkpoint::read(in, num_swaps_);
+  q_reg_.resize(num_qubits_);
+  for (uint_t i = 0; i < num_qubits_; i++) {
+    uint_t dim;
+    Checkpoint::read(in, dim);
+    std::vector<cmatrix_t> data(dim);
+    for (auto &mat : data)
+      Checkpoint::read(in, mat);
+    q_reg_[i] = MPS_Tensor(data);
+  }
+  lambda_reg_.resize(num_qubits_ - 1);
+  for (auto &lambda : lambda_reg_)
+    Checkpoint::read(in, lambda);
+}
+
+double MPS::memory_mb() const {
+  double size = 0;
+  for (uint_t i = 0; i < q_reg_.size(); i++) {
+    const reg_t dims = q_reg_[i].get_size();
+    size += q_reg_[i].get_dim() * dims[0] * dims[1] *
+            q_reg_[i].get_element_size();
+  }
+  for (const auto &lambda : lambda_reg_)
+    size += lambda.size() * sizeof(double);
+  return size / (1ULL << 20);
+}
+
+//-------------------------------------------------------------------------
+// Qubit layout
+//-------------------------------------------------------------------------
+
+reg_t MPS::linear_layout(uint_t num_qubits,
+			 const std::vector<std::pair<uint_t, uint_t>> &gates) {
+  reg_t order(num_qubits);
+  std::iota(order.begin(), order.end(), 0);
+  if (gates.empty() || num_qubits < 3)
+    return order;
+
+  // Number of gates between every two qubits
+  std::vector<rvector_t> weights(num_qubits, rvector_t(num_qubits, 0.));
+  rvector_t degrees(num_qubits, 0.);
+  for (const auto &gate : gates) {
+    weights[gate.first][gate.second] += 1.;
+    weights[gate.second][gate.first] += 1.;
+    degrees[gate.first] += 1.;
+    degrees[gate.second] += 1.;
+  }
+  // Total distance of the gates, not counting adjacent qubits
+  auto total_distance = [&](const reg_t &location) {
+    double distance = 0;
+    for (const auto &gate : gates) {
+      const uint_t a = location[gate.first], b = location[gate.second];
+      distance += (a > b) ? a - b - 1 : b - a - 1;
+    }
+    return distance;
+  };
+
+  // The chain grows at both ends, so the positions are offset by num_qubits
+  reg_t location(num_qubits, 0);
+  std::vector<bool> placed(num_qubits, false);
+  rvector_t connections(num_qubits, 0.);
+  uint_t left = num_qubits, right = num_qubits;
+  auto place = [&](uint_t qubit, uint_t position) {
+    location[qubit] = position;
+    placed[qubit] = true;
+    for (uint_t q = 0; q < num_qubits; q++)
+      connections[q] += weights[q][qubit];
+  };
+  place(std::max_element(degrees.begin(), degrees.end()) - degrees.begin(),
+	num_qubits);
+
+  for (uint_t step = 1; step < num_qubits; step++) {
+    // The qubit with the most gates with the placed qubits, or else the
+    // qubit with the most gates
+    uint_t next = num_qubits;
+    for (uint_t q = 0; q < num_qubits; q++) {
+      if (placed[q])
+	continue;
+      if (next == num_qubits || connections[q] > connections[next] ||
+	  (connections[q] == connections[next] && degrees[q] > degrees[next]))
+	next = q;
+    }
+    // Place it at the end closest to the qubits it has gates with
+    double left_cost = 0., right_cost = 0.;
+    for (uint_t q = 0; q < num_qubits; q++) {
+      if (placed[q] && weights[next][q] > 0) {
+	left_cost += weights[next][q] * (location[q] - left + 1);
+	right_cost += weights[next][q] * (right + 1 - location[q]);
+      }
+    }
+    if (left_cost < right_cost)
+      place(next, --left);
+    else
+      place(next, ++right);
+  }
+  for (uint_t q = 0; q < num_qubits; q++)
+    location[q] -= left;
+
+  reg_t identity(order);
+  if (total_distance(location) >= total_distance(identity))
+    return order;
+  for (uint_t q = 0; q < num_qubits; q++)
+    order[location[q]] = q;
+  return order;
+}
+
+bool MPS::apply_layout(const reg_t &order) {
+  if (order.size() != num_qubits_ || get_max_bond_dimensions() > 1)
+    return false;
+  std::vector<MPS_Tensor> new_q_reg(num_qubits_);
+  for (uint_t i = 0; i < num_qubits_; i++)
+    new_q_reg[i] = q_reg_[get_qubit_index(order[i])];
+  q_reg_ = std::move(new_q_reg);
+  qubit_ordering_.order_ = order;
+  for (uint_t i = 0; i < num_qubits_; i++)
+    qubit_ordering_.location_[order[i]] = i;
+  return true;
+}
+
+void MPS::truncate_like(MPS &sub_MPS) const {
+  sub_MPS.truncation_threshold_ = truncation_threshold_;
+  sub_MPS.max_bond_dimension_ = max_bond_dimension_;
+}
+
+void MPS::add_discarded_weight(const MPS &sub_MPS) {
+  discarded_weight_ += sub_MPS.discarded_weight_;
+}
+
+void MPS::apply_memory_budget() {
+  if (memory_budget_mb_ == 0)
+    return;
+  // Only tighten the truncation again if the memory kept growing since
+  // the last time it was tightened
+  const double memory = memory_mb();
+  if (memory < MEMORY_BUDGET_FRACTION * memory_budget_mb_ ||
+      memory <= budget_memory_mb_)
+    return;
+  budget_memory_mb_ = memory;
+
+  if (truncation_threshold_ < MAX_ADAPTIVE_TRUNCATION_THRESHOLD) {
+    truncation_threshold_ = std::min(MAX_ADAPTIVE_TRUNCATION_THRESHOLD,
+				     std::max(MIN_ADAPTIVE_TRUNCATION_THRESHOLD,
+					      ADAPTIVE_TRUNCATION_FACTOR * truncation_threshold_));
+  } else {
+    max_bond_dimension_ = std::max<uint_t>(1,
+      std::min(max_bond_dimension_, get_max_bond_dimensions()) / 2);
+  }
+}
  
 
 //-------------------------------------------------------------------------
@@ -16,6 +16,7 @@
 #ifndef _aer_matrix_product_state_hpp_
 #define _aer_matrix_product_state_hpp_
 
+#include "framework/checkpoint.hpp"
 #include "framework/json.hpp"
 #include "framework/utils.hpp"
 #include "framework/operations.hpp"
@@ -33,7 +34,7 @@ enum Gates {
 
   //enum class Direction {RIGHT, LEFT};
 
-  enum class Sample_measure_alg {APPLY_MEASURE, PROB, HEURISTIC};
+  enum class Sample_measure_alg {APPLY_MEASURE, PROB, HEURISTIC, CONDITIONAL};
 
 //=========================================================================
 // MPS class
@@ -143,6 +144,23 @@ public:
 		   const std::vector<cmatrix_t> &kmats,
 		   RngEngine &rng);
 
+  //---------------------------------------------------------------
+  // Function name: apply_kraus_purified
+  // Description: Apply a Kraus channel without sampling an operator. New
+  //   purification qubits in the |0> state are added next to the qubits,
+  //   and the isometry |psi> -> sum_k |k> K_k |psi> is applied to the
+  //   qubits and the purification qubits. The reduced state of the other
+  //   qubits is then the output of the channel.
+  // Parameters: the qubits and the Kraus operators of the channel.
+  //---------------------------------------------------------------
+  void apply_kraus_purified(const reg_t &qubits,
+			    const std::vector<cmatrix_t> &kmats);
+
+  // The number of purification qubits of the MPS
+  uint_t get_num_purification_qubits() const {
+    return num_purification_qubits_;
+  }
+
   //---------------------------------------------------------------
   // Function: expectation_value
   // Description: Computes expectation value of the given qubits on the given matrix.
@@ -163,6 +181,24 @@ public:
   //------------------------------------------------------------------
   complex_t expectation_value_pauli(const reg_t &qubits, const std::string &matrices) const;
 
+  //---------------------------------------------------------------
+  // Function: expectation_values_pauli
+  // Description: Computes the expectation values of a list of Pauli strings
+  //   on the same qubits. Since the MPS is in canonical form, the environment
+  //   of a contiguous range of qubits is given by the Lambdas at its edges,
+  //   so every string is only contracted over its support, i.e., the range
+  //   from its first to its last non-identity matrix. The Gamma tensors
+  //   multiplied by their left Lambda are computed once for all the strings,
+  //   and the strings are sorted by support so that strings with a common
+  //   prefix share the contraction of the prefix.
+  // Parameters: The qubits for which we compute expectation value.
+  //             The strings of matrices of the set {X, Y, Z, I}, in reverse
+  //             order relative to the qubits.
+  // Returns: The expectation value of every string.
+  //------------------------------------------------------------------
+  std::vector<complex_t> expectation_values_pauli(const reg_t &qubits,
+						  const std::vector<std::string> &matrices) const;
+
   //------------------------------------------------------------------
   // Function name: MPS_with_new_indices
   // Description: Moves the indices of the selected qubits for more efficient computation
@@ -241,6 +277,148 @@ public:
     return enable_gate_opt_;
   }
 
+  static void set_memory_budget_mb(uint_t memory_budget_mb) {
+    memory_budget_mb_ = memory_budget_mb;
+  }
+
+  static uint_t get_memory_budget_mb() {
+    return memory_budget_mb_;
+  }
+
+  static void set_initial_layout(bool initial_layout) {
+    initial_layout_ = initial_layout;
+  }
+
+  static bool get_initial_layout() {
+    return initial_layout_;
+  }
+
+  static void set_purification(bool purification) {
+    purification_ = purification;
+  }
+
+  static bool get_purification() {
+    return purification_;
+  }
+
+  static void set_routing_lookahead(uint_t routing_lookahead) {
+    routing_lookahead_ = routing_lookahead;
+  }
+
+  static uint_t get_routing_lookahead() {
+    return routing_lookahead_;
+  }
+
+  //----------------------------------------------------------------
+  // Function name: linear_layout
+  // Description: Choose a linear ordering of the qubits for a list of
+  //      two-qubit gates. The qubits are placed greedily, each time the
+  //      qubit with the largest number of gates with the placed qubits, at
+  //      the end of the chain minimizing the distance to them.
+  // Parameters: number of qubits, the qubits of the two-qubit gates
+  // Returns: reg_t - the qubit at each position of the chain, or the
+  //      sorted ordering if it has a smaller total distance
+  //----------------------------------------------------------------
+  static reg_t linear_layout(uint_t num_qubits,
+			     const std::vector<std::pair<uint_t, uint_t>> &gates);
+
+  //----------------------------------------------------------------
+  // Function name: apply_layout
+  // Description: Reorder the qubits of a product state without swaps
+  // Parameters: the qubit at each position of the chain
+  // Returns: bool - false if the state is not a product state, in which
+  //      case it is not changed
+  //----------------------------------------------------------------
+  bool apply_layout(const reg_t &order);
+
+  //----------------------------------------------------------------
+  // Function name: set_lookahead
+  // Description: Set the qubits of the next two-qubit gates after the one
+  //      applied next. Two qubits that are not adjacent are moved together
+  //      to the positions minimizing the distance of these gates.
+  // Parameters: the qubits of the next two-qubit gates
+  //----------------------------------------------------------------
+  void set_lookahead(std::vector<std::pair<uint_t, uint_t>>::const_iterator begin,
+		     std::vector<std::pair<uint_t, uint_t>>::const_iterator end) {
+    lookahead_.assign(begin, end);
+  }
+
+  // The number of swaps of adjacent qubits for routing the gates since
+  // the MPS was initialized
+  uint_t get_num_swaps() const {
+    return num_swaps_;
+  }
+
+  //----------------------------------------------------------------
+  // Function name: begin_layer, end_layer
+  // Description: Between these calls, the two-qubit gates on adjacent
+  //      positions are not applied immediately. They are collected until a
+  //      gate shares a position with a collected gate, and the collected
+  //      gates, which act on disjoint bonds, are then applied in parallel.
+  //      end_layer applies the remaining gates. Only two-qubit gates may be
+  //      applied between these calls.
+  // Parameters: the number of threads applying the gates
+  //----------------------------------------------------------------
+  void begin_layer(uint_t threads) {
+    layer_ = true;
+    layer_threads_ = threads;
+  }
+  void end_layer();
+
+  //----------------------------------------------------------------
+  // Function name: required_memory_mb
+  // Description: Estimate the peak memory of simulating a circuit from the
+  //      initial product state. The bond dimension of every cut of the chain
+  //      is bounded symbolically through the operations of the circuit:
+  //      a 2-qubit gate multiplies the bond dimension of its cut by the
+  //      operator Schmidt rank of the gate (2 for controlled and Ising gates,
+  //      4 for swap and general matrices), and the bond dimension of a cut
+  //      is at most twice the bond dimension of its neighbouring cuts and at
+  //      most the maximum bond dimension. The swaps moving non-adjacent qubits
+  //      together are tracked as in the simulation.
+  // Parameters: number of qubits, the operations of the circuit
+  // Returns: size_t - the estimated memory in megabytes
+  //----------------------------------------------------------------
+  static size_t required_memory_mb(uint_t num_qubits,
+				   const std::vector<Operations::Op> &ops);
+
+  //----------------------------------------------------------------
+  // Function name: memory_mb
+  // Description: The memory used by the tensors of the MPS
+  // Returns: double - the memory in megabytes
+  //----------------------------------------------------------------
+  double memory_mb() const;
+
+  //----------------------------------------------------------------
+  // Function name: get_discarded_weight
+  // Description: The sum of the squares of all the Schmidt coefficients
+  //      truncated since the MPS was initialized
+  //----------------------------------------------------------------
+  double get_discarded_weight() const {
+    return discarded_weight_;
+  }
+
+  // The truncation threshold and the maximum bond dimension of this MPS.
+  // They are initialized from the MPS_Tensor settings and tightened when
+  // the memory budget is approached.
+  double get_truncation_threshold() const {
+    return truncation_threshold_;
+  }
+
+  uint_t get_max_bond_dimension() const {
+    return max_bond_dimension_;
+  }
+
+  //----------------------------------------------------------------
+  // Function name: save_checkpoint, load_checkpoint
+  // Description: Write the tensors, the qubit ordering and the truncation
+  //      of the MPS to a binary checkpoint stream, and restore them. The
+  //      MPS must be initialized with the number of qubits of the saved
+  //      MPS, without its purification qubits.
+  //----------------------------------------------------------------
+  void save_checkpoint(std::ostream &out) const;
+  void load_checkpoint(std::istream &in);
+
   //----------------------------------------------------------------
   // Function name: norm
   // Description: the norm is defined as <psi|A^dagger . A|psi>.
@@ -258,6 +436,20 @@ public:
   reg_t apply_measure(const reg_t &qubits,
 		      RngEngine &rng);
 
+  //----------------------------------------------------------------
+  // Function name: sample_measure_using_conditional_probabilities
+  // Description: Samples the qubits one by one along the chain from the
+  //   conditional probabilities of each outcome given the outcomes of the
+  //   previous positions. The shots are split between the outcomes at every
+  //   position, so that every distinct prefix of outcomes is computed once
+  //   for all of its shots, and the MPS is not copied or modified.
+  // Parameters: qubits to sample, number of shots, random engine.
+  // Returns: the outcomes of the qubits for every shot.
+  //----------------------------------------------------------------
+  std::vector<reg_t> sample_measure_using_conditional_probabilities(const reg_t &qubits,
+								    uint_t shots,
+								    RngEngine &rng) const;
+
   //----------------------------------------------------------------
   // Function name: initialize_from_statevector
   // Description: This function receives as input a state_vector and
@@ -299,6 +491,14 @@ private:
 				 Gates gate_type, const cmatrix_t &mat,
 				 bool swapped,
 				 bool is_diagonal=false);
+  // Apply a gate on the positions A and A+1 and return the discarded weight.
+  // Gates on disjoint bonds can be applied concurrently
+  double update_2_qubit_tensors(uint_t A,
+				Gates gate_type, const cmatrix_t &mat,
+				bool swapped,
+				bool is_diagonal);
+  // Apply the gates collected in a layer, in parallel
+  void apply_layer_gates();
   void apply_3_qubit_gate(const reg_t &qubits, Gates gate_type, 
 			  const cmatrix_t &mat, bool is_diagonal=false);
   void apply_matrix_internal(const reg_t & qubits, const cmatrix_t &mat,
@@ -358,6 +558,11 @@ private:
    uint_t apply_measure(uint_t qubit, 
 			  RngEngine &rng);
 
+  // Restore the canonical form after a non-unitary operator on the
+  // positions min_position ... max_position
+  void propagate_to_neighbors_internal(uint_t min_position,
+				       uint_t max_position);
+
   reg_t sample_measure_using_probabilities_internal(const rvector_t &rnds, 
 						    const reg_t &qubits) const;
 
@@ -404,6 +609,29 @@ private:
   //----------------------------------------------------------------
   void change_position(uint_t src, uint_t dst);
 
+  // Insert a qubit in the |0> state at a position of the chain, and
+  // return its index
+  uint_t add_qubit(uint_t position);
+
+  // Replace the run of adjacent purification qubits around a position by
+  // the fewest qubits that keep the rank of its reduced state, truncated as
+  // the bonds are
+  void compress_purification_qubits(uint_t position);
+
+  // Copy the truncation settings of this MPS to a temporary sub-MPS, and
+  // accumulate its discarded weight back
+  void truncate_like(MPS &sub_MPS) const;
+  void add_discarded_weight(const MPS &sub_MPS);
+
+  // Raise the truncation threshold, and then lower the maximum bond
+  // dimension, while the memory approaches the memory budget
+  void apply_memory_budget();
+
+  // The position of the left qubit of a gate on the qubits at positions
+  // first < second after they are moved together
+  uint_t routing_position(uint_t first, uint_t second,
+			  uint_t default_pos) const;
+
   uint_t num_qubits_;
   std::vector<MPS_Tensor> q_reg_;
   std::vector<rvector_t> lambda_reg_;
@@ -418,6 +646,33 @@ private:
     reg_t location_;
   } qubit_ordering_;
 
+  // Truncation of this MPS, see get_truncation_threshold
+  double truncation_threshold_ = MPS_Tensor::get_truncation_threshold();
+  uint_t max_bond_dimension_ = MPS_Tensor::get_max_bond_dimension();
+  double discarded_weight_ = 0.;
+  // Memory when the truncation was last tightened
+  double budget_memory_mb_ = 0.;
+
+  // Routing of the two-qubit gates, see set_lookahead
+  std::vector<std::pair<uint_t, uint_t>> lookahead_;
+  uint_t num_swaps_ = 0;
+
+  // The two-qubit gates collected in a layer, see begin_layer
+  struct layer_gate {
+    uint_t A;
+    Gates gate_type;
+    cmatrix_t mat;
+    bool swapped;
+    bool is_diagonal;
+  };
+  // Number of qubits added by apply_kraus_purified, the last ones
+  // of the qubit indices
+  uint_t num_purification_qubits_ = 0;
+
+  bool layer_ = false;
+  uint_t layer_threads_ = 1;
+  std::vector<layer_gate> layer_gates_;
+
   //-----------------------------------------------------------------------
   // Config settings
   //-----------------------------------------------------------------------
@@ -428,6 +683,13 @@ private:
   static double json_chop_threshold_;  // Threshold for choping small values
                                     // in JSON serialization
   static bool enable_gate_opt_;      // allow optimizations on gates
+  static uint_t memory_budget_mb_;   // Memory budget for adaptive truncation
+                                     // (0 for no budget)
+  static bool initial_layout_;       // Choose the initial ordering of the qubits
+  static uint_t routing_lookahead_;  // Number of next two-qubit gates
+                                     // considered when routing a gate
+  static bool purification_;         // Apply Kraus channels and resets to
+                                     // purification qubits
 };
 
 inline std::ostream &operator<<(std::ostream &out, const rvector_t &vec) {
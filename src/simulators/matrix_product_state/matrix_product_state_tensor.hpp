@@ -16,6 +16,7 @@
 #ifndef _tensor_tensor_hpp_
 #define _tensor_tensor_hpp_
 
+#include <algorithm>
 #include <cstdio>
 #include <iostream>
 #include <iomanip>
@@ -44,6 +45,9 @@ namespace MatrixProductState {
 // When applying a two-qubit gate, we temporarily create an MPS_Tensor of four matrices,
 // corresponding to |00>, |01>, |10>, |11>.
 // These are later decomposed back to the stable state of two matrices MPS_Tensor (per qubit).
+// In single precision the matrices are stored as complex<float> between
+// operations, and converted to double precision only while an operation that
+// needs it is applied.
 //----------------------------------------------------------------
 
 class MPS_Tensor
@@ -59,9 +63,11 @@ public:
     B(0,0) = beta;
     data_.push_back(A);
     data_.push_back(B);
+    pack();
   }
   MPS_Tensor(const MPS_Tensor& rhs){
     data_ = rhs.data_;
+    data_single_ = rhs.data_single_;
   }
 
   MPS_Tensor(const cmatrix_t& data0, const cmatrix_t& data1){
@@ -69,6 +75,7 @@ public:
       data_.clear();
     data_.push_back(data0);
     data_.push_back(data1);
+    pack();
   }
 
   MPS_Tensor(const std::vector<cmatrix_t> &data){
@@ -76,6 +83,7 @@ public:
       data_.clear();
     for (uint_t i=0; i<data.size(); i++)
       data_.push_back(data[i]);
+    pack();
   }
 
   // Destructor
@@ -86,18 +94,15 @@ public:
     if (this != &rhs){
       data_.clear();
       data_ = rhs.data_;
+      data_single_ = rhs.data_single_;
     }
     return *this;
   }
   virtual std::ostream& print(std::ostream& out) const;
   reg_t get_size() const;
   cvector_t get_data(uint_t a1, uint_t a2) const;
-  cmatrix_t get_data(uint_t i) const {
-    return data_[i];
-  }
-  const std::vector<cmatrix_t> get_data() const {
-    return data_;
-  }
+  cmatrix_t get_data(uint_t i) const;
+  const std::vector<cmatrix_t> get_data() const;
   void insert_data(uint_t a1, uint_t a2, cvector_t data);
 
   static void set_chop_threshold(double chop_threshold) {
@@ -112,6 +117,14 @@ public:
     truncation_threshold_ = truncation_threshold;
   }
 
+  static void set_svd_alg(SVD_alg alg) {
+    svd_alg_ = alg;
+  }
+
+  static void set_single_precision(bool single_precision) {
+    single_precision_ = single_precision;
+  }
+
   static double get_chop_threshold() {
     return chop_threshold_;
   }
@@ -123,6 +136,14 @@ public:
   static double get_truncation_threshold() {
     return truncation_threshold_;
   }
+
+  static SVD_alg get_svd_alg() {
+    return svd_alg_;
+  }
+
+  static bool get_single_precision() {
+    return single_precision_;
+  }
   //------------------------------------------------------------------
   // function name: get_dim
   // Description: Get the dimension of the physical index of the tensor
@@ -130,7 +151,11 @@ public:
   // Returns: uint_t of the dimension of the physical index of the tensor.
   //------------------------------------------------------------------
   uint_t get_dim() const {
-    return data_.size();
+    return data_single_.empty() ? data_.size() : data_single_.size();
+  }
+  // Size in bytes of an element of the stored matrices
+  size_t get_element_size() const {
+    return data_single_.empty() ? sizeof(complex_t) : sizeof(complexf_t);
   }
   void apply_pauli(char gate);
   void apply_x();
@@ -151,7 +176,9 @@ public:
   void div_Gamma_by_left_Lambda(const rvector_t &Lambda);
   void div_Gamma_by_right_Lambda(const rvector_t &Lambda);
   static MPS_Tensor contract(const MPS_Tensor &left_gamma, const rvector_t &lambda, const MPS_Tensor &right_gamma, bool mul_by_lambda);
-  static void Decompose(MPS_Tensor &temp, MPS_Tensor &left_gamma, rvector_t &lambda, MPS_Tensor &right_gamma);
+  static double Decompose(MPS_Tensor &temp, MPS_Tensor &left_gamma, rvector_t &lambda, MPS_Tensor &right_gamma);
+  static double Decompose(MPS_Tensor &temp, MPS_Tensor &left_gamma, rvector_t &lambda, MPS_Tensor &right_gamma,
+			  uint_t max_bond_dimension, double truncation_threshold);
   static void reshape_for_3_qubits_before_SVD(const std::vector<cmatrix_t> data, MPS_Tensor &reshaped_tensor);
 static void contract_2_dimensions(const MPS_Tensor &left_gamma, 
 				  const MPS_Tensor &right_gamma,
@@ -167,12 +194,34 @@ private:
   void mul_Gamma_by_Lambda(const rvector_t &Lambda,
 			   bool right, /* or left */
 			   bool mul    /* or div */);
-
+  template <class T>
+  static void mul_Gamma_by_Lambda(std::vector<matrix<T>> &data,
+				  const rvector_t &Lambda,
+				  bool right, bool mul);
+  template <class L, class R>
+  static void contract_2_dimensions(const std::vector<matrix<L>> &left_data,
+				    const std::vector<matrix<R>> &right_data,
+				    uint_t omp_threads,
+				    cmatrix_t &result);
+
+  // Store the matrices in single precision if single_precision_ is set
+  void pack();
+  // Convert the stored matrices back to double precision
+  void unpack();
+  // Multiply the matrix with index i by a phase, in the stored precision
+  void mul_matrix(uint_t i, const complex_t &factor);
+  void swap_matrices(uint_t i, uint_t j);
+
+  // The matrices of the tensor are stored either in data_, or in single
+  // precision in data_single_, the other vector is empty
   std::vector<cmatrix_t> data_;
+  std::vector<cmatrixf_t> data_single_;
 
   static double chop_threshold_;
   static uint_t max_bond_dimension_;
   static double truncation_threshold_;
+  static SVD_alg svd_alg_;
+  static bool single_precision_;
 };
 
 //=========================================================================
@@ -181,6 +230,8 @@ private:
 double MPS_Tensor::chop_threshold_ = CHOP_THRESHOLD;
 uint_t MPS_Tensor::max_bond_dimension_ = UINT64_MAX;
 double MPS_Tensor::truncation_threshold_ = 1e-16;
+SVD_alg MPS_Tensor::svd_alg_ = SVD_alg::HEURISTIC;
+bool MPS_Tensor::single_precision_ = false;
 
 const double MPS_Tensor::SQR_HALF = sqrt(0.5);
 
@@ -190,19 +241,20 @@ const double MPS_Tensor::SQR_HALF = sqrt(0.5);
 //-------------------------------------------------------------
 std::ostream& MPS_Tensor::print(std::ostream& out) const {
     complex_t value;
+    const std::vector<cmatrix_t> data = get_data();
 
     out << "[" << std::endl;
-    if (data_.size() > 0){
+    if (data.size() > 0){
         //Printing the matrices row by row (i.e., not matrix by matrix)
 
-        for (uint_t row = 0; row < data_[0].GetRows(); row++){
-            for(uint_t i = 0; i < data_.size(); i++)
+        for (uint_t row = 0; row < data[0].GetRows(); row++){
+            for(uint_t i = 0; i < data.size(); i++)
             {
                 out << " |";
 
-                for (uint_t column = 0; column < data_[0].GetColumns(); column++){
+                for (uint_t column = 0; column < data[0].GetColumns(); column++){
 
-                    value = data_[i](row, column);
+                    value = data[i](row, column);
 
                     out << "(" << std::fixed << std::setprecision(NUMBER_OF_PRINTED_DIGITS) << value.real() << ", ";
                     out << std::fixed  << std::setprecision(NUMBER_OF_PRINTED_DIGITS) << value.imag() << ")," ;
@@ -226,6 +278,11 @@ std::ostream& MPS_Tensor::print(std::ostream& out) const {
 reg_t MPS_Tensor::get_size() const
 {
 	reg_t result;
+	if (!data_single_.empty()) {
+	  result.push_back(data_single_[0].GetRows());
+	  result.push_back(data_single_[0].GetColumns());
+	  return result;
+	}
 	result.push_back(data_[0].GetRows());
 	result.push_back(data_[0].GetColumns());
 	return result;
@@ -242,11 +299,32 @@ reg_t MPS_Tensor::get_size() const
 cvector_t MPS_Tensor::get_data(uint_t a1, uint_t a2) const
 {
   cvector_t Res;
+  for(uint_t i = 0; i < data_single_.size(); i++)
+    Res.push_back(data_single_[i](a1, a2));
   for(uint_t i = 0; i < data_.size(); i++)
     Res.push_back(data_[i](a1, a2));
   return Res;
 }
 
+cmatrix_t MPS_Tensor::get_data(uint_t i) const
+{
+  if (data_single_.empty())
+    return data_[i];
+  cmatrix_t Res;
+  Res = data_single_[i];
+  return Res;
+}
+
+const std::vector<cmatrix_t> MPS_Tensor::get_data() const
+{
+  if (data_single_.empty())
+    return data_;
+  std::vector<cmatrix_t> Res(data_single_.size());
+  for(uint_t i = 0; i < data_single_.size(); i++)
+    Res[i] = data_single_[i];
+  return Res;
+}
+
 //---------------------------------------------------------------
 // function name: insert_data
 // Description: Insert data to some axis of the MPS_Tensor
@@ -256,10 +334,54 @@ cvector_t MPS_Tensor::get_data(uint_t a1, uint_t a2) const
 //---------------------------------------------------------------
 void MPS_Tensor::insert_data(uint_t a1, uint_t a2, cvector_t data)
 {
+  for(uint_t i = 0; i < data_single_.size(); i++)
+    data_single_[i](a1,a2) = complexf_t(data[i]);
   for(uint_t i = 0; i < data_.size(); i++)
     data_[i](a1,a2) = data[i];
 }
 
+//---------------------------------------------------------------
+// function name: pack, unpack
+// Description: Convert the matrices between the double precision data_
+// 		and the single precision data_single_. pack does nothing
+// 		in double precision.
+//---------------------------------------------------------------
+void MPS_Tensor::pack()
+{
+  if (!single_precision_ || data_.empty())
+    return;
+  data_single_.resize(data_.size());
+  for(uint_t i = 0; i < data_.size(); i++)
+    data_single_[i] = data_[i];
+  data_.clear();
+}
+
+void MPS_Tensor::unpack()
+{
+  if (data_single_.empty())
+    return;
+  data_.resize(data_single_.size());
+  for(uint_t i = 0; i < data_single_.size(); i++)
+    data_[i] = data_single_[i];
+  data_single_.clear();
+}
+
+void MPS_Tensor::mul_matrix(uint_t i, const complex_t &factor)
+{
+  if (data_single_.empty())
+    data_[i] = data_[i] * factor;
+  else
+    data_single_[i] = data_single_[i] * complexf_t(factor);
+}
+
+void MPS_Tensor::swap_matrices(uint_t i, uint_t j)
+{
+  if (data_single_.empty())
+    std::swap(data_[i], data_[j]);
+  else
+    std::swap(data_single_[i], data_single_[j]);
+}
+
 void MPS_Tensor::apply_pauli(char gate) {
   switch (gate) {
   case 'X':
@@ -287,42 +409,43 @@ void MPS_Tensor::apply_pauli(char gate) {
 //---------------------------------------------------------------
 void MPS_Tensor::apply_x()
 {
-  std::swap(data_[0], data_[1]);
+  swap_matrices(0, 1);
 }
   void MPS_Tensor::apply_y()
   {
-    data_[0] = data_[0] * complex_t(0, 1);
-    data_[1] = data_[1] * complex_t(0, -1);
-    std::swap(data_[0], data_[1]);
+    mul_matrix(0, complex_t(0, 1));
+    mul_matrix(1, complex_t(0, -1));
+    swap_matrices(0, 1);
   }
 
 void MPS_Tensor::apply_z()
 {
-  data_[1] = data_[1] * (-1.0);
+  mul_matrix(1, -1.0);
 }
 
 void MPS_Tensor::apply_s()
 {
-  data_[1] = data_[1] * complex_t(0, 1);
+  mul_matrix(1, complex_t(0, 1));
 }
 
 void MPS_Tensor::apply_sdg()
 {
-  data_[1] = data_[1] * complex_t(0, -1);
+  mul_matrix(1, complex_t(0, -1));
 }
 
 void MPS_Tensor::apply_t()
 {
-  data_[1] = data_[1] * complex_t(SQR_HALF, SQR_HALF);
+  mul_matrix(1, complex_t(SQR_HALF, SQR_HALF));
 }
 
 void MPS_Tensor::apply_tdg()
 {
-  data_[1] = data_[1] * complex_t(SQR_HALF, -SQR_HALF);
+  mul_matrix(1, complex_t(SQR_HALF, -SQR_HALF));
 }
 
 void MPS_Tensor::apply_matrix(const cmatrix_t &mat, bool swapped, bool is_diagonal)
 {
+  unpack();
   if (swapped)
     swap(data_[1], data_[2]);
 
@@ -346,37 +469,38 @@ void MPS_Tensor::apply_matrix(const cmatrix_t &mat, bool swapped, bool is_diagon
 
   if (swapped)
     swap(data_[1], data_[2]);
+  pack();
 }
 
 void MPS_Tensor::apply_cnot(bool swapped)
 {
   if(!swapped)
-    std::swap(data_[2],data_[3]);
+    swap_matrices(2, 3);
   else
-    std::swap(data_[1],data_[3]);
+    swap_matrices(1, 3);
 }
 
 void MPS_Tensor::apply_swap()
 {
-  std::swap(data_[1],data_[2]);
+  swap_matrices(1, 2);
 }
 
 void MPS_Tensor::apply_cz()
 {
-  data_[3] = data_[3] * (-1.0);
+  mul_matrix(3, -1.0);
 }
 
 void MPS_Tensor::apply_ccx(uint_t target_qubit)
 {
   switch (target_qubit) {
   case 0:
-    swap(data_[3], data_[7]);
+    swap_matrices(3, 7);
     break;
   case 1:
-    swap(data_[5], data_[7]);
+    swap_matrices(5, 7);
     break;
   case 2:
-    swap(data_[6], data_[7]);
+    swap_matrices(6, 7);
     break;
   default:
    throw std::invalid_argument("Target qubit for cxx must be 0, 1, or 2"); 
@@ -417,23 +541,41 @@ void MPS_Tensor::mul_Gamma_by_Lambda(const rvector_t &Lambda,
 			 bool mul    /* or div */)
 {
   if (Lambda == rvector_t {1.0}) return;
-  uint_t rows = data_[0].GetRows(), cols = data_[0].GetColumns();
-  for(uint_t i = 0; i < data_.size(); i++)
+  if (data_single_.empty())
+    mul_Gamma_by_Lambda(data_, Lambda, right, mul);
+  else
+    mul_Gamma_by_Lambda(data_single_, Lambda, right, mul);
+}
+
+// The factors are applied in double precision, so that dividing by small
+// Lambda values does not overflow in single precision
+template <class T>
+void MPS_Tensor::mul_Gamma_by_Lambda(std::vector<matrix<T>> &data,
+				     const rvector_t &Lambda,
+				     bool right, /* or left */
+				     bool mul    /* or div */)
+{
+  uint_t rows = data[0].GetRows(), cols = data[0].GetColumns();
+  for(uint_t i = 0; i < data.size(); i++)
     for(uint_t a1 = 0; a1 < rows; a1++)
       for(uint_t a2 = 0; a2 < cols; a2++) {
 	uint_t factor = right ? a2 : a1;
+	complex_t value = data[i](a1,a2);
 	if (mul) {
-	  data_[i](a1,a2) *= Lambda[factor];
+	  value *= Lambda[factor];
 	} else{
-	  data_[i](a1,a2) /= Lambda[factor];
+	  value /= Lambda[factor];
 	}
+	data[i](a1,a2) = T(value);
       }
 }
 
 //---------------------------------------------------------------
 // function name: contract
 // Description: Contract two Gamma tensors and the Lambda between
-// 		them. Usually used before 2-qubits gate.
+// 		them. Usually used before 2-qubits gate. In single precision
+// 		the products are computed from the stored single precision
+// 		matrices and the result is stored in single precision.
 // Parameters: MPS_Tensor &left_gamma, &right_gamma , rvector_t &lambda -
 // 	       tensors to contract.
 // Returns: The result tensor of the contract
@@ -448,10 +590,33 @@ MPS_Tensor MPS_Tensor::contract(const MPS_Tensor &left_gamma,
   if (mul_by_lambda) {
     new_left.mul_Gamma_by_right_Lambda(lambda);
   }
+  // The right tensor is converted to the precision of the products only if
+  // it is not already stored in it
+  MPS_Tensor new_right;
+  const MPS_Tensor *right = &right_gamma;
+  if (single_precision_ == right_gamma.data_single_.empty()) {
+    new_right = right_gamma;
+    if (single_precision_)
+      new_right.pack();
+    else
+      new_right.unpack();
+    right = &new_right;
+  }
+  if (single_precision_) {
+    new_left.pack();
+    const std::vector<cmatrixf_t> &left_single = new_left.data_single_;
+    const std::vector<cmatrixf_t> &right_single = right->data_single_;
+    Res.data_single_.resize(left_single.size() * right_single.size());
+    for(uint_t i = 0; i < left_single.size(); i++)
+      for(uint_t j = 0; j < right_single.size(); j++)
+	Res.data_single_[i * right_single.size() + j] = left_single[i] * right_single[j];
+    return Res;
+  }
+  new_left.unpack();
   for(uint_t i = 0; i < new_left.data_.size(); i++)
-    for(uint_t j = 0; j < right_gamma.data_.size(); j++) {
+    for(uint_t j = 0; j < right->data_.size(); j++) {
 
-      Res.data_.push_back(new_left.data_[i] * right_gamma.data_[j]);
+      Res.data_.push_back(new_left.data_[i] * right->data_[j]);
     }
   return Res;
 }
@@ -478,12 +643,34 @@ void MPS_Tensor::contract_2_dimensions(const MPS_Tensor &left_gamma,
 				       uint_t omp_threads,
 				       cmatrix_t &result)
 {
-  int_t left_rows = left_gamma.data_[0].GetRows();
-  int_t left_columns = left_gamma.data_[0].GetColumns();
-  int_t left_size = left_gamma.get_dim();
-  int_t right_rows = right_gamma.data_[0].GetRows();
-  int_t right_columns = right_gamma.data_[0].GetColumns();
-  int_t right_size = right_gamma.get_dim();
+  const bool left_single = !left_gamma.data_single_.empty();
+  const bool right_single = !right_gamma.data_single_.empty();
+  if (left_single && right_single)
+    contract_2_dimensions(left_gamma.data_single_, right_gamma.data_single_,
+			  omp_threads, result);
+  else if (left_single)
+    contract_2_dimensions(left_gamma.data_single_, right_gamma.data_,
+			  omp_threads, result);
+  else if (right_single)
+    contract_2_dimensions(left_gamma.data_, right_gamma.data_single_,
+			  omp_threads, result);
+  else
+    contract_2_dimensions(left_gamma.data_, right_gamma.data_,
+			  omp_threads, result);
+}
+
+template <class L, class R>
+void MPS_Tensor::contract_2_dimensions(const std::vector<matrix<L>> &left_data,
+				       const std::vector<matrix<R>> &right_data,
+				       uint_t omp_threads,
+				       cmatrix_t &result)
+{
+  int_t left_rows = left_data[0].GetRows();
+  int_t left_columns = left_data[0].GetColumns();
+  int_t left_size = left_data.size();
+  int_t right_rows = right_data[0].GetRows();
+  int_t right_columns = right_data[0].GetColumns();
+  int_t right_size = right_data.size();
 
   // left_columns/right_rows and left_size/right_size
   if (left_columns != right_rows)   
@@ -514,8 +701,8 @@ void MPS_Tensor::contract_2_dimensions(const MPS_Tensor &left_gamma,
 
           for (int_t size=0; size<left_size; size++)
 	      for (int_t index=0; index<left_columns ; index++) {
-		result(l_row, r_col) += left_gamma.data_[size](l_row, index) *
-		  right_gamma.data_[size](index, r_col);      
+		result(l_row, r_col) += complex_t(left_data[size](l_row, index)) *
+		  complex_t(right_data[size](index, r_col));
 	      }
 	}
 }
@@ -526,22 +713,39 @@ void MPS_Tensor::contract_2_dimensions(const MPS_Tensor &left_gamma,
 // Parameters: MPS_Tensor &temp - the tensor to decompose.
 //			   MPS_Tensor &left_gamma, &right_gamma , rvector_t &lambda -
 // 			   tensors for the result.
-// Returns: none.
+//			   uint_t max_bond_dimension, double truncation_threshold -
+//			   the truncation of the Lambda (default: the static settings).
+// Returns: double - the discarded weight of the truncation.
 //---------------------------------------------------------------
-void MPS_Tensor::Decompose(MPS_Tensor &temp, MPS_Tensor &left_gamma, rvector_t &lambda, MPS_Tensor &right_gamma)
+double MPS_Tensor::Decompose(MPS_Tensor &temp, MPS_Tensor &left_gamma, rvector_t &lambda, MPS_Tensor &right_gamma)
+{
+  return Decompose(temp, left_gamma, lambda, right_gamma,
+		   max_bond_dimension_, truncation_threshold_);
+}
+
+double MPS_Tensor::Decompose(MPS_Tensor &temp, MPS_Tensor &left_gamma, rvector_t &lambda, MPS_Tensor &right_gamma,
+			     uint_t max_bond_dimension, double truncation_threshold)
 {
   cmatrix_t C;
-  C = reshape_before_SVD(temp.data_);
+  if (temp.data_single_.empty())
+    C = reshape_before_SVD(temp.data_);
+  else
+    C = reshape_before_SVD(temp.get_data());
   cmatrix_t U, V;
   rvector_t S(std::min(C.GetRows(), C.GetColumns()));
 
-  csvd_wrapper(C, U, S, V);
-  reduce_zeros(U, S, V,
-	       max_bond_dimension_, truncation_threshold_);
+  svd(C, U, S, V, svd_alg_, max_bond_dimension, single_precision_);
+  double discarded_weight = reduce_zeros(U, S, V,
+					 max_bond_dimension, truncation_threshold);
 
+  left_gamma.data_single_.clear();
+  right_gamma.data_single_.clear();
   left_gamma.data_  = reshape_U_after_SVD(U);
   lambda            = S;
   right_gamma.data_ = reshape_V_after_SVD(V);
+  left_gamma.pack();
+  right_gamma.pack();
+  return discarded_weight;
 }
 
   void MPS_Tensor::reshape_for_3_qubits_before_SVD(const std::vector<cmatrix_t> data, 
@@ -24,6 +24,8 @@
 #include <cmath>
 #include <complex>
 #include <cassert>
+#include <limits>
+#include <random>
 #include "svd.hpp"
 #include "framework/utils.hpp"
 #include "framework/linalg/almost_equal.hpp"
@@ -35,6 +37,14 @@ constexpr long double tiny_factor = 1e30;
 constexpr auto zero_threshold = 1e-50;  // threshold for comparing FP values
 constexpr auto THRESHOLD = 1e-9; // threshold for cutting values in reduce_zeros
 constexpr auto NUM_SVD_TRIES = 15;
+// randomized SVD: number of extra random vectors, number of power iterations
+// and smallest matrix dimension for which it is used
+constexpr uint_t RANDOMIZED_SVD_OVERSAMPLING = 10;
+constexpr uint_t RANDOMIZED_SVD_POWER_ITERATIONS = 2;
+constexpr uint_t RANDOMIZED_SVD_MIN_DIM = 128;
+constexpr uint_t RANDOMIZED_SVD_SEED = 1234;
+// smallest matrix dimension for which LAPACK is faster than csvd
+constexpr uint_t LAPACK_SVD_MIN_DIM = 16;
 
 cmatrix_t diag(rvector_t S, uint_t m, uint_t n);
 
@@ -94,10 +104,12 @@ uint_t num_of_SV(rvector_t S, double threshold)
 	return sum;
 }
 
-void reduce_zeros(cmatrix_t &U, rvector_t &S, cmatrix_t &V,
-		  uint_t max_bond_dimension, double truncation_threshold) {
+double reduce_zeros(cmatrix_t &U, rvector_t &S, cmatrix_t &V,
+		    uint_t max_bond_dimension, double truncation_threshold) {
   uint_t SV_num = num_of_SV(S, CHOP_THRESHOLD);
   uint_t new_SV_num = SV_num;
+  // The randomized SVD only computes the leading singular values
+  const bool partial_SVD = S.size() < std::min(U.GetRows(), V.GetRows());
 
   if (max_bond_dimension < SV_num) {
     // in this case, leave only the first max_bond_dimension
@@ -116,12 +128,24 @@ void reduce_zeros(cmatrix_t &U, rvector_t &S, cmatrix_t &V,
       break;
     }
   }
+  // The discarded weight is the sum of the squares of the Schmidt coefficients
+  // that are not kept. The randomized SVD does not compute all of them, so
+  // the weight is taken relative to the norm of the state
+  double total_squares = 0, kept_squares = 0;
+  for (uint_t i=0; i<S.size(); i++) {
+    total_squares += std::norm(S[i]);
+    if (i < new_SV_num)
+      kept_squares += std::norm(S[i]);
+  }
+  const double discarded_weight =
+    std::max(0., (partial_SVD ? 1. : total_squares) - kept_squares);
+
   U.resize(U.GetRows(), new_SV_num);
   S.resize(new_SV_num);
   V.resize(V.GetRows(), new_SV_num);
 
   // After approximation, we may need to re-normalize the values of S
-  if (new_SV_num < SV_num) {
+  if (new_SV_num < SV_num || partial_SVD) {
     double sum=0;
     for (uint_t i=0; i<S.size(); i++) {
       sum += std::norm(S[i]);
@@ -133,6 +157,7 @@ void reduce_zeros(cmatrix_t &U, rvector_t &S, cmatrix_t &V,
       }
     }
   }
+  return discarded_weight;
 }
 
 void validate_SVD_result(const cmatrix_t &A, const cmatrix_t &U, 
@@ -581,6 +606,219 @@ void csvd_wrapper(cmatrix_t &A, cmatrix_t &U, rvector_t &S, cmatrix_t &V)
 
 }
 
+//-------------------------------------------------------------
+// function name: lapack_csvd
+// Description: Computes the SVD A = U S V^dagger with LAPACK zgesdd,
+//              or zgesvd if zgesdd does not converge. U and V have
+//              min(rows, columns) columns. A is overwritten.
+// Returns: SUCCESS, or FAILURE if neither routine converged
+//-------------------------------------------------------------
+status lapack_csvd(cmatrix_t &A, cmatrix_t &U, rvector_t &S, cmatrix_t &V) {
+  int m = A.GetRows(), n = A.GetColumns();
+  int min_dim = std::min(m, n), max_dim = std::max(m, n);
+  int lda = m, ldu = m, ldvt = min_dim;
+  int lwork = -1, info = 0;
+  cmatrix_t copied_A = A;
+  cmatrix_t VT(min_dim, n);
+  U.initialize(m, min_dim);
+  S.resize(min_dim);
+
+  char jobz = 'S';
+  std::vector<double> rwork(std::max(1, min_dim * std::max(5 * min_dim + 7,
+                                                       2 * max_dim + 2 * min_dim + 1)));
+  std::vector<int> iwork(8 * min_dim);
+  complex_t work_size;
+  zgesdd_(&jobz, &m, &n, A.data(), &lda, S.data(), U.data(), &ldu, VT.data(),
+          &ldvt, &work_size, &lwork, rwork.data(), iwork.data(), &info);
+  lwork = static_cast<int>(work_size.real());
+  std::vector<complex_t> work(std::max(1, lwork));
+  zgesdd_(&jobz, &m, &n, A.data(), &lda, S.data(), U.data(), &ldu, VT.data(),
+          &ldvt, work.data(), &lwork, rwork.data(), iwork.data(), &info);
+
+  if (info != 0) {
+    A = copied_A;
+    char jobu = 'S', jobvt = 'S';
+    lwork = -1;
+    zgesvd_(&jobu, &jobvt, &m, &n, A.data(), &lda, S.data(), U.data(), &ldu,
+            VT.data(), &ldvt, &work_size, &lwork, rwork.data(), &info);
+    lwork = static_cast<int>(work_size.real());
+    work.resize(std::max(1, lwork));
+    zgesvd_(&jobu, &jobvt, &m, &n, A.data(), &lda, S.data(), U.data(), &ldu,
+            VT.data(), &ldvt, work.data(), &lwork, rwork.data(), &info);
+    if (info != 0) {
+      A = copied_A;
+      return FAILURE;
+    }
+  }
+  V = AER::Utils::dagger(VT);
+#ifdef DEBUG
+  validate_SVD_result(copied_A, U, S, V);
+#endif
+  return SUCCESS;
+}
+
+//-------------------------------------------------------------
+// function name: lapack_csvd_single
+// Description: Computes the SVD A = U S V^dagger in single precision
+//              with LAPACK cgesdd, or cgesvd if cgesdd does not
+//              converge. A is not modified. The singular values below
+//              the rounding error of the largest one are set to zero,
+//              so that they are removed by reduce_zeros instead of
+//              increasing the bond dimension.
+// Returns: SUCCESS, or FAILURE if neither routine converged
+//-------------------------------------------------------------
+status lapack_csvd_single(const cmatrix_t &A, cmatrix_t &U, rvector_t &S,
+                          cmatrix_t &V) {
+  int m = A.GetRows(), n = A.GetColumns();
+  int min_dim = std::min(m, n), max_dim = std::max(m, n);
+  int lda = m, ldu = m, ldvt = min_dim;
+  int lwork = -1, info = 0;
+  cmatrixf_t A_single;
+  A_single = A;
+  cmatrixf_t U_single(m, min_dim), VT_single(min_dim, n);
+  std::vector<float> S_single(min_dim);
+
+  char jobz = 'S';
+  std::vector<float> rwork(std::max(1, min_dim * std::max(5 * min_dim + 7,
+                                                      2 * max_dim + 2 * min_dim + 1)));
+  std::vector<int> iwork(8 * min_dim);
+  complexf_t work_size;
+  cgesdd_(&jobz, &m, &n, A_single.data(), &lda, S_single.data(),
+          U_single.data(), &ldu, VT_single.data(), &ldvt, &work_size, &lwork,
+          rwork.data(), iwork.data(), &info);
+  lwork = static_cast<int>(work_size.real());
+  std::vector<complexf_t> work(std::max(1, lwork));
+  cgesdd_(&jobz, &m, &n, A_single.data(), &lda, S_single.data(),
+          U_single.data(), &ldu, VT_single.data(), &ldvt, work.data(), &lwork,
+          rwork.data(), iwork.data(), &info);
+
+  if (info != 0) {
+    A_single = A;
+    char jobu = 'S', jobvt = 'S';
+    lwork = -1;
+    cgesvd_(&jobu, &jobvt, &m, &n, A_single.data(), &lda, S_single.data(),
+            U_single.data(), &ldu, VT_single.data(), &ldvt, &work_size, &lwork,
+            rwork.data(), &info);
+    lwork = static_cast<int>(work_size.real());
+    work.resize(std::max(1, lwork));
+    cgesvd_(&jobu, &jobvt, &m, &n, A_single.data(), &lda, S_single.data(),
+            U_single.data(), &ldu, VT_single.data(), &ldvt, work.data(), &lwork,
+            rwork.data(), &info);
+    if (info != 0)
+      return FAILURE;
+  }
+  U = U_single;
+  V = AER::Utils::dagger(VT_single);
+  S.resize(min_dim);
+  const double rounding_error = (min_dim > 0) ?
+    S_single[0] * max_dim * std::numeric_limits<float>::epsilon() : 0.;
+  for (int i = 0; i < min_dim; i++)
+    S[i] = (S_single[i] > rounding_error) ? S_single[i] : 0.;
+  return SUCCESS;
+}
+
+// Replace the columns of A by an orthonormal basis of their span
+void orthonormalize(cmatrix_t &A) {
+  int m = A.GetRows(), n = A.GetColumns();
+  int lda = m, lwork = -1, info = 0;
+  std::vector<complex_t> tau(std::min(m, n));
+  complex_t work_size;
+  zgeqrf_(&m, &n, A.data(), &lda, tau.data(), &work_size, &lwork, &info);
+  lwork = static_cast<int>(work_size.real());
+  std::vector<complex_t> work(std::max(1, lwork));
+  zgeqrf_(&m, &n, A.data(), &lda, tau.data(), work.data(), &lwork, &info);
+  int k = tau.size();
+  lwork = -1;
+  zungqr_(&m, &n, &k, A.data(), &lda, tau.data(), &work_size, &lwork, &info);
+  lwork = static_cast<int>(work_size.real());
+  work.resize(std::max(1, lwork));
+  zungqr_(&m, &n, &k, A.data(), &lda, tau.data(), work.data(), &lwork, &info);
+  if (info != 0) {
+    throw std::runtime_error("Error: QR decomposition failed in randomized SVD");
+  }
+}
+
+//-------------------------------------------------------------
+// function name: randomized_csvd
+// Description: Computes the leading rank singular values and vectors
+//              of A (Halko, Martinsson and Tropp, SIAM Rev. 53, 217
+//              (2011)). The range of A is sampled with a fixed random
+//              seed so that the results are reproducible.
+//-------------------------------------------------------------
+void randomized_csvd(cmatrix_t &A, cmatrix_t &U, rvector_t &S, cmatrix_t &V,
+                     uint_t rank) {
+  const uint_t m = A.GetRows(), n = A.GetColumns();
+  rank = std::min(rank, std::min(m, n));
+  const uint_t num_samples = std::min(rank + RANDOMIZED_SVD_OVERSAMPLING,
+                                      std::min(m, n));
+  std::mt19937_64 rng(RANDOMIZED_SVD_SEED);
+  std::normal_distribution<double> normal;
+  cmatrix_t omega(n, num_samples);
+  for (uint_t j = 0; j < num_samples; j++)
+    for (uint_t i = 0; i < n; i++)
+      omega(i, j) = complex_t(normal(rng), normal(rng));
+
+  // Orthonormal basis Q of the range of (A A^dagger)^q A omega
+  cmatrix_t Q = A * omega;
+  orthonormalize(Q);
+  const cmatrix_t A_dagger = AER::Utils::dagger(A);
+  for (uint_t iter = 0; iter < RANDOMIZED_SVD_POWER_ITERATIONS; iter++) {
+    cmatrix_t Z = A_dagger * Q;
+    orthonormalize(Z);
+    Q = A * Z;
+    orthonormalize(Q);
+  }
+
+  // SVD of the projection B = Q^dagger A = U_B S V^dagger
+  cmatrix_t B = AER::Utils::dagger(Q) * A;
+  cmatrix_t U_B;
+  if (lapack_csvd(B, U_B, S, V) == FAILURE)
+    csvd_wrapper(B, U_B, S, V);
+  U = Q * U_B;
+
+  const uint_t num_SV = std::min<uint_t>(rank, S.size());
+  U.resize(m, num_SV);
+  S.resize(num_SV);
+  V.resize(n, num_SV);
+}
+
+//-------------------------------------------------------------
+// function name: choose_svd_alg
+// Description: Chooses the SVD algorithm for a rows x columns matrix.
+//              The randomized SVD is used when the maximum bond dimension
+//              keeps at most a quarter of the singular values of a large
+//              matrix, csvd for small matrices where the LAPACK call
+//              overhead dominates, and LAPACK otherwise.
+//-------------------------------------------------------------
+SVD_alg choose_svd_alg(uint_t rows, uint_t cols, uint_t max_bond_dimension) {
+  const uint_t min_dim = std::min(rows, cols);
+  if (min_dim < LAPACK_SVD_MIN_DIM)
+    return SVD_alg::CSVD;
+  if (min_dim >= RANDOMIZED_SVD_MIN_DIM &&
+      max_bond_dimension <= min_dim / 4 - RANDOMIZED_SVD_OVERSAMPLING)
+    return SVD_alg::RANDOMIZED;
+  return SVD_alg::LAPACK;
+}
+
+void svd(cmatrix_t &A, cmatrix_t &U, rvector_t &S, cmatrix_t &V,
+         SVD_alg alg, uint_t max_bond_dimension, bool single_precision) {
+  if (alg == SVD_alg::HEURISTIC)
+    alg = choose_svd_alg(A.GetRows(), A.GetColumns(), max_bond_dimension);
+  switch (alg) {
+    case SVD_alg::RANDOMIZED:
+      randomized_csvd(A, U, S, V, max_bond_dimension);
+      break;
+    case SVD_alg::LAPACK:
+      if (single_precision && lapack_csvd_single(A, U, S, V) == SUCCESS)
+        break;
+      if (lapack_csvd(A, U, S, V) == SUCCESS)
+        break;
+      // fall through to csvd
+    default:
+      csvd_wrapper(A, U, S, V);
+  }
+}
+
 } // namespace AER
 
 
@@ -29,15 +29,37 @@ using long_complex_t = std::complex<long double>;
 
 enum status {SUCCESS, FAILURE};
 
+// Algorithms for the SVD of the MPS tensors
+// - csvd: the Golub-Kahan algorithm of csvd
+// - lapack: LAPACK zgesdd, or zgesvd if zgesdd does not converge
+// - randomized: randomized SVD computing only the singular values that are
+//   kept by the maximum bond dimension
+// - heuristic: choose one of these by the size of the matrix and the
+//   maximum bond dimension
+enum class SVD_alg {CSVD, LAPACK, RANDOMIZED, HEURISTIC};
+
 cmatrix_t reshape_before_SVD(std::vector<cmatrix_t> data);
 std::vector<cmatrix_t> reshape_U_after_SVD(cmatrix_t U);
 rvector_t reshape_S_after_SVD(rvector_t S);
 std::vector<cmatrix_t> reshape_V_after_SVD(const cmatrix_t V);
 uint_t num_of_SV(rvector_t S, double threshold);
-void reduce_zeros(cmatrix_t &U, rvector_t &S, cmatrix_t &V,
-                  uint_t max_bond_dimension, double truncation_threshold);
+// Truncate the SVD and return the discarded weight, i.e., the sum of the
+// squares of the removed singular values
+double reduce_zeros(cmatrix_t &U, rvector_t &S, cmatrix_t &V,
+                    uint_t max_bond_dimension, double truncation_threshold);
 status csvd(cmatrix_t &C, cmatrix_t &U,rvector_t &S,cmatrix_t &V);
 void csvd_wrapper(cmatrix_t &C, cmatrix_t &U,rvector_t &S,cmatrix_t &V);
+status lapack_csvd(cmatrix_t &C, cmatrix_t &U, rvector_t &S, cmatrix_t &V);
+status lapack_csvd_single(const cmatrix_t &C, cmatrix_t &U, rvector_t &S,
+                          cmatrix_t &V);
+void randomized_csvd(cmatrix_t &C, cmatrix_t &U, rvector_t &S, cmatrix_t &V,
+                     uint_t rank);
+SVD_alg choose_svd_alg(uint_t rows, uint_t cols, uint_t max_bond_dimension);
+// If single_precision is true, the LAPACK SVD is computed in single precision
+// and csvd, the randomized SVD and the fallback remain in double precision
+void svd(cmatrix_t &C, cmatrix_t &U, rvector_t &S, cmatrix_t &V,
+         SVD_alg alg, uint_t max_bond_dimension,
+         bool single_precision = false);
 
 
 //-------------------------------------------------------------------------
@@ -15,6 +15,7 @@
 #ifndef _aer_stabilizer_state_hpp
 #define _aer_stabilizer_state_hpp
 
+#include "framework/checkpoint.hpp"
 #include "framework/utils.hpp"
 #include "framework/json.hpp"
 #include "simulators/state.hpp"
@@ -105,6 +106,11 @@ public:
                                             uint_t shots,
                                             RngEngine &rng) override;
 
+  // Checkpoints store the Clifford table
+  virtual bool checkpoint_supported() const override {return true;}
+  virtual void save_checkpoint(std::ostream &out) const override;
+  virtual void load_checkpoint(std::istream &in) override;
+
 protected:
 
   //-----------------------------------------------------------------------
@@ -279,7 +285,8 @@ void State::apply_ops(const std::vector<Operations::Op> &ops,
                       ExperimentResult &result,
                       RngEngine &rng, bool final_ops) {
   // Simple loop over vector of input operations
-  for (const auto &op: ops) {
+  for (size_t i = 0; i < ops.size(); ++i) {
+    const auto &op = ops[i];
     if(BaseState::creg_.check_conditional(op)) {
       switch (op.type) {
         case Operations::OpType::barrier:
@@ -307,6 +314,7 @@ void State::apply_ops(const std::vector<Operations::Op> &ops,
                                       op.name + "\'.");
       }
     }
+    BaseState::checkpoint_hook(i + 1);
   }
 }
 
@@ -432,6 +440,46 @@ std::vector<reg_t> State::sample_measure(const reg_t &qubits,
   return samples;
 }
 
+//=========================================================================
+// Implementation: Checkpoints
+//=========================================================================
+
+void State::save_checkpoint(std::ostream &out) const {
+  // The X and Z bits of the destabilizers and stabilizers, and the phases
+  Checkpoint::write<uint_t>(out, qreg_.num_qubits());
+  for (const auto &pauli : qreg_.table()) {
+    Checkpoint::write(out, pauli.X.getData());
+    Checkpoint::write(out, pauli.Z.getData());
+  }
+  Checkpoint::write(out, qreg_.phases());
+}
+
+void State::load_checkpoint(std::istream &in) {
+  uint_t num_qubits;
+  Checkpoint::read(in, num_qubits);
+  if (num_qubits != qreg_.num_qubits()) {
+    throw std::runtime_error(
+        "Stabilizer::State: the checkpoint does not match the number of "
+        "qubits of the state.");
+  }
+  const uint_t block = BV::BinaryVector::BLOCK_SIZE;
+  auto load_bits = [&](BV::BinaryVector &bits) {
+    std::vector<uint64_t> data;
+    Checkpoint::read(in, data);
+    if (data.size() != (num_qubits - 1) / block + 1)
+      throw std::runtime_error("Stabilizer::State: invalid checkpoint.");
+    for (uint_t q = 0; q < num_qubits; ++q)
+      bits.setValue((data[q / block] >> (q % block)) & 1ULL, q);
+  };
+  for (auto &pauli : qreg_.table()) {
+    load_bits(pauli.X);
+    load_bits(pauli.Z);
+  }
+  Checkpoint::read(in, qreg_.phases());
+  if (qreg_.phases().size() != 2 * num_qubits)
+    throw std::runtime_error("Stabilizer::State: invalid checkpoint.");
+}
+
 //=========================================================================
 // Implementation: Snapshots
 //=========================================================================
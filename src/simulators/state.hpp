@@ -15,6 +15,8 @@
 #ifndef _aer_base_state_hpp_
 #define _aer_base_state_hpp_
 
+#include <functional>
+
 #include "framework/json.hpp"
 #include "framework/opset.hpp"
 #include "framework/types.hpp"
@@ -161,6 +163,31 @@ public:
                                             uint_t shots,
                                             RngEngine &rng);
 
+  //-----------------------------------------------------------------------
+  // Optional: checkpoints
+  //
+  // These methods are only required for a State subclass to support the
+  // checkpoints of the QasmController
+  //-----------------------------------------------------------------------
+
+  // Return true if the quantum state can be written to a checkpoint
+  virtual bool checkpoint_supported() const {return false;}
+
+  // Write the quantum state to a binary checkpoint stream
+  virtual void save_checkpoint(std::ostream &out) const;
+
+  // Restore the quantum state from a binary checkpoint stream. The state
+  // must be initialized with the number of qubits of the saved state.
+  virtual void load_checkpoint(std::istream &in);
+
+  // Set a function called by apply_ops with the number of ops applied so
+  // far, after the ops where the state can be written to a checkpoint.
+  // A State subclass that supports checkpoints calls it between the blocks
+  // of ops it applies together. An empty function removes the hook.
+  void set_checkpoint_hook(const std::function<void(uint_t)> &hook) {
+    checkpoint_hook_ = hook;
+  }
+
   //=======================================================================
   // Standard non-virtual methods
   //
@@ -271,6 +298,15 @@ protected:
   // Set a global phase exp(1j * theta) for the state
   bool has_global_phase_ = false;
   complex_t global_phase_ = 1;
+
+  // Call the checkpoint hook after the first num_ops ops of apply_ops
+  void checkpoint_hook(uint_t num_ops) const {
+    if (checkpoint_hook_)
+      checkpoint_hook_(num_ops);
+  }
+
+  // Function called between the ops applied by apply_ops
+  std::function<void(uint_t)> checkpoint_hook_;
 };
 
 
@@ -305,6 +341,18 @@ std::vector<reg_t> State<state_t>::sample_measure(const reg_t &qubits,
 }
 
 
+template <class state_t>
+void State<state_t>::save_checkpoint(std::ostream &out) const {
+  (ignore_argument)out;
+  throw std::runtime_error(name() + " state does not support checkpoints.");
+}
+
+template <class state_t>
+void State<state_t>::load_checkpoint(std::istream &in) {
+  (ignore_argument)in;
+  throw std::runtime_error(name() + " state does not support checkpoints.");
+}
+
 template <class state_t>
 void State<state_t>::initialize_creg(uint_t num_memory, uint_t num_register) {
   creg_.initialize(num_memory, num_register);
@@ -0,0 +1,127 @@
+/**
+ * This code is part of Qiskit.
+ *
+ * (C) Copyright IBM 2018, 2019, 2020.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+
+
+#ifndef _qv_pauli_groups_hpp_
+#define _qv_pauli_groups_hpp_
+
+#include <algorithm>
+#include <complex>
+#include <cstdint>
+#include <string>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+#include <stdexcept>
+
+namespace AER {
+namespace QV {
+
+// Type aliases
+using uint_t = uint64_t;
+using reg_t = std::vector<uint_t>;
+using pauli_sum_t = std::vector<std::pair<std::complex<double>, std::string>>;
+
+//============================================================================
+// Pauli sum grouping
+//============================================================================
+
+// Terms of a Pauli sum that share the same X/Y flip mask.
+// Every term of a group pairs the same amplitudes (i, i ^ x_mask), so the
+// expectation values of all terms in the group can be accumulated in a single
+// pass over the amplitude pairs. The terms only differ in the Z mask used for
+// the sign of each amplitude, and in the phase (-1j) ** num_y.
+struct PauliGroup {
+  uint_t x_mask = 0;
+  uint_t x_max = 0;
+  reg_t x_qubits;
+  std::vector<uint_t> z_masks;
+  std::vector<std::complex<double>> phases;
+  std::vector<std::complex<double>> coeffs;
+};
+
+// Split a sum of (coeff, pauli) terms on the given qubits into groups of
+// terms with the same X/Y flip mask. Groups are returned in order of their
+// first term in the sum.
+inline std::vector<PauliGroup> pauli_groups(const reg_t &qubits,
+                                            const pauli_sum_t &paulis) {
+  std::vector<PauliGroup> groups;
+  std::unordered_map<uint_t, size_t> group_index;
+  const size_t N = qubits.size();
+  // The overall phase of a term is (-1j) ** number of Y terms modulo 4
+  const std::complex<double> y_phases[4] = {{1., 0.}, {0., -1.}, {-1., 0.}, {0., 1.}};
+
+  for (const auto &term : paulis) {
+    const auto &pauli = term.second;
+    if (pauli.size() != N) {
+      throw std::invalid_argument("Invalid Pauli \"" + pauli +
+                                  "\" (length does not match qubits).");
+    }
+    // Break string up into Z and X
+    // With Y being both Z and X (plus a phase)
+    uint_t x_mask = 0;
+    uint_t z_mask = 0;
+    uint_t num_y = 0;
+    uint_t x_max = 0;
+    reg_t x_qubits;
+    for (size_t i = 0; i < N; ++i) {
+      const uint_t bit = 1ULL << qubits[i];
+      switch (pauli[N - 1 - i]) {
+        case 'I':
+          break;
+        case 'X': {
+          x_mask += bit;
+          x_max = std::max(x_max, qubits[i]);
+          x_qubits.push_back(qubits[i]);
+          break;
+        }
+        case 'Z': {
+          z_mask += bit;
+          break;
+        }
+        case 'Y': {
+          x_mask += bit;
+          x_max = std::max(x_max, qubits[i]);
+          x_qubits.push_back(qubits[i]);
+          z_mask += bit;
+          num_y++;
+          break;
+        }
+        default:
+          throw std::invalid_argument("Invalid Pauli \"" + std::to_string(pauli[N - 1 - i]) + "\".");
+      }
+    }
+
+    auto it = group_index.find(x_mask);
+    if (it == group_index.end()) {
+      it = group_index.emplace(x_mask, groups.size()).first;
+      groups.emplace_back();
+      groups.back().x_mask = x_mask;
+      groups.back().x_max = x_max;
+      groups.back().x_qubits = std::move(x_qubits);
+    }
+    auto &group = groups[it->second];
+    group.z_masks.push_back(z_mask);
+    group.phases.push_back(y_phases[num_y & 3]);
+    group.coeffs.push_back(term.first);
+  }
+  return groups;
+}
+
+//------------------------------------------------------------------------------
+} // end namespace QV
+} // end namespace AER
+//------------------------------------------------------------------------------
+#endif // end module
@@ -28,7 +28,14 @@
 #include <sstream>
 #include <stdexcept>
 
+#if defined(__linux__)
+#include <sys/mman.h>
+#include <sys/syscall.h>
+#include <unistd.h>
+#endif
+
 #include "simulators/statevector/indexes.hpp"
+#include "simulators/statevector/pauli_groups.hpp"
 #include "simulators/statevector/transformer.hpp"
 #include "simulators/statevector/transformer_avx2.hpp"
 #include "framework/avx2_detect.hpp"
@@ -281,6 +288,13 @@ public:
   double expval_pauli(const reg_t &qubits, const std::string &pauli,
                       const complex_t &coeff = 1) const;
 
+  // Return the expectation value of a sum of N-qubit Pauli matrices
+  // sum_j coeff_j * <P_j>. The Paulis are input as (coeff, string) pairs.
+  // Terms with the same X/Y support are evaluated in a single pass over the
+  // vector.
+  std::complex<double> expval_pauli_sum(const reg_t &qubits,
+                                        const pauli_sum_t &paulis) const;
+
   //-----------------------------------------------------------------------
   // JSON configuration settings
   //-----------------------------------------------------------------------
@@ -318,6 +332,30 @@ public:
   // Get the sample_measure index size
   int get_sample_measure_index_size() {return sample_measure_index_size_;}
 
+  // Set the allocation policy for the amplitude buffer. Valid policies are
+  //   * "default": aligned allocation, pages are placed when first written
+  //   * "hugepage": 2MB aligned allocation advised to use transparent
+  //                 huge pages to reduce TLB misses (Linux only)
+  //   * "interleaved": pages interleaved across all NUMA nodes (Linux only)
+  //   * "first_touch": pages are written by the OpenMP threads with the same
+  //                    static schedule as the gate kernels, so each page is
+  //                    placed on the NUMA node of the thread that uses it
+  void set_allocator(const std::string &policy);
+
+  // Get the allocation policy that was applied to the last allocated buffer.
+  // This is "default" if the configured policy could not be applied.
+  const std::string &get_allocator() const {return applied_allocator_;}
+
+  // Set the number of shards of the amplitude buffer. If greater than 1 and
+  // a power of two, the buffer is split into contiguous shards of the
+  // highest qubits, and the pages of each shard are placed on one NUMA node,
+  // round robin over the nodes allowed for this process (Linux only).
+  void set_num_shards(uint_t shards) {num_shards_ = shards;}
+
+  // Get the number of shards of the last allocated buffer that were placed
+  // on NUMA nodes, or 1 if the buffer is not sharded
+  uint_t get_num_shards() const {return applied_shards_;}
+
 protected:
 
   //-----------------------------------------------------------------------
@@ -336,6 +374,12 @@ protected:
   int sample_measure_index_size_ = 10; // Sample measure indexing qubit size
   double json_chop_threshold_ = 0;  // Threshold for choping small values
                                     // in JSON serialization
+  std::string allocator_ = "default"; // Allocation policy for buffers
+  uint_t num_shards_ = 1;              // Number of NUMA shards of buffers
+
+  // Allocation policy and number of shards applied to the last buffer
+  mutable std::string applied_allocator_ = "default";
+  mutable uint_t applied_shards_ = 1;
   inline uint_t omp_threads_managed() const {
     return (num_qubits_ > omp_threshold_ && omp_threads_ > 1) ? omp_threads_: 1;
   }
@@ -487,6 +531,13 @@ protected:
 
   // Allocates memory for the checkoiunt
   void allocate_checkpoint(size_t data_size);
+
+  // Allocates a buffer using the current allocation policy
+  std::complex<data_t>* allocate_buffer(size_t data_size) const;
+
+  // Place each shard of a page aligned buffer on one NUMA node.
+  // Returns false if the shards could not be bound.
+  bool bind_shards(void* data, size_t bytes) const;
 };
 
 /*******************************************************************************
@@ -704,9 +755,8 @@ void QubitVector<data_t>::set_num_qubits(size_t num_qubits) {
     free_mem();
   }
   data_size_ = BITS[num_qubits];
-  allocate_mem(data_size_);
-
   num_qubits_ = num_qubits;
+  allocate_mem(data_size_);
 }
 
 template <typename data_t>
@@ -732,27 +782,117 @@ void QubitVector<data_t>::allocate_mem(size_t data_size){
   free_mem();
   // Allocate memory for new vector
   if (data_ == nullptr) {
-#if !defined(_WIN64) && !defined(_WIN32)
-    void* data;
-    posix_memalign(&data, 64, sizeof(std::complex<data_t>) * data_size);
-    data_ = reinterpret_cast<std::complex<data_t>*>(data);
-#else
-    data_ = reinterpret_cast<std::complex<data_t>*>(malloc(sizeof(std::complex<data_t>) * data_size));
-#endif
+    data_ = allocate_buffer(data_size);
+    // zero() writes every page with the same static schedule as the kernels
+    if (allocator_ == "first_touch")
+      zero();
   }
 }
 
 template <typename data_t>
 void QubitVector<data_t>::allocate_checkpoint(size_t data_size){
   free_checkpoint();
+  checkpoint_ = allocate_buffer(data_size);
+}
+
+template <typename data_t>
+std::complex<data_t>* QubitVector<data_t>::allocate_buffer(size_t data_size) const {
+  const size_t bytes = sizeof(std::complex<data_t>) * data_size;
+  std::string applied = "default";
+  applied_shards_ = 1;
 #if !defined(_WIN64) && !defined(_WIN32)
-  void* data;
-  posix_memalign(&data, 64, sizeof(std::complex<data_t>) * data_size);
-  checkpoint_ = reinterpret_cast<std::complex<data_t>*>(data);
+  // Huge and NUMA policies work on whole pages
+  size_t alignment = 64;
+  if (allocator_ == "hugepage") {
+    alignment = 1ULL << 21;
+  } else if (allocator_ == "interleaved" || num_shards_ > 1) {
+    alignment = sysconf(_SC_PAGE_SIZE);
+  }
+  void* data = nullptr;
+  if (posix_memalign(&data, alignment, bytes) != 0) {
+    throw std::runtime_error("QubitVector: failed to allocate " +
+                             std::to_string(bytes) + " bytes.");
+  }
+#if defined(__linux__)
+  const size_t aligned_bytes = ((bytes + alignment - 1) / alignment) * alignment;
+  if (allocator_ == "hugepage") {
+#if defined(MADV_HUGEPAGE)
+    if (madvise(data, aligned_bytes, MADV_HUGEPAGE) == 0)
+      applied = "hugepage";
+#endif
+  }
+  // The shard placement replaces the interleaved policy
+  if (num_shards_ > 1 && bind_shards(data, bytes)) {
+    applied_shards_ = num_shards_;
+  } else if (allocator_ == "interleaved") {
+#if defined(SYS_mbind)
+    // Interleave over all nodes allowed for this process. The kernel
+    // restricts the node mask to the nodes that have memory.
+    const int mpol_interleave = 3;
+    const unsigned long nodemask = ~0UL;
+    if (syscall(SYS_mbind, data, aligned_bytes, mpol_interleave, &nodemask,
+                8 * sizeof(nodemask), 0) == 0)
+      applied = "interleaved";
+#endif
+  }
+#endif
+  std::complex<data_t>* buffer = reinterpret_cast<std::complex<data_t>*>(data);
 #else
-  checkpoint_ = reinterpret_cast<std::complex<data_t>*>(malloc(sizeof(std::complex<data_t>) * data_size));
+  std::complex<data_t>* buffer = reinterpret_cast<std::complex<data_t>*>(malloc(bytes));
+  if (buffer == nullptr) {
+    throw std::runtime_error("QubitVector: failed to allocate " +
+                             std::to_string(bytes) + " bytes.");
+  }
 #endif
 
+  // The pages are placed by their first write, in allocate_mem for the
+  // state and in checkpoint for a copy of the state
+  if (allocator_ == "first_touch")
+    applied = "first_touch";
+  applied_allocator_ = applied;
+  return buffer;
+}
+
+template <typename data_t>
+bool QubitVector<data_t>::bind_shards(void* data, size_t bytes) const {
+#if defined(__linux__) && defined(SYS_mbind) && defined(SYS_get_mempolicy)
+  const size_t page_size = sysconf(_SC_PAGE_SIZE);
+  if ((num_shards_ & (num_shards_ - 1)) != 0 || bytes % num_shards_ != 0 ||
+      (bytes / num_shards_) % page_size != 0)
+    return false;
+
+  // Nodes allowed for this process
+  const int mpol_f_mems_allowed = 4;
+  const size_t mask_bits = 1024;
+  std::vector<unsigned long> allowed(mask_bits / (8 * sizeof(unsigned long)), 0);
+  if (syscall(SYS_get_mempolicy, nullptr, allowed.data(), mask_bits, nullptr,
+              mpol_f_mems_allowed) != 0)
+    return false;
+  std::vector<size_t> nodes;
+  for (size_t node = 0; node < mask_bits; ++node) {
+    if (allowed[node / (8 * sizeof(unsigned long))] &
+        (1UL << (node % (8 * sizeof(unsigned long)))))
+      nodes.push_back(node);
+  }
+  if (nodes.empty())
+    return false;
+
+  // Prefer the node of each shard, so that pages fall back to other nodes
+  // instead of failing when the node is full
+  const int mpol_preferred = 1;
+  const size_t shard_bytes = bytes / num_shards_;
+  for (size_t shard = 0; shard < num_shards_; ++shard) {
+    const size_t node = nodes[shard % nodes.size()];
+    std::vector<unsigned long> mask(allowed.size(), 0);
+    mask[node / (8 * sizeof(unsigned long))] = 1UL << (node % (8 * sizeof(unsigned long)));
+    if (syscall(SYS_mbind, reinterpret_cast<char*>(data) + shard * shard_bytes,
+                shard_bytes, mpol_preferred, mask.data(), mask_bits + 1, 0) != 0)
+      return false;
+  }
+  return true;
+#else
+  return false;
+#endif
 }
 
 template <typename data_t>
@@ -875,6 +1015,16 @@ void QubitVector<data_t>::set_omp_threshold(int n) {
     omp_threshold_ = n;
 }
 
+template <typename data_t>
+void QubitVector<data_t>::set_allocator(const std::string &policy) {
+  if (policy != "default" && policy != "hugepage" &&
+      policy != "interleaved" && policy != "first_touch") {
+    throw std::invalid_argument("QubitVector: invalid allocator policy \"" +
+                                policy + "\".");
+  }
+  allocator_ = policy;
+}
+
 template <typename data_t>
 void QubitVector<data_t>::set_json_chop_threshold(double threshold) {
   json_chop_threshold_ = threshold;
@@ -1865,6 +2015,81 @@ double QubitVector<data_t>::expval_pauli(const reg_t &qubits,
   return std::real(apply_reduction_lambda(std::move(lambda), (size_t) 0, (data_size_ >> 1)));
 }
 
+template <typename data_t>
+std::complex<double>
+QubitVector<data_t>::expval_pauli_sum(const reg_t &qubits,
+                                      const pauli_sum_t &paulis) const {
+  std::complex<double> expval(0., 0.);
+  for (const auto &group : pauli_groups(qubits, paulis)) {
+    const int_t NTERMS = group.z_masks.size();
+    const auto &z_masks = group.z_masks;
+    // For each term accumulate sum_i sign_z(i) * val(i), where val(i) is
+    // |psi_i|^2 for Z-only terms, and for each amplitude pair
+    // (i, i ^ x_mask) is either Re or Im of psi_{i ^ x_mask} * conj(psi_i)
+    // depending on whether the Z mask anti-commutes with the X mask
+    std::vector<double> vals(NTERMS, 0.);
+    std::vector<int> use_imag(NTERMS, 0);
+    for (int_t j = 0; j < NTERMS; ++j)
+      use_imag[j] = AER::Utils::popcount(group.x_mask & z_masks[j]) & 1;
+
+    if (!group.x_mask) {
+      const int_t END = data_size_;
+      #pragma omp parallel if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) num_threads(omp_threads_)
+      {
+        std::vector<double> vals_private(NTERMS, 0.);
+        #pragma omp for
+        for (int_t i = 0; i < END; ++i) {
+          const double val = std::real(data_[i] * std::conj(data_[i]));
+          for (int_t j = 0; j < NTERMS; ++j) {
+            if (AER::Utils::popcount(i & z_masks[j]) & 1)
+              vals_private[j] -= val;
+            else
+              vals_private[j] += val;
+          }
+        }
+        #pragma omp critical
+        for (int_t j = 0; j < NTERMS; ++j) {
+          vals[j] += vals_private[j];
+        }
+      }
+    } else {
+      const uint_t mask_u = ~MASKS[group.x_max + 1];
+      const uint_t mask_l = MASKS[group.x_max];
+      const uint_t x_mask = group.x_mask;
+      const int_t END = data_size_ >> 1;
+      #pragma omp parallel if (num_qubits_ > omp_threshold_ && omp_threads_ > 1) num_threads(omp_threads_)
+      {
+        std::vector<double> vals_private(NTERMS, 0.);
+        #pragma omp for
+        for (int_t i = 0; i < END; ++i) {
+          const int_t idx0 = ((i << 1) & mask_u) | (i & mask_l);
+          const std::complex<double> val = data_[idx0 ^ x_mask] * std::conj(data_[idx0]);
+          for (int_t j = 0; j < NTERMS; ++j) {
+            const double part = use_imag[j] ? val.imag() : val.real();
+            if (AER::Utils::popcount(idx0 & z_masks[j]) & 1)
+              vals_private[j] -= part;
+            else
+              vals_private[j] += part;
+          }
+        }
+        #pragma omp critical
+        for (int_t j = 0; j < NTERMS; ++j) {
+          vals[j] += vals_private[j];
+        }
+      }
+      // Each pair contributes Re(phase * val) +/- Re(phase * conj(val))
+      for (int_t j = 0; j < NTERMS; ++j) {
+        const auto &phase = group.phases[j];
+        vals[j] *= use_imag[j] ? -2. * phase.imag() : 2. * phase.real();
+      }
+    }
+    for (int_t j = 0; j < NTERMS; ++j) {
+      expval += group.coeffs[j] * vals[j];
+    }
+  }
+  return expval;
+}
+
 /*******************************************************************************
  *
  * PAULI
@@ -0,0 +1,443 @@
+/**
+ * This code is part of Qiskit.
+ *
+ * (C) Copyright IBM 2018, 2019, 2020.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+
+
+#ifndef _qv_qubit_vector_chunked_hpp_
+#define _qv_qubit_vector_chunked_hpp_
+
+#include <algorithm>
+#include <cstdlib>
+#include <string>
+#include <vector>
+#include <stdexcept>
+
+#if !defined(_WIN64) && !defined(_WIN32)
+#include <sys/mman.h>
+#include <sys/statvfs.h>
+#include <unistd.h>
+#endif
+
+#include "framework/operations.hpp"
+#include "simulators/statevector/qubitvector.hpp"
+
+namespace AER {
+namespace QV {
+
+//============================================================================
+// QubitVectorChunked class
+//============================================================================
+
+// Out-of-core qubit vector whose amplitudes are stored on disk.
+//
+// The vector is stored in unlinked temporary chunk files in the chunk
+// directory. Each file holds at least 2^chunk_qubits amplitudes and at most
+// MAX_CHUNK_FILES files are used, so every file is a single memory map and the
+// number of maps stays bounded. The files are mapped into one reserved address
+// range, so the vector is contiguous in memory and all QubitVector kernels
+// can be applied to the full vector, whose pages are read and written back by
+// the OS page cache.
+//
+// The vector is split into 2^(n - chunk_qubits) chunks of 2^chunk_qubits
+// amplitudes. The chunk_qubits lowest (local) qubits index the amplitudes of
+// a chunk and the remaining (global) qubits index the chunks. select_chunk
+// restricts the vector to the amplitudes of one chunk, as a vector of the
+// local qubits, so that the Statevector::State applies a block of gates on
+// local qubits chunk by chunk in a single streaming pass over the files.
+// Gates on global qubits are moved to local qubits by swap gates inserted by
+// the LocalQubits transpiler pass, and a swap of a local and a global qubit
+// exchanges halves of pairs of chunks.
+//
+// Chunk files are only supported on POSIX systems.
+
+template <typename data_t = double>
+class QubitVectorChunked : public QubitVector<data_t> {
+
+public:
+  using BaseVector = QubitVector<data_t>;
+
+  //-----------------------------------------------------------------------
+  // Constructors and Destructor
+  //-----------------------------------------------------------------------
+
+  QubitVectorChunked();
+  explicit QubitVectorChunked(size_t num_qubits);
+  virtual ~QubitVectorChunked();
+  QubitVectorChunked(const QubitVectorChunked& obj) = delete;
+  QubitVectorChunked &operator=(const QubitVectorChunked& obj) = delete;
+
+  //-----------------------------------------------------------------------
+  // Utility functions
+  //-----------------------------------------------------------------------
+
+  // Return the string name of the QubitVectorChunked class
+  static std::string name() {return "statevector_chunked";}
+
+  // Set the size of the vector in terms of qubit number
+  void set_num_qubits(size_t num_qubits);
+
+  // Returns the memory required to keep one chunk resident in the page cache
+  size_t required_memory_mb(uint_t num_qubits) const;
+
+  // Returns the memory required to apply the operations. This is the memory
+  // of one chunk, and of a copy of the full vector if the operations contain
+  // statevector snapshots.
+  size_t required_memory_mb(uint_t num_qubits,
+                            const std::vector<Operations::Op> &ops) const;
+
+  // Returns the disk space required for the chunk files of the vector
+  size_t required_disk_mb(uint_t num_qubits) const;
+
+  // Moves the data to a complex vector
+  // The chunk files are unmapped, so the data is copied to memory
+  AER::Vector<std::complex<data_t>> move_to_vector();
+
+  //-----------------------------------------------------------------------
+  // Check point operations
+  //-----------------------------------------------------------------------
+
+  // Create a checkpoint of the current state
+  // The checkpoint is stored in its own set of chunk files
+  void checkpoint();
+
+  // Revert to the checkpoint
+  void revert(bool keep);
+
+  //-----------------------------------------------------------------------
+  // Chunk configuration settings
+  //-----------------------------------------------------------------------
+
+  // Set the directory for the chunk files. This should be on a local disk.
+  void set_chunk_directory(const std::string &directory);
+
+  // Get the directory for the chunk files.
+  const std::string &get_chunk_directory() const {return chunk_directory_;}
+
+  // Set the number of qubits of the amplitudes stored in each chunk file.
+  void set_chunk_qubits(int n);
+
+  // Get the number of qubits of the amplitudes stored in each chunk file.
+  uint_t get_chunk_qubits() const {return chunk_qubits_;}
+
+  // Maximum number of chunk files (and memory maps) for one buffer
+  static constexpr size_t MAX_CHUNK_FILES = 64;
+
+  // Default number of qubits of a chunk
+  static constexpr uint_t DEFAULT_CHUNK_QUBITS = 20;
+
+  //-----------------------------------------------------------------------
+  // Chunk streaming
+  //-----------------------------------------------------------------------
+
+  // Return the number of chunks of the full vector
+  uint_t num_chunks() const;
+
+  // Restrict the vector to the amplitudes of a chunk. Until select_all is
+  // called the vector is a vector of the local qubits, and the next chunk is
+  // read ahead from the chunk files.
+  void select_chunk(uint_t chunk);
+
+  // Restore the full vector after select_chunk
+  void select_all();
+
+  // Get the allocation policy for the amplitude buffer.
+  // Chunk files are used instead of the QubitVector allocation policies.
+  std::string get_allocator() const {return "chunk_files";}
+
+protected:
+
+  //-----------------------------------------------------------------------
+  // Protected data members
+  //-----------------------------------------------------------------------
+
+  // Flags for the buffers that are mapped to chunk files. The buffers
+  // allocated by the QubitVector base class are released with free.
+  bool data_mapped_ = false;
+  bool checkpoint_mapped_ = false;
+
+  // Full vector while a chunk is selected, or nullptr
+  std::complex<data_t>* full_data_ = nullptr;
+  uint_t full_qubits_ = 0;
+
+  //-----------------------------------------------------------------------
+  // Config settings
+  //-----------------------------------------------------------------------
+  std::string chunk_directory_ = default_chunk_directory();
+  uint_t chunk_qubits_ = DEFAULT_CHUNK_QUBITS;  // 16 MB chunks for complex double
+
+  static std::string default_chunk_directory();
+
+  // Map a buffer of the current data size to a new set of chunk files
+  std::complex<data_t>* map_chunks() const;
+
+  // Release a buffer allocated by this class or by the base class
+  void release(std::complex<data_t>* &data, bool &mapped) const;
+};
+
+/*******************************************************************************
+ *
+ * Implementations
+ *
+ ******************************************************************************/
+
+//------------------------------------------------------------------------------
+// Constructors & Destructor
+//------------------------------------------------------------------------------
+
+template <typename data_t>
+QubitVectorChunked<data_t>::QubitVectorChunked(size_t num_qubits)
+  : BaseVector() {
+  set_num_qubits(num_qubits);
+}
+
+template <typename data_t>
+QubitVectorChunked<data_t>::QubitVectorChunked() : QubitVectorChunked(0) {}
+
+template <typename data_t>
+QubitVectorChunked<data_t>::~QubitVectorChunked() {
+  // Release the mapped buffers before the base class frees its buffers
+  select_all();
+  release(BaseVector::data_, data_mapped_);
+  release(BaseVector::checkpoint_, checkpoint_mapped_);
+}
+
+//------------------------------------------------------------------------------
+// Utility
+//------------------------------------------------------------------------------
+
+template <typename data_t>
+void QubitVectorChunked<data_t>::set_num_qubits(size_t num_qubits) {
+  select_all();
+  release(BaseVector::checkpoint_, checkpoint_mapped_);
+  release(BaseVector::data_, data_mapped_);
+  BaseVector::num_qubits_ = num_qubits;
+  BaseVector::data_size_ = BITS[num_qubits];
+  BaseVector::data_ = map_chunks();
+  data_mapped_ = true;
+}
+
+template <typename data_t>
+size_t QubitVectorChunked<data_t>::required_memory_mb(uint_t num_qubits) const {
+  return BaseVector::required_memory_mb(std::min<uint_t>(num_qubits, chunk_qubits_));
+}
+
+template <typename data_t>
+size_t QubitVectorChunked<data_t>::required_memory_mb(
+    uint_t num_qubits, const std::vector<Operations::Op> &ops) const {
+  const bool copies_vector = std::any_of(
+      ops.begin(), ops.end(), [](const Operations::Op &op) {
+        return op.type == Operations::OpType::snapshot && op.name == "statevector";
+      });
+  if (copies_vector)
+    return required_memory_mb(num_qubits) + BaseVector::required_memory_mb(num_qubits);
+  return required_memory_mb(num_qubits);
+}
+
+template <typename data_t>
+size_t QubitVectorChunked<data_t>::required_disk_mb(uint_t num_qubits) const {
+  return BaseVector::required_memory_mb(num_qubits);
+}
+
+template <typename data_t>
+AER::Vector<std::complex<data_t>> QubitVectorChunked<data_t>::move_to_vector() {
+  if (!data_mapped_)
+    return BaseVector::move_to_vector();
+  auto vec = BaseVector::copy_to_vector();
+  release(BaseVector::data_, data_mapped_);
+  return vec;
+}
+
+template <typename data_t>
+void QubitVectorChunked<data_t>::checkpoint() {
+  release(BaseVector::checkpoint_, checkpoint_mapped_);
+  BaseVector::checkpoint_ = map_chunks();
+  checkpoint_mapped_ = true;
+
+  const int_t END = BaseVector::data_size_;    // end for k loop
+  #pragma omp parallel for if (BaseVector::num_qubits_ > BaseVector::omp_threshold_ && BaseVector::omp_threads_ > 1) num_threads(BaseVector::omp_threads_)
+  for (int_t k = 0; k < END; ++k)
+    BaseVector::checkpoint_[k] = BaseVector::data_[k];
+}
+
+template <typename data_t>
+void QubitVectorChunked<data_t>::revert(bool keep) {
+  // If we aren't keeping checkpoint we don't need to copy memory
+  // we can simply swap the pointers and release the discarded chunk files
+  if (!keep) {
+    release(BaseVector::data_, data_mapped_);
+    BaseVector::data_ = BaseVector::checkpoint_;
+    data_mapped_ = checkpoint_mapped_;
+    BaseVector::checkpoint_ = nullptr;
+    checkpoint_mapped_ = false;
+    return;
+  }
+  BaseVector::revert(keep);
+}
+
+//------------------------------------------------------------------------------
+// Chunk streaming
+//------------------------------------------------------------------------------
+
+template <typename data_t>
+uint_t QubitVectorChunked<data_t>::num_chunks() const {
+  const uint_t num_qubits = (full_data_ == nullptr) ? BaseVector::num_qubits_ : full_qubits_;
+  return (num_qubits > chunk_qubits_) ? BITS[num_qubits - chunk_qubits_] : 1;
+}
+
+template <typename data_t>
+void QubitVectorChunked<data_t>::select_chunk(uint_t chunk) {
+  if (full_data_ == nullptr) {
+    full_data_ = BaseVector::data_;
+    full_qubits_ = BaseVector::num_qubits_;
+  }
+  const uint_t local_qubits = std::min<uint_t>(full_qubits_, chunk_qubits_);
+  const size_t chunk_size = BITS[local_qubits];
+  BaseVector::data_ = full_data_ + chunk * chunk_size;
+  BaseVector::num_qubits_ = local_qubits;
+  BaseVector::data_size_ = chunk_size;
+#if !defined(_WIN64) && !defined(_WIN32)
+  // Read the next chunk while this chunk is updated
+  const size_t chunk_bytes = sizeof(std::complex<data_t>) * chunk_size;
+  if (data_mapped_ && chunk + 1 < num_chunks() &&
+      chunk_bytes % sysconf(_SC_PAGE_SIZE) == 0) {
+    madvise(BaseVector::data_ + chunk_size, chunk_bytes, MADV_WILLNEED);
+  }
+#endif
+}
+
+template <typename data_t>
+void QubitVectorChunked<data_t>::select_all() {
+  if (full_data_ == nullptr)
+    return;
+  BaseVector::data_ = full_data_;
+  BaseVector::num_qubits_ = full_qubits_;
+  BaseVector::data_size_ = BITS[full_qubits_];
+  full_data_ = nullptr;
+}
+
+//------------------------------------------------------------------------------
+// Chunk files
+//------------------------------------------------------------------------------
+
+template <typename data_t>
+std::string QubitVectorChunked<data_t>::default_chunk_directory() {
+  const char* tmpdir = std::getenv("TMPDIR");
+  return (tmpdir != nullptr && *tmpdir != '\0') ? tmpdir : "/tmp";
+}
+
+template <typename data_t>
+void QubitVectorChunked<data_t>::set_chunk_directory(const std::string &directory) {
+  if (!directory.empty())
+    chunk_directory_ = directory;
+}
+
+template <typename data_t>
+void QubitVectorChunked<data_t>::set_chunk_qubits(int n) {
+  if (n > 0)
+    chunk_qubits_ = n;
+}
+
+template <typename data_t>
+std::complex<data_t>* QubitVectorChunked<data_t>::map_chunks() const {
+#if !defined(_WIN64) && !defined(_WIN32)
+  const size_t bytes = sizeof(std::complex<data_t>) * BaseVector::data_size_;
+
+  // Chunk files must be mapped at page boundaries, so chunks smaller
+  // than a page are merged into a single file. Consecutive chunks are
+  // merged so that at most MAX_CHUNK_FILES files are mapped, since every
+  // file mapping counts against the vm.max_map_count limit.
+  const size_t page_size = sysconf(_SC_PAGE_SIZE);
+  size_t file_bytes = sizeof(std::complex<data_t>) *
+                      BITS[std::min<uint_t>(BaseVector::num_qubits_, chunk_qubits_)];
+  file_bytes = std::max<size_t>(file_bytes, bytes / MAX_CHUNK_FILES);
+  file_bytes = (file_bytes < page_size) ? bytes : file_bytes;
+  const size_t num_files = bytes / file_bytes;
+
+  struct statvfs stat;
+  if (statvfs(chunk_directory_.c_str(), &stat) != 0) {
+    throw std::runtime_error("QubitVectorChunked: invalid chunk directory \"" +
+                             chunk_directory_ + "\".");
+  }
+  const size_t available_mb = (stat.f_bavail * stat.f_frsize) >> 20;
+  if (available_mb < required_disk_mb(BaseVector::num_qubits_)) {
+    throw std::runtime_error("QubitVectorChunked: insufficient disk space in \"" +
+                             chunk_directory_ + "\" for a " +
+                             std::to_string(BaseVector::num_qubits_) +
+                             "-qubit vector (" +
+                             std::to_string(required_disk_mb(BaseVector::num_qubits_)) +
+                             " MB required, " + std::to_string(available_mb) +
+                             " MB available).");
+  }
+
+  // Reserve a contiguous address range and map every chunk file into it
+  char* base = reinterpret_cast<char*>(
+      mmap(nullptr, bytes, PROT_NONE, MAP_PRIVATE | MAP_ANONYMOUS, -1, 0));
+  if (base == MAP_FAILED) {
+    throw std::runtime_error("QubitVectorChunked: failed to reserve " +
+                             std::to_string(bytes) + " bytes of address space.");
+  }
+  const std::string pattern = chunk_directory_ + "/qiskit_aer_chunk_XXXXXX";
+  for (size_t i = 0; i < num_files; ++i) {
+    std::vector<char> path(pattern.begin(), pattern.end());
+    path.push_back('\0');
+    const int fd = mkstemp(path.data());
+    if (fd < 0) {
+      munmap(base, bytes);
+      throw std::runtime_error("QubitVectorChunked: failed to create a chunk file in \"" +
+                               chunk_directory_ + "\".");
+    }
+    // The file is removed as soon as it is unmapped
+    unlink(path.data());
+    void* chunk = MAP_FAILED;
+    if (ftruncate(fd, file_bytes) == 0) {
+      chunk = mmap(base + i * file_bytes, file_bytes, PROT_READ | PROT_WRITE,
+                   MAP_SHARED | MAP_FIXED, fd, 0);
+    }
+    close(fd);
+    if (chunk == MAP_FAILED) {
+      munmap(base, bytes);
+      throw std::runtime_error("QubitVectorChunked: failed to map a chunk file in \"" +
+                               chunk_directory_ + "\".");
+    }
+  }
+  // Most kernels sweep the vector in index order, so let the OS read ahead
+  madvise(base, bytes, MADV_SEQUENTIAL);
+  return reinterpret_cast<std::complex<data_t>*>(base);
+#else
+  throw std::runtime_error("QubitVectorChunked: chunked statevector is not supported on Windows.");
+#endif
+}
+
+template <typename data_t>
+void QubitVectorChunked<data_t>::release(std::complex<data_t>* &data, bool &mapped) const {
+  if (data == nullptr)
+    return;
+#if !defined(_WIN64) && !defined(_WIN32)
+  if (mapped) {
+    munmap(data, sizeof(std::complex<data_t>) * BaseVector::data_size_);
+  } else {
+    free(data);
+  }
+#else
+  free(data);
+#endif
+  data = nullptr;
+  mapped = false;
+}
+
+//------------------------------------------------------------------------------
+} // end namespace QV
+} // end namespace AER
+//------------------------------------------------------------------------------
+#endif // end module
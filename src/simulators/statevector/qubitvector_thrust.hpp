@@ -52,6 +52,7 @@
 
 #include "framework/json.hpp"
 #include "framework/linalg/vector.hpp"
+#include "simulators/statevector/pauli_groups.hpp"
 
 #ifdef AER_TIMING
 
@@ -1069,6 +1070,13 @@ public:
   double expval_pauli(const reg_t &qubits, const std::string &pauli,
                       const complex_t &coeff = 1) const;
 
+  // Return the expectation value of a sum of N-qubit Pauli matrices
+  // sum_j coeff_j * <P_j>. The Paulis are input as (coeff, string) pairs.
+  // Terms with the same X/Y support are evaluated in a single pass over the
+  // vector.
+  std::complex<double> expval_pauli_sum(const reg_t &qubits,
+                                        const pauli_sum_t &paulis) const;
+
   //-----------------------------------------------------------------------
   // JSON configuration settings
   //-----------------------------------------------------------------------
@@ -1106,6 +1114,20 @@ public:
   // Get the sample_measure index size
   int get_sample_measure_index_size() {return sample_measure_index_size_;}
 
+  // Set the allocation policy for host buffers. Buffers are allocated by
+  // Thrust, so only the "default" policy is used.
+  void set_allocator(const std::string &policy) {}
+
+  // Get the allocation policy for host buffers
+  std::string get_allocator() const {return "default";}
+
+  // Set the number of NUMA shards of host buffers. Buffers are allocated by
+  // Thrust, so they are not sharded.
+  void set_num_shards(uint_t shards) {}
+
+  // Get the number of NUMA shards of host buffers
+  uint_t get_num_shards() const {return 1;}
+
 protected:
 
   //-----------------------------------------------------------------------
@@ -4840,6 +4862,236 @@ double QubitVectorThrust<data_t>::expval_pauli(const reg_t &qubits,
   }
 }
 
+//sum of Pauli terms sharing the same X mask
+//params_ holds the sorted X qubits followed by the Z mask of each term,
+//matrix_ holds the weighted phase of each term
+template <typename data_t>
+class expval_pauli_sum_func : public GateFuncBase
+{
+protected:
+  uint_t x_mask_;
+  uint_t nterms_;
+  uint_t nqubits_;
+public:
+  expval_pauli_sum_func(uint_t x,uint_t nt,int nq)
+  {
+    x_mask_ = x;
+    nterms_ = nt;
+    nqubits_ = nq;
+  }
+
+  bool Reduction(void)
+  {
+    return true;
+  }
+
+  __host__ __device__ double operator()(const thrust::tuple<uint_t,struct GateParams<data_t>> &iter) const
+  {
+    uint_t i,j,k,localMask,iChunk,iPair,nPair,gid;
+    uint_t idx,ii,mask,t,count,gidChunk;
+    thrust::complex<data_t>* pV;
+    uint_t* offsets;
+    uint_t* qubits;
+    uint_t* z_masks;
+    thrust::complex<double>* phases;
+    thrust::complex<double> q0;
+    thrust::complex<double> q1;
+    thrust::complex<double> a0;
+    double d0,d1,ret = 0.0;
+    struct GateParams<data_t> params;
+
+    i = ExtractIndexFromTuple(iter);
+    params = ExtractParamsFromTuple(iter);
+    pV = params.buf_;
+    offsets = params.offsets_;
+    qubits = params.params_;
+    z_masks = params.params_ + nqubits_;
+    phases = params.matrix_;
+    localMask = params.lmask_;
+    gid = params.gid_;
+
+    idx = 0;
+    ii = i;
+    for(j=0;j<nqubits_;j++){
+      mask = (1ull << qubits[j]) - 1;
+
+      t = ii & mask;
+      idx += t;
+      ii = (ii - t) << 1;
+    }
+    idx += ii;
+
+    nPair = 1ull << (nqubits_ - 1);
+    for(iChunk=0;iChunk<nPair;iChunk++){
+      iPair = iChunk ^ ((1ull << nqubits_) - 1);
+
+      q0 = pV[offsets[iChunk] + idx];
+      q1 = pV[offsets[iPair] + idx];
+      a0 = thrust::conj(q0) * q1;
+
+      gidChunk = gid + idx;
+      for(j=0;j<nqubits_;j++){
+        if(((iChunk >> j) & 1) == 1){
+          gidChunk += (1ull << qubits[j]);
+        }
+      }
+
+      for(k=0;k<nterms_;k++){
+        d0 = (phases[k] * a0).real();
+        d1 = (phases[k] * thrust::conj(a0)).real();
+
+        //count bits (__builtin_popcountll can not be used on GPU)
+        count = gidChunk & z_masks[k];
+        count = (count & 0x5555555555555555) + ((count >> 1) & 0x5555555555555555);
+        count = (count & 0x3333333333333333) + ((count >> 2) & 0x3333333333333333);
+        count = (count & 0x0f0f0f0f0f0f0f0f) + ((count >> 4) & 0x0f0f0f0f0f0f0f0f);
+        count = (count & 0x00ff00ff00ff00ff) + ((count >> 8) & 0x00ff00ff00ff00ff);
+        count = (count & 0x0000ffff0000ffff) + ((count >> 16) & 0x0000ffff0000ffff);
+        count = (count & 0x00000000ffffffff) + ((count >> 32) & 0x00000000ffffffff);
+        if(count & 1){
+          d0 = -d0;
+        }
+
+        count = (gidChunk ^ x_mask_) & z_masks[k];
+        count = (count & 0x5555555555555555) + ((count >> 1) & 0x5555555555555555);
+        count = (count & 0x3333333333333333) + ((count >> 2) & 0x3333333333333333);
+        count = (count & 0x0f0f0f0f0f0f0f0f) + ((count >> 4) & 0x0f0f0f0f0f0f0f0f);
+        count = (count & 0x00ff00ff00ff00ff) + ((count >> 8) & 0x00ff00ff00ff00ff);
+        count = (count & 0x0000ffff0000ffff) + ((count >> 16) & 0x0000ffff0000ffff);
+        count = (count & 0x00000000ffffffff) + ((count >> 32) & 0x00000000ffffffff);
+        if(count & 1){
+          d1 = -d1;
+        }
+
+        if((localMask >> iChunk) & 1){
+          ret += d0;
+        }
+        if((localMask >> iPair) & 1){
+          ret += d1;
+        }
+      }
+    }
+
+    return ret;
+  }
+  const char* Name(void)
+  {
+    return "expval_pauli_sum";
+  }
+};
+
+//sum of Pauli terms with Z only
+//params_ holds the Z mask of each term, matrix_ holds the weight of each term
+template <typename data_t>
+class expval_pauli_sum_Z_func : public GateFuncBase
+{
+protected:
+  uint_t nterms_;
+public:
+  expval_pauli_sum_Z_func(uint_t nt)
+  {
+    nterms_ = nt;
+  }
+
+  bool IsDiagonal(void)
+  {
+    return true;
+  }
+  bool Reduction(void)
+  {
+    return true;
+  }
+
+  __host__ __device__ double operator()(const thrust::tuple<uint_t,struct GateParams<data_t>> &iter) const
+  {
+    uint_t i,k,gid;
+    thrust::complex<data_t>* pV;
+    uint_t* z_masks;
+    thrust::complex<double>* weights;
+    thrust::complex<data_t> q0;
+    double p0,ret = 0.0;
+    struct GateParams<data_t> params;
+    uint_t count;
+
+    i = ExtractIndexFromTuple(iter);
+    params = ExtractParamsFromTuple(iter);
+    pV = params.buf_;
+    z_masks = params.params_;
+    weights = params.matrix_;
+    gid = params.gid_;
+
+    q0 = pV[i];
+    p0 = q0.real()*q0.real() + q0.imag()*q0.imag();
+
+    for(k=0;k<nterms_;k++){
+      //count bits (__builtin_popcountll can not be used on GPU)
+      count = (i + gid) & z_masks[k];
+      count = (count & 0x5555555555555555) + ((count >> 1) & 0x5555555555555555);
+      count = (count & 0x3333333333333333) + ((count >> 2) & 0x3333333333333333);
+      count = (count & 0x0f0f0f0f0f0f0f0f) + ((count >> 4) & 0x0f0f0f0f0f0f0f0f);
+      count = (count & 0x00ff00ff00ff00ff) + ((count >> 8) & 0x00ff00ff00ff00ff);
+      count = (count & 0x0000ffff0000ffff) + ((count >> 16) & 0x0000ffff0000ffff);
+      count = (count & 0x00000000ffffffff) + ((count >> 32) & 0x00000000ffffffff);
+
+      if(count & 1){
+        ret -= weights[k].real() * p0;
+      }
+      else{
+        ret += weights[k].real() * p0;
+      }
+    }
+
+    return ret;
+  }
+  const char* Name(void)
+  {
+    return "expval_pauli_sum_Z";
+  }
+};
+
+template <typename data_t>
+std::complex<double> QubitVectorThrust<data_t>::expval_pauli_sum(const reg_t &qubits,
+                                                                 const pauli_sum_t &paulis) const
+{
+  std::complex<double> expval(0., 0.);
+
+  for (const auto &group : pauli_groups(qubits, paulis)) {
+    const uint_t nterms = group.z_masks.size();
+
+    //the reduction kernels return a real number, so the real and imaginary
+    //parts of the coefficients are reduced in separate passes
+    bool has_imag = false;
+    for (const auto &coeff : group.coeffs) {
+      has_imag |= (coeff.imag() != 0.);
+    }
+
+    reg_t qubits_sorted = group.x_qubits;
+    std::sort(qubits_sorted.begin(), qubits_sorted.end());
+    reg_t params = qubits_sorted;
+    params.insert(params.end(), group.z_masks.begin(), group.z_masks.end());
+
+    for (int part = 0; part < (has_imag ? 2 : 1); part++) {
+      cvector_t<double> weighted(nterms);
+      for (uint_t k = 0; k < nterms; k++) {
+        const double w = (part == 0) ? group.coeffs[k].real() : group.coeffs[k].imag();
+        weighted[k] = w * group.phases[k];
+      }
+      set_matrix(weighted);
+      set_params(params);
+
+      double val;
+      if (group.x_mask == 0) {
+        val = apply_function(expval_pauli_sum_Z_func<data_t>(nterms), qubits);
+      }
+      else {
+        val = apply_function(expval_pauli_sum_func<data_t>(group.x_mask, nterms, qubits_sorted.size()), qubits_sorted);
+      }
+      expval += (part == 0) ? std::complex<double>(val, 0.) : std::complex<double>(0., val);
+    }
+  }
+  return expval;
+}
+
 /*******************************************************************************
  *
  * PAULI
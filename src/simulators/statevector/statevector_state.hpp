@@ -16,12 +16,15 @@
 #define _statevector_state_hpp
 
 #include <algorithm>
+#include <numeric>
 #define _USE_MATH_DEFINES
 #include <math.h>
 
+#include "framework/checkpoint.hpp"
 #include "framework/json.hpp"
 #include "framework/utils.hpp"
 #include "qubitvector.hpp"
+#include "qubitvector_chunked.hpp"
 #include "simulators/state.hpp"
 #ifdef AER_THRUST_SUPPORTED
 #include "qubitvector_thrust.hpp"
@@ -127,11 +130,25 @@ public:
   // if the controller/engine allows threads for it
   virtual void set_config(const json_t &config) override;
 
+  // Add the allocation policy of the state buffers to the metadata
+  virtual void add_metadata(ExperimentResult &result) const override;
+
   // Sample n-measurement outcomes without applying the measure operation
   // to the system state
   virtual std::vector<reg_t> sample_measure(const reg_t &qubits, uint_t shots,
                                             RngEngine &rng) override;
 
+  // Checkpoints are supported by every statevector class
+  virtual bool checkpoint_supported() const override;
+
+  // Write and read the amplitudes of the state
+  virtual void save_checkpoint(std::ostream &out) const override;
+  virtual void load_checkpoint(std::istream &in) override;
+
+  // Return true if the amplitudes of the state are a contiguous buffer in
+  // host memory, which is written to checkpoints without a copy
+  bool host_buffer() const;
+
   //-----------------------------------------------------------------------
   // Additional methods
   //-----------------------------------------------------------------------
@@ -142,11 +159,97 @@ public:
   // Initialize OpenMP settings for the underlying QubitVector class
   void initialize_omp();
 
+  //-----------------------------------------------------------------------
+  // Shot branching
+  //-----------------------------------------------------------------------
+
+  // Return the outcome probabilities of a measure or reset operation
+  rvector_t branch_probabilities(const Operations::Op &op) const;
+
+  // Apply a measure or reset operation for a fixed outcome with
+  // probability prob, instead of sampling the outcome
+  void apply_branch(const Operations::Op &op, uint_t outcome, double prob);
+
+  // Return true if the state after resetting the qubits does not depend
+  // on the outcome of the reset, so that the outcomes need not be branched
+  bool is_deterministic_reset(const reg_t &qubits) const;
+
 protected:
+  //-----------------------------------------------------------------------
+  // Config
+  //-----------------------------------------------------------------------
+
+  // Set the chunk file settings for a chunked QubitVector class.
+  // This does nothing for the in-memory QubitVector classes.
+  template <class qreg_t>
+  static void set_chunk_config(qreg_t &qreg, const json_t &config) {}
+
+  template <typename data_t>
+  static void set_chunk_config(QV::QubitVectorChunked<data_t> &qreg,
+                               const json_t &config);
+
+  //-----------------------------------------------------------------------
+  // Chunk streaming
+  //-----------------------------------------------------------------------
+
+  // Return the number of chunks of a chunked QubitVector class.
+  // The in-memory QubitVector classes are a single chunk.
+  template <class qreg_t>
+  static uint_t num_chunks(const qreg_t &qreg) {return 1;}
+
+  template <typename data_t>
+  static uint_t num_chunks(const QV::QubitVectorChunked<data_t> &qreg) {
+    return qreg.num_chunks();
+  }
+
+  // Restrict a chunked QubitVector class to the amplitudes of a chunk,
+  // or restore the full vector if chunk is num_chunks
+  template <class qreg_t>
+  static void select_chunk(qreg_t &qreg, uint_t chunk) {}
+
+  template <typename data_t>
+  static void select_chunk(QV::QubitVectorChunked<data_t> &qreg, uint_t chunk);
+
+  // Return the memory required by the qreg to apply the ops
+  template <class qreg_t>
+  static size_t qreg_memory_mb(const qreg_t &qreg, uint_t num_qubits,
+                               const std::vector<Operations::Op> &ops) {
+    return qreg.required_memory_mb(num_qubits);
+  }
+
+  template <typename data_t>
+  static size_t qreg_memory_mb(const QV::QubitVectorChunked<data_t> &qreg,
+                               uint_t num_qubits,
+                               const std::vector<Operations::Op> &ops) {
+    return qreg.required_memory_mb(num_qubits, ops);
+  }
+
+  // Return the end of the block of operations starting at pos that can be
+  // applied to every chunk separately: gates on local qubits and diagonal
+  // gates, whose global qubits are fixed within a chunk
+  size_t chunk_block_end(const std::vector<Operations::Op> &ops, size_t pos,
+                         uint_t num_local) const;
+
+  // Apply the operations [begin, end) chunk by chunk, so that each chunk is
+  // read and written once for the block
+  void apply_chunk_block(const std::vector<Operations::Op> &ops,
+                         size_t begin, size_t end);
+
+  // Return the diagonal of a diagonal operation on its qubits
+  cvector_t op_diagonal(const Operations::Op &op) const;
+
+  // Number of blocks of operations streamed over the chunks, each block
+  // is a single pass over the chunk files
+  uint_t chunk_passes_ = 0;
+
   //-----------------------------------------------------------------------
   // Apply instructions
   //-----------------------------------------------------------------------
 
+  // Apply a single operation
+  void apply_op(const Operations::Op &op, ExperimentResult &result,
+                RngEngine &rng, bool last_op);
+
   // Applies a sypported Gate operation to the state class.
   // If the input is not in allowed_gates an exeption will be raised.
   void apply_gate(const Operations::Op &op);
@@ -440,8 +543,7 @@ template <class statevec_t>
 size_t State<statevec_t>::required_memory_mb(uint_t num_qubits,
                                              const std::vector<Operations::Op> &ops)
                                              const {
-  (void)ops; // avoid unused variable compiler warning
-  return BaseState::qreg_.required_memory_mb(num_qubits);
+  return qreg_memory_mb(BaseState::qreg_, num_qubits, ops);
 }
 
 template <class statevec_t>
@@ -461,6 +563,95 @@ void State<statevec_t>::set_config(const json_t &config) {
   if (JSON::get_value(index_size, "statevector_sample_measure_opt", config)) {
     BaseState::qreg_.set_sample_measure_index_size(index_size);
   };
+
+  // Set the chunk files for the chunked statevector
+  set_chunk_config(BaseState::qreg_, config);
+
+  // Set the allocation policy for the state buffers
+  std::string allocator;
+  if (JSON::get_value(allocator, "statevector_allocator", config)) {
+    BaseState::qreg_.set_allocator(allocator);
+  }
+
+  // Place the shards of the state buffers on NUMA nodes
+  uint_t shards;
+  if (JSON::get_value(shards, "statevector_shards", config)) {
+    BaseState::qreg_.set_num_shards(shards);
+  }
+}
+
+template <class statevec_t>
+void State<statevec_t>::add_metadata(ExperimentResult &result) const {
+  result.metadata.add(BaseState::qreg_.get_allocator(), "statevector_allocator");
+  if (BaseState::qreg_.get_num_shards() > 1) {
+    result.metadata.add(BaseState::qreg_.get_num_shards(), "statevector_shards");
+  }
+  if (num_chunks(BaseState::qreg_) > 1) {
+    result.metadata.add(num_chunks(BaseState::qreg_), "statevector_chunks", "chunks");
+    result.metadata.add(chunk_passes_, "statevector_chunks", "streamed_blocks");
+  }
+}
+
+template <class statevec_t>
+bool State<statevec_t>::checkpoint_supported() const {
+  return true;
+}
+
+template <class statevec_t>
+void State<statevec_t>::save_checkpoint(std::ostream &out) const {
+  // A vector in host memory is written from its buffer, and a device
+  // vector from a copy
+  const auto &qreg = BaseState::qreg_;
+  Checkpoint::write<uint_t>(out, qreg.num_qubits());
+  if (host_buffer()) {
+    Checkpoint::write_amplitudes(out, qreg.data(), qreg.size());
+  } else {
+    const auto vec = qreg.copy_to_vector();
+    Checkpoint::write_amplitudes(out, vec.data(), vec.size());
+  }
+}
+
+template <class statevec_t>
+void State<statevec_t>::load_checkpoint(std::istream &in) {
+  auto &qreg = BaseState::qreg_;
+  using amplitude_t = typename std::remove_pointer<
+      typename std::decay<decltype(qreg.data())>::type>::type;
+  uint_t num_qubits;
+  Checkpoint::read(in, num_qubits);
+  const uint_t size =
+      Checkpoint::read_amplitudes_size<typename amplitude_t::value_type>(in);
+  if (num_qubits != qreg.num_qubits() || size != qreg.size()) {
+    throw std::runtime_error(
+        "Statevector::State: the checkpoint does not match the number of "
+        "qubits of the state.");
+  }
+  if (host_buffer()) {
+    Checkpoint::read_buffer(in, qreg.data(), size);
+  } else {
+    AER::Vector<amplitude_t> vec(size, false);
+    Checkpoint::read_buffer(in, vec.data(), size);
+    qreg.initialize_from_data(vec.data(), size);
+  }
+}
+
+template <class statevec_t>
+bool State<statevec_t>::host_buffer() const {
+  return std::is_base_of<QV::QubitVector<double>, statevec_t>::value ||
+         std::is_base_of<QV::QubitVector<float>, statevec_t>::value;
+}
+
+template <class statevec_t>
+template <typename data_t>
+void State<statevec_t>::set_chunk_config(QV::QubitVectorChunked<data_t> &qreg,
+                                         const json_t &config) {
+  std::string directory;
+  if (JSON::get_value(directory, "statevector_chunk_directory", config)) {
+    qreg.set_chunk_directory(directory);
+  }
+  int chunk_qubits;
+  if (JSON::get_value(chunk_qubits, "statevector_chunk_qubits", config)) {
+    qreg.set_chunk_qubits(chunk_qubits);
+  }
 }
 
 //=========================================================================
@@ -472,54 +663,222 @@ void State<statevec_t>::apply_ops(const std::vector<Operations::Op> &ops,
                                   ExperimentResult &result,
                                   RngEngine &rng,
                                   bool final_ops) {
+  // A chunked statevector applies blocks of gates chunk by chunk
+  const uint_t chunks = num_chunks(BaseState::qreg_);
+  uint_t num_local = BaseState::qreg_.num_qubits();
+  for (uint_t chunk = 1; chunk < chunks; chunk <<= 1)
+    --num_local;
 
   // Simple loop over vector of input operations
   for (size_t i = 0; i < ops.size(); ++i) {
-    const auto& op = ops[i];
-    if(BaseState::creg_.check_conditional(op)) {
-      switch (op.type) {
-        case Operations::OpType::barrier:
-          break;
-        case Operations::OpType::reset:
-          apply_reset(op.qubits, rng);
-          break;
-        case Operations::OpType::initialize:
-          apply_initialize(op.qubits, op.params, rng);
-          break;
-        case Operations::OpType::measure:
-          apply_measure(op.qubits, op.memory, op.registers, rng);
-          break;
-        case Operations::OpType::bfunc:
-          BaseState::creg_.apply_bfunc(op);
-          break;
-        case Operations::OpType::roerror:
-          BaseState::creg_.apply_roerror(op, rng);
-          break;
-        case Operations::OpType::gate:
-          apply_gate(op);
-          break;
-        case Operations::OpType::snapshot:
-          apply_snapshot(op, result, final_ops && ops.size() == i + 1);
-          break;
-        case Operations::OpType::matrix:
-          apply_matrix(op);
-          break;
-        case Operations::OpType::diagonal_matrix:
-          BaseState::qreg_.apply_diagonal_matrix(op.qubits, op.params);
-          break;
-        case Operations::OpType::multiplexer:
-          apply_multiplexer(op.regs[0], op.regs[1],
-                            op.mats); // control qubits ([0]) & target qubits([1])
-          break;
-        case Operations::OpType::kraus:
-          apply_kraus(op.qubits, op.mats, rng);
-          break;
-        default:
-          throw std::invalid_argument(
-              "QubitVector::State::invalid instruction \'" + op.name + "\'.");
+    if (chunks > 1) {
+      const size_t end = chunk_block_end(ops, i, num_local);
+      if (end > i) {
+        apply_chunk_block(ops, i, end);
+        i = end - 1;
+        BaseState::checkpoint_hook(end);
+        continue;
+      }
+    }
+    apply_op(ops[i], result, rng, final_ops && ops.size() == i + 1);
+    BaseState::checkpoint_hook(i + 1);
+  }
+}
+
+template <class statevec_t>
+void State<statevec_t>::apply_op(const Operations::Op &op,
+                                 ExperimentResult &result,
+                                 RngEngine &rng,
+                                 bool last_op) {
+  if(BaseState::creg_.check_conditional(op)) {
+    switch (op.type) {
+      case Operations::OpType::barrier:
+        break;
+      case Operations::OpType::reset:
+        apply_reset(op.qubits, rng);
+        break;
+      case Operations::OpType::initialize:
+        apply_initialize(op.qubits, op.params, rng);
+        break;
+      case Operations::OpType::measure:
+        apply_measure(op.qubits, op.memory, op.registers, rng);
+        break;
+      case Operations::OpType::bfunc:
+        BaseState::creg_.apply_bfunc(op);
+        break;
+      case Operations::OpType::roerror:
+        BaseState::creg_.apply_roerror(op, rng);
+        break;
+      case Operations::OpType::gate:
+        apply_gate(op);
+        break;
+      case Operations::OpType::snapshot:
+        apply_snapshot(op, result, last_op);
+        break;
+      case Operations::OpType::matrix:
+        apply_matrix(op);
+        break;
+      case Operations::OpType::diagonal_matrix:
+        BaseState::qreg_.apply_diagonal_matrix(op.qubits, op.params);
+        break;
+      case Operations::OpType::multiplexer:
+        apply_multiplexer(op.regs[0], op.regs[1],
+                          op.mats); // control qubits ([0]) & target qubits([1])
+        break;
+      case Operations::OpType::kraus:
+        apply_kraus(op.qubits, op.mats, rng);
+        break;
+      default:
+        throw std::invalid_argument(
+            "QubitVector::State::invalid instruction \'" + op.name + "\'.");
+    }
+  }
+}
+
+//=========================================================================
+// Implementation: Chunk streaming
+//=========================================================================
+
+template <class statevec_t>
+template <typename data_t>
+void State<statevec_t>::select_chunk(QV::QubitVectorChunked<data_t> &qreg,
+                                     uint_t chunk) {
+  if (chunk < qreg.num_chunks()) {
+    qreg.select_chunk(chunk);
+  } else {
+    qreg.select_all();
+  }
+}
+
+template <class statevec_t>
+size_t State<statevec_t>::chunk_block_end(const std::vector<Operations::Op> &ops,
+                                          size_t pos, uint_t num_local) const {
+  auto is_local = [num_local](const reg_t &qubits) {
+    return std::all_of(qubits.begin(), qubits.end(),
+                       [num_local](uint_t qubit) { return qubit < num_local; });
+  };
+  for (; pos < ops.size(); ++pos) {
+    const auto &op = ops[pos];
+    switch (op.type) {
+      case Operations::OpType::barrier:
+      case Operations::OpType::diagonal_matrix:
+        continue;
+      case Operations::OpType::gate:
+        if (Operations::is_diagonal_gate(op.name) || is_local(op.qubits))
+          continue;
+        return pos;
+      case Operations::OpType::matrix:
+        if (is_local(op.qubits))
+          continue;
+        return pos;
+      default:
+        return pos;
+    }
+  }
+  return pos;
+}
+
+template <class statevec_t>
+void State<statevec_t>::apply_chunk_block(const std::vector<Operations::Op> &ops,
+                                          size_t begin, size_t end) {
+  const uint_t num_qubits = BaseState::qreg_.num_qubits();
+  const uint_t chunks = num_chunks(BaseState::qreg_);
+  uint_t num_local = num_qubits;
+  for (uint_t chunk = 1; chunk < chunks; chunk <<= 1)
+    --num_local;
+
+  // The classical register does not change within the block, so the
+  // conditions are checked once. Operations on global qubits are diagonal,
+  // and their diagonals are restricted to the local qubits in each chunk.
+  std::vector<const Operations::Op*> block;
+  std::vector<cvector_t> diagonals;
+  for (size_t i = begin; i < end; ++i) {
+    const auto &op = ops[i];
+    if (op.type == Operations::OpType::barrier ||
+        !BaseState::creg_.check_conditional(op))
+      continue;
+    block.push_back(&op);
+    const bool global = std::any_of(op.qubits.begin(), op.qubits.end(),
+                                    [num_local](uint_t qubit) {
+                                      return qubit >= num_local;
+                                    });
+    diagonals.push_back(global ? op_diagonal(op) : cvector_t());
+  }
+  if (block.empty())
+    return;
+
+  try {
+    for (uint_t chunk = 0; chunk < chunks; ++chunk) {
+      select_chunk(BaseState::qreg_, chunk);
+      for (size_t j = 0; j < block.size(); ++j) {
+        const auto &op = *block[j];
+        if (diagonals[j].empty()) {
+          switch (op.type) {
+            case Operations::OpType::gate:
+              apply_gate(op);
+              break;
+            case Operations::OpType::matrix:
+              apply_matrix(op);
+              break;
+            default:
+              BaseState::qreg_.apply_diagonal_matrix(op.qubits, op.params);
+          }
+          continue;
+        }
+        // Fix the global qubits of the diagonal to their values in the chunk
+        reg_t local_qubits;
+        std::vector<uint_t> local_bits;
+        uint_t offset = 0;
+        for (uint_t k = 0; k < op.qubits.size(); ++k) {
+          const uint_t qubit = op.qubits[k];
+          if (qubit < num_local) {
+            local_qubits.push_back(qubit);
+            local_bits.push_back(QV::BITS[k]);
+          } else if ((chunk >> (qubit - num_local)) & 1ULL) {
+            offset += QV::BITS[k];
+          }
         }
+        cvector_t diag(QV::BITS[local_qubits.size()]);
+        for (uint_t m = 0; m < diag.size(); ++m) {
+          uint_t index = offset;
+          for (uint_t k = 0; k < local_bits.size(); ++k) {
+            if ((m >> k) & 1ULL)
+              index += local_bits[k];
+          }
+          diag[m] = diagonals[j][index];
+        }
+        if (local_qubits.empty()) {
+          // A phase of the whole chunk
+          if (diag[0] != complex_t(1., 0.))
+            BaseState::qreg_.apply_diagonal_matrix({0}, {diag[0], diag[0]});
+        } else {
+          BaseState::qreg_.apply_diagonal_matrix(local_qubits, diag);
+        }
+      }
     }
+  } catch (...) {
+    select_chunk(BaseState::qreg_, chunks);
+    throw;
   }
+  select_chunk(BaseState::qreg_, chunks);
+  ++chunk_passes_;
+}
+
+template <class statevec_t>
+cvector_t State<statevec_t>::op_diagonal(const Operations::Op &op) const {
+  if (op.type == Operations::OpType::diagonal_matrix)
+    return op.params;
+  // Apply the diagonal gate to the vector of ones on its qubits
+  Operations::Op local_op = op;
+  std::iota(local_op.qubits.begin(), local_op.qubits.end(), 0);
+  local_op.conditional = false;
+  State<QV::QubitVector<double>> state;
+  state.initialize_qreg(op.qubits.size());
+  state.qreg().initialize_from_vector(cvector_t(QV::BITS[op.qubits.size()], 1.));
+  ExperimentResult result;
+  RngEngine rng;
+  state.apply_ops({local_op}, result, rng);
+  return state.qreg().vector();
 }
 
 //=========================================================================
@@ -615,13 +974,9 @@ void State<statevec_t>::snapshot_pauli_expval(const Operations::Op &op,
         "Invalid expval snapshot (Pauli components are empty).");
   }
 
-  // Accumulate expval components
-  complex_t expval(0., 0.);
-  for (const auto &param : op.params_expval_pauli) {
-    const auto &coeff = param.first;
-    const auto &pauli = param.second;
-    expval += coeff * BaseState::qreg_.expval_pauli(op.qubits, pauli);
-  }
+  // Compute the expectation value of the Pauli sum
+  complex_t expval = BaseState::qreg_.expval_pauli_sum(op.qubits,
+                                                       op.params_expval_pauli);
 
   // Add to snapshot
   Utils::chop_inplace(expval, json_chop_threshold_);
@@ -1002,6 +1357,35 @@ void State<statevec_t>::apply_reset(const reg_t &qubits, RngEngine &rng) {
   measure_reset_update(qubits, 0, meas.first, meas.second);
 }
 
+template <class statevec_t>
+rvector_t State<statevec_t>::branch_probabilities(const Operations::Op &op) const {
+  return measure_probs(op.qubits);
+}
+
+template <class statevec_t>
+void State<statevec_t>::apply_branch(const Operations::Op &op, uint_t outcome,
+                                     double prob) {
+  if (op.type == Operations::OpType::reset) {
+    measure_reset_update(op.qubits, 0, outcome, prob);
+    return;
+  }
+  measure_reset_update(op.qubits, outcome, outcome, prob);
+  const reg_t bits = Utils::int2reg(outcome, 2, op.qubits.size());
+  BaseState::creg_.store_measure(bits, op.memory, op.registers);
+}
+
+template <class statevec_t>
+bool State<statevec_t>::is_deterministic_reset(const reg_t &qubits) const {
+  // A reset qubit that is not entangled with the other qubits (its Bloch
+  // vector has unit length) leaves the same state for every outcome
+  if (qubits.size() != 1)
+    return false;
+  const double x = BaseState::qreg_.expval_pauli(qubits, "X");
+  const double y = BaseState::qreg_.expval_pauli(qubits, "Y");
+  const double z = BaseState::qreg_.expval_pauli(qubits, "Z");
+  return std::abs(x * x + y * y + z * z - 1.) < 1e-10;
+}
+
 template <class statevec_t>
 std::pair<uint_t, double>
 State<statevec_t>::sample_measure_with_prob(const reg_t &qubits,
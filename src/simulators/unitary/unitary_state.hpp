@@ -97,6 +97,9 @@ public:
   // Config: {"omp_qubit_threshold": 7}
   virtual void set_config(const json_t &config) override;
 
+  // Add the allocation policy of the state buffers to the metadata
+  virtual void add_metadata(ExperimentResult &result) const override;
+
   //-----------------------------------------------------------------------
   // Additional methods
   //-----------------------------------------------------------------------
@@ -284,6 +287,17 @@ void State<unitary_matrix_t>::set_config(const json_t &config) {
   // Set threshold for truncating snapshots
   JSON::get_value(json_chop_threshold_, "zero_threshold", config);
   BaseState::qreg_.set_json_chop_threshold(json_chop_threshold_);
+
+  // Set the allocation policy for the state buffers
+  std::string allocator;
+  if (JSON::get_value(allocator, "statevector_allocator", config)) {
+    BaseState::qreg_.set_allocator(allocator);
+  }
+}
+
+template <class unitary_matrix_t>
+void State<unitary_matrix_t>::add_metadata(ExperimentResult &result) const {
+  result.metadata.add(BaseState::qreg_.get_allocator(), "statevector_allocator");
 }
 
 template <class unitary_matrix_t>
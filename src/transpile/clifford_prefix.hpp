@@ -0,0 +1,278 @@
+/**
+ * This code is part of Qiskit.
+ *
+ * (C) Copyright IBM 2018, 2019, 2020.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+#ifndef _aer_transpile_clifford_prefix_hpp_
+#define _aer_transpile_clifford_prefix_hpp_
+
+#include <cmath>
+#include <numeric>
+
+#include "transpile/circuitopt.hpp"
+#include "simulators/stabilizer/stabilizer_state.hpp"
+
+namespace AER {
+namespace Transpile {
+
+// Simulate the leading Clifford gates of a circuit on the stabilizer
+// tableau and replace them by the initialization of the resulting state.
+//
+// The stabilizer state of n qubits with generators g_1, ..., g_n is the
+// uniform superposition, up to phases, of the 2^r basis states of an affine
+// subspace, where r is the rank of the X part of the generators. After
+// Gaussian elimination r generators have independent X parts, and the other
+// n - r generators are products of Z operators fixing an offset basis state
+// b. Each amplitude is obtained from the previous one in a Gray code
+// traversal of the subspace by applying a single generator, so that the
+// statevector is computed in O(2^r) operations.
+//
+// The global phase of the Clifford prefix is not kept by the tableau, so the
+// pass is skipped for circuits with statevector snapshots.
+
+class CliffordPrefix : public CircuitOptimization {
+public:
+
+  // CliffordPrefix uses following configuration options
+  // - clifford_prefix_enable (bool): if true, activate optimization
+  //       (default: true)
+  // - clifford_prefix_threshold (int): qubit number threshold for activating
+  //       the pass (default: 14)
+  void set_config(const json_t &config) override;
+
+  void optimize_circuit(Circuit& circ,
+                        Noise::NoiseModel& noise,
+                        const Operations::OpSet &opset,
+                        ExperimentResult &result) const override;
+
+  // Return the statevector of a stabilizer state
+  cvector_t statevector(const Clifford::Clifford &clifford,
+                        uint_t &rank) const;
+
+  uint_t threshold = 14;
+  bool active = true;
+
+  // Number of OpenMP threads used to compute the statevector
+  int threads = 1;
+
+  // Minimum number of Clifford gates of a prefix
+  const static uint_t min_gates = 2;
+
+  // Maximum number of qubits of the integer masks used by the conversion
+  const static uint_t max_qubits = 63;
+
+private:
+  // A stabilizer generator i^k X^x Z^z with qubit bit masks x and z
+  struct Generator {
+    uint_t x = 0;
+    uint_t z = 0;
+    uint_t k = 0;
+  };
+
+  // Replace g by the product g h of two commuting generators
+  static void multiply(Generator &g, const Generator &h);
+
+  // Return true if the operation is part of a Clifford prefix
+  bool is_clifford(const Operations::Op &op) const;
+};
+
+void CliffordPrefix::set_config(const json_t &config) {
+  CircuitOptimization::set_config(config);
+  JSON::get_value(active, "clifford_prefix_enable", config);
+  int value;
+  if (JSON::get_value(value, "clifford_prefix_threshold", config) && value > 0)
+    threshold = value;
+}
+
+void CliffordPrefix::optimize_circuit(Circuit& circ,
+                                      Noise::NoiseModel& noise,
+                                      const Operations::OpSet &allowed_opset,
+                                      ExperimentResult &result) const {
+  if (!active || circ.num_qubits < threshold || circ.num_qubits > max_qubits ||
+      !allowed_opset.contains(Operations::OpType::initialize))
+    return;
+
+  // The global phase of the prefix is observable in statevector snapshots
+  for (const auto &op : circ.ops) {
+    if (op.type == Operations::OpType::snapshot && op.name == "statevector")
+      return;
+  }
+
+  // Find the maximal prefix of Clifford gates
+  uint_t prefix = 0;
+  uint_t num_gates = 0;
+  while (prefix < circ.ops.size() && is_clifford(circ.ops[prefix])) {
+    if (circ.ops[prefix].type == Operations::OpType::gate)
+      ++num_gates;
+    ++prefix;
+  }
+  if (num_gates < min_gates)
+    return;
+
+  using clock_t = std::chrono::high_resolution_clock;
+  auto timer_start = clock_t::now();
+
+  // Simulate the prefix on the stabilizer tableau
+  Stabilizer::State stabilizer;
+  stabilizer.initialize_qreg(circ.num_qubits);
+  RngEngine rng;
+  ExperimentResult prefix_result;
+  std::vector<Operations::Op> prefix_ops(circ.ops.begin(),
+                                         circ.ops.begin() + prefix);
+  stabilizer.apply_ops(prefix_ops, prefix_result, rng);
+
+  // Replace the prefix by the initialization of all qubits
+  Operations::Op op;
+  op.type = Operations::OpType::initialize;
+  op.name = "initialize";
+  op.qubits.resize(circ.num_qubits);
+  std::iota(op.qubits.begin(), op.qubits.end(), 0);
+  uint_t rank;
+  op.params = statevector(stabilizer.qreg(), rank);
+
+  circ.ops.erase(circ.ops.begin() + 1, circ.ops.begin() + prefix);
+  circ.ops[0] = std::move(op);
+  circ.set_params();
+
+  auto timer_stop = clock_t::now();
+  result.metadata.add(num_gates, "clifford_prefix", "prefix_gates");
+  result.metadata.add(rank, "clifford_prefix", "rank");
+  result.metadata.add(std::chrono::duration<double>(timer_stop - timer_start).count(),
+                      "clifford_prefix", "time_taken");
+}
+
+bool CliffordPrefix::is_clifford(const Operations::Op &op) const {
+  if (op.conditional)
+    return false;
+  switch (op.type) {
+    case Operations::OpType::barrier:
+      return true;
+    case Operations::OpType::gate:
+      return Stabilizer::StateOpSet.contains_gates(op.name);
+    default:
+      return false;
+  }
+}
+
+void CliffordPrefix::multiply(Generator &g, const Generator &h) {
+  // (i^a X^x1 Z^z1)(i^b X^x2 Z^z2) = i^(a + b) (-1)^|z1 & x2| X^(x1 ^ x2) Z^(z1 ^ z2)
+  g.k = (g.k + h.k + 2 * Utils::popcount(g.z & h.x)) & 3ULL;
+  g.x ^= h.x;
+  g.z ^= h.z;
+}
+
+cvector_t CliffordPrefix::statevector(const Clifford::Clifford &clifford,
+                                      uint_t &rank) const {
+  const uint_t num_qubits = clifford.num_qubits();
+  if (num_qubits > max_qubits) {
+    throw std::invalid_argument("CliffordPrefix: too many qubits (" +
+                                std::to_string(num_qubits) + ").");
+  }
+
+  // Stabilizer generators with phase (-1)^p X^x Z^z = i^(2p + |x & z|) X^x Z^z,
+  // since every qubit with both X and Z is a Y = i X Z operator
+  std::vector<Generator> gens(num_qubits);
+  for (uint_t i = 0; i < num_qubits; ++i) {
+    const auto &row = clifford.stabilizer(i);
+    for (uint_t q = 0; q < num_qubits; ++q) {
+      if (row.X[q])
+        gens[i].x |= (1ULL << q);
+      if (row.Z[q])
+        gens[i].z |= (1ULL << q);
+    }
+    gens[i].k = (2 * clifford.phases()[num_qubits + i] +
+                 Utils::popcount(gens[i].x & gens[i].z)) & 3ULL;
+  }
+
+  // Row reduce the X parts of the generators
+  rank = 0;
+  for (uint_t q = 0; q < num_qubits; ++q) {
+    const uint_t bit = 1ULL << q;
+    uint_t pivot = rank;
+    while (pivot < num_qubits && !(gens[pivot].x & bit))
+      ++pivot;
+    if (pivot == num_qubits)
+      continue;
+    std::swap(gens[rank], gens[pivot]);
+    for (uint_t i = 0; i < num_qubits; ++i) {
+      if (i != rank && (gens[i].x & bit))
+        multiply(gens[i], gens[rank]);
+    }
+    ++rank;
+  }
+
+  // The remaining generators (-1)^(k/2) Z^z fix z.b = k/2 mod 2 for every
+  // basis state b of the support. Row reduce their Z parts to find the
+  // solution with all free bits zero.
+  uint_t offset = 0;
+  uint_t row = rank;
+  for (uint_t q = 0; q < num_qubits && row < num_qubits; ++q) {
+    const uint_t bit = 1ULL << q;
+    uint_t pivot = row;
+    while (pivot < num_qubits && !(gens[pivot].z & bit))
+      ++pivot;
+    if (pivot == num_qubits)
+      continue;
+    std::swap(gens[row], gens[pivot]);
+    for (uint_t i = rank; i < num_qubits; ++i) {
+      if (i != row && (gens[i].z & bit))
+        multiply(gens[i], gens[row]);
+    }
+    ++row;
+  }
+  for (uint_t i = rank; i < num_qubits; ++i) {
+    if (gens[i].k & 2ULL)
+      offset |= gens[i].z & (~gens[i].z + 1);  // lowest set bit is the pivot
+  }
+
+  // Traverse the support in Gray code order from the offset. Applying the
+  // generator g = i^k X^x Z^z to the state gives
+  // psi(c ^ x) = i^k (-1)^|z & c| psi(c).
+  const complex_t phases[4] = {{1., 0.}, {0., 1.}, {-1., 0.}, {0., -1.}};
+  const double norm = std::pow(2., -0.5 * rank);
+  cvector_t psi(1ULL << num_qubits, 0.);
+
+  // Split the traversal into blocks starting at their own Gray code element
+  const uint_t block_bits = (threads > 1) ? std::min<uint_t>(rank, 8) : 0;
+  const int_t num_blocks = 1LL << block_bits;
+  const uint_t block_size = 1ULL << (rank - block_bits);
+#pragma omp parallel for if (threads > 1 && num_blocks > 1) num_threads(threads)
+  for (int_t block = 0; block < num_blocks; ++block) {
+    const uint_t start = block * block_size;
+    uint_t state = offset;
+    uint_t phase = 0;
+    const uint_t gray = start ^ (start >> 1);
+    for (uint_t j = 0; j < rank; ++j) {
+      if ((gray >> j) & 1ULL) {
+        phase = (phase + gens[j].k + 2 * Utils::popcount(gens[j].z & state)) & 3ULL;
+        state ^= gens[j].x;
+      }
+    }
+    psi[state] = norm * phases[phase];
+    for (uint_t t = start + 1; t < start + block_size; ++t) {
+      // Gray code step t flips the generator of the lowest set bit of t
+      uint_t j = 0;
+      while (!((t >> j) & 1ULL))
+        ++j;
+      phase = (phase + gens[j].k + 2 * Utils::popcount(gens[j].z & state)) & 3ULL;
+      state ^= gens[j].x;
+      psi[state] = norm * phases[phase];
+    }
+  }
+  return psi;
+}
+
+//-------------------------------------------------------------------------
+} // end namespace Transpile
+} // end namespace AER
+//-------------------------------------------------------------------------
+#endif
@@ -0,0 +1,377 @@
+/**
+ * This code is part of Qiskit.
+ *
+ * (C) Copyright IBM 2018, 2019, 2020.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+#ifndef _aer_transpile_commutation_hpp_
+#define _aer_transpile_commutation_hpp_
+
+#include <algorithm>
+#include <set>
+#include <unordered_map>
+
+#include "transpile/circuitopt.hpp"
+#include "simulators/unitary/unitary_state.hpp"
+
+namespace AER {
+namespace Transpile {
+
+// Reorder commuting gates so that gates on the same qubits are adjacent
+// before gate fusion.
+//
+// Each gate acts on each of its qubits as a Z-type operation (it is block
+// diagonal in the computational basis of the qubit, such as any diagonal gate
+// or the control of a CX), an X-type operation (it is block diagonal in the
+// X basis of the qubit, such as an RX gate or the target of a CX), or a
+// general operation. Two gates commute if they act with the same Z or X type
+// on every qubit they share. The gates between non-unitary operations are
+// scheduled in a topological order of this commutation DAG that groups gates
+// acting on at most fusion_max_qubit qubits, and runs of diagonal gates are
+// merged into a single diagonal matrix.
+
+class CommutationReorder : public CircuitOptimization {
+public:
+
+  // CommutationReorder uses following configuration options
+  // - commutation_enable (bool): if true, activate optimization (default: true)
+  // - commutation_threshold (int): qubit number threshold for activating the
+  //       pass (default: 14)
+  // - commutation_verbose (bool): if true, output the reordered circuit
+  //       in metadata (default: false)
+  // - fusion_max_qubit (int): maximum number of qubits of a group of
+  //       reordered gates and of a merged diagonal gate (default: 5)
+  void set_config(const json_t &config) override;
+
+  void optimize_circuit(Circuit& circ,
+                        Noise::NoiseModel& noise,
+                        const Operations::OpSet &opset,
+                        ExperimentResult &result) const override;
+
+  uint_t threshold = 14;
+  uint_t max_qubit = 5;
+  bool verbose = false;
+  bool active = true;
+
+  // Maximum number of gates in a group of gates that commute on a qubit.
+  // Larger groups are split to bound the number of DAG edges.
+  const static uint_t max_group = 32;
+
+  // The action of a gate on one of its qubits
+  enum class Action {z, x, general};
+
+private:
+  // Return true if the operation can be reordered
+  bool can_reorder(const Operations::Op& op) const;
+
+  // Return the action of a gate on each of its qubits
+  std::vector<Action> actions(const Operations::Op& op) const;
+
+  // Return true if the gate is a diagonal matrix
+  bool is_diagonal(const Operations::Op& op) const;
+
+  // Reorder ops[start, end) and return true if the order was changed
+  bool reorder(std::vector<Operations::Op>& ops, uint_t start, uint_t end) const;
+
+  // Merge runs of diagonal gates in ops[start, end) and return the number
+  // of removed gates. Removed gates are replaced by nop operations.
+  uint_t merge_diagonals(std::vector<Operations::Op>& ops,
+                         uint_t start, uint_t end) const;
+
+  // Return a diagonal matrix operation equal to a list of diagonal gates
+  Operations::Op make_diagonal(const std::vector<Operations::Op>& ops) const;
+
+  const static stringset_t x_gates_;
+  const static stringset_t controlled_x_gates_;
+  const static stringset_t controlled_gates_;
+};
+
+const stringset_t CommutationReorder::x_gates_({
+  "x", "rx", "sx", "rxx"
+});
+
+const stringset_t CommutationReorder::controlled_x_gates_({
+  "CX", "cx", "ccx", "mcx", "csx", "mcsx", "mcrx"
+});
+
+const stringset_t CommutationReorder::controlled_gates_({
+  "cy", "cu2", "cu3", "mcy", "mcu2", "mcu3", "mcr", "mcry"
+});
+
+void CommutationReorder::set_config(const json_t &config) {
+  CircuitOptimization::set_config(config);
+  JSON::get_value(active, "commutation_enable", config);
+  JSON::get_value(verbose, "commutation_verbose", config);
+  int value;
+  if (JSON::get_value(value, "commutation_threshold", config) && value > 0)
+    threshold = value;
+  if (JSON::get_value(value, "fusion_max_qubit", config) && value > 0)
+    max_qubit = value;
+}
+
+void CommutationReorder::optimize_circuit(Circuit& circ,
+                                          Noise::NoiseModel& noise,
+                                          const Operations::OpSet &allowed_opset,
+                                          ExperimentResult &result) const {
+  if (!active || circ.num_qubits < threshold || circ.ops.size() < 3)
+    return;
+
+  const bool merge = allowed_opset.contains(Operations::OpType::diagonal_matrix);
+  bool reordered = false;
+  uint_t merged = 0;
+
+  // Reorder the gates between operations that cannot be reordered
+  uint_t start = 0;
+  for (uint_t i = 0; i <= circ.ops.size(); ++i) {
+    if (i < circ.ops.size() && can_reorder(circ.ops[i]))
+      continue;
+    if (i - start > 1) {
+      reordered |= reorder(circ.ops, start, i);
+      if (merge)
+        merged += merge_diagonals(circ.ops, start, i);
+    }
+    start = i + 1;
+  }
+
+  if (merged > 0) {
+    auto it = std::remove_if(circ.ops.begin(), circ.ops.end(),
+                             [](const Operations::Op& op) {
+                               return op.type == Operations::OpType::nop;
+                             });
+    circ.ops.erase(it, circ.ops.end());
+    circ.set_params();
+  }
+
+  result.metadata.add(reordered, "commutation", "reordered");
+  result.metadata.add(merged, "commutation", "merged_diagonal_gates");
+  if (verbose)
+    result.metadata.add(circ.ops, "commutation", "output_ops");
+}
+
+bool CommutationReorder::can_reorder(const Operations::Op& op) const {
+  if (op.conditional || op.qubits.empty())
+    return false;
+  switch (op.type) {
+    case Operations::OpType::gate:
+    case Operations::OpType::diagonal_matrix:
+    case Operations::OpType::barrier:
+      return true;
+    case Operations::OpType::matrix:
+      return op.mats.size() == 1;
+    default:
+      return false;
+  }
+}
+
+bool CommutationReorder::is_diagonal(const Operations::Op& op) const {
+  switch (op.type) {
+    case Operations::OpType::gate:
+      return Operations::is_diagonal_gate(op.name);
+    case Operations::OpType::diagonal_matrix:
+      return true;
+    case Operations::OpType::matrix:
+      return Utils::is_diagonal(op.mats[0], .0);
+    default:
+      return false;
+  }
+}
+
+std::vector<CommutationReorder::Action>
+CommutationReorder::actions(const Operations::Op& op) const {
+  const uint_t num_qubits = op.qubits.size();
+  if (is_diagonal(op))
+    return std::vector<Action>(num_qubits, Action::z);
+  // Barriers do not commute with any gate
+  std::vector<Action> ret(num_qubits, Action::general);
+  if (op.type != Operations::OpType::gate)
+    return ret;
+  if (x_gates_.find(op.name) != x_gates_.end()) {
+    std::fill(ret.begin(), ret.end(), Action::x);
+  } else if (controlled_x_gates_.find(op.name) != controlled_x_gates_.end()) {
+    std::fill(ret.begin(), ret.end() - 1, Action::z);
+    ret.back() = Action::x;
+  } else if (controlled_gates_.find(op.name) != controlled_gates_.end()) {
+    std::fill(ret.begin(), ret.end() - 1, Action::z);
+  } else if (op.name == "cswap" || op.name == "mcswap") {
+    std::fill(ret.begin(), ret.end() - 2, Action::z);
+  }
+  return ret;
+}
+
+bool CommutationReorder::reorder(std::vector<Operations::Op>& ops,
+                                 uint_t start, uint_t end) const {
+  const uint_t size = end - start;
+
+  // The gates acting on each qubit are split into consecutive groups of gates
+  // with the same Z or X action. A gate depends on every gate in the previous
+  // group of each of its qubits.
+  struct QubitGroups {
+    Action action = Action::general;
+    reg_t current;
+    reg_t previous;
+  };
+  std::unordered_map<uint_t, QubitGroups> groups;
+  std::vector<reg_t> successors(size);
+  reg_t num_predecessors(size, 0);
+  reg_t last_successor(size, size);
+  for (uint_t i = 0; i < size; ++i) {
+    const auto &op = ops[start + i];
+    const auto op_actions = actions(op);
+    for (uint_t j = 0; j < op.qubits.size(); ++j) {
+      auto &group = groups[op.qubits[j]];
+      if (group.current.empty() || op_actions[j] == Action::general ||
+          op_actions[j] != group.action || group.current.size() >= max_group) {
+        group.previous.swap(group.current);
+        group.current.clear();
+        group.action = op_actions[j];
+      }
+      group.current.push_back(i);
+      for (const auto k : group.previous) {
+        if (last_successor[k] != i) {
+          last_successor[k] = i;
+          successors[k].push_back(i);
+          ++num_predecessors[i];
+        }
+      }
+    }
+  }
+
+  std::set<uint_t> ready;
+  for (uint_t i = 0; i < size; ++i) {
+    if (num_predecessors[i] == 0)
+      ready.insert(i);
+  }
+
+  // Schedule the first ready gate that keeps the qubits of the current
+  // group within max_qubit, or start a new group with the first one
+  reg_t order;
+  order.reserve(size);
+  std::set<uint_t> group_qubits;
+  while (!ready.empty()) {
+    auto next = ready.end();
+    for (auto it = ready.begin(); it != ready.end(); ++it) {
+      const auto &qubits = ops[start + *it].qubits;
+      uint_t num_new = 0;
+      for (const auto qubit : qubits)
+        num_new += (group_qubits.find(qubit) == group_qubits.end());
+      if (group_qubits.size() + num_new <= max_qubit) {
+        next = it;
+        break;
+      }
+    }
+    if (next == ready.end()) {
+      next = ready.begin();
+      group_qubits.clear();
+    }
+    const uint_t i = *next;
+    group_qubits.insert(ops[start + i].qubits.begin(), ops[start + i].qubits.end());
+    ready.erase(next);
+    order.push_back(i);
+    for (const auto j : successors[i]) {
+      if (--num_predecessors[j] == 0)
+        ready.insert(j);
+    }
+  }
+
+  bool changed = false;
+  for (uint_t i = 0; i < size; ++i)
+    changed |= (order[i] != i);
+  if (!changed)
+    return false;
+
+  std::vector<Operations::Op> ordered_ops;
+  ordered_ops.reserve(size);
+  for (const auto i : order)
+    ordered_ops.push_back(std::move(ops[start + i]));
+  std::move(ordered_ops.begin(), ordered_ops.end(), ops.begin() + start);
+  return true;
+}
+
+uint_t CommutationReorder::merge_diagonals(std::vector<Operations::Op>& ops,
+                                           uint_t start, uint_t end) const {
+  // A run of diagonal gates is merged into a diagonal gate at the position of
+  // its last gate. Gates between them on other qubits commute with the
+  // earlier diagonal gates of the run, so they are kept in place.
+  uint_t removed = 0;
+  reg_t run;
+  std::set<uint_t> run_qubits;
+
+  auto flush = [&]() {
+    if (run.size() > 1) {
+      std::vector<Operations::Op> diag_ops;
+      for (const auto i : run)
+        diag_ops.push_back(ops[i]);
+      for (uint_t i = 0; i + 1 < run.size(); ++i)
+        ops[run[i]].type = Operations::OpType::nop;
+      ops[run.back()] = make_diagonal(diag_ops);
+      removed += run.size() - 1;
+    }
+    run.clear();
+    run_qubits.clear();
+  };
+
+  for (uint_t i = start; i < end; ++i) {
+    const auto &op = ops[i];
+    bool overlap = false;
+    for (const auto qubit : op.qubits)
+      overlap |= (run_qubits.find(qubit) != run_qubits.end());
+    if (is_diagonal(op)) {
+      std::set<uint_t> qubits = run_qubits;
+      qubits.insert(op.qubits.begin(), op.qubits.end());
+      if (qubits.size() > max_qubit) {
+        flush();
+        qubits = std::set<uint_t>(op.qubits.begin(), op.qubits.end());
+      }
+      run.push_back(i);
+      run_qubits.swap(qubits);
+    } else if (overlap) {
+      flush();
+    }
+  }
+  flush();
+  return removed;
+}
+
+Operations::Op
+CommutationReorder::make_diagonal(const std::vector<Operations::Op>& ops) const {
+  // Remap the qubits of the gates to the qubits of the diagonal gate
+  std::set<uint_t> qubit_set;
+  for (const auto &op : ops)
+    qubit_set.insert(op.qubits.begin(), op.qubits.end());
+  const reg_t qubits(qubit_set.begin(), qubit_set.end());
+  std::unordered_map<uint_t, uint_t> qubit_mapping;
+  for (uint_t j = 0; j < qubits.size(); ++j)
+    qubit_mapping[qubits[j]] = j;
+  std::vector<Operations::Op> mapped_ops(ops);
+  for (auto &op : mapped_ops) {
+    for (auto &qubit : op.qubits)
+      qubit = qubit_mapping[qubit];
+  }
+
+  RngEngine dummy_rng;
+  ExperimentResult dummy_result;
+  QubitUnitary::State<> unitary_simulator;
+  unitary_simulator.initialize_qreg(qubits.size());
+  unitary_simulator.apply_ops(mapped_ops, dummy_result, dummy_rng);
+
+  Operations::Op op;
+  op.type = Operations::OpType::diagonal_matrix;
+  op.name = "diagonal";
+  op.qubits = qubits;
+  op.params = Utils::matrix_diagonal(unitary_simulator.qreg().move_to_matrix());
+  return op;
+}
+
+//-------------------------------------------------------------------------
+} // end namespace Transpile
+} // end namespace AER
+//-------------------------------------------------------------------------
+#endif
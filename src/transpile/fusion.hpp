@@ -48,6 +48,11 @@ public:
    *       than to enable fusion optimization [Default: 14]
    * - fusion_cost_factor (double): a cost function to estimate an aggregate
    *       gate [Default: 1.8]
+   * - fusion_cost_table (list[double]): relative cost of applying a k-qubit
+   *       matrix to the state for k = 1, 2, ... If empty the costs are
+   *       derived from fusion_cost_factor [Default: []]
+   * - fusion_reorder (bool): Reorder operations on disjoint qubits to group
+   *       gates on the same qubits before fusion [Default: True]
    */
   Fusion(uint_t _max_qubit = 5, uint_t _threshold = 14, double _cost_factor = 1.8)
     : max_qubit(_max_qubit), threshold(_threshold), cost_factor(_cost_factor) {}
@@ -69,6 +74,8 @@ public:
   uint_t max_qubit;
   uint_t threshold;
   double cost_factor;
+  std::vector<double> cost_table;
+  bool reorder = true;
   bool verbose = false;
   bool active = true;
   bool allow_superop = false;
@@ -83,6 +90,9 @@ private:
 
   double get_cost(const op_t& op) const;
 
+  // Estimated cost of applying a matrix on num_qubits qubits to the state
+  double kernel_cost(uint_t num_qubits, bool diagonal) const;
+
   bool aggregate_operations(oplist_t& ops,
                             const int fusion_start,
                             const int fusion_end,
@@ -90,6 +100,22 @@ private:
                             ExperimentResult &result,
                             Method method) const;
 
+  // Return the minimal estimated cost of ops[fusion_start, fusion_end) and
+  // set fusion_to[i - fusion_start] to the first operation of the fused
+  // block that ends with the i-th operation
+  double fusion_path(const oplist_t& ops,
+                     const int fusion_start,
+                     const int fusion_end,
+                     uint_t max_fused_qubits,
+                     std::vector<int>& fusion_to) const;
+
+  // Return a topological order of the gate DAG of ops[fusion_start, fusion_end)
+  // that groups operations acting on at most max_fused_qubits qubits
+  reg_t dag_order(const oplist_t& ops,
+                  const int fusion_start,
+                  const int fusion_end,
+                  uint_t max_fused_qubits) const;
+
   // Aggregate a subcircuit of operations into a single operation
   op_t generate_fusion_operation(const std::vector<op_t>& fusioned_ops,
                                  const reg_t &num_qubits,
@@ -99,6 +125,8 @@ private:
                    const uint_t from,
                    const uint_t until) const;
 
+  bool is_diagonal_op(const op_t& op) const;
+
   double estimate_cost(const oplist_t& ops,
                        const uint_t from,
                        const uint_t until) const;
@@ -111,6 +139,7 @@ private:
 
 private:
   const static Operations::OpSet noise_opset_;
+  const static stringset_t diagonal_gates_;
 };
 
 
@@ -121,6 +150,11 @@ const Operations::OpSet Fusion::noise_opset_(
   {}, {}
 );
 
+const stringset_t Fusion::diagonal_gates_({
+  "id", "u0", "u1", "p", "z", "s", "sdg", "t", "tdg", "rz",
+  "cu1", "cp", "cz", "rzz", "mcu1", "mcp", "mcz", "ccz"
+});
+
 
 void Fusion::set_config(const json_t &config) {
 
@@ -140,6 +174,17 @@ void Fusion::set_config(const json_t &config) {
 
   if (JSON::check_key("fusion_cost_factor", config))
     JSON::get_value(cost_factor, "fusion_cost_factor", config);
+
+  if (JSON::check_key("fusion_cost_table", config)) {
+    JSON::get_value(cost_table, "fusion_cost_table", config);
+    for (const auto cost: cost_table) {
+      if (!(cost > 0.))
+        throw std::invalid_argument("Invalid fusion_cost_table (costs must be positive).");
+    }
+  }
+
+  if (JSON::check_key("fusion_reorder", config))
+    JSON::get_value(reorder, "fusion_reorder", config);
   
   if (JSON::check_key("fusion_allow_kraus", config))
     JSON::get_value(allow_kraus, "fusion_allow_kraus", config);
@@ -194,6 +239,15 @@ void Fusion::optimize_circuit(Circuit& circ,
 
   result.metadata.add(cost_factor, "fusion", "cost_factor");
   result.metadata.add(max_qubit, "fusion", "max_fused_qubits");
+  std::vector<double> costs;
+  for (uint_t num_qubits = 1; num_qubits <= max_qubit; ++num_qubits)
+    costs.push_back(kernel_cost(num_qubits, false));
+  result.metadata.add(costs, "fusion", "cost_table");
+
+  // Keep the input operations for verbose metadata
+  oplist_t input_ops;
+  if (verbose)
+    input_ops = circ.ops;
 
   // Apply fusion
   bool applied = false;
@@ -233,8 +287,15 @@ void Fusion::optimize_circuit(Circuit& circ,
 
   // Final metadata
   if (verbose && applied) {
-    result.metadata.add(circ.ops, "fusion", "input_ops");
-    result.metadata.add(circ.ops, "fusion", "output_ops"); // This looks like a bug?
+    double input_cost = 0., output_cost = 0.;
+    for (const auto &op: input_ops)
+      input_cost += get_cost(op);
+    for (const auto &op: circ.ops)
+      output_cost += get_cost(op);
+    result.metadata.add(input_cost, "fusion", "input_cost");
+    result.metadata.add(output_cost, "fusion", "output_cost");
+    result.metadata.add(input_ops, "fusion", "input_ops");
+    result.metadata.add(circ.ops, "fusion", "output_ops");
   }
   auto timer_stop = clock_t::now();
   auto time_taken = std::chrono::duration<double>(timer_stop - timer_start).count();
@@ -258,6 +319,8 @@ bool Fusion::can_apply_fusion(const op_t& op, uint_t max_fused_qubits, Method me
   switch (op.type) {
     case optype_t::matrix:
       return op.mats.size() == 1 && op.qubits.size() <= max_fused_qubits;
+    case optype_t::diagonal_matrix:
+      return op.qubits.size() <= max_fused_qubits;
     case optype_t::kraus:
     case optype_t::reset:
     case optype_t::superop: {
@@ -284,7 +347,36 @@ double Fusion::get_cost(const op_t& op) const {
   if (can_ignore(op))
     return .0;
   else
-    return cost_factor;
+    return kernel_cost(op.qubits.size(), is_diagonal_op(op));
+}
+
+double Fusion::kernel_cost(uint_t num_qubits, bool diagonal) const {
+  // A diagonal matrix is a single pass over the state for any number of qubits
+  if (diagonal || num_qubits == 0)
+    num_qubits = 1;
+
+  if (!cost_table.empty()) {
+    if (num_qubits <= cost_table.size())
+      return cost_table[num_qubits - 1];
+    // The matrix-vector product doubles for each qubit beyond the table
+    return cost_table.back() * pow(2., (double) (num_qubits - cost_table.size()));
+  }
+
+  if(is_avx2_supported()){
+    switch (num_qubits) {
+      case 1:
+        // [[ falling through :) ]]
+      case 2:
+        return cost_factor;
+      case 3:
+        return cost_factor * 1.1;
+      case 4:
+        return cost_factor * 3;
+      default:
+        return pow(cost_factor, (double) (num_qubits - 1));
+    }
+  }
+  return pow(cost_factor, (double) std::max(num_qubits - 1, uint_t(1)));
 }
 
 
@@ -328,47 +420,38 @@ bool Fusion::aggregate_operations(oplist_t& ops,
                                   ExperimentResult &result,
                                   Method method) const {
 
-  // costs[i]: estimated cost to execute from 0-th to i-th in original.ops
-  std::vector<double> costs;
   // fusion_to[i]: best path to i-th in original.ops
   std::vector<int> fusion_to;
-
-  // set costs and fusion_to of fusion_start
-  fusion_to.push_back(fusion_start);
-  costs.push_back(get_cost(ops[fusion_start]));
-
-  bool applied = false;
-  // calculate the minimal path to each operation in the circuit
-  for (int i = fusion_start + 1; i < fusion_end; ++i) {
-    // init with fusion from i-th to i-th
-    fusion_to.push_back(i);
-    costs.push_back(costs[i - fusion_start - 1] + get_cost(ops[i]));
-
-    for (int num_fusion = 2; num_fusion <=  static_cast<int> (max_fused_qubits); ++num_fusion) {
-      // calculate cost if {num_fusion}-qubit fusion is applied
-      reg_t fusion_qubits;
-      add_fusion_qubits(fusion_qubits, ops[i]);
-
-      for (int j = i - 1; j >= fusion_start; --j) {
-        add_fusion_qubits(fusion_qubits, ops[j]);
-
-        if (static_cast<int> (fusion_qubits.size()) > num_fusion) // exceed the limit of fusion
-          break;
-
-        // calculate a new cost of (i-th) by adding
-        double estimated_cost = estimate_cost(ops, (uint_t) j, i) // fusion gate from j-th to i-th, and
-            + (j == 0 ? 0.0 : costs[j - 1 - fusion_start]); // cost of (j-1)-th
-
-        // update cost
-        if (estimated_cost <= costs[i - fusion_start]) {
-          costs[i - fusion_start] = estimated_cost;
-          fusion_to[i - fusion_start] = j;
-          applied = true;
+  double cost = fusion_path(ops, fusion_start, fusion_end, max_fused_qubits, fusion_to);
+
+  // Reordering commuting operations on disjoint qubits can group more gates
+  // into a fused block. Use the reordered operations if they are cheaper.
+  if (reorder) {
+    const reg_t order = dag_order(ops, fusion_start, fusion_end, max_fused_qubits);
+    bool reordered = false;
+    for (uint_t i = 0; i < order.size(); ++i)
+      reordered |= (order[i] != i);
+    if (reordered) {
+      oplist_t ordered_ops;
+      ordered_ops.reserve(order.size());
+      for (const auto i: order)
+        ordered_ops.push_back(ops[fusion_start + i]);
+      std::vector<int> ordered_fusion_to;
+      double ordered_cost = fusion_path(ordered_ops, 0, ordered_ops.size(),
+                                        max_fused_qubits, ordered_fusion_to);
+      if (ordered_cost < cost) {
+        for (uint_t i = 0; i < ordered_ops.size(); ++i) {
+          ops[fusion_start + i] = std::move(ordered_ops[i]);
+          fusion_to[i] = ordered_fusion_to[i] + fusion_start;
         }
       }
     }
   }
 
+  bool applied = false;
+  for (int i = fusion_start; i < fusion_end; ++i)
+    applied |= (fusion_to[i - fusion_start] != i);
+
   if (!applied)
     return false;
 
@@ -410,6 +493,113 @@ bool Fusion::aggregate_operations(oplist_t& ops,
   return true;
 }
 
+double Fusion::fusion_path(const oplist_t& ops,
+                           const int fusion_start,
+                           const int fusion_end,
+                           uint_t max_fused_qubits,
+                           std::vector<int>& fusion_to) const {
+
+  // costs[i]: estimated cost to execute from 0-th to i-th in original.ops
+  std::vector<double> costs;
+  fusion_to.clear();
+
+  // set costs and fusion_to of fusion_start
+  fusion_to.push_back(fusion_start);
+  costs.push_back(get_cost(ops[fusion_start]));
+
+  // calculate the minimal path to each operation in the circuit
+  for (int i = fusion_start + 1; i < fusion_end; ++i) {
+    // init with fusion from i-th to i-th
+    fusion_to.push_back(i);
+    costs.push_back(costs[i - fusion_start - 1] + get_cost(ops[i]));
+
+    // calculate cost if ops from j-th to i-th are fused
+    reg_t fusion_qubits;
+    add_fusion_qubits(fusion_qubits, ops[i]);
+
+    for (int j = i - 1; j >= fusion_start; --j) {
+      add_fusion_qubits(fusion_qubits, ops[j]);
+
+      if (fusion_qubits.size() > max_fused_qubits) // exceed the limit of fusion
+        break;
+
+      // calculate a new cost of (i-th) by adding
+      double estimated_cost = estimate_cost(ops, (uint_t) j, i) // fusion gate from j-th to i-th, and
+          + (j == fusion_start ? 0.0 : costs[j - 1 - fusion_start]); // cost of (j-1)-th
+
+      // update cost
+      if (estimated_cost <= costs[i - fusion_start]) {
+        costs[i - fusion_start] = estimated_cost;
+        fusion_to[i - fusion_start] = j;
+      }
+    }
+  }
+  return costs.back();
+}
+
+reg_t Fusion::dag_order(const oplist_t& ops,
+                        const int fusion_start,
+                        const int fusion_end,
+                        uint_t max_fused_qubits) const {
+
+  const uint_t size = fusion_end - fusion_start;
+
+  // An operation depends on the last previous operation on each of its qubits
+  std::vector<reg_t> successors(size);
+  reg_t num_predecessors(size, 0);
+  std::unordered_map<uint_t, uint_t> last_ops;
+  for (uint_t i = 0; i < size; ++i) {
+    for (const auto qubit: ops[fusion_start + i].qubits) {
+      auto it = last_ops.find(qubit);
+      if (it != last_ops.end()) {
+        auto &next = successors[it->second];
+        if (next.empty() || next.back() != i) {
+          next.push_back(i);
+          ++num_predecessors[i];
+        }
+      }
+      last_ops[qubit] = i;
+    }
+  }
+
+  std::set<uint_t> ready;
+  for (uint_t i = 0; i < size; ++i) {
+    if (num_predecessors[i] == 0)
+      ready.insert(i);
+  }
+
+  // Schedule the first ready operation that keeps the qubits of the current
+  // group within max_fused_qubits, or start a new group with the first one
+  reg_t order;
+  order.reserve(size);
+  reg_t group_qubits;
+  while (!ready.empty()) {
+    auto next = ready.end();
+    for (auto it = ready.begin(); it != ready.end(); ++it) {
+      reg_t qubits = group_qubits;
+      add_fusion_qubits(qubits, ops[fusion_start + *it]);
+      if (qubits.size() <= max_fused_qubits) {
+        next = it;
+        group_qubits = qubits;
+        break;
+      }
+    }
+    if (next == ready.end()) {
+      next = ready.begin();
+      group_qubits.clear();
+      add_fusion_qubits(group_qubits, ops[fusion_start + *next]);
+    }
+    const uint_t i = *next;
+    ready.erase(next);
+    order.push_back(i);
+    for (const auto j: successors[i]) {
+      if (--num_predecessors[j] == 0)
+        ready.insert(j);
+    }
+  }
+  return order;
+}
+
 //------------------------------------------------------------------------------
 // Gate-swap optimized helper functions
 //------------------------------------------------------------------------------
@@ -436,38 +626,37 @@ bool Fusion::is_diagonal(const std::vector<op_t>& ops,
       i += 2;
       continue;
     }
-    if (ops[i].name == "u1" || ops[i].name == "cu1" || ops[i].name == "cp")
+    if (can_ignore(ops[i]) || is_diagonal_op(ops[i]))
       continue;
     return false;
   }
   return true;
 }
 
+bool Fusion::is_diagonal_op(const op_t& op) const {
+  switch (op.type) {
+    case optype_t::gate:
+      return diagonal_gates_.find(op.name) != diagonal_gates_.end();
+    case optype_t::diagonal_matrix:
+      return true;
+    case optype_t::matrix:
+      return op.mats.size() == 1 && Utils::is_diagonal(op.mats[0], .0);
+    default:
+      return false;
+  }
+}
+
 double Fusion::estimate_cost(const std::vector<op_t>& ops,
                              const uint_t from,
                              const uint_t until) const {
   if (is_diagonal(ops, from, until))
-    return cost_factor;
+    return kernel_cost(1, true);
 
   reg_t fusion_qubits;
   for (uint_t i = from; i <= until; ++i)
     add_fusion_qubits(fusion_qubits, ops[i]);
 
-  if(is_avx2_supported()){
-    switch (fusion_qubits.size()) {
-      case 1:
-        // [[ falling through :) ]]
-      case 2:
-        return cost_factor;
-      case 3:
-        return cost_factor * 1.1;
-      case 4:
-        return cost_factor * 3;
-      default:
-        return pow(cost_factor, (double) std::max(fusion_qubits.size() - 1, size_t(1)));
-    }
-  }
-  return pow(cost_factor, (double) std::max(fusion_qubits.size() - 1, size_t(1)));
+  return kernel_cost(fusion_qubits.size(), false);
 }
 
 void Fusion::add_fusion_qubits(reg_t& fusion_qubits, const op_t& op) const {
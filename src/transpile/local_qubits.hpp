@@ -0,0 +1,284 @@
+/**
+ * This code is part of Qiskit.
+ *
+ * (C) Copyright IBM 2018, 2019, 2020.
+ *
+ * This code is licensed under the Apache License, Version 2.0. You may
+ * obtain a copy of this license in the LICENSE.txt file in the root directory
+ * of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+ *
+ * Any modifications or derivative works of this code must retain this
+ * copyright notice, and modified files need to carry a notice indicating
+ * that they have been altered from the originals.
+ */
+
+#ifndef _aer_transpile_local_qubits_hpp_
+#define _aer_transpile_local_qubits_hpp_
+
+#include <algorithm>
+#include <limits>
+
+#include "transpile/circuitopt.hpp"
+
+namespace AER {
+namespace Transpile {
+
+// Keep non-diagonal operations on the local qubits of a sharded statevector.
+//
+// A statevector split into 2^k shards (for example one shard per NUMA socket,
+// with the pages of each shard placed on one NUMA node by QubitVector) has
+// n - k local qubits whose amplitude pairs always lie in the same shard, and
+// k global qubits whose amplitude pairs lie in different shards.
+// This pass remaps the circuit qubits so that every non-diagonal operation
+// acts only on local qubits. When an operation needs a global qubit, a swap
+// gate exchanging it with the local qubit that is used furthest in the future
+// is inserted. This swap is the only pass that exchanges amplitudes between
+// pairs of shards.
+//
+// Diagonal operations, measurements and snapshots that only read the state do
+// not exchange amplitudes and are remapped without swaps, so measure sampling
+// is not affected. Snapshots of the full state restore the original qubit
+// order before they are applied.
+//
+// The same remapping keeps the operations of a chunked statevector stored in
+// chunk files on the qubits within a chunk, if the number of local qubits
+// is set instead of the number of shards.
+
+class LocalQubits : public CircuitOptimization {
+public:
+
+  // LocalQubits uses following configuration options
+  // - statevector_shards (int): number of shards of the statevector, this must
+  //       be a power of two and 1 disables the pass (default: 1)
+  // - statevector_parallel_threshold (int): qubit number threshold for
+  //       activating the pass (default: 14)
+  // - local_qubits_verbose (bool): if true, output the remapped circuit
+  //       in metadata (default: false)
+  void set_config(const json_t &config) override;
+
+  void optimize_circuit(Circuit& circ,
+                        Noise::NoiseModel& noise,
+                        const Operations::OpSet &opset,
+                        ExperimentResult &result) const override;
+
+  uint_t shards = 1;
+  uint_t local_qubits = 0;  // If non-zero overrides the shards
+  uint_t threshold = 14;
+  bool verbose = false;
+  bool active = true;
+
+private:
+  // Return true if the operation exchanges amplitudes between basis
+  // states that differ on its qubits
+  bool is_local_op(const Operations::Op& op) const;
+
+  // Return true if the operation is valid for remapped qubits
+  bool can_remap(const Operations::Op& op) const;
+
+  // Return a swap gate on two qubits
+  Operations::Op make_swap(uint_t qubit0, uint_t qubit1) const;
+
+  // Append swap gates to restore the identity qubit mapping
+  void restore_mapping(reg_t& mapping, reg_t& inverse,
+                       std::vector<Operations::Op>& ops) const;
+};
+
+void LocalQubits::set_config(const json_t &config) {
+  CircuitOptimization::set_config(config);
+
+  int value;
+  if (JSON::get_value(value, "statevector_shards", config) && value > 0)
+    shards = value;
+  if (JSON::get_value(value, "statevector_parallel_threshold", config) && value > 0)
+    threshold = value;
+  JSON::get_value(verbose, "local_qubits_verbose", config);
+}
+
+void LocalQubits::optimize_circuit(Circuit& circ,
+                                   Noise::NoiseModel& noise,
+                                   const Operations::OpSet &allowed_opset,
+                                   ExperimentResult &result) const {
+  if (!active || circ.num_qubits <= threshold)
+    return;
+  if (local_qubits == 0 && shards < 2)
+    return;
+
+  if (shards & (shards - 1)) {
+    throw std::invalid_argument("LocalQubits: statevector_shards (" +
+                                std::to_string(shards) +
+                                ") must be a power of two.");
+  }
+  uint_t global_qubits = 0;
+  while ((1ULL << global_qubits) < shards)
+    ++global_qubits;
+
+  // Every non-diagonal operation must fit in the local qubits
+  const uint_t num_qubits = circ.num_qubits;
+  if (local_qubits > 0)
+    global_qubits = num_qubits - std::min(num_qubits, local_qubits);
+  const uint_t num_local = num_qubits - std::min(num_qubits, global_qubits);
+  if (num_local == num_qubits)
+    return;
+  for (const auto &op : circ.ops) {
+    if (!is_local_op(op) && op.qubits.size() > num_local)
+      return;
+  }
+
+  // Positions of the non-diagonal operations on each circuit qubit
+  // for choosing the local qubit that is used furthest in the future
+  std::vector<std::vector<uint_t>> uses(num_qubits);
+  for (uint_t i = 0; i < circ.ops.size(); ++i) {
+    if (!is_local_op(circ.ops[i])) {
+      for (const auto qubit : circ.ops[i].qubits)
+        uses[qubit].push_back(i);
+    }
+  }
+  auto next_use = [&](uint_t qubit, uint_t pos) -> uint_t {
+    auto it = std::lower_bound(uses[qubit].begin(), uses[qubit].end(), pos);
+    return (it == uses[qubit].end()) ? std::numeric_limits<uint_t>::max() : *it;
+  };
+
+  // mapping[circuit qubit] = state qubit and inverse[state qubit] = circuit qubit
+  reg_t mapping(num_qubits);
+  reg_t inverse(num_qubits);
+  for (uint_t qubit = 0; qubit < num_qubits; ++qubit) {
+    mapping[qubit] = qubit;
+    inverse[qubit] = qubit;
+  }
+
+  std::vector<Operations::Op> ops;
+  ops.reserve(circ.ops.size());
+  uint_t num_swaps = 0;
+  size_t first_measure_pos = circ.first_measure_pos;
+  for (uint_t i = 0; i < circ.ops.size(); ++i) {
+    if (i == circ.first_measure_pos)
+      first_measure_pos = ops.size();
+    Operations::Op op = circ.ops[i];
+
+    if (!can_remap(op)) {
+      const auto size = ops.size();
+      restore_mapping(mapping, inverse, ops);
+      num_swaps += ops.size() - size;
+      ops.push_back(std::move(op));
+      continue;
+    }
+
+    if (!is_local_op(op)) {
+      // Swap global qubits of the operation with local qubits that are
+      // not used by the operation
+      for (const auto qubit : op.qubits) {
+        if (mapping[qubit] < num_local)
+          continue;
+        uint_t best = num_local;
+        uint_t best_use = 0;
+        for (uint_t local = 0; local < num_local; ++local) {
+          const uint_t logical = inverse[local];
+          if (std::find(op.qubits.begin(), op.qubits.end(), logical) != op.qubits.end())
+            continue;
+          const uint_t use = next_use(logical, i);
+          if (best == num_local || use > best_use) {
+            best = local;
+            best_use = use;
+          }
+        }
+        const uint_t global = mapping[qubit];
+        ops.push_back(make_swap(best, global));
+        std::swap(inverse[best], inverse[global]);
+        mapping[inverse[best]] = best;
+        mapping[inverse[global]] = global;
+        ++num_swaps;
+      }
+    }
+
+    for (auto &qubit : op.qubits)
+      qubit = mapping[qubit];
+    for (auto &reg : op.regs)
+      for (auto &qubit : reg)
+        qubit = mapping[qubit];
+    ops.push_back(std::move(op));
+  }
+  if (circ.first_measure_pos >= circ.ops.size())
+    first_measure_pos = ops.size();
+
+  // The number of qubits is kept, since the local and global qubits are
+  // positions in the state of the original size
+  circ.ops = std::move(ops);
+  circ.set_params();
+  circ.num_qubits = num_qubits;
+  circ.first_measure_pos = first_measure_pos;
+
+  result.metadata.add(1ULL << global_qubits, "local_qubits", "shards");
+  result.metadata.add(num_swaps, "local_qubits", "swaps");
+  if (verbose)
+    result.metadata.add(circ.ops, "local_qubits", "output_ops");
+}
+
+bool LocalQubits::is_local_op(const Operations::Op& op) const {
+  switch (op.type) {
+    case Operations::OpType::gate:
+      return Operations::is_diagonal_gate(op.name);
+    case Operations::OpType::matrix:
+    case Operations::OpType::multiplexer:
+    case Operations::OpType::kraus:
+    case Operations::OpType::superop:
+    case Operations::OpType::reset:
+    case Operations::OpType::initialize:
+      return false;
+    default:
+      return true;
+  }
+}
+
+bool LocalQubits::can_remap(const Operations::Op& op) const {
+  switch (op.type) {
+    case Operations::OpType::snapshot: {
+      const stringset_t allowed({
+        "memory",
+        "register",
+        "probabilities",
+        "probabilities_with_variance",
+        "density_matrix",
+        "density_matrix_with_variance",
+        "expectation_value_pauli",
+        "expectation_value_pauli_with_variance",
+        "expectation_value_pauli_single_shot",
+        "expectation_value_matrix",
+        "expectation_value_matrix_with_variance",
+        "expectation_value_matrix_single_shot"
+      });
+      return allowed.find(op.name) != allowed.end();
+    }
+    default:
+      return true;
+  }
+}
+
+Operations::Op LocalQubits::make_swap(uint_t qubit0, uint_t qubit1) const {
+  Operations::Op op;
+  op.type = Operations::OpType::gate;
+  op.name = "swap";
+  op.qubits = {qubit0, qubit1};
+  op.string_params = {op.name};
+  return op;
+}
+
+void LocalQubits::restore_mapping(reg_t& mapping, reg_t& inverse,
+                                  std::vector<Operations::Op>& ops) const {
+  for (uint_t qubit = 0; qubit < mapping.size(); ++qubit) {
+    const uint_t current = mapping[qubit];
+    if (current == qubit)
+      continue;
+    // Move circuit qubit to state qubit `qubit`
+    ops.push_back(make_swap(qubit, current));
+    const uint_t other = inverse[qubit];
+    std::swap(inverse[qubit], inverse[current]);
+    mapping[qubit] = qubit;
+    mapping[other] = current;
+  }
+}
+
+//-------------------------------------------------------------------------
+} // end namespace Transpile
+} // end namespace AER
+//-------------------------------------------------------------------------
+#endif
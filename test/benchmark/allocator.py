@@ -0,0 +1,69 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Statevector Allocation Policy Benchmarking
+"""
+from time import time
+from qiskit import QuantumCircuit, assemble
+from qiskit.providers.aer import QasmSimulator
+
+ALLOCATORS = ['default', 'hugepage', 'interleaved', 'first_touch']
+METHODS = ['statevector', 'density_matrix']
+# Number of qubits of the state buffer: density matrices use twice the
+# number of circuit qubits
+BUFFER_QUBITS = [20, 24, 28]
+
+
+def u3_layers(num_qubits, layers):
+    """Layers of single-qubit gates on every qubit, each gate is one pass over the state."""
+    circuit = QuantumCircuit(num_qubits)
+    for layer in range(layers):
+        for q in range(num_qubits):
+            circuit.u3(0.1 * (layer + 1), 0.2 * q, 0.3, q)
+    return circuit
+
+
+class AllocatorSuite:
+    """Gate throughput for each statevector_allocator policy."""
+
+    def __init__(self):
+        self.timeout = 60 * 20
+        self.params = (ALLOCATORS, METHODS, BUFFER_QUBITS)
+        self.param_names = ['allocator', 'method', 'buffer_qubits']
+        self.simulator = QasmSimulator()
+        self.layers = 4
+
+    def setup(self, allocator, method, buffer_qubits):
+        num_qubits = buffer_qubits // 2 if method == 'density_matrix' else buffer_qubits
+        self.num_gates = self.layers * num_qubits
+        self.qobj = assemble(u3_layers(num_qubits, self.layers), self.simulator, shots=1)
+        # Disable fusion so that every gate is a pass over the state buffer
+        self.backend_options = {'method': method,
+                                'statevector_allocator': allocator,
+                                'fusion_enable': False}
+
+    def _run(self):
+        start = time()
+        result = self.simulator.run(self.qobj, backend_options=self.backend_options).result()
+        if not result.success:
+            raise ValueError('simulation error ({0})'.format(result.status))
+        return time() - start
+
+    def time_u3_layers(self, allocator, method, buffer_qubits):
+        self._run()
+
+    def track_bandwidth(self, allocator, method, buffer_qubits):
+        # Each gate reads and writes every complex double amplitude once
+        num_bytes = self.num_gates * 2 * 16 * (2 ** buffer_qubits)
+        return num_bytes / self._run() / 1e9
+
+    track_bandwidth.unit = 'GB/s'
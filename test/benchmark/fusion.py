@@ -0,0 +1,72 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Gate Fusion Benchmarking
+"""
+import numpy as np
+from qiskit.compiler import transpile, assemble
+from qiskit.providers.aer import QasmSimulator
+
+from benchmark.circuit_library_circuits import CircuitLibraryCircuits
+
+APPS = ['qft', 'real_amplitudes', 'real_amplitudes_linear', 'efficient_su2',
+        'excitation_preserving', 'graph_state', 'iqp', 'quantum_volume']
+# Fusion in the order of the circuit, after reordering the gate DAG, or disabled
+FUSIONS = {
+    'disabled': {'fusion_enable': False},
+    'linear': {'fusion_reorder': False},
+    'dag': {'fusion_reorder': True}
+}
+QUBITS = [16, 20, 24]
+
+
+class FusionSuite(CircuitLibraryCircuits):
+    """Statevector simulation time and fused gates for each fusion mode."""
+
+    def __init__(self):
+        self.timeout = 60 * 10
+        self.params = (APPS, list(FUSIONS), QUBITS)
+        self.param_names = ['application', 'fusion', 'qubit']
+        self.simulator = QasmSimulator()
+
+    def transpile(self, circuit):
+        return transpile(circuit, basis_gates=[
+            'u1', 'u2', 'u3', 'cx', 'cz', 'id', 'x', 'y', 'z', 'h', 's', 'sdg',
+            't', 'tdg', 'swap', 'ccx', 'unitary', 'diagonal', 'cu1', 'mcx'])
+
+    def setup(self, app, fusion, qubit):
+        circuit = getattr(self, app)(qubit, None)
+        if circuit.parameters:
+            rng = np.random.default_rng(1)
+            circuit = circuit.bind_parameters(
+                {param: rng.random() for param in circuit.parameters})
+        circuit.measure_all()
+        self.qobj = assemble(circuit, self.simulator, shots=1000)
+        self.backend_options = {'method': 'statevector', 'fusion_threshold': 1}
+        self.backend_options.update(FUSIONS[fusion])
+
+    def _run(self, verbose=False):
+        backend_options = dict(self.backend_options, fusion_verbose=verbose)
+        result = self.simulator.run(self.qobj, backend_options=backend_options).result()
+        if not result.success:
+            raise ValueError('simulation error ({0})'.format(result.status))
+        return result.results[0].metadata.get('fusion', {})
+
+    def time_simulation(self, app, fusion, qubit):
+        self._run()
+
+    def track_output_ops(self, app, fusion, qubit):
+        # Fused circuits report their operations in the verbose metadata
+        metadata = self._run(verbose=True)
+        return len(metadata.get('output_ops', self.qobj.experiments[0].instructions))
+
+    track_output_ops.unit = 'operations'
@@ -0,0 +1,70 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Initial State Benchmarking
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.providers.aer import StatevectorSimulator
+
+FORMATS = ['list', 'complex128', 'complex64', 'npy']
+QUBITS = [16, 20, 24]
+
+
+class InitialStatevectorSuite:
+    """Statevector simulation time and peak memory of a single gate circuit
+    with an initial statevector passed as a list of complex numbers, a NumPy
+    array or a memory mapped .npy file."""
+
+    def __init__(self):
+        self.timeout = 60 * 20
+        self.params = (FORMATS, QUBITS)
+        self.param_names = ['format', 'qubit']
+        self.simulator = StatevectorSimulator()
+
+    def setup(self, fmt, qubit):
+        circuit = QuantumCircuit(qubit)
+        circuit.h(0)
+        self.qobj = assemble(circuit, self.simulator, shots=1)
+        state = np.full(2 ** qubit, 2 ** (-qubit / 2), dtype=np.complex128)
+        self.directory = None
+        if fmt == 'list':
+            self.initial_statevector = state.tolist()
+        elif fmt == 'complex64':
+            self.initial_statevector = state.astype(np.complex64)
+        elif fmt == 'npy':
+            self.directory = tempfile.TemporaryDirectory()
+            self.initial_statevector = os.path.join(self.directory.name, 'initial.npy')
+            np.save(self.initial_statevector, state)
+        else:
+            self.initial_statevector = state
+
+    def teardown(self, fmt, qubit):
+        if self.directory is not None:
+            self.directory.cleanup()
+
+    def _run(self):
+        result = self.simulator.run(
+            self.qobj, initial_statevector=self.initial_statevector).result()
+        if not result.success:
+            raise ValueError('simulation error ({0})'.format(result.status))
+
+    def time_simulation(self, fmt, qubit):
+        self._run()
+
+    def peakmem_simulation(self, fmt, qubit):
+        self._run()
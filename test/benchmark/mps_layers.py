@@ -0,0 +1,56 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Matrix Product State Parallel Layers Benchmarking
+"""
+from qiskit import QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.providers.aer import QasmSimulator
+
+THREADS = [1, 2, 4, 8]
+QUBITS = [50, 100]
+# Maximum bond dimension of the simulations
+MAX_BOND_DIMENSION = 64
+
+
+def trotter_circuit(num_qubits, steps=10, dt=0.1):
+    """Return the Trotterized evolution of a transverse field Ising chain."""
+    circuit = QuantumCircuit(num_qubits)
+    for _ in range(steps):
+        for start in [0, 1]:
+            for qubit in range(start, num_qubits - 1, 2):
+                circuit.rzz(2 * dt, qubit, qubit + 1)
+        circuit.rx(2 * dt, range(num_qubits))
+    circuit.measure_all()
+    return circuit
+
+
+class MPSLayersSuite:
+    """Matrix product state simulation of Trotter circuits for each number of threads."""
+
+    def __init__(self):
+        self.timeout = 60 * 20
+        self.params = (THREADS, QUBITS)
+        self.param_names = ['threads', 'qubit']
+        self.simulator = QasmSimulator()
+
+    def setup(self, threads, qubit):
+        self.backend_options = {
+            'method': 'matrix_product_state',
+            'max_parallel_threads': threads,
+            'matrix_product_state_max_bond_dimension': MAX_BOND_DIMENSION}
+        self.qobj = assemble(trotter_circuit(qubit), self.simulator, shots=100)
+
+    def time_simulation(self, threads, qubit):
+        result = self.simulator.run(self.qobj, **self.backend_options).result()
+        if not result.success:
+            raise ValueError('simulation error ({0})'.format(result.status))
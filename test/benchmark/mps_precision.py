@@ -0,0 +1,53 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Matrix Product State Precision Benchmarking
+"""
+from qiskit.circuit.random import random_circuit
+from qiskit.compiler import transpile, assemble
+from qiskit.providers.aer import QasmSimulator
+
+PRECISIONS = ['double', 'single']
+QUBITS = [100]
+MAX_BOND_DIMENSIONS = [64, 128]
+
+
+class MPSPrecisionSuite:
+    """Matrix product state simulation time and peak memory of bond
+    dimension limited random circuits in single and double precision."""
+
+    def __init__(self):
+        self.timeout = 60 * 20
+        self.params = (PRECISIONS, QUBITS, MAX_BOND_DIMENSIONS)
+        self.param_names = ['precision', 'qubit', 'max_bond_dimension']
+        self.simulator = QasmSimulator()
+
+    def setup(self, precision, qubit, max_bond_dimension):
+        self.backend_options = {
+            'method': 'matrix_product_state',
+            'precision': precision,
+            'matrix_product_state_max_bond_dimension': max_bond_dimension}
+        circuit = random_circuit(qubit, 10, max_operands=2, seed=qubit)
+        circuit = transpile(circuit, basis_gates=['u1', 'u2', 'u3', 'cx', 'cp'])
+        circuit.measure_all()
+        self.qobj = assemble(circuit, self.simulator, shots=100)
+
+    def _run(self):
+        result = self.simulator.run(self.qobj, **self.backend_options).result()
+        if not result.success:
+            raise ValueError('simulation error ({0})'.format(result.status))
+
+    def time_simulation(self, precision, qubit, max_bond_dimension):
+        self._run()
+
+    def peakmem_simulation(self, precision, qubit, max_bond_dimension):
+        self._run()
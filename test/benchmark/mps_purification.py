@@ -0,0 +1,74 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Matrix Product State Purification Benchmarking
+"""
+from qiskit import QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.providers.aer import QasmSimulator
+from qiskit.providers.aer.noise import NoiseModel
+from qiskit.providers.aer.noise.errors import (depolarizing_error,
+                                               amplitude_damping_error)
+
+NOISE_METHODS = ['purification', 'trajectories']
+QUBITS = [20, 40]
+SHOTS = 1000
+# Maximum bond dimension of the simulations
+MAX_BOND_DIMENSION = 32
+
+
+def noise_model(error=0.01):
+    """Return a noise model of Kraus channels."""
+    noise = NoiseModel()
+    noise.add_all_qubit_quantum_error(amplitude_damping_error(error), ['u3'])
+    noise.add_all_qubit_quantum_error(depolarizing_error(error, 2), ['cx'])
+    return noise
+
+
+def brickwork_circuit(num_qubits, layers=4):
+    """Return layers of rotations and nearest neighbor CX gates with a
+    final Z expectation value snapshot."""
+    circuit = QuantumCircuit(num_qubits)
+    for layer in range(layers):
+        for qubit in range(num_qubits):
+            circuit.u3(0.1 * (qubit % 7 + 1), 0.2 * layer, 0.3, qubit)
+        for qubit in range(layer % 2, num_qubits - 1, 2):
+            circuit.cx(qubit, qubit + 1)
+    circuit.snapshot_expectation_value(
+        'expval', [[1.0, 'Z' * num_qubits]], list(range(num_qubits)))
+    circuit.measure_all()
+    return circuit
+
+
+class MPSPurificationSuite:
+    """Matrix product state simulation time of noisy circuits with purified
+    Kraus channels and with one trajectory per shot."""
+
+    def __init__(self):
+        self.timeout = 60 * 20
+        self.params = (NOISE_METHODS, QUBITS)
+        self.param_names = ['noise_method', 'qubit']
+        self.simulator = QasmSimulator()
+
+    def setup(self, noise_method, qubit):
+        self.backend_options = {
+            'method': 'matrix_product_state',
+            'noise_model': noise_model(),
+            'mps_purification': noise_method == 'purification',
+            'matrix_product_state_max_bond_dimension': MAX_BOND_DIMENSION}
+        self.qobj = assemble(brickwork_circuit(qubit), self.simulator,
+                             shots=SHOTS)
+
+    def time_simulation(self, noise_method, qubit):
+        result = self.simulator.run(self.qobj, **self.backend_options).result()
+        if not result.success:
+            raise ValueError('simulation error ({0})'.format(result.status))
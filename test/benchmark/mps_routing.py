@@ -0,0 +1,72 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Matrix Product State Routing Benchmarking
+"""
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.providers.aer import QasmSimulator
+
+ROUTINGS = ['sorted', 'lookahead']
+QUBITS = [16, 24, 32]
+# Probability of an edge of the random graphs
+EDGE_PROBABILITY = 0.5
+# Maximum bond dimension of the simulations
+MAX_BOND_DIMENSION = 32
+
+
+def qaoa_circuit(num_qubits, layers=2, seed=1234):
+    """Return a QAOA circuit on a random graph."""
+    rng = np.random.default_rng(seed)
+    circuit = QuantumCircuit(num_qubits)
+    circuit.h(range(num_qubits))
+    for _ in range(layers):
+        edges = [(i, j) for i in range(num_qubits) for j in range(i + 1, num_qubits)
+                 if rng.random() < EDGE_PROBABILITY]
+        for k in rng.permutation(len(edges)):
+            circuit.rzz(0.3, *edges[k])
+        circuit.rx(0.7, range(num_qubits))
+    circuit.measure_all()
+    return circuit
+
+
+class MPSRoutingSuite:
+    """Matrix product state simulation of QAOA circuits for each routing."""
+
+    def __init__(self):
+        self.timeout = 60 * 20
+        self.params = (ROUTINGS, QUBITS)
+        self.param_names = ['routing', 'qubit']
+        self.simulator = QasmSimulator()
+
+    def setup(self, routing, qubit):
+        self.backend_options = {
+            'method': 'matrix_product_state',
+            'matrix_product_state_max_bond_dimension': MAX_BOND_DIMENSION}
+        if routing == 'sorted':
+            self.backend_options['mps_initial_layout'] = False
+            self.backend_options['mps_routing_lookahead'] = 0
+        self.qobj = assemble(qaoa_circuit(qubit), self.simulator, shots=100)
+
+    def _run(self):
+        result = self.simulator.run(self.qobj, **self.backend_options).result()
+        if not result.success:
+            raise ValueError('simulation error ({0})'.format(result.status))
+        return result
+
+    def time_simulation(self, routing, qubit):
+        self._run()
+
+    def track_swaps(self, routing, qubit):
+        return self._run().results[0].metadata['matrix_product_state_swaps']
@@ -0,0 +1,52 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Matrix Product State SVD Benchmarking
+"""
+from qiskit.circuit.library import QFT
+from qiskit.circuit.random import random_circuit
+from qiskit.compiler import transpile, assemble
+from qiskit.providers.aer import QasmSimulator
+
+APPS = ['qft', 'random']
+SVD_ALGORITHMS = ['csvd', 'lapack', 'randomized', 'heuristic']
+QUBITS = [50, 75, 100]
+# Maximum bond dimension of the random circuits
+MAX_BOND_DIMENSION = 64
+
+
+class MPSSVDSuite:
+    """Matrix product state simulation time for each SVD algorithm."""
+
+    def __init__(self):
+        self.timeout = 60 * 20
+        self.params = (APPS, SVD_ALGORITHMS, QUBITS)
+        self.param_names = ['application', 'svd_algorithm', 'qubit']
+        self.simulator = QasmSimulator()
+
+    def setup(self, app, svd_algorithm, qubit):
+        self.backend_options = {'method': 'matrix_product_state',
+                                'mps_svd_algorithm': svd_algorithm}
+        if app == 'qft':
+            circuit = QFT(qubit)
+        else:
+            circuit = random_circuit(qubit, 10, max_operands=2, seed=qubit)
+            self.backend_options['matrix_product_state_max_bond_dimension'] = \
+                MAX_BOND_DIMENSION
+        circuit = transpile(circuit, basis_gates=['u1', 'u2', 'u3', 'cx', 'cp'])
+        circuit.measure_all()
+        self.qobj = assemble(circuit, self.simulator, shots=100)
+
+    def time_simulation(self, app, svd_algorithm, qubit):
+        result = self.simulator.run(self.qobj, **self.backend_options).result()
+        if not result.success:
+            raise ValueError('simulation error ({0})'.format(result.status))
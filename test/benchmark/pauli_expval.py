@@ -0,0 +1,82 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Pauli Expectation Value Benchmarking on Molecular Hamiltonians
+"""
+from qiskit import QuantumCircuit, assemble
+from qiskit.chemistry import FermionicOperator
+from qiskit.chemistry.drivers import PySCFDriver, UnitsType
+from qiskit.providers.aer import QasmSimulator
+# pylint: disable=unused-import
+from qiskit.providers.aer.extensions import snapshot_expectation_value
+
+# Jordan-Wigner mapped STO-3G Hamiltonians
+MOLECULES = {
+    'H2': 'H .0 .0 .0; H .0 .0 0.735',                       # qubits: 4
+    'LiH': 'H .0 .0 .0; Li .0 .0 1.6',                       # qubits: 12
+    'HF': 'H .0 .0 .0; F .0 .0 0.92',                        # qubits: 12
+    'BeH2': 'H .0 .0 -1.33; Be .0 .0 .0; H .0 .0 1.33',      # qubits: 14
+    'H2O': 'O .0 .0 .0; H .757 .586 .0; H -.757 .586 .0',    # qubits: 14
+}
+METHODS = ['statevector', 'density_matrix', 'statevector_thrust', 'matrix_product_state']
+# Largest number of qubits to run with the density matrix method
+MAX_DENSITY_MATRIX_QUBITS = 12
+
+
+def molecular_hamiltonian(mol_string):
+    """Return the Hamiltonian of a molecule as a list of [coeff, label] Paulis."""
+    driver = PySCFDriver(atom=mol_string, unit=UnitsType.ANGSTROM, charge=0, spin=0,
+                         basis='sto3g')
+    molecule = driver.run()
+    ferm_op = FermionicOperator(h1=molecule.one_body_integrals,
+                                h2=molecule.two_body_integrals)
+    qubit_op = ferm_op.mapping('jordan_wigner')
+    return [[coeff, pauli.to_label()] for coeff, pauli in qubit_op.paulis]
+
+
+def expval_circuit(paulis, layers=2):
+    """Hardware-efficient ansatz state followed by an expectation value snapshot."""
+    num_qubits = len(paulis[0][1])
+    circuit = QuantumCircuit(num_qubits)
+    for layer in range(layers):
+        for q in range(num_qubits):
+            circuit.ry(0.1 * (layer + 1) * (q + 1), q)
+            circuit.rz(0.2 * (layer + 1) * (q + 1), q)
+        for q in range(num_qubits - 1):
+            circuit.cx(q, q + 1)
+    circuit.snapshot_expectation_value('energy', paulis, range(num_qubits))
+    return circuit
+
+
+class PauliExpvalSuite:
+    """Expectation values of molecular Hamiltonians with one snapshot per circuit."""
+
+    def __init__(self):
+        self.timeout = 60 * 20
+        self.params = (list(MOLECULES), METHODS)
+        self.param_names = ['molecule', 'method']
+        self.simulator = QasmSimulator()
+        self.hamiltonians = {}
+
+    def setup(self, molecule, method):
+        if molecule not in self.hamiltonians:
+            self.hamiltonians[molecule] = molecular_hamiltonian(MOLECULES[molecule])
+        paulis = self.hamiltonians[molecule]
+        if method == 'density_matrix' and len(paulis[0][1]) > MAX_DENSITY_MATRIX_QUBITS:
+            raise NotImplementedError
+        self.qobj = assemble(expval_circuit(paulis), self.simulator, shots=1)
+        self.backend_options = {'method': method}
+
+    def time_expval_pauli(self, molecule, method):
+        result = self.simulator.run(self.qobj, backend_options=self.backend_options).result()
+        if not result.success:
+            raise ValueError('simulation error ({0})'.format(result.status))
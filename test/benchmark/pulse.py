@@ -0,0 +1,149 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Pulse Simulator Benchmarking
+"""
+from time import time
+import numpy as np
+from qiskit.compiler import assemble
+from qiskit.pulse import (Schedule, Play, Acquire, Waveform, DriveChannel,
+                          AcquireChannel, MemorySlot)
+from qiskit.providers.aer import PulseSimulator
+from qiskit.providers.aer.pulse import duffing_system_model
+from qiskit.providers.aer.pulse.system_models.hamiltonian_model import HamiltonianModel
+from qiskit.providers.aer.pulse.controllers.digest_pulse_qobj import digest_pulse_qobj
+
+DEFAULT_OSCILLATORS = [1, 2, 3, 4, 5]
+DEFAULT_SOLVER_OSCILLATORS = [1, 2, 3]
+DEFAULT_SCHEDULE_LENGTHS = [100, 1000]
+DEFAULT_EXPERIMENTS = [1, 10, 100]
+DEFAULT_DE_METHODS = ['zvode-adams', 'scipy-RK45', 'native-dopri5', 'native-RK4']
+
+SOLVER_UNITARY = 'unitary'
+SOLVER_MONTE_CARLO = 'monte_carlo'
+
+
+def _duffing_model(num_oscillators, dim_oscillators=3):
+    """Duffing oscillators coupled in a chain, with frequencies in GHz and dt in ns."""
+    return duffing_system_model(dim_oscillators=dim_oscillators,
+                                oscillator_freqs=[5.0 + 0.1 * q for q in range(num_oscillators)],
+                                anharm_freqs=[-0.33] * num_oscillators,
+                                drive_strengths=[0.02] * num_oscillators,
+                                coupling_dict={(q, q + 1): 0.002
+                                               for q in range(num_oscillators - 1)},
+                                dt=1.)
+
+
+def _schedule(num_oscillators, length):
+    """Gaussian drives of the given length on every oscillator, followed by measurement."""
+    times = np.arange(length)
+    samples = 0.1 * np.exp(-((times - length / 2) ** 2) / (2 * (length / 6) ** 2))
+    schedule = Schedule()
+    for q in range(num_oscillators):
+        schedule |= Play(Waveform(samples), DriveChannel(q))
+    for q in range(num_oscillators):
+        schedule |= Acquire(1, AcquireChannel(q), MemorySlot(q)) << length
+    return schedule
+
+
+def _qobj(simulator, num_oscillators, length, num_experiments=1, shots=100):
+    return assemble([_schedule(num_oscillators, length)] * num_experiments,
+                    backend=simulator,
+                    meas_level=2,
+                    meas_return='single',
+                    meas_map=[list(range(num_oscillators))],
+                    qubit_lo_freq=[5.0 + 0.1 * q for q in range(num_oscillators)],
+                    memory_slots=num_oscillators,
+                    shots=shots)
+
+
+class PulseModelConstructionSuite:
+    """Construction of Duffing oscillator system models."""
+
+    def __init__(self):
+        self.timeout = 60 * 10
+        self.params = (DEFAULT_OSCILLATORS,)
+        self.param_names = ['oscillators']
+
+    def time_duffing_system_model(self, num_oscillators):
+        HamiltonianModel.clear_cache()
+        _duffing_model(num_oscillators)
+
+    def time_duffing_system_model_cached(self, num_oscillators):
+        _duffing_model(num_oscillators)
+
+
+class PulseDigestionSuite:
+    """Digestion of pulse qobjs into the simulation data structures."""
+
+    def __init__(self):
+        self.timeout = 60 * 10
+        self.params = (DEFAULT_EXPERIMENTS, DEFAULT_SCHEDULE_LENGTHS)
+        self.param_names = ['experiments', 'schedule_length']
+
+    def setup(self, num_experiments, length):
+        self.system_model = _duffing_model(2)
+        self.simulator = PulseSimulator(system_model=self.system_model)
+        self.qobj = _qobj(self.simulator, 2, length, num_experiments)
+
+    def time_digest_pulse_qobj(self, num_experiments, length):
+        digest_pulse_qobj(self.qobj,
+                          self.system_model.hamiltonian._channels,
+                          self.system_model.dt,
+                          self.system_model.subsystem_list)
+
+
+class PulseSolverSuite:
+    """Unitary and Monte Carlo solves for each DE method."""
+
+    def __init__(self):
+        self.timeout = 60 * 10
+        self.params = (DEFAULT_DE_METHODS,
+                       [SOLVER_UNITARY, SOLVER_MONTE_CARLO],
+                       DEFAULT_SOLVER_OSCILLATORS,
+                       DEFAULT_SCHEDULE_LENGTHS)
+        self.param_names = ['method', 'solver', 'oscillators', 'schedule_length']
+
+    def setup(self, method, solver, num_oscillators, length):
+        self.simulator = PulseSimulator(system_model=_duffing_model(num_oscillators))
+        # the Monte Carlo solver runs one solve per shot
+        shots = 100 if solver == SOLVER_UNITARY else 8
+        self.qobj = _qobj(self.simulator, num_oscillators, length, shots=shots)
+        self.run_options = {'solver_options': {'method': method}}
+        if solver == SOLVER_MONTE_CARLO:
+            # amplitude damping on every oscillator forces the Monte Carlo solver
+            self.run_options['noise_model'] = {
+                'qubit': {str(q): {'Sm': 0.001} for q in range(num_oscillators)}}
+
+    def _run(self):
+        start = time()
+        result = self.simulator.run(self.qobj, **self.run_options).result()
+        if not result.success:
+            raise ValueError('simulation error ({0})'.format(result.status))
+        return time() - start
+
+    def time_pulse_simulator(self, method, solver, num_oscillators, length):
+        self._run()
+
+    def peakmem_pulse_simulator(self, method, solver, num_oscillators, length):
+        self._run()
+
+
+if __name__ == "__main__":
+    for method in DEFAULT_DE_METHODS:
+        for solver in [SOLVER_UNITARY, SOLVER_MONTE_CARLO]:
+            for num_oscillators in DEFAULT_SOLVER_OSCILLATORS:
+                for length in DEFAULT_SCHEDULE_LENGTHS:
+                    suite = PulseSolverSuite()
+                    suite.setup(method, solver, num_oscillators, length)
+                    print('pulse,{0},{1},{2},{3},{4}'.format(method, solver, num_oscillators,
+                                                             length, suite._run()))
@@ -0,0 +1,62 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Sharded Statevector Scaling Benchmarking
+"""
+from qiskit.circuit.library import QuantumVolume
+from qiskit.compiler import transpile, assemble
+from qiskit.providers.aer import QasmSimulator
+
+# Number of shards, e.g. the number of NUMA sockets of the machine
+SHARDS = [1, 2, 4]
+# Number of OpenMP threads, run with OMP_PROC_BIND=spread and
+# OMP_PLACES=sockets so that the threads are spread over the sockets
+THREADS = [1, 2, 4, 8, 16, 32]
+QUBITS = [26, 28, 30]
+
+
+class ShardsSuite:
+    """Statevector simulation time of quantum volume circuits for each number
+    of shards and threads, for the scaling of the sharded statevector across
+    NUMA sockets."""
+
+    def __init__(self):
+        self.timeout = 60 * 20
+        self.params = (SHARDS, THREADS, QUBITS)
+        self.param_names = ['shards', 'threads', 'qubit']
+        self.simulator = QasmSimulator()
+
+    def setup(self, shards, threads, qubit):
+        circuit = transpile(QuantumVolume(qubit, 10, seed=0),
+                            basis_gates=['u1', 'u2', 'u3', 'cx'],
+                            optimization_level=0)
+        circuit.measure_all()
+        self.qobj = assemble(circuit, self.simulator, shots=1)
+        self.backend_options = {'method': 'statevector',
+                                'statevector_shards': shards,
+                                'statevector_allocator': 'first_touch',
+                                'max_parallel_threads': threads}
+
+    def _run(self):
+        result = self.simulator.run(self.qobj, **self.backend_options).result()
+        if not result.success:
+            raise ValueError('simulation error ({0})'.format(result.status))
+        return result
+
+    def time_quantum_volume(self, shards, threads, qubit):
+        self._run()
+
+    def track_swaps(self, shards, threads, qubit):
+        metadata = self._run().results[0].metadata
+        return metadata.get('local_qubits', {}).get('swaps', 0)
+
+    track_swaps.unit = 'swaps'
@@ -0,0 +1,189 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+QasmSimulator Integration Tests
+"""
+# pylint: disable=no-member
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+
+from qiskit import QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.providers.aer import AerError, QasmSimulator
+from qiskit.providers.aer.noise import NoiseModel, pauli_error
+
+
+class QasmCheckpointTests:
+    """QasmSimulator checkpoint tests."""
+
+    SIMULATOR = QasmSimulator()
+
+    def checkpoint_circuit(self, num_qubits=6, mid_measure=False):
+        """Return layers of rotations and CX gates."""
+        circuit = QuantumCircuit(num_qubits, num_qubits)
+        for layer in range(4):
+            for qubit in range(num_qubits):
+                circuit.u3(0.1 * (qubit + 1), 0.2 * layer, 0.3, qubit)
+            for qubit in range(layer % 2, num_qubits - 1, 2):
+                circuit.cx(qubit, qubit + 1)
+            if mid_measure and layer == 1:
+                circuit.measure(0, 0)
+        circuit.measure(range(num_qubits), range(num_qubits))
+        return circuit
+
+    def test_checkpoint_counts(self):
+        """Test checkpoints give the same counts"""
+        shots = 2000
+        circuit = self.checkpoint_circuit()
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots)
+        result = self.SIMULATOR.run(qobj, **self.BACKEND_OPTS).result()
+        self.assertSuccess(result)
+        self.assertNotIn('checkpoint', result.results[0].metadata)
+        target = result.get_counts(0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            backend_options = self.BACKEND_OPTS.copy()
+            backend_options['checkpoint_directory'] = directory
+            backend_options['checkpoint_ops'] = 4
+            result = self.SIMULATOR.run(qobj, **backend_options).result()
+            self.assertSuccess(result)
+            metadata = result.results[0].metadata
+            self.assertTrue(metadata.get('measure_sampling'))
+            self.assertGreater(metadata['checkpoint']['num_checkpoints'], 0)
+            self.assertNotIn('resumed_op', metadata['checkpoint'])
+            # The checkpoint is removed when the circuit is completed
+            self.assertEqual(os.listdir(directory), [])
+        self.compare_counts(result, [circuit], [target], delta=0.05 * shots)
+
+    def test_checkpoint_single_shot(self):
+        """Test checkpoints of a single shot with a mid-circuit measure"""
+        circuit = self.checkpoint_circuit(mid_measure=True)
+        qobj = assemble(circuit, self.SIMULATOR, shots=1, seed_simulator=1234)
+        with tempfile.TemporaryDirectory() as directory:
+            backend_options = self.BACKEND_OPTS.copy()
+            backend_options['checkpoint_directory'] = directory
+            backend_options['checkpoint_ops'] = 1
+            result = self.SIMULATOR.run(qobj, **backend_options).result()
+            self.assertSuccess(result)
+            metadata = result.results[0].metadata
+            self.assertGreater(metadata['checkpoint']['num_checkpoints'], 0)
+            self.assertEqual(sum(result.get_counts(0).values()), 1)
+
+    def interrupt(self, qobj, backend_options, directory):
+        """Kill a simulation in a subprocess once it wrote a checkpoint.
+
+        Returns True if the simulation left a checkpoint file."""
+        job_file = os.path.join(directory, 'job.pickle')
+        with open(job_file, 'wb') as file:
+            pickle.dump((qobj, backend_options), file)
+        script = ('import pickle, sys\n'
+                  'from qiskit.providers.aer import QasmSimulator\n'
+                  'with open(sys.argv[1], "rb") as file:\n'
+                  '    qobj, options = pickle.load(file)\n'
+                  'QasmSimulator().run(qobj, **options).result()\n')
+        process = subprocess.Popen([sys.executable, '-c', script, job_file])
+        try:
+            while process.poll() is None and not any(
+                    name.endswith('.bin') for name in os.listdir(directory)):
+                time.sleep(0.001)
+        finally:
+            process.kill()
+            process.wait()
+        return any(name.endswith('.bin') for name in os.listdir(directory))
+
+    def resume_circuit(self, num_qubits=16, mid_measure=False):
+        """Return a long circuit of rotation layers."""
+        circuit = QuantumCircuit(num_qubits, num_qubits)
+        for layer in range(100):
+            for qubit in range(num_qubits):
+                circuit.u3(0.01 * (qubit + layer), 0.1, 0.2, qubit)
+            if mid_measure and layer == 50:
+                circuit.measure(0, 0)
+                circuit.x(1).c_if(circuit.cregs[0], 1)
+        circuit.measure(range(num_qubits), range(num_qubits))
+        return circuit
+
+    def assertResumed(self, qobj, backend_options, **run_options):
+        """Assert that resuming an interrupted simulation gives the memory
+        of the uninterrupted simulation."""
+        result = self.SIMULATOR.run(qobj, **backend_options,
+                                    **run_options).result()
+        self.assertSuccess(result)
+        target = result.get_memory(0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            backend_options = backend_options.copy()
+            backend_options.update(run_options)
+            backend_options['checkpoint_directory'] = directory
+            backend_options['checkpoint_ops'] = 1
+            if not self.interrupt(qobj, backend_options, directory):
+                self.skipTest('The simulation completed before it was interrupted')
+
+            del backend_options['checkpoint_directory']
+            result = self.SIMULATOR.resume(qobj, directory,
+                                           **backend_options).result()
+            self.assertSuccess(result)
+            metadata = result.results[0].metadata
+            self.assertIn('resumed_op', metadata['checkpoint'])
+            # The checkpoint is removed when the circuit is completed
+            self.assertFalse(any(name.endswith('.bin')
+                                 for name in os.listdir(directory)))
+        self.assertEqual(result.get_memory(0), target)
+
+    def test_checkpoint_resume(self):
+        """Test resuming from the checkpoint of an interrupted simulation"""
+        circuit = self.resume_circuit()
+        qobj = assemble(circuit, self.SIMULATOR, shots=100, memory=True,
+                        seed_simulator=1234)
+        self.assertResumed(qobj, self.BACKEND_OPTS)
+
+    def test_checkpoint_resume_shots(self):
+        """Test resuming the shots of a circuit simulated one at a time"""
+        circuit = self.resume_circuit(mid_measure=True)
+        qobj = assemble(circuit, self.SIMULATOR, shots=20, memory=True,
+                        seed_simulator=1234)
+        self.assertResumed(qobj, self.BACKEND_OPTS,
+                           shot_branching_enable=False)
+
+    def test_checkpoint_resume_noise(self):
+        """Test resuming the shots of a circuit with sampled noise"""
+        circuit = self.resume_circuit()
+        noise_model = NoiseModel()
+        noise_model.add_all_qubit_quantum_error(
+            pauli_error([('X', 0.01), ('I', 0.99)]), ['u3'])
+        qobj = assemble(circuit, self.SIMULATOR, shots=20, memory=True,
+                        seed_simulator=1234)
+        self.assertResumed(qobj, self.BACKEND_OPTS, noise_model=noise_model)
+
+    def test_checkpoint_resume_shot_branching(self):
+        """Test resuming the branches of shot branching"""
+        circuit = self.resume_circuit(mid_measure=True)
+        qobj = assemble(circuit, self.SIMULATOR, shots=100, memory=True,
+                        seed_simulator=1234)
+        self.assertResumed(qobj, self.BACKEND_OPTS,
+                           shot_branching_enable=True)
+
+    def test_checkpoint_resume_errors(self):
+        """Test resuming requires a checkpoint directory and a seed"""
+        circuit = self.checkpoint_circuit()
+        qobj = assemble(circuit, self.SIMULATOR, shots=10)
+        method = self.BACKEND_OPTS['method']
+        with tempfile.TemporaryDirectory() as directory:
+            self.assertRaises(AerError, self.SIMULATOR.resume, qobj,
+                              directory, method=method)
+            self.assertRaises(AerError, self.SIMULATOR.resume, qobj,
+                              os.path.join(directory, 'missing'),
+                              seed_simulator=1234, method=method)
@@ -0,0 +1,104 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+QasmSimulator Integration Tests
+"""
+# pylint: disable=no-member
+from qiskit import QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.providers.aer import QasmSimulator
+# pylint: disable=unused-import
+from qiskit.providers.aer.extensions import Snapshot
+
+
+class QasmCliffordPrefixTests:
+    """QasmSimulator Clifford prefix tests."""
+
+    SIMULATOR = QasmSimulator()
+
+    def clifford_prefix_options(self, enabled=True):
+        """Return default backend_options dict."""
+        backend_options = self.BACKEND_OPTS.copy()
+        backend_options['clifford_prefix_enable'] = enabled
+        backend_options['clifford_prefix_threshold'] = 1
+        return backend_options
+
+    def clifford_prefix_circuit(self, num_qubits=6):
+        """Return a circuit of Clifford layers followed by rotations."""
+        circuit = QuantumCircuit(num_qubits)
+        for layer in range(4):
+            for qubit in range(num_qubits):
+                if (layer + qubit) % 3 == 0:
+                    circuit.h(qubit)
+                elif (layer + qubit) % 3 == 1:
+                    circuit.s(qubit)
+                else:
+                    circuit.sx(qubit)
+            for qubit in range(layer % 2, num_qubits - 1, 2):
+                circuit.cx(qubit, qubit + 1)
+            circuit.cz(0, num_qubits - 1)
+            circuit.y(layer % num_qubits)
+            circuit.barrier()
+        for qubit in range(num_qubits):
+            circuit.u3(0.1 * (qubit + 1), 0.2, 0.3, qubit)
+        circuit.cx(0, 1)
+        circuit.t(1)
+        return circuit
+
+    def test_clifford_prefix_probabilities(self):
+        """Test Clifford prefix gives the same probabilities"""
+        circuit = self.clifford_prefix_circuit()
+        circuit.snapshot_probabilities('probs', list(range(circuit.num_qubits)))
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+
+        result = self.SIMULATOR.run(
+            qobj, **self.clifford_prefix_options(enabled=False)).result()
+        self.assertSuccess(result)
+        self.assertNotIn('clifford_prefix', result.results[0].metadata)
+        target = result.data(0)['snapshots']['probabilities']['probs'][0]['value']
+
+        result = self.SIMULATOR.run(
+            qobj, **self.clifford_prefix_options()).result()
+        self.assertSuccess(result)
+        meta = result.results[0].metadata.get('clifford_prefix', {})
+        self.assertEqual(meta.get('prefix_gates'), 42)
+        value = result.data(0)['snapshots']['probabilities']['probs'][0]['value']
+        self.assertDictAlmostEqual(value, target, delta=1e-10)
+
+    def test_clifford_prefix_counts(self):
+        """Test Clifford prefix with measure sampling"""
+        circuit = self.clifford_prefix_circuit()
+        circuit.measure_all()
+        shots = 2000
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots)
+
+        result = self.SIMULATOR.run(
+            qobj, **self.clifford_prefix_options(enabled=False)).result()
+        self.assertSuccess(result)
+        target = result.get_counts(0)
+
+        result = self.SIMULATOR.run(
+            qobj, **self.clifford_prefix_options()).result()
+        self.assertSuccess(result)
+        self.assertIn('clifford_prefix', result.results[0].metadata)
+        self.assertTrue(result.results[0].metadata.get('measure_sampling'))
+        self.compare_counts(result, [circuit], [target], delta=0.05 * shots)
+
+    def test_clifford_prefix_statevector_snapshot(self):
+        """Test Clifford prefix is skipped for statevector snapshots"""
+        circuit = self.clifford_prefix_circuit()
+        circuit.snapshot_statevector('final')
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+        result = self.SIMULATOR.run(
+            qobj, **self.clifford_prefix_options()).result()
+        self.assertSuccess(result)
+        self.assertNotIn('clifford_prefix', result.results[0].metadata)
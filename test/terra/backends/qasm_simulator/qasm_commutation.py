@@ -0,0 +1,125 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+QasmSimulator Integration Tests
+"""
+# pylint: disable=no-member
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import QFT
+from qiskit.circuit.random import random_circuit
+from qiskit.compiler import assemble, transpile
+from qiskit.providers.aer import QasmSimulator
+# pylint: disable=unused-import
+from qiskit.providers.aer.extensions import Snapshot
+
+
+class QasmCommutationTests:
+    """QasmSimulator commutation reordering tests."""
+
+    SIMULATOR = QasmSimulator()
+
+    def commutation_options(self, enabled=True, fusion=False, verbose=False):
+        """Return default backend_options dict."""
+        backend_options = self.BACKEND_OPTS.copy()
+        backend_options['commutation_enable'] = enabled
+        backend_options['commutation_threshold'] = 1
+        backend_options['commutation_verbose'] = verbose
+        backend_options['fusion_enable'] = fusion
+        backend_options['fusion_threshold'] = 1
+        return backend_options
+
+    def commutation_circuits(self):
+        """Return circuits with commuting gates and a final snapshot."""
+        num_qubits = 6
+        circuits = []
+
+        circuit = transpile(QFT(num_qubits), self.SIMULATOR,
+                            basis_gates=['u1', 'u2', 'u3', 'cx', 'cp'],
+                            optimization_level=0)
+        circuits.append(circuit)
+
+        circuit = QuantumCircuit(num_qubits)
+        circuit.h(range(num_qubits))
+        for layer in range(3):
+            for qubit in range(num_qubits):
+                circuit.rzz(0.1 * (layer + 1), qubit, (qubit + 2) % num_qubits)
+            for qubit in range(num_qubits):
+                circuit.cx(qubit, (qubit + 1) % num_qubits)
+                circuit.rx(0.2 * (layer + 1), qubit)
+                circuit.t(qubit)
+        circuits.append(circuit)
+
+        circuit = transpile(random_circuit(num_qubits, 12, seed=7),
+                            self.SIMULATOR, optimization_level=0)
+        circuits.append(circuit)
+
+        for circuit in circuits:
+            circuit.snapshot_statevector('final')
+        return circuits
+
+    def test_commutation_statevector(self):
+        """Test commutation reordering gives the same final state"""
+        circuits = self.commutation_circuits()
+        qobj = assemble(circuits, self.SIMULATOR, shots=1)
+        result = self.SIMULATOR.run(
+            qobj, **self.commutation_options(enabled=False)).result()
+        self.assertSuccess(result)
+        targets = [result.data(i)['snapshots']['statevector']['final'][0]
+                   for i in range(len(circuits))]
+
+        for fusion in [False, True]:
+            with self.subTest(msg='fusion={}'.format(fusion)):
+                result = self.SIMULATOR.run(
+                    qobj, **self.commutation_options(fusion=fusion)).result()
+                self.assertSuccess(result)
+                for i, target in enumerate(targets):
+                    self.assertIn('commutation', result.results[i].metadata)
+                    value = result.data(i)['snapshots']['statevector']['final'][0]
+                    self.assertTrue(np.allclose(value, target))
+
+    def test_commutation_merge_diagonal(self):
+        """Test commutation reordering merges runs of diagonal gates"""
+        circuit = QuantumCircuit(3)
+        circuit.h(range(3))
+        circuit.cp(0.3, 0, 1)
+        circuit.x(2)
+        circuit.rz(0.4, 0)
+        circuit.t(1)
+        circuit.cz(1, 0)
+        circuit.measure_all()
+        qobj = assemble(circuit, self.SIMULATOR, shots=100, seed_simulator=1)
+
+        result = self.SIMULATOR.run(
+            qobj, **self.commutation_options(enabled=False)).result()
+        self.assertSuccess(result)
+        target = result.get_counts(0)
+
+        result = self.SIMULATOR.run(
+            qobj, **self.commutation_options(verbose=True)).result()
+        self.assertSuccess(result)
+        meta = result.results[0].metadata.get('commutation', {})
+        self.assertEqual(meta.get('merged_diagonal_gates'), 3)
+        names = [op['name'] for op in meta.get('output_ops')]
+        self.assertEqual(names.count('diagonal'), 1)
+        self.assertDictAlmostEqual(result.get_counts(0), target, delta=0.0)
+
+    def test_commutation_threshold(self):
+        """Test commutation reordering qubit threshold"""
+        circuit = self.commutation_circuits()[0]
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+        backend_options = self.commutation_options()
+        backend_options['commutation_threshold'] = circuit.num_qubits + 1
+        result = self.SIMULATOR.run(qobj, **backend_options).result()
+        self.assertSuccess(result)
+        self.assertNotIn('commutation', result.results[0].metadata)
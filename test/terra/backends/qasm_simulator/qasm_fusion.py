@@ -424,3 +424,39 @@ class QasmFusionTests:
                                    result_disabled.get_counts(circuit),
                                    delta=0.0,
                                    msg="fusion for qft was failed")
+
+    def test_fusion_reorder(self):
+        """Test Fusion reorders gates on disjoint qubits"""
+        shots = 100
+        circuit = QuantumCircuit(4)
+        for _ in range(3):
+            for qubit in [0, 2, 1, 3]:
+                circuit.u3(0.1, 0.2, 0.3, qubit)
+            circuit.cx(0, 1)
+            circuit.cx(2, 3)
+        circuit.measure_all()
+        qobj = assemble([circuit], self.SIMULATOR, shots=shots, seed_simulator=1)
+
+        backend_options = self.fusion_options(enabled=False, threshold=1)
+        result_disabled = self.SIMULATOR.run(qobj, **backend_options).result()
+        self.assertSuccess(result_disabled)
+
+        metas = {}
+        for reorder in [False, True]:
+            backend_options = self.fusion_options(enabled=True, threshold=1, verbose=True)
+            backend_options['fusion_max_qubit'] = 2
+            backend_options['fusion_reorder'] = reorder
+            result = self.SIMULATOR.run(qobj, **backend_options).result()
+            self.assertSuccess(result)
+            metas[reorder] = self.fusion_metadata(result)
+            self.assertTrue(metas[reorder].get('applied'))
+            self.assertLess(metas[reorder]['output_cost'], metas[reorder]['input_cost'])
+            self.assertDictAlmostEqual(result.get_counts(circuit),
+                                       result_disabled.get_counts(circuit),
+                                       delta=0.0,
+                                       msg="fusion with reorder={} failed".format(reorder))
+
+        # Reordering the gates of each qubit pair fuses them into one gate
+        self.assertLess(metas[True]['output_cost'], metas[False]['output_cost'])
+        self.assertLess(len(metas[True]['output_ops']), len(metas[False]['output_ops']))
+        self.assertEqual(len(metas[True]['input_ops']), len(metas[False]['input_ops']))
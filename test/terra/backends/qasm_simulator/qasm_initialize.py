@@ -13,7 +13,11 @@
 QasmSimulator Integration Tests
 """
 
+import os
+import tempfile
+
 from test.terra.reference import ref_initialize
+from qiskit import QuantumCircuit
 from qiskit.compiler import assemble
 from qiskit.providers.aer import QasmSimulator
 
@@ -104,3 +108,47 @@ class QasmInitializeTests:
         result = self.SIMULATOR.run(qobj, **opts).result()
         self.assertSuccess(result)
         self.compare_counts(result, circuits, targets, delta=0.05 * shots)
+
+    # ---------------------------------------------------------------------
+    # Test initial states passed as NumPy buffers
+    # ---------------------------------------------------------------------
+    def hadamard_state(self, num_qubits, value):
+        """Return the state H^n|value>, which is exact in single precision."""
+        signs = [(-1) ** bin(i & value).count('1') for i in range(2 ** num_qubits)]
+        return np.array(signs, dtype=complex) / 2 ** (num_qubits / 2)
+
+    def test_initial_statevector_buffers(self):
+        """Test QasmSimulator initial_statevector as arrays and .npy files"""
+        shots = 100
+        circuit = QuantumCircuit(4, 4)
+        circuit.h(range(4))
+        circuit.measure(range(4), range(4))
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots)
+        initial = self.hadamard_state(4, 11)
+        targets = [{'0xb': shots}]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'initial.npy')
+            np.save(path, initial)
+            values = {'complex128': initial,
+                      'complex64': initial.astype(np.complex64),
+                      'npy': path}
+            for label, value in values.items():
+                with self.subTest(msg=label):
+                    opts = self.BACKEND_OPTS.copy()
+                    opts['initial_statevector'] = value
+                    result = self.SIMULATOR.run(qobj, **opts).result()
+                    self.assertSuccess(result)
+                    self.compare_counts(result, [circuit], targets, delta=0)
+
+    def test_initialize_complex64(self):
+        """Test QasmSimulator initialize with a complex64 array"""
+        shots = 100
+        circuit = QuantumCircuit(4, 4)
+        circuit.initialize(self.hadamard_state(4, 6).astype(np.complex64), range(4))
+        circuit.h(range(4))
+        circuit.measure(range(4), range(4))
+        targets = [{'0x6': shots}]
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots)
+        result = self.SIMULATOR.run(qobj, **self.BACKEND_OPTS).result()
+        self.assertSuccess(result)
+        self.compare_counts(result, [circuit], targets, delta=0)
@@ -0,0 +1,116 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+QasmSimulator Integration Tests
+"""
+# pylint: disable=no-member
+import numpy as np
+
+from qiskit.circuit.library import QuantumVolume
+from qiskit.compiler import assemble, transpile
+from qiskit.providers.aer import QasmSimulator
+# pylint: disable=unused-import
+from qiskit.providers.aer.extensions import Snapshot
+from test.terra.decorators import requires_method
+
+
+class QasmLocalQubitsTests:
+    """QasmSimulator sharded statevector local qubit tests."""
+
+    SIMULATOR = QasmSimulator()
+
+    def local_qubits_options(self, shards=None):
+        """Return default backend_options dict."""
+        backend_options = self.BACKEND_OPTS.copy()
+        backend_options['statevector_parallel_threshold'] = 2
+        backend_options['fusion_enable'] = False
+        if shards is not None:
+            backend_options['statevector_shards'] = shards
+        return backend_options
+
+    def qv_circuit(self, num_qubits=6):
+        """Return a quantum volume circuit with a final statevector snapshot."""
+        circuit = transpile(QuantumVolume(num_qubits, seed=1234),
+                            basis_gates=['u1', 'u2', 'u3', 'cx'],
+                            optimization_level=0)
+        circuit.snapshot_probabilities('probs', [0, num_qubits - 1])
+        circuit.snapshot_statevector('final')
+        return circuit
+
+    def test_local_qubits_statevector(self):
+        """Test sharded statevector gives the same final state"""
+        circuit = self.qv_circuit()
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+
+        result = self.SIMULATOR.run(qobj, **self.local_qubits_options()).result()
+        self.assertSuccess(result)
+        self.assertNotIn('local_qubits', result.results[0].metadata)
+        target = result.data(0)['snapshots']
+
+        for shards in [2, 4]:
+            with self.subTest(msg='shards={}'.format(shards)):
+                result = self.SIMULATOR.run(
+                    qobj, **self.local_qubits_options(shards)).result()
+                self.assertSuccess(result)
+                meta = result.results[0].metadata.get('local_qubits', {})
+                self.assertEqual(meta.get('shards'), shards)
+                self.assertGreater(meta.get('swaps'), 0)
+                value = result.data(0)['snapshots']
+                self.assertTrue(np.allclose(value['statevector']['final'][0],
+                                            target['statevector']['final'][0]))
+                self.assertDictAlmostEqual(
+                    value['probabilities']['probs'][0]['value'],
+                    target['probabilities']['probs'][0]['value'])
+
+    def test_local_qubits_counts(self):
+        """Test sharded statevector measurement counts"""
+        shots = 2000
+        circuit = self.qv_circuit()
+        circuit.measure_all()
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots, seed_simulator=1)
+        result = self.SIMULATOR.run(qobj, **self.local_qubits_options()).result()
+        self.assertSuccess(result)
+        target = result.get_counts(0)
+        result = self.SIMULATOR.run(qobj, **self.local_qubits_options(4)).result()
+        self.assertSuccess(result)
+        self.compare_counts(result, [circuit], [target], hex_counts=False,
+                            delta=0.05 * shots)
+
+    @requires_method("qasm_simulator", "statevector_chunked")
+    def test_local_qubits_chunked(self):
+        """Test chunked statevector streams chunks and gives the same final state"""
+        circuit = self.qv_circuit()
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+        result = self.SIMULATOR.run(qobj, **self.local_qubits_options()).result()
+        self.assertSuccess(result)
+        target = result.data(0)['snapshots']
+
+        backend_options = self.local_qubits_options()
+        backend_options['method'] = 'statevector_chunked'
+        backend_options['statevector_chunk_qubits'] = 3
+        result = self.SIMULATOR.run(qobj, **backend_options).result()
+        self.assertSuccess(result)
+        meta = result.results[0].metadata
+        self.assertEqual(meta.get('statevector_chunks', {}).get('chunks'), 8)
+        self.assertGreater(meta.get('statevector_chunks', {}).get('streamed_blocks'), 0)
+        self.assertGreater(meta.get('local_qubits', {}).get('swaps'), 0)
+        value = result.data(0)['snapshots']
+        self.assertTrue(np.allclose(value['statevector']['final'][0],
+                                    target['statevector']['final'][0]))
+
+    def test_local_qubits_invalid_shards(self):
+        """Test the number of shards must be a power of two"""
+        circuit = self.qv_circuit()
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+        result = self.SIMULATOR.run(
+            qobj, **self.local_qubits_options(3)).result()
+        self.assertFalse(getattr(result, 'success', False))
@@ -0,0 +1,97 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+QasmSimulator Integration Tests
+"""
+# pylint: disable=no-member
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Instruction
+from qiskit.compiler import assemble
+from qiskit.providers.aer import QasmSimulator
+
+
+class QasmMeasureSamplingTests:
+    """QasmSimulator measure sampling analysis tests."""
+
+    SIMULATOR = QasmSimulator()
+
+    def test_measure_sampling_rule(self):
+        """Test measure sampling analysis of stochastic instructions"""
+        shots = 2000
+        # Phase damping channel
+        dephasing = Instruction('kraus', 1, 0, [np.diag([1, 0.8]), np.diag([0, 0.6])])
+        # Bit flip channel, a mixture of the identity and X unitaries
+        bit_flip = Instruction('kraus', 1, 0, [np.sqrt(0.8) * np.eye(2),
+                                               np.sqrt(0.2) * np.array([[0, 1], [1, 0]])])
+        # Amplitude damping channel
+        damping = Instruction('kraus', 1, 0, [np.diag([1, np.sqrt(0.7)]),
+                                              np.array([[0, np.sqrt(0.3)], [0, 0]])])
+
+        # Reset and initialize of initial qubits, and a diagonal Kraus
+        # channel followed by diagonal gates
+        circuit1 = QuantumCircuit(2)
+        circuit1.reset(0)
+        circuit1.initialize([0.6, 0.8], [1])
+        circuit1.h(0)
+        circuit1.append(dephasing, [0])
+        circuit1.rz(0.3, 0)
+        circuit1.measure_all()
+        target1 = {'00': 0.18 * shots, '01': 0.18 * shots,
+                   '10': 0.32 * shots, '11': 0.32 * shots}
+
+        # Reset after a gate
+        circuit2 = QuantumCircuit(2)
+        circuit2.h(0)
+        circuit2.reset(0)
+        circuit2.measure_all()
+        target2 = {'00': shots}
+
+        # Diagonal Kraus channel followed by a non-diagonal gate
+        circuit3 = QuantumCircuit(2)
+        circuit3.h(0)
+        circuit3.append(dephasing, [0])
+        circuit3.h(0)
+        circuit3.measure_all()
+        target3 = {'00': 0.9 * shots, '01': 0.1 * shots}
+
+        # Bit flip channel followed by a diagonal gate, and amplitude
+        # damping channel. Their outcome transitions are sampled.
+        circuit4 = QuantumCircuit(2)
+        circuit4.h(1)
+        circuit4.x(0)
+        circuit4.append(bit_flip, [0])
+        circuit4.rz(0.3, 0)
+        circuit4.append(damping, [1])
+        circuit4.measure_all()
+        target4 = {'00': 0.13 * shots, '01': 0.52 * shots,
+                   '10': 0.07 * shots, '11': 0.28 * shots}
+
+        circuits = [circuit1, circuit2, circuit3, circuit4]
+        qobj = assemble(circuits, self.SIMULATOR, shots=shots)
+        result = self.SIMULATOR.run(qobj, **self.BACKEND_OPTS).result()
+        self.assertSuccess(result)
+        rules = [
+            (True, 'diagonal_kraus,initialize_initial_qubits,reset_initial_qubits'),
+            (False, 'reset'),
+            (False, 'kraus'),
+            (True, 'sampled_kraus')
+        ]
+        targets = [target1, target2, target3, target4]
+        for i, (sampling, rule) in enumerate(rules):
+            with self.subTest(msg=rule):
+                metadata = result.results[i].metadata
+                self.assertEqual(metadata.get('measure_sampling'), sampling)
+                self.assertEqual(metadata.get('measure_sampling_rule'), rule)
+                self.assertDictAlmostEqual(result.get_counts(i), targets[i],
+                                           delta=0.05 * shots)
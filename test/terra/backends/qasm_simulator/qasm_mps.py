@@ -0,0 +1,282 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+QasmSimulator Integration Tests
+"""
+# pylint: disable=no-member
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import QFT, QuantumVolume
+from qiskit.compiler import assemble, transpile
+from qiskit.providers.aer import QasmSimulator
+from qiskit.providers.aer.noise import NoiseModel
+from qiskit.providers.aer.noise.errors import (depolarizing_error,
+                                               amplitude_damping_error)
+# pylint: disable=unused-import
+from qiskit.providers.aer.extensions import Snapshot
+
+
+class QasmMatrixProductStateTests:
+    """QasmSimulator matrix product state options tests."""
+
+    SIMULATOR = QasmSimulator()
+
+    def mps_circuit(self, num_qubits=6):
+        """Return an entangling circuit with a final statevector snapshot."""
+        circuit = transpile(QuantumVolume(num_qubits, seed=1234),
+                            basis_gates=['u1', 'u2', 'u3', 'cx'],
+                            optimization_level=0)
+        circuit.snapshot_statevector('final')
+        return circuit
+
+    def test_mps_svd_algorithms(self):
+        """Test the SVD algorithms give the same final state"""
+        circuit = self.mps_circuit()
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+        target = None
+        for algorithm in ['csvd', 'lapack', 'randomized', 'heuristic']:
+            with self.subTest(msg=algorithm):
+                backend_options = self.BACKEND_OPTS.copy()
+                backend_options['mps_svd_algorithm'] = algorithm
+                result = self.SIMULATOR.run(qobj, **backend_options).result()
+                self.assertSuccess(result)
+                self.assertEqual(
+                    result.results[0].metadata.get('matrix_product_state_svd_algorithm'),
+                    algorithm)
+                value = result.data(0)['snapshots']['statevector']['final'][0]
+                if target is None:
+                    target = value
+                else:
+                    self.assertAlmostEqual(abs(np.vdot(target, value)), 1)
+
+        with self.subTest(msg='invalid algorithm'):
+            backend_options = self.BACKEND_OPTS.copy()
+            backend_options['mps_svd_algorithm'] = 'invalid'
+            result = self.SIMULATOR.run(qobj, **backend_options).result()
+            self.assertFalse(getattr(result, 'success', False))
+
+    def test_mps_discarded_weight(self):
+        """Test the discarded weight of the truncation is reported"""
+        circuit = self.mps_circuit()
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+        backend_options = self.BACKEND_OPTS.copy()
+        result = self.SIMULATOR.run(qobj, **backend_options).result()
+        self.assertSuccess(result)
+        self.assertAlmostEqual(
+            result.results[0].metadata.get('matrix_product_state_discarded_weight'), 0)
+
+        backend_options['matrix_product_state_max_bond_dimension'] = 2
+        result = self.SIMULATOR.run(qobj, **backend_options).result()
+        self.assertSuccess(result)
+        weight = result.results[0].metadata.get('matrix_product_state_discarded_weight')
+        self.assertGreater(weight, 0)
+        self.assertLess(weight, 1)
+
+    def test_mps_memory_budget(self):
+        """Test the truncation is adapted to the memory budget"""
+        circuit = self.mps_circuit(16)
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+        backend_options = self.BACKEND_OPTS.copy()
+        backend_options['mps_memory_budget_mb'] = 1
+        result = self.SIMULATOR.run(qobj, **backend_options).result()
+        self.assertSuccess(result)
+        metadata = result.results[0].metadata
+        self.assertEqual(metadata.get('matrix_product_state_memory_budget_mb'), 1)
+        self.assertGreater(
+            metadata.get('matrix_product_state_adaptive_truncation_threshold'),
+            metadata.get('matrix_product_state_truncation_threshold'))
+        self.assertGreater(metadata.get('matrix_product_state_discarded_weight'), 0)
+
+        with self.subTest(msg='no budget'):
+            backend_options['mps_memory_budget_mb'] = 0
+            result = self.SIMULATOR.run(
+                assemble(self.mps_circuit(), self.SIMULATOR, shots=1),
+                **backend_options).result()
+            self.assertSuccess(result)
+            metadata = result.results[0].metadata
+            self.assertEqual(metadata.get('matrix_product_state_memory_budget_mb'), 0)
+            self.assertNotIn('matrix_product_state_adaptive_truncation_threshold',
+                             metadata)
+
+        with self.subTest(msg='default'):
+            result = self.SIMULATOR.run(
+                assemble(self.mps_circuit(), self.SIMULATOR, shots=1),
+                **self.BACKEND_OPTS).result()
+            self.assertSuccess(result)
+            metadata = result.results[0].metadata
+            self.assertEqual(metadata.get('matrix_product_state_memory_budget_mb'), 0)
+            self.assertNotIn('matrix_product_state_adaptive_truncation_threshold',
+                             metadata)
+
+    def test_mps_large_qft(self):
+        """Test a large QFT is not rejected by the worst case memory estimate"""
+        circuit = transpile(QFT(60), basis_gates=['u1', 'u2', 'u3', 'cx', 'cp'])
+        circuit.measure_all()
+        qobj = assemble(circuit, self.SIMULATOR, shots=10)
+        result = self.SIMULATOR.run(qobj, **self.BACKEND_OPTS).result()
+        self.assertSuccess(result)
+        self.assertEqual(sum(result.get_counts(0).values()), 10)
+
+    def test_mps_precision(self):
+        """Test the single precision gives the double precision final state"""
+        circuit = self.mps_circuit(10)
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+        target = None
+        for precision in ['double', 'single']:
+            with self.subTest(msg=precision):
+                backend_options = self.BACKEND_OPTS.copy()
+                backend_options['precision'] = precision
+                result = self.SIMULATOR.run(qobj, **backend_options).result()
+                self.assertSuccess(result)
+                self.assertEqual(
+                    result.results[0].metadata.get('matrix_product_state_precision'),
+                    precision)
+                value = result.data(0)['snapshots']['statevector']['final'][0]
+                if target is None:
+                    target = value
+                else:
+                    self.assertAlmostEqual(abs(np.vdot(target, value)), 1, places=5)
+
+    def test_mps_routing(self):
+        """Test the qubit layout and routing give the same final state"""
+        circuit = QuantumCircuit(8)
+        circuit.h(range(8))
+        for qubit in range(8):
+            circuit.cx(qubit, (3 * qubit + 5) % 8)
+            circuit.rzz(0.1 * qubit, qubit, 7 - qubit)
+        circuit.measure_all(add_bits=True)
+        circuit.cx(0, 4)
+        circuit.snapshot_statevector('final')
+        qobj = assemble(circuit, self.SIMULATOR, shots=1, seed_simulator=1234)
+        target = None
+        for layout, lookahead in [(False, 0), (True, 0), (False, 16), (True, 16)]:
+            with self.subTest(msg='layout={}, lookahead={}'.format(layout, lookahead)):
+                backend_options = self.BACKEND_OPTS.copy()
+                backend_options['mps_initial_layout'] = layout
+                backend_options['mps_routing_lookahead'] = lookahead
+                result = self.SIMULATOR.run(qobj, **backend_options).result()
+                self.assertSuccess(result)
+                self.assertIn('matrix_product_state_swaps', result.results[0].metadata)
+                value = result.data(0)['snapshots']['statevector']['final'][0]
+                if target is None:
+                    target = value
+                else:
+                    self.assertAlmostEqual(abs(np.vdot(target, value)), 1)
+
+    def test_mps_expval_pauli(self):
+        """Test the batched Pauli expectation value against the statevector method"""
+        circuit = self.mps_circuit()
+        circuit.data.pop()
+        paulis = [[0.5, 'XZZZZX'], [0.5, 'YZZZZY'], [-0.25, 'IIZZII'],
+                  [1.0, 'IIIIII'], [0.75, 'XXIIII'], [0.3, 'IIIIYX'],
+                  [0.2, 'ZIXIYZ'], [-0.4, 'IZZXII']]
+        circuit.snapshot_expectation_value('expval', paulis, [2, 0, 5, 1, 4, 3])
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+        result = self.SIMULATOR.run(qobj, method='statevector').result()
+        self.assertSuccess(result)
+        target = result.data(0)['snapshots']['expectation_value']['expval'][0]['value']
+
+        result = self.SIMULATOR.run(qobj, **self.BACKEND_OPTS).result()
+        self.assertSuccess(result)
+        value = result.data(0)['snapshots']['expectation_value']['expval'][0]['value']
+        self.assertAlmostEqual(value, target)
+
+    def test_mps_sample_measure_algorithms(self):
+        """Test the sample measure algorithms give the same counts"""
+        circuit = QuantumCircuit(12)
+        circuit.h(0)
+        for qubit in range(1, 12):
+            circuit.cx(qubit // 2, qubit)
+        for qubit in [0, 5, 11]:
+            circuit.rx(0.4 * (qubit + 1), qubit)
+        circuit.measure_all()
+        shots = 4000
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots, seed_simulator=1234)
+        backend_options = self.BACKEND_OPTS.copy()
+        backend_options['mps_sample_measure_algorithm'] = 'mps_probabilities'
+        result = self.SIMULATOR.run(qobj, **backend_options).result()
+        self.assertSuccess(result)
+        target = result.get_counts(0)
+        for algorithm in ['mps_apply_measure', 'mps_conditional_probabilities']:
+            with self.subTest(msg=algorithm):
+                backend_options['mps_sample_measure_algorithm'] = algorithm
+                result = self.SIMULATOR.run(qobj, **backend_options).result()
+                self.assertSuccess(result)
+                self.compare_counts(result, [circuit], [target], delta=0.05 * shots)
+
+    def test_mps_parallel_layers(self):
+        """Test the gates of a layer applied in parallel give the same final state"""
+        circuit = QuantumCircuit(16)
+        for step in range(4):
+            for start in [0, 1]:
+                for qubit in range(start, 15, 2):
+                    circuit.rzz(0.2 * (step + 1), qubit, qubit + 1)
+                    circuit.cx(qubit, qubit + 1)
+            circuit.rx(0.3, range(16))
+            circuit.cp(0.5, 0, 15)
+        circuit.snapshot_statevector('final')
+        qobj = assemble(circuit, self.SIMULATOR, shots=1)
+        target = None
+        for threads in [1, 4]:
+            with self.subTest(msg='threads={}'.format(threads)):
+                backend_options = self.BACKEND_OPTS.copy()
+                backend_options['max_parallel_threads'] = threads
+                result = self.SIMULATOR.run(qobj, **backend_options).result()
+                self.assertSuccess(result)
+                value = result.data(0)['snapshots']['statevector']['final'][0]
+                if target is None:
+                    target = value
+                else:
+                    self.assertAlmostEqual(abs(np.vdot(target, value)), 1)
+
+    def test_mps_purification(self):
+        """Test the purified noise gives the density matrix probabilities"""
+        noise_model = NoiseModel()
+        noise_model.add_all_qubit_quantum_error(
+            amplitude_damping_error(0.1), ['u3'])
+        noise_model.add_all_qubit_quantum_error(
+            depolarizing_error(0.05, 2), ['cx'])
+        circuit = QuantumCircuit(4)
+        for layer in range(2):
+            for qubit in range(4):
+                circuit.u3(0.3 * (qubit + 1), 0.2 * layer, 0.1, qubit)
+            for qubit in range(layer % 2, 3, 2):
+                circuit.cx(qubit, qubit + 1)
+            circuit.cx(0, 3)
+        circuit.reset(2)
+        circuit.snapshot_probabilities('probs', [0, 2, 3])
+        circuit.snapshot_expectation_value('expval', [[1.0, 'ZXZ'], [0.5, 'YIY']],
+                                           [0, 2, 3])
+        circuit.measure_all()
+        shots = 4000
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots, seed_simulator=1234)
+        result = self.SIMULATOR.run(qobj, method='density_matrix',
+                                    noise_model=noise_model).result()
+        self.assertSuccess(result)
+        target_probs = result.data(0)['snapshots']['probabilities']['probs'][0]['value']
+        target_expval = result.data(0)['snapshots']['expectation_value']['expval'][0]['value']
+        target_counts = result.get_counts(0)
+
+        backend_options = self.BACKEND_OPTS.copy()
+        backend_options['mps_purification'] = True
+        result = self.SIMULATOR.run(qobj, noise_model=noise_model,
+                                    **backend_options).result()
+        self.assertSuccess(result)
+        metadata = result.results[0].metadata
+        self.assertTrue(metadata.get('measure_sampling'))
+        self.assertGreater(metadata.get('matrix_product_state_purification_qubits'), 0)
+        probs = result.data(0)['snapshots']['probabilities']['probs'][0]['value']
+        self.assertDictAlmostEqual(probs, target_probs, delta=1e-8)
+        expval = result.data(0)['snapshots']['expectation_value']['expval'][0]['value']
+        self.assertAlmostEqual(expval, target_expval)
+        self.compare_counts(result, [circuit], [target_counts], delta=0.05 * shots)
@@ -0,0 +1,156 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+QasmSimulator Integration Tests
+"""
+# pylint: disable=no-member
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.providers.aer import QasmSimulator
+
+
+class QasmShotBranchingTests:
+    """QasmSimulator shot branching tests."""
+
+    SIMULATOR = QasmSimulator()
+
+    def shot_branching_options(self, enable=True):
+        """Return default backend_options dict."""
+        backend_options = self.BACKEND_OPTS.copy()
+        backend_options['shot_branching_enable'] = enable
+        return backend_options
+
+    def mid_measure_circuit(self):
+        """Return a circuit with mid-circuit measurements and resets."""
+        circuit = QuantumCircuit(3, 3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure(0, 0)
+        circuit.reset(0)
+        circuit.ry(1.0, 0)
+        circuit.reset(1)
+        circuit.h(2)
+        circuit.measure(0, 1)
+        circuit.measure(2, 2)
+        return circuit
+
+    def test_shot_branching_counts(self):
+        """Test shot branching counts match per-shot simulation"""
+        shots = 4000
+        circuit = self.mid_measure_circuit()
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots)
+
+        result = self.SIMULATOR.run(
+            qobj, **self.shot_branching_options(False)).result()
+        self.assertSuccess(result)
+        self.assertNotIn('shot_branching', result.results[0].metadata)
+        target = result.get_counts(0)
+
+        result = self.SIMULATOR.run(
+            qobj, **self.shot_branching_options()).result()
+        self.assertSuccess(result)
+        metadata = result.results[0].metadata
+        self.assertTrue(metadata.get('shot_branching'))
+        self.assertFalse(metadata.get('measure_sampling'))
+        # 2 outcomes for each measurement. The resets of qubits that are
+        # not entangled do not branch, and the two branches of the first
+        # measurement coincide after qubit 0 and 1 are reset.
+        self.assertEqual(metadata.get('shot_branches'), 4)
+        self.assertEqual(metadata.get('shot_branch_merges'), 1)
+        self.assertDictAlmostEqual(result.get_counts(0), target,
+                                   delta=0.05 * shots)
+
+    def test_shot_branching_conditional(self):
+        """Test shot branching with conditional gates"""
+        shots = 1000
+        qr = QuantumRegister(2)
+        cr0 = ClassicalRegister(1)
+        cr1 = ClassicalRegister(1)
+        circuit = QuantumCircuit(qr, cr0, cr1)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr0[0])
+        circuit.x(qr[1]).c_if(cr0, 1)
+        circuit.measure(qr[1], cr1[0])
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots)
+
+        result = self.SIMULATOR.run(
+            qobj, **self.shot_branching_options()).result()
+        self.assertSuccess(result)
+        self.assertTrue(result.results[0].metadata.get('shot_branching'))
+        counts = result.get_counts(0)
+        self.assertEqual(set(counts), {'0 0', '1 1'})
+        self.assertDictAlmostEqual(counts, {'0 0': shots / 2, '1 1': shots / 2},
+                                   delta=0.05 * shots)
+
+    def test_shot_branching_memory(self):
+        """Test shot branching returns memory for every shot"""
+        shots = 100
+        circuit = self.mid_measure_circuit()
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots, memory=True)
+        result = self.SIMULATOR.run(
+            qobj, **self.shot_branching_options()).result()
+        self.assertSuccess(result)
+        memory = result.get_memory(0)
+        self.assertEqual(len(memory), shots)
+        # The memory is in shot order, not grouped by branch
+        changes = sum(a != b for a, b in zip(memory, memory[1:]))
+        self.assertGreater(changes,
+                           result.results[0].metadata.get('shot_branches'))
+
+    def test_shot_branching_merge(self):
+        """Test shot branching merges the branches of a measure and reset"""
+        shots = 1000
+        circuit = QuantumCircuit(2, 2)
+        circuit.h(0)
+        circuit.measure(0, 0)
+        circuit.reset(0)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.measure(0, 1)
+        circuit.h(1)
+        circuit.measure(1, 1)
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots)
+
+        result = self.SIMULATOR.run(
+            qobj, **self.shot_branching_options()).result()
+        self.assertSuccess(result)
+        metadata = result.results[0].metadata
+        self.assertTrue(metadata.get('shot_branching'))
+        self.assertGreaterEqual(metadata.get('shot_branch_merges'), 1)
+        target = {'00': shots / 4, '01': shots / 4,
+                  '10': shots / 4, '11': shots / 4}
+        self.assertDictAlmostEqual(result.get_counts(0), target,
+                                   delta=0.05 * shots)
+
+    def test_shot_branching_low_memory(self):
+        """Test shot branching counts when the branch states cannot be saved"""
+        shots = 4000
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.h(qr[1]).c_if(cr, 1)
+        circuit.measure(qr[1], cr[1])
+        qobj = assemble(circuit, self.SIMULATOR, shots=shots)
+        target = {'00': shots / 2, '01': shots / 4, '11': shots / 4}
+        # With 1 MB no state can be saved, and with 2 MB only the
+        # state of the first branch can be saved
+        for max_memory_mb in [1, 2]:
+            with self.subTest(max_memory_mb=max_memory_mb):
+                backend_options = self.shot_branching_options()
+                backend_options['max_memory_mb'] = max_memory_mb
+                result = self.SIMULATOR.run(qobj, **backend_options).result()
+                self.assertSuccess(result)
+                self.assertTrue(result.results[0].metadata.get('shot_branching'))
+                self.assertDictAlmostEqual(result.get_counts(0), target,
+                                           delta=0.05 * shots)
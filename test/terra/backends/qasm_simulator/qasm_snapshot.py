@@ -659,6 +659,40 @@ class QasmSnapshotExpValPauliNCTests:
             with self.subTest(msg='Pauli {}'.format(pauli)):
                 self.general_test(pauli, num_qubits=3, seed=seed)
 
+    def test_pauli_sum(self):
+        """Test snapshot of a sum of all 3-qubit Paulis on an entangled state."""
+        num_qubits = 4
+        pauli_qubits = [0, 2, 3]
+        rng = np.random.default_rng(100)
+        init_circ = QuantumCircuit(num_qubits)
+        for i, par in enumerate(rng.uniform(-1, 1, size=(num_qubits, 3))):
+            init_circ.u3(*par, i)
+        for i in range(num_qubits - 1):
+            init_circ.cx(i, i + 1)
+
+        paulis = [''.join(reversed(tup))
+                  for tup in it.product(['I', 'X', 'Y', 'Z'], repeat=3)]
+        coeffs = rng.uniform(-1, 1, size=len(paulis)) + 1j * rng.uniform(
+            -1, 1, size=len(paulis))
+
+        # Compute the target expectation value
+        rho = Operator(DensityMatrix.from_instruction(init_circ))
+        target = 0
+        for coeff, pauli in zip(coeffs, paulis):
+            op = Operator.from_label(pauli)
+            target += coeff * np.real(np.trace(rho.compose(op, pauli_qubits).data))
+
+        # Simulate expectation value
+        qc = init_circ.copy()
+        qc.snapshot_expectation_value('final', list(zip(coeffs, paulis)), pauli_qubits)
+        qobj = assemble(qc)
+        result = self.SIMULATOR.run(
+            qobj, **self.BACKEND_OPTS).result()
+        self.assertSuccess(result)
+        snapshots = result.data(0).get('snapshots', {})
+        expval = snapshots.get('expectation_value', {})['final'][0]['value']
+        self.assertAlmostEqual(expval, target)
+
 
 class QasmSnapshotExpValMatrixTests:
     """QasmSimulator snapshot pauli expectation value tests."""
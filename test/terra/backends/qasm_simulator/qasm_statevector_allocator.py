@@ -0,0 +1,51 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+QasmSimulator Integration Tests
+"""
+# pylint: disable=no-member
+from qiskit import QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.providers.aer import QasmSimulator
+
+
+class QasmStatevectorAllocatorTests:
+    """QasmSimulator statevector allocator tests."""
+
+    SIMULATOR = QasmSimulator()
+
+    def test_statevector_allocator(self):
+        """Test statevector_allocator policies are reported in metadata"""
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.cx(1, 2)
+        circuit.measure_all()
+        qobj = assemble(circuit, self.SIMULATOR, shots=100)
+        for allocator in ['default', 'hugepage', 'interleaved', 'first_touch']:
+            with self.subTest(msg=allocator):
+                backend_options = self.BACKEND_OPTS.copy()
+                backend_options['statevector_allocator'] = allocator
+                result = self.SIMULATOR.run(qobj, **backend_options).result()
+                self.assertSuccess(result)
+                # The policy falls back to default if it cannot be applied
+                self.assertIn(
+                    result.results[0].metadata.get('statevector_allocator'),
+                    {allocator, 'default'})
+                counts = result.get_counts(0)
+                self.assertEqual(set(counts), {'000', '111'})
+
+        with self.subTest(msg='invalid allocator'):
+            backend_options = self.BACKEND_OPTS.copy()
+            backend_options['statevector_allocator'] = 'invalid'
+            result = self.SIMULATOR.run(qobj, **backend_options).result()
+            self.assertFalse(getattr(result, 'success', False))
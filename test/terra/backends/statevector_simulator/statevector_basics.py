@@ -13,6 +13,9 @@
 StatevectorSimulator Integration Tests
 """
 
+import os
+import tempfile
+import numpy as np
 from numpy import exp, pi
 
 from test.terra.reference import ref_measure
@@ -23,8 +26,9 @@ from test.terra.reference import ref_1q_clifford
 from test.terra.reference import ref_unitary_gate
 from test.terra.reference import ref_diagonal_gate
 
-from qiskit import execute, transpile, assemble
+from qiskit import QuantumCircuit, execute, transpile, assemble
 from qiskit.providers.aer import StatevectorSimulator
+from qiskit.quantum_info import Statevector
 
 
 class StatevectorSimulatorTests:
@@ -261,3 +265,31 @@ class StatevectorSimulatorTests:
         result = self.SIMULATOR.run(qobj).result()
         self.assertSuccess(result)
         self.compare_statevector(result, circuits, targets, ignore_phase=False)
+
+    # ---------------------------------------------------------------------
+    # Test initial statevector
+    # ---------------------------------------------------------------------
+    def test_initial_statevector_buffers(self):
+        """Test initial statevector as NumPy arrays and .npy files."""
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.cx(0, 2)
+        qobj = assemble(circuit, shots=1)
+        # Amplitudes exactly representable in single precision
+        rng = np.random.default_rng(1234)
+        initial = 0.25 * rng.choice([1, -1], 8) + 0.25j * rng.choice([1, -1], 8)
+        target = Statevector(initial).evolve(circuit)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'initial.npy')
+            np.save(path, initial)
+            values = {'complex128': initial,
+                      'complex64': initial.astype(np.complex64),
+                      'list': initial.tolist(),
+                      'npy': path}
+            for label, value in values.items():
+                with self.subTest(msg=label):
+                    result = self.SIMULATOR.run(
+                        qobj, initial_statevector=value,
+                        **self.BACKEND_OPTS).result()
+                    self.assertSuccess(result)
+                    self.compare_statevector(result, [circuit], [target])
@@ -0,0 +1,98 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+autotune module tests
+"""
+# pylint: disable=protected-access
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from qiskit import QuantumCircuit
+from qiskit.compiler import assemble
+from qiskit.providers.aer import QasmSimulator, StatevectorSimulator
+from qiskit.providers.aer.utils import autotune
+from qiskit.providers.aer.backends.backend_utils import (
+    autotune_profile_key, AUTOTUNE_PROFILE_ENV)
+
+from test.terra.common import QiskitAerTestCase
+
+AUTOTUNE_OPTIONS = [
+    'statevector_parallel_threshold', 'fusion_cost_table', 'fusion_threshold',
+    'fusion_max_qubit', 'statevector_sample_measure_opt',
+    'extended_stabilizer_parallel_threshold', 'mps_parallel_threshold'
+]
+
+
+class TestAutotune(QiskitAerTestCase):
+    """Tests for autotuned simulator options."""
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = os.path.join(directory.name, 'aer_autotune.json')
+        patch = mock.patch.dict(os.environ, {AUTOTUNE_PROFILE_ENV: self.filename})
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def qobj(self):
+        """Return a test qobj."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        return assemble(circuit, shots=1)
+
+    def test_autotune_profile(self):
+        """Test autotune writes the options of the machine to the profile"""
+        options = autotune(min_qubits=2, max_qubits=4, depth=2, shots=100,
+                           repeats=1)
+        self.assertEqual(sorted(options), sorted(AUTOTUNE_OPTIONS))
+        with open(self.filename) as file:
+            profile = json.load(file)
+        self.assertEqual(profile[autotune_profile_key()]['options'], options)
+
+    def test_autotune_default_options(self):
+        """Test simulators use autotuned options as defaults"""
+        options = {'statevector_parallel_threshold': 3, 'fusion_threshold': 4,
+                   'mps_parallel_threshold': 5}
+        with open(self.filename, 'w') as file:
+            json.dump({autotune_profile_key(): {'options': options}}, file)
+
+        config = StatevectorSimulator()._format_qobj(self.qobj()).config
+        self.assertEqual(config.statevector_parallel_threshold, 3)
+        self.assertEqual(config.fusion_threshold, 4)
+
+        # Fusion options are only used for the statevector method
+        config = QasmSimulator()._format_qobj(self.qobj()).config
+        self.assertEqual(config.mps_parallel_threshold, 5)
+        self.assertFalse(hasattr(config, 'fusion_threshold'))
+        config = QasmSimulator(method='statevector')._format_qobj(self.qobj()).config
+        self.assertEqual(config.fusion_threshold, 4)
+
+        # Options that are set override the autotuned options
+        config = QasmSimulator()._format_qobj(
+            self.qobj(), statevector_parallel_threshold=10).config
+        self.assertEqual(config.statevector_parallel_threshold, 10)
+
+    def test_autotune_other_machine(self):
+        """Test autotuned options of other machines are not used"""
+        with open(self.filename, 'w') as file:
+            json.dump({'other machine': {'options': {'fusion_threshold': 4}}}, file)
+        config = StatevectorSimulator()._format_qobj(self.qobj()).config
+        self.assertFalse(hasattr(config, 'fusion_threshold'))
+
+
+if __name__ == '__main__':
+    unittest.main()
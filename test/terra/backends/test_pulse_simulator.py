@@ -108,6 +108,40 @@ class TestPulseSimulator(common.QiskitAerTestCase):
         exp_counts = {'1': 256}
         self.assertDictAlmostEqual(counts, exp_counts)
 
+    def test_x_gate_native_methods(self):
+        """Test a pi pulse on a 2 level system with the native DE methods."""
+
+        omega_0 = 1.1329824
+        r = 0.01
+        total_samples = 100
+        y0 = np.array([1.0, 0.0])
+        seed = 9000
+
+        pulse_sim = PulseSimulator(system_model=self._system_model_1Q(omega_0, r))
+
+        schedule = self._1Q_constant_sched(total_samples)
+        qobj = assemble([schedule],
+                        backend=pulse_sim,
+                        meas_level=2,
+                        meas_return='single',
+                        meas_map=[[0]],
+                        qubit_lo_freq=[omega_0],
+                        memory_slots=1,
+                        shots=256)
+
+        samples = np.ones((total_samples, 1))
+        indep_yf = simulate_1q_model(y0, omega_0, r, np.array([omega_0]),
+                                     samples, 1.)
+
+        for method in ['native-dopri5', 'native-RK4']:
+            solver_options = {'method': method, 'atol': 1e-10, 'rtol': 1e-10}
+            result = pulse_sim.run(qobj, initial_state=y0, seed=seed,
+                                   solver_options=solver_options).result()
+            pulse_sim_yf = result.get_statevector()
+
+            self.assertGreaterEqual(state_fidelity(pulse_sim_yf, indep_yf), 1 - 10**-5)
+            self.assertDictAlmostEqual(result.get_counts(), {'1': 256})
+
     def test_x_gate_rwa(self):
         """Test a schedule for a pi pulse on a 2 level system in the rotating frame with a
         the rotating wave approximation."""
@@ -299,6 +333,35 @@ class TestPulseSimulator(common.QiskitAerTestCase):
         exp_counts = {'0': 10}
         self.assertDictAlmostEqual(counts, exp_counts)
 
+    def test_1Q_noise_native_methods(self):
+        """Tests Monte Carlo simulation of noise operators with the native DE methods."""
+
+        omega_0 = 1.1329824
+        r = 0.01
+        total_samples = 100
+        y0 = np.array([1.0, 0.0])
+        seed = 9000
+        noise_model = {"qubit": {"0": {"Sm": 1.}}}
+
+        pulse_sim = PulseSimulator(system_model=self._system_model_1Q(omega_0, r),
+                                   noise_model=noise_model)
+
+        schedule = self._1Q_constant_sched(total_samples)
+        qobj = assemble([schedule],
+                        backend=pulse_sim,
+                        meas_level=2,
+                        meas_return='single',
+                        meas_map=[[0]],
+                        qubit_lo_freq=[omega_0],
+                        memory_slots=2,
+                        shots=10)
+
+        for method in ['native-dopri5', 'native-RK4']:
+            solver_options = {'method': method}
+            result = pulse_sim.run(qobj, initial_state=y0, seed=seed,
+                                   solver_options=solver_options).result()
+            self.assertDictAlmostEqual(result.get_counts(), {'0': 10})
+
     def test_unitary_parallel(self):
         """Test for parallel solving in unitary simulation. Uses same schedule as test_x_gate but
         runs it twice to trigger parallel execution.
@@ -964,6 +1027,56 @@ class TestPulseSimulator(common.QiskitAerTestCase):
         self.assertGreaterEqual(state_fidelity(statevector, expected_vector),
                                 1 - (10**-5))
 
+    def test_analytic_idle_propagation(self):
+        """Test propagation of idle intervals with the drift Hamiltonian against the full
+        DE solution, for a schedule with long delays and a non-diagonal drift."""
+
+        # two coupled qubits with exchange interaction in the drift
+        hamiltonian = {}
+        hamiltonian['h_str'] = ['np.pi*v0*Z0',
+                                'np.pi*v1*Z1',
+                                '2*np.pi*j*(Sp0*Sm1+Sm0*Sp1)',
+                                '2*np.pi*r*X0||D0',
+                                '2*np.pi*r*X1||D1']
+        hamiltonian['vars'] = {'v0': 1., 'v1': 1.05, 'j': 0.01, 'r': 0.02}
+        hamiltonian['qub'] = {'0': 2, '1': 2}
+        ham_model = HamiltonianModel.from_dict(hamiltonian)
+        system_model = PulseSystemModel(hamiltonian=ham_model,
+                                        u_channel_lo=[],
+                                        subsystem_list=[0, 1],
+                                        dt=1.)
+
+        total_samples = 20
+        sched = Schedule()
+        sched += Play(Waveform(np.ones(total_samples) * 0.5), DriveChannel(0))
+        sched += Delay(500, DriveChannel(0))
+        sched += Play(Waveform(np.ones(total_samples) * 0.5), DriveChannel(0))
+        sched += Delay(300, DriveChannel(1))
+        sched += Play(Waveform(np.ones(total_samples) * 0.5), DriveChannel(1))
+        sched |= Acquire(1, AcquireChannel(0), MemorySlot(0)) << sched.duration
+        sched |= Acquire(1, AcquireChannel(1), MemorySlot(1)) << sched.duration
+
+        y0 = np.array([1., 0., 0., 0.])
+        pulse_sim = PulseSimulator(system_model=system_model, initial_state=y0)
+        qobj = assemble([sched],
+                        backend=pulse_sim,
+                        meas_level=2,
+                        meas_return='single',
+                        meas_map=[[0, 1]],
+                        qubit_lo_freq=[1., 1.],
+                        memory_slots=2,
+                        shots=1)
+
+        solver_options = {'atol': 1e-10, 'rtol': 1e-10}
+        results = pulse_sim.run(qobj, solver_options=solver_options).result()
+        expected_yf = results.get_statevector()
+
+        solver_options['analytic_idle'] = True
+        results = pulse_sim.run(qobj, solver_options=solver_options).result()
+        yf = results.get_statevector()
+
+        self.assertGreaterEqual(state_fidelity(yf, expected_yf), 1 - (10**-5))
+
     def test_shift_phase(self):
         """Test ShiftPhase command."""
 
@@ -47,6 +47,9 @@ from test.terra.backends.qasm_simulator.qasm_snapshot import QasmSnapshotExpValP
 from test.terra.backends.qasm_simulator.qasm_snapshot import QasmSnapshotExpValPauliNCTests
 from test.terra.backends.qasm_simulator.qasm_snapshot import QasmSnapshotExpValMatrixTests
 from test.terra.backends.qasm_simulator.qasm_snapshot import QasmSnapshotAmplitudesTests
+# Other tests
+from test.terra.backends.qasm_simulator.qasm_mps import QasmMatrixProductStateTests
+from test.terra.backends.qasm_simulator.qasm_checkpoint import QasmCheckpointTests
 
 
 class TestQasmMatrixProductStateSimulator(
@@ -75,7 +78,9 @@ class TestQasmMatrixProductStateSimulator(
         QasmSnapshotExpValPauliNCTests,
         QasmSnapshotExpValMatrixTests,
         QasmSnapshotAmplitudesTests,
-        QasmStandardGateStatevectorTests
+        QasmStandardGateStatevectorTests,
+        QasmMatrixProductStateTests,
+        QasmCheckpointTests
 ):
     """QasmSimulator matrix product state method tests."""
 
@@ -51,6 +51,13 @@ from test.terra.backends.qasm_simulator.qasm_snapshot import QasmSnapshotExpValM
 from test.terra.backends.qasm_simulator.qasm_method import QasmMethodTests
 from test.terra.backends.qasm_simulator.qasm_thread_management import QasmThreadManagementTests
 from test.terra.backends.qasm_simulator.qasm_fusion import QasmFusionTests
+from test.terra.backends.qasm_simulator.qasm_commutation import QasmCommutationTests
+from test.terra.backends.qasm_simulator.qasm_clifford_prefix import QasmCliffordPrefixTests
+from test.terra.backends.qasm_simulator.qasm_local_qubits import QasmLocalQubitsTests
+from test.terra.backends.qasm_simulator.qasm_shot_branching import QasmShotBranchingTests
+from test.terra.backends.qasm_simulator.qasm_checkpoint import QasmCheckpointTests
+from test.terra.backends.qasm_simulator.qasm_measure_sampling import QasmMeasureSamplingTests
+from test.terra.backends.qasm_simulator.qasm_statevector_allocator import QasmStatevectorAllocatorTests
 from test.terra.backends.qasm_simulator.qasm_delay_measure import QasmDelayMeasureTests
 from test.terra.backends.qasm_simulator.qasm_truncate import QasmQubitsTruncateTests
 from test.terra.backends.qasm_simulator.qasm_basics import QasmBasicsTests
@@ -63,7 +70,9 @@ class StatevectorTests(
         QasmMultiplexerTests, QasmAlgorithmTests, QasmAlgorithmTestsWaltzBasis,
         QasmAlgorithmTestsMinimalBasis, QasmUnitaryGateTests, QasmDiagonalGateTests,
         QasmReadoutNoiseTests, QasmPauliNoiseTests, QasmThreadManagementTests,
-        QasmFusionTests, QasmDelayMeasureTests, QasmQubitsTruncateTests,
+        QasmFusionTests, QasmCommutationTests, QasmCliffordPrefixTests,
+        QasmDelayMeasureTests,
+        QasmQubitsTruncateTests,
         QasmResetNoiseTests, QasmKrausNoiseTests, QasmBasicsTests,
         QasmSnapshotStatevectorTests, QasmSnapshotDensityMatrixTests,
         QasmSnapshotProbabilitiesTests, QasmSnapshotExpValPauliTests,
@@ -74,7 +83,10 @@ class StatevectorTests(
     pass
 
 
-class TestQasmSimulatorStatevector(common.QiskitAerTestCase, StatevectorTests):
+class TestQasmSimulatorStatevector(common.QiskitAerTestCase, StatevectorTests,
+                                   QasmLocalQubitsTests, QasmShotBranchingTests,
+                                   QasmCheckpointTests, QasmMeasureSamplingTests,
+                                   QasmStatevectorAllocatorTests):
     """QasmSimulator statevector method tests."""
 
     BACKEND_OPTS = {
@@ -84,6 +96,7 @@ class TestQasmSimulatorStatevector(common.QiskitAerTestCase, StatevectorTests):
     }
 
 
+
 @requires_method("qasm_simulator", "statevector_gpu")
 class TestQasmSimulatorStatevectorThrustGPU(common.QiskitAerTestCase,
                                             StatevectorTests):
@@ -108,5 +121,18 @@ class TestQasmSimulatorStatevectorThrustCPU(common.QiskitAerTestCase,
     }
 
 
+@requires_method("qasm_simulator", "statevector_chunked")
+class TestQasmSimulatorStatevectorChunked(common.QiskitAerTestCase,
+                                          StatevectorTests):
+    """QasmSimulator statevector_chunked method tests."""
+
+    BACKEND_OPTS = {
+        "seed_simulator": 271828,
+        "method": "statevector_chunked",
+        "statevector_chunk_qubits": 2,
+        "max_parallel_threads": 1
+    }
+
+
 if __name__ == '__main__':
     unittest.main()
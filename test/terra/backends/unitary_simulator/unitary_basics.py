@@ -13,14 +13,18 @@
 UnitarySimulator Integration Tests
 """
 
+import os
+import tempfile
+import numpy as np
 from numpy import exp, pi
 
 from test.terra.reference import ref_1q_clifford
 from test.terra.reference import ref_unitary_gate
 from test.terra.reference import ref_diagonal_gate
 
-from qiskit import execute, assemble, transpile
+from qiskit import QuantumCircuit, execute, assemble, transpile
 from qiskit.providers.aer import UnitarySimulator
+from qiskit.quantum_info import Operator, random_unitary
 
 
 class UnitarySimulatorTests:
@@ -79,3 +83,28 @@ class UnitarySimulatorTests:
         result = self.SIMULATOR.run(qobj).result()
         self.assertSuccess(result)
         self.compare_unitary(result, circuits, targets, ignore_phase=False)
+
+    # ---------------------------------------------------------------------
+    # Test initial unitary
+    # ---------------------------------------------------------------------
+    def test_initial_unitary_buffers(self):
+        """Test initial unitary as NumPy arrays and .npy files."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        qobj = assemble(circuit, shots=1)
+        initial = random_unitary(4, seed=1234).data
+        target = Operator(initial).compose(circuit)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'initial.npy')
+            np.save(path, initial)
+            values = {'complex128': initial,
+                      'list': initial.tolist(),
+                      'npy': path}
+            for label, value in values.items():
+                with self.subTest(msg=label):
+                    result = self.SIMULATOR.run(
+                        qobj, initial_unitary=value,
+                        **self.BACKEND_OPTS).result()
+                    self.assertSuccess(result)
+                    self.compare_unitary(result, [circuit], [target])
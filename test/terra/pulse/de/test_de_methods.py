@@ -8,6 +8,7 @@ from qiskit.providers.aer.pulse.de.DE_Methods import (ODE_Method,
                                                       RK4,
                                                       ScipyODE,
                                                       QiskitZVODE,
+                                                      NativeODE,
                                                       method_from_string)
 
 from ...common import QiskitAerTestCase
@@ -43,6 +44,9 @@ class TestDE_Methods(QiskitAerTestCase):
         method = method_from_string('zvode-adams')
         self.assertTrue(method == QiskitZVODE)
 
+        method = method_from_string('native-dopri5')
+        self.assertTrue(method == NativeODE)
+
     def test_ScipyODE_options_and_defaults(self):
         """Test option handling for ScipyODE solver."""
 
@@ -76,6 +80,23 @@ class TestDE_Methods(QiskitAerTestCase):
         except Exception as exception:
             self.assertEqual(str(exception), expected_message)
 
+    def test_NativeODE_options_and_rhs_error(self):
+        """Test option handling and missing native rhs error for NativeODE solver."""
+
+        options = DE_Options(method='native-dopri5')
+        expected_message = "NativeODE requires a 'native_rhs' entry in the rhs dict."
+        with self.assertRaises(Exception) as context:
+            NativeODE(t0=0., y0=np.array([1.]), rhs=self.rhs, options=options)
+        self.assertEqual(str(context.exception), expected_message)
+
+        solver = NativeODE(t0=0., y0=np.array([1.]),
+                           rhs={'rhs': self.rhs['rhs'], 'native_rhs': object()},
+                           options=options)
+        self.assertTrue(solver.options.method == 'dopri5')
+        self.assertTrue(solver.options.first_step == 0)
+        self.assertTrue(solver.options.max_step == 0)
+        self.assertTrue(solver.options.min_step == 0)
+
     def test_standard_problems_ScipyODE_RK45(self):
         """Run standard variable step tests for scipy-RK45."""
         self._test_variable_step_method('scipy-RK45')
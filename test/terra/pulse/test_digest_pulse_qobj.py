@@ -0,0 +1,76 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Tests for digestion of PulseQobj dicts into pulse simulation structures
+"""
+
+import unittest
+from collections import OrderedDict
+import numpy as np
+from test.terra.common import QiskitAerTestCase
+from qiskit.providers.aer.pulse.controllers.digest_pulse_qobj import (build_pulse_arrays,
+                                                                      experiment_to_structs)
+
+
+class TestDigestPulseQobj(QiskitAerTestCase):
+    """Tests for build_pulse_arrays and experiment_to_structs"""
+
+    def setUp(self):
+        super().setUp()
+        self.pulse_library = [{'name': 'gauss', 'samples': np.array([0.1, 0.5, 0.1]) + 0j},
+                              {'name': 'square', 'samples': [[0.2, 0.1], [0.2, 0.1]]},
+                              {'name': 'gauss_copy', 'samples': np.array([0.1, 0.5, 0.1]) + 0j}]
+        self.channels = OrderedDict([('D0', 0), ('D1', 1), ('U0', 2)])
+        self.experiment = {'header': {},
+                           'instructions': [{'name': 'gauss', 'ch': 'd0', 't0': 0},
+                                            {'name': 'square', 'ch': 'd1', 't0': 0},
+                                            {'name': 'fc', 'ch': 'd0', 't0': 3, 'phase': 0.5},
+                                            {'name': 'gauss_copy', 'ch': 'd0', 't0': 3},
+                                            {'name': 'fc', 'ch': 'd0', 't0': 6, 'phase': 0.25},
+                                            {'name': 'square', 'ch': 'd1', 't0': 6,
+                                             'conditional': 0},
+                                            {'name': 'acquire', 'qubits': [0, 1],
+                                             'memory_slot': [0, 1], 't0': 8, 'duration': 2}]}
+
+    def test_build_pulse_arrays(self):
+        """Test that identical waveforms are stored once."""
+        pulses, pulses_idx, pulse_dict = build_pulse_arrays([self.experiment],
+                                                            self.pulse_library)
+
+        self.assertEqual(pulse_dict['gauss'], 0)
+        self.assertEqual(pulse_dict['square'], 1)
+        self.assertEqual(pulse_dict['gauss_copy'], pulse_dict['gauss'])
+        self.assertEqual(pulse_dict['pv'], [])
+        self.assertEqual(list(pulses_idx[:3]), [0, 3, 5])
+        self.assertTrue(np.allclose(pulses, [0.1, 0.5, 0.1, 0.2 + 0.1j, 0.2 + 0.1j]))
+
+    def test_experiment_to_structs(self):
+        """Test the per-channel pulse and phase tables."""
+        _, pulses_idx, pulse_dict = build_pulse_arrays([self.experiment], self.pulse_library)
+        structs = experiment_to_structs(self.experiment, self.channels, pulses_idx,
+                                        pulse_dict, dt=0.5)
+
+        d0_pulses, d0_phases = structs['channels']['D0']
+        self.assertTrue(np.allclose(d0_pulses, [0., 1.5, 0, -1, 1.5, 3., 0, -1]))
+        self.assertTrue(np.allclose(d0_phases, [1.5, 0.5, -1, 3., 0.75, -1]))
+
+        d1_pulses, d1_phases = structs['channels']['D1']
+        self.assertTrue(np.allclose(d1_pulses, [0., 1., 1, -1, 3., 4., 1, 0]))
+        self.assertEqual(len(d1_phases), 0)
+
+        self.assertEqual(len(structs['channels']['U0'][0]), 0)
+        self.assertTrue(np.allclose(structs['tlist'], [0., 4.]))
+        self.assertTrue(structs['can_sample'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -267,6 +267,45 @@ class TestHamiltonianModel(QiskitAerTestCase):
         qubit_lo = ham_model.get_qubit_lo_from_drift()
         self.assertAlmostEqual(norm(qubit_lo - np.array([1.])), 0)
 
+    def test_variable_precision(self):
+        """Test the drift is computed with the full precision of the variables"""
+
+        a = 1.23456789012e-4
+        ham_dict = {'h_str': ['a*Z0', 'X0||D0'], 'vars': {'a': a}, 'qub': {'0': 2}}
+        ham_model = HamiltonianModel.from_dict(ham_dict)
+        self.assertAlmostEqual(norm(np.sort(ham_model._evals) - np.array([-a, a])), 0,
+                               places=15)
+
+    def test_from_dict_cache(self):
+        """Test that equal Hamiltonian dicts reuse the cached model data"""
+
+        HamiltonianModel.clear_cache()
+
+        ham_dict = {'h_str': ['a*Z0', 'r*X0||D0'],
+                    'vars': {'a': 1., 'r': 0.1},
+                    'qub': {'0': 2}}
+        ham_model0 = HamiltonianModel.from_dict(ham_dict)
+        ham_model1 = HamiltonianModel.from_dict(dict(ham_dict))
+
+        self.assertIsNot(ham_model0, ham_model1)
+        self.assertIs(ham_model0._system, ham_model1._system)
+        self.assertIs(ham_model0._estates, ham_model1._estates)
+        self.assertIs(ham_model0._h_ops_data, ham_model1._h_ops_data)
+
+        # changing a variable must produce a new model
+        ham_dict['vars'] = {'a': 2., 'r': 0.1}
+        ham_model2 = HamiltonianModel.from_dict(ham_dict)
+        self.assertIsNot(ham_model0._evals, ham_model2._evals)
+        self.assertAlmostEqual(norm(ham_model2._evals - 2 * ham_model0._evals), 0)
+
+        # an explicit but equivalent subsystem list hits the same entry
+        ham_model3 = HamiltonianModel.from_dict(ham_dict, subsystem_list=[0])
+        self.assertIs(ham_model2._system, ham_model3._system)
+
+        HamiltonianModel.clear_cache()
+        ham_model4 = HamiltonianModel.from_dict(ham_dict)
+        self.assertIsNot(ham_model2._system, ham_model4._system)
+
     def test_empty_hamiltonian_string_exception(self):
         """Test exception raising for empty hamiltonian string"""
 